@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Single entry point for the AI_first scripts: `python3 AI_first/scripts/aifirst.py <command> [args]`.
+
+Each command maps to one of the standalone scripts, and that script is imported only when its
+command runs, so hook- and agent-triggered calls pay for one module's imports instead of all of
+them. The scripts keep working when run directly.
+"""
+from __future__ import annotations
+
+import sys
+
+COMMANDS = {
+    "docs": ("render_docs", "Render markdown under AI_first/docs and AI_first/projects to HTML"),
+    "pm": ("render_pm", "Refresh PM.html and the project detail pages"),
+    "issues": ("issues", "Bug Management store commands (list, add, update, close, ...)"),
+    "watch": ("watch_docs", "Watch markdown and re-render docs on change"),
+    "init": ("init_project", "Scaffold a new project"),
+    "daemon": ("aifirst_daemon", "Optional in-memory daemon (serve, status, stop)"),
+    "cache": ("render_cache", "Shared render cache (stats, prune)"),
+    "links": ("link_graph", "Link graph queries (backlinks, links, dependents, broken)"),
+}
+
+
+def _usage() -> str:
+    width = max(len(name) for name in COMMANDS)
+    lines = ["usage: aifirst.py <command> [args]", "", "commands:"]
+    lines += [f"  {name.ljust(width)}  {help_text}" for name, (_, help_text) in COMMANDS.items()]
+    lines += ["", "Run `aifirst.py <command> --help` for a command's options."]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in {"-h", "--help"}:
+        print(_usage())
+        return
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        raise SystemExit(f"Unknown command '{command}'.\n\n{_usage()}")
+    import importlib
+
+    module = importlib.import_module(COMMANDS[command][0])
+    # argparse derives `prog` from argv[0], so help and errors read `aifirst.py <command>`.
+    sys.argv = [f"aifirst.py {command}", *rest]
+    module.main(rest)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        sys.exit(130)
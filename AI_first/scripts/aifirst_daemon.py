@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""Optional long-lived helper that answers AI_first CLI calls over a Unix domain socket.
+
+The daemon keeps the parsed project model, the issue rows, and rendered doc pages in memory and
+refreshes them by polling the source tree. `issues.py`, `render_pm.py`, and `render_docs.py`
+forward to it when the socket is live and fall back to running locally otherwise. The client side
+(`forward`) only imports what it needs, since every CLI call goes through it.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SOCKET_ENV = "AIFIRST_SOCKET"
+DISABLE_ENV = "AIFIRST_NO_DAEMON"
+CLIENT_TIMEOUT = 120.0
+# How long the server waits on one client's request bytes before dropping it; requests are served serially.
+REQUEST_TIMEOUT = 5.0
+COMMANDS = ("issues", "docs", "pm")
+
+Signature = Tuple[int, int]
+
+
+def socket_path(repo_root: Path) -> Path:
+    override = os.environ.get(SOCKET_ENV, "").strip()
+    if override:
+        return Path(override)
+    import hashlib
+    import tempfile
+
+    # Keep the path short (AF_UNIX caps it near 100 bytes) and unique per checkout.
+    digest = hashlib.sha1(str(repo_root.resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"aifirst-{digest}.sock"
+
+
+def _request(path: Path, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        chunks: List[bytes] = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def forward(command: str, argv: List[str], repo_root: Path) -> Optional[int]:
+    """Run a CLI command through the daemon; return None when the caller should run locally."""
+    if os.environ.get(DISABLE_ENV, "").strip() not in {"", "0"}:
+        return None
+    if "-h" in argv or "--help" in argv:
+        return None
+    path = socket_path(repo_root)
+    if not path.exists():
+        return None
+    payload = {
+        "command": command,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "repo_root": str(repo_root.resolve()),
+    }
+    try:
+        reply = _request(path, payload, CLIENT_TIMEOUT)
+    except (OSError, ValueError):
+        return None
+    if not reply.get("handled"):
+        return None
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    return int(reply.get("code", 0))
+
+
+def _stat_sig(path: Path) -> Optional[Signature]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _TreeWatch:
+    """Stat-based view of the markdown files under a set of roots.
+
+    Directory mtimes detect creates, deletes, and renames (triggering a rescan); otherwise a poll
+    only stats the files already known, which keeps it cheap on large trees.
+    """
+
+    def __init__(self, roots: Tuple[Path, ...]) -> None:
+        self.roots = roots
+        self.files: Dict[Path, Signature] = {}
+        self.dirs: Dict[Path, Optional[int]] = {}
+        self.generation = 0
+        self._scan()
+
+    def _scan(self) -> None:
+        files: Dict[Path, Signature] = {}
+        dirs: Dict[Path, Optional[int]] = {}
+        for root in self.roots:
+            if not root.exists():
+                dirs[root] = None
+                continue
+            for dirpath, _dirnames, filenames in os.walk(root):
+                current = Path(dirpath)
+                try:
+                    dirs[current] = current.stat().st_mtime_ns
+                except OSError:
+                    continue
+                for name in filenames:
+                    if not name.endswith(".md"):
+                        continue
+                    sig = _stat_sig(current / name)
+                    if sig is not None:
+                        files[current / name] = sig
+        self.files = files
+        self.dirs = dirs
+
+    def poll(self) -> bool:
+        for directory, mtime in self.dirs.items():
+            try:
+                current: Optional[int] = directory.stat().st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                self._scan()
+                self.generation += 1
+                return True
+        changed = False
+        for path, sig in list(self.files.items()):
+            current_sig = _stat_sig(path)
+            if current_sig is None:
+                self._scan()
+                self.generation += 1
+                return True
+            if current_sig != sig:
+                self.files[path] = current_sig
+                changed = True
+        if changed:
+            self.generation += 1
+        return changed
+
+
+class _State:
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.trees: Dict[Tuple[Path, ...], _TreeWatch] = {}
+        self.doc_cache: Dict[Tuple[Path, Path], Signature] = {}
+        self.issue_rows: Dict[Tuple[Path, Tuple[str, ...]], Tuple[Signature, Any]] = {}
+        self.bug_rollups: Dict[Path, Tuple[Optional[Signature], Dict[str, Any]]] = {}
+        self.projects: Dict[Path, Tuple[Tuple[Any, ...], list]] = {}
+
+    def tree(self, roots: Tuple[Path, ...]) -> _TreeWatch:
+        watch = self.trees.get(roots)
+        if watch is None:
+            watch = _TreeWatch(roots)
+            self.trees[roots] = watch
+        else:
+            watch.poll()
+        return watch
+
+    def poll_all(self) -> None:
+        for watch in self.trees.values():
+            watch.poll()
+        for path, where in list(self.issue_rows):
+            self.rows_for(path, list(where))
+
+    # -- issues ---------------------------------------------------------------------------
+    def rows_for(self, path: Path, where: Optional[List[str]] = None) -> Any:
+        import issues
+
+        key = (path, tuple(where or ()))
+        sig = _stat_sig(path) or (0, 0)
+        cached = self.issue_rows.get(key)
+        if cached and cached[0] == sig:
+            return cached[1]
+        rows = issues._prepare_columns(path, where)
+        self.issue_rows[key] = (sig, rows)
+        return rows
+
+    def handle_issues(self, argv: List[str]) -> None:
+        import issues
+
+        args = issues.parse_args(argv)
+        stores = issues._resolve_stores(args.data)
+        if len(stores) == 1:
+            issues._export(self.rows_for(stores[0].resolve(), args.where), args.format, args.output, stores, args.plain)
+        else:
+            issues._export_stores(stores, args.format, args.output, args.plain, args.where)
+
+    # -- docs -----------------------------------------------------------------------------
+    def handle_docs(self, argv: List[str]) -> None:
+        import render_docs
+
+        args = render_docs.parse_args(argv)
+        support_root, projects_root, out_root = render_docs._resolve_roots(args, self.repo_root)
+        index = None
+        if not args.no_search:
+            import search_index
+
+            index = search_index.open_index(self.repo_root)
+        fragments = None if args.no_fragments else render_docs.open_fragments(self.repo_root)
+        cache = render_docs._open_cache(args)
+        links = None
+        if not args.no_links:
+            from link_graph import open_graph
+
+            links = open_graph(self.repo_root)
+        rendered: List[str] = []
+        watch = self.tree((support_root, projects_root))
+        for md_path, sig in sorted(watch.files.items()):
+            out_path = render_docs._output_for(md_path, support_root, projects_root, out_root)
+            if out_path is None:
+                continue
+            key = (md_path, out_path)
+            cached = self.doc_cache.get(key)
+            if (
+                cached == sig
+                and out_path.exists()
+                and (index is None or index.has(index.href_for(out_path)))
+                and (fragments is None or fragments.has(md_path.relative_to(self.repo_root).as_posix()))
+            ):
+                continue
+            render_docs._build_doc(md_path, out_path, self.repo_root, index, fragments, cache, links)
+            rendered.append(md_path.relative_to(self.repo_root).as_posix())
+            self.doc_cache[key] = sig
+        if index is not None:
+            index.prune(self.repo_root)
+            index.save()
+        if fragments is not None:
+            fragments.prune(self.repo_root)
+            fragments.save()
+        if cache is not None:
+            cache.close()
+        if links is not None:
+            render_docs._finish_links(links, self.repo_root, rendered)
+
+    # -- pm -------------------------------------------------------------------------------
+    def handle_pm(self, argv: List[str]) -> None:
+        import render_pm
+        from render_common import bug_rollup
+
+        args = render_pm.parse_args(argv)
+        if args.portfolio:
+            render_pm._run_portfolio(args, self.repo_root)
+            return
+        projectplan_path, issues_path, pm_path, ui_root = render_pm._resolve_paths(args, self.repo_root)
+        watch = self.tree((self.repo_root / "AI_first" / "docs", self.repo_root / "AI_first" / "projects"))
+        key = (watch.generation, _stat_sig(projectplan_path))
+        sources = render_pm._open_sources(args)
+        cached = self.projects.get(projectplan_path)
+        if cached and cached[0] == key:
+            projects = cached[1]
+        else:
+            projects = render_pm._build_projects(self.repo_root, projectplan_path, sources)
+            self.projects[projectplan_path] = (key, projects)
+        issues_sig = _stat_sig(issues_path)
+        cached_rollup = self.bug_rollups.get(issues_path)
+        if cached_rollup and cached_rollup[0] == issues_sig:
+            rollup = cached_rollup[1]
+        else:
+            rollup = bug_rollup(issues_path)
+            self.bug_rollups[issues_path] = (issues_sig, rollup)
+        render_pm._write_outputs(
+            projects,
+            rollup,
+            pm_path,
+            ui_root,
+            self.repo_root,
+            args.dry_run,
+            lazy=args.lazy,
+            rollup_path=(self.repo_root / args.rollup).resolve(),
+            sources=sources,
+        )
+        if not args.no_links and not args.dry_run:
+            from link_graph import open_graph
+
+            render_pm.record_links(open_graph(self.repo_root), projects, ui_root, self.repo_root)
+        sources.save()
+
+    def handle(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        command = payload.get("command")
+        if command == "status":
+            return {"handled": True, "status": self.status()}
+        if command not in COMMANDS:
+            return {"handled": False, "error": f"unknown command {command!r}"}
+        if Path(payload.get("repo_root", "")) != self.repo_root:
+            return {"handled": False, "error": "daemon serves a different repo root"}
+        handler = getattr(self, f"handle_{command}")
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = 0
+        previous_cwd = os.getcwd()
+        with self.lock:
+            self.requests += 1
+            try:
+                os.chdir(payload.get("cwd") or previous_cwd)
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    handler(list(payload.get("argv", [])))
+            except SystemExit as exc:
+                if isinstance(exc.code, int):
+                    code = exc.code
+                elif exc.code is not None:
+                    stderr.write(f"{exc.code}\n")
+                    code = 1
+            except Exception as exc:
+                stderr.write(f"aifirst daemon error: {exc!r}\n")
+                code = 1
+            finally:
+                os.chdir(previous_cwd)
+        return {"handled": True, "code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "repo_root": str(self.repo_root),
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "watched_files": sum(len(watch.files) for watch in self.trees.values()),
+            "cached_docs": len(self.doc_cache),
+            "cached_issue_stores": len(self.issue_rows),
+            "cached_project_models": len(self.projects),
+        }
+
+
+def _watch_loop(state: _State, interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        with state.lock:
+            try:
+                state.poll_all()
+            except Exception as exc:
+                print(f"[watch] refresh failed: {exc!r}", file=sys.stderr)
+
+
+def _read_request(conn: Any) -> Optional[Dict[str, Any]]:
+    """The JSON object a client sent, or None when it is not one; raises OSError on timeout."""
+    data = b""
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    try:
+        payload = json.loads(data.decode("utf-8"))
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def serve(repo_root: Path, interval: float) -> None:
+    import socket
+
+    path = socket_path(repo_root)
+    if path.exists():
+        try:
+            _request(path, {"command": "status"}, 1.0)
+        except (OSError, ValueError):
+            path.unlink()
+        else:
+            raise SystemExit(f"Daemon already running on {path}")
+    scripts_dir = str(Path(__file__).resolve().parent)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+
+    state = _State(repo_root)
+    stop = threading.Event()
+    watcher = threading.Thread(target=_watch_loop, args=(state, interval, stop), daemon=True)
+    watcher.start()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(16)
+    print(f"AI_first daemon listening on {path} (Ctrl+C to stop)...")
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(REQUEST_TIMEOUT)
+                try:
+                    payload = _read_request(conn)
+                except OSError:
+                    continue
+                try:
+                    if payload is None:
+                        conn.sendall(json.dumps({"handled": False, "error": "malformed request"}).encode("utf-8"))
+                        continue
+                    if payload.get("command") == "stop":
+                        conn.sendall(json.dumps({"handled": True, "stopping": True}).encode("utf-8"))
+                        break
+                    reply = state.handle(payload)
+                    conn.sendall(json.dumps(reply).encode("utf-8"))
+                except OSError:
+                    continue
+    except KeyboardInterrupt:
+        print("Stopped.")
+    finally:
+        stop.set()
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve AI_first CLI commands from an in-memory cache")
+    parser.add_argument("action", choices=["serve", "status", "stop"], help="Daemon action")
+    parser.add_argument("--interval", type=float, default=0.5, help="File polling interval in seconds")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    repo_root = Path(__file__).resolve().parents[2]
+    if args.action == "serve":
+        serve(repo_root, args.interval)
+        return
+    path = socket_path(repo_root)
+    try:
+        reply = _request(path, {"command": args.action}, 5.0)
+    except (OSError, ValueError):
+        raise SystemExit(f"No daemon running on {path}")
+    if args.action == "status":
+        print(json.dumps(reply.get("status", {}), indent=2, sort_keys=True))
+    else:
+        print(f"Stopped daemon on {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,913 @@
+#!/usr/bin/env python3
+"""Local benchmarks for AI_first tooling hot paths.
+
+Run from the repo root, e.g. `python3 AI_first/scripts/benchmarks.py writes --writers 32`.
+Benchmarks work on temporary copies and never touch the real stores or UI outputs.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+MARKDOWN_CORPUS = SCRIPTS_DIR / "markdown_corpus.json"
+MARKDOWN_JS = SCRIPTS_DIR.parent / "ui" / "assets" / "markdown.js"
+# Import overhead allowed on top of a bare interpreter start for `aifirst.py <command> --help`.
+COLD_START_BUDGET_MS = 60.0
+# Per-doubling time growth above which a parser counts as superlinear (quadratic paths show ~4).
+PARSER_GROWTH_LIMIT = 2.5
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def _writer(store: str, writer: int, records: int, group_commit: bool, barrier, results) -> None:
+    import issues
+
+    barrier.wait()
+    fsyncs = 0
+    for seq in range(1, records + 1):
+        fields = {
+            "project": "bugmgmt",
+            "phase": "01",
+            "stage": "foundation",
+            "area": "bench",
+            "severity": "minor",
+            "summary": f"Benchmark issue {writer}/{seq}",
+        }
+        issue_id = f"BMG-{2000 + writer:04d}-01-{seq:03d}"
+        _, synced = issues._write_issue(Path(store), issue_id, fields, create=True, group_commit=group_commit)
+        fsyncs += int(synced)
+    results.put(fsyncs)
+
+
+def bench_writes(writers: int, records: int) -> List[Dict[str, object]]:
+    """Concurrent `add` throughput with group commit versus one fsync per append."""
+    if records > 999:
+        raise SystemExit("--records must be <= 999 (one ID month per writer)")
+    rows: List[Dict[str, object]] = []
+    for group_commit in (True, False):
+        with tempfile.TemporaryDirectory(prefix="bench-writes-") as tmp:
+            store = Path(tmp) / "issues.jsonl"
+            barrier = multiprocessing.Barrier(writers + 1)
+            results = multiprocessing.Queue()
+            procs = [
+                multiprocessing.Process(target=_writer, args=(str(store), w, records, group_commit, barrier, results))
+                for w in range(writers)
+            ]
+            for proc in procs:
+                proc.start()
+            barrier.wait()
+            start = time.perf_counter()
+            fsyncs = sum(results.get() for _ in procs)
+            elapsed = time.perf_counter() - start
+            for proc in procs:
+                proc.join()
+            lines = sum(1 for _ in store.open(encoding="utf-8"))
+        total = writers * records
+        rows.append(
+            {
+                "mode": "group commit" if group_commit else "fsync per append",
+                "writers": writers,
+                "records": total,
+                "stored": lines,
+                "seconds": round(elapsed, 3),
+                "records_per_s": round(total / elapsed, 1) if elapsed else 0.0,
+                "fsyncs": fsyncs,
+            }
+        )
+    return rows
+
+
+def bench_bodies(count: int, body_bytes: int, runs: int) -> List[Dict[str, object]]:
+    """List-scan time and peak memory for an inline store versus the same store split into bodies."""
+    import tracemalloc
+
+    import issues
+
+    filler = ("Steps to reproduce, observed and expected behaviour, and notes. " * (body_bytes // 64 + 1))[:body_bytes]
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-bodies-") as tmp:
+        store = Path(tmp) / "issues.jsonl"
+        with store.open("w", encoding="utf-8") as f:
+            for seq in range(1, count + 1):
+                record = {
+                    "id": f"BMG-2025-01-{seq:05d}",
+                    "date": "2025-01-05",
+                    "project": "bugmgmt",
+                    "phase": "01",
+                    "stage": "foundation",
+                    "area": "bench",
+                    "status": "open",
+                    "severity": "minor",
+                    "summary": f"Benchmark issue {seq}",
+                    "owner": "bench",
+                    "root_cause": filler,
+                    "proposed_fix": filler,
+                    "qa_reproduction": filler,
+                }
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        target = f"BMG-2025-01-{count // 2:05d}"
+        for layout in ("inline", "split"):
+            issues._compact(store, layout)
+            samples = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                issues._prepare_rows(store)
+                samples.append((time.perf_counter() - start) * 1000)
+            tracemalloc.start()
+            issues._prepare_rows(store)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            start = time.perf_counter()
+            record = issues._get_issue(store, target)
+            get_ms = (time.perf_counter() - start) * 1000
+            rows.append(
+                {
+                    "layout": layout,
+                    "issues": count,
+                    "store_kb": store.stat().st_size // 1024,
+                    "list_ms": round(statistics.median(samples), 1),
+                    "list_peak_mb": round(peak / 2**20, 1),
+                    "get_ms": round(get_ms, 2),
+                    "get_fields": len(record or {}),
+                }
+            )
+    return rows
+
+
+def _write_log_doc(path: Path, size_mb: float) -> None:
+    """A stage action file with a long execution log: headings, lists, tables, and code blocks."""
+    chunk = "\n".join(
+        [
+            "## Run {n}",
+            "- Started `step {n}` with [notes](notes.md) attached",
+            "- Result: **ok**",
+            "",
+            "| Check | Status |",
+            "|---|---|",
+            "| lint | pass |",
+            "| tests | pass |",
+            "",
+            "```",
+            "$ python3 run.py --step {n}",
+            "done in 1.2s",
+            "```",
+            "Plain paragraph describing what happened during run {n}.",
+            "",
+        ]
+    )
+    target = int(size_mb * 2**20)
+    written = 0
+    with path.open("w", encoding="utf-8") as f:
+        f.write("# Execution log\n\n")
+        n = 0
+        while written < target:
+            text = chunk.format(n=n) + "\n"
+            f.write(text)
+            written += len(text)
+            n += 1
+
+
+def bench_docs(size_mb: float) -> List[Dict[str, object]]:
+    """Peak memory and time to render one large markdown file, buffered versus streamed."""
+    import tracemalloc
+
+    import render_docs
+
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-docs-") as tmp:
+        root = Path(tmp)
+        md_path = root / "AI_first" / "projects" / "bench" / "actions" / "log_action.md"
+        md_path.parent.mkdir(parents=True)
+        _write_log_doc(md_path, size_mb)
+        out_path = root / "AI_first" / "ui" / "docs" / "projects" / "bench" / "actions" / "log_action.html"
+        out_path.parent.mkdir(parents=True)
+
+        def buffered() -> None:
+            md_text = md_path.read_text(encoding="utf-8")
+            title = render_docs._extract_title(md_text.splitlines(), md_path.stem)
+            page = render_docs._doc_page(md_path, out_path, root, title, render_docs._render_markdown(md_text))
+            out_path.write_text(page, encoding="utf-8")
+
+        def streamed() -> None:
+            render_docs._build_doc(md_path, out_path, root)
+
+        pages = {}
+        for mode, render in (("buffered", buffered), ("streamed", streamed)):
+            start = time.perf_counter()
+            render()
+            elapsed = time.perf_counter() - start
+            pages[mode] = out_path.read_bytes()
+            tracemalloc.start()
+            render()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            rows.append(
+                {
+                    "mode": mode,
+                    "doc_mb": round(md_path.stat().st_size / 2**20, 1),
+                    "seconds": round(elapsed, 2),
+                    "peak_mb": round(peak / 2**20, 1),
+                }
+            )
+        for row in rows:
+            row["same_output"] = pages["buffered"] == pages["streamed"]
+    return rows
+
+
+def bench_columns(count: int, runs: int) -> List[Dict[str, object]]:
+    """issues.py list preparation: dict-per-issue rows versus the columnar model, rebuilt, read from
+    its snapshot, and caught up after appends; each variant's export is compared with the dict one."""
+    import hashlib
+    import random
+    import tracemalloc
+
+    import issue_columns
+    import issues
+
+    rng = random.Random(11)
+
+    def record(seq: int) -> Dict[str, object]:
+        return {
+            "id": f"BMG-2025-{seq % 12 + 1:02d}-{seq:06d}",
+            "date": f"2025-{seq % 12 + 1:02d}-{seq % 28 + 1:02d}",
+            "project": "bugmgmt",
+            "phase": f"{rng.randint(1, 6):02d}",
+            "stage": rng.choice(["foundation", "build", "verify", "release"]),
+            "area": rng.choice(["ui", "cli", "docs", "store", "daemon"]),
+            "status": rng.choice(issues.STATUS_ORDER),
+            "severity": rng.choice(issues.SEVERITY_ORDER),
+            "summary": f"Benchmark issue {seq}",
+            "owner": rng.choice(["alice", "bob", "carol", "unassigned"]),
+        }
+
+    def append(store: Path, seqs: range) -> None:
+        with store.open("a", encoding="utf-8") as f:
+            for seq in seqs:
+                f.write(json.dumps(record(seq), separators=(",", ":")) + "\n")
+
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-columns-") as tmp:
+        store = Path(tmp) / "issues.jsonl"
+        snapshot = issue_columns.columns_path(store)
+        append(store, range(1, count + 1))
+        # Re-file a tenth of the issues so the store holds superseded records.
+        append(store, range(1, count + 1, 10))
+
+        def export_digest(prepared: object) -> str:
+            out = Path(tmp) / "export.json"
+            issues._export(prepared, "json", out, [store])
+            return hashlib.sha1(out.read_bytes()).hexdigest()
+
+        def measure(mode: str, prepare: Callable[[], object], setup: Callable[[], None]) -> Dict[str, object]:
+            samples = []
+            for _ in range(runs):
+                setup()
+                start = time.perf_counter()
+                prepare()
+                samples.append((time.perf_counter() - start) * 1000)
+            setup()
+            tracemalloc.start()
+            prepared = prepare()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            start = time.perf_counter()
+            header = issues._export_header(prepared)
+            header_ms = (time.perf_counter() - start) * 1000
+            return {
+                "mode": mode,
+                "issues": header["count"],
+                "prepare_ms": round(statistics.median(samples), 1),
+                "peak_mb": round(peak / 2**20, 1),
+                "header_ms": round(header_ms, 1),
+                "export": export_digest(prepared),
+            }
+
+        def drop_snapshot() -> None:
+            snapshot.unlink(missing_ok=True)
+
+        def keep_snapshot() -> None:
+            if not snapshot.exists():
+                issue_columns.load_columns(store)
+
+        rows.append(measure("dicts", lambda: issues._prepare_rows(store), lambda: None))
+        rows.append(measure("columns, no snapshot", lambda: issues._prepare_columns(store), drop_snapshot))
+        rows.append(measure("columns, snapshot", lambda: issues._prepare_columns(store), keep_snapshot))
+        extra = max(1, count // 100)
+        baseline = store.read_bytes()
+
+        def appended() -> None:
+            store.write_bytes(baseline)
+            drop_snapshot()
+            issue_columns.load_columns(store)
+            append(store, range(count + 1, count + extra + 1))
+
+        rows.append(measure(f"columns, {extra} appended", lambda: issues._prepare_columns(store), appended))
+        rows.append(measure(f"dicts, {extra} appended", lambda: issues._prepare_rows(store), lambda: None))
+        store_kb = store.stat().st_size // 1024
+        snapshot_kb = snapshot.stat().st_size // 1024
+    expected = {row["issues"]: row["export"] for row in rows if row["mode"].startswith("dicts")}
+    for row in rows:
+        row["export_matches"] = row.pop("export") == expected[row["issues"]]
+        row["store_kb"] = store_kb
+        row["snapshot_kb"] = snapshot_kb
+    return rows
+
+
+def bench_stats(count: int) -> List[Dict[str, object]]:
+    """issues.py stats over a generated store, with NumPy (when installed) and with the pure-Python path."""
+    import importlib.util
+    import random
+    from datetime import date
+
+    import issue_columns
+    import issue_stats
+    import issues
+
+    rng = random.Random(5)
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-stats-") as tmp:
+        store = Path(tmp) / "issues.jsonl"
+        with store.open("w", encoding="utf-8") as f:
+            for seq in range(1, count + 1):
+                opened = 738000 + rng.randint(0, 700)
+                record = {
+                    "id": f"BMG-2025-01-{seq:07d}",
+                    "date": date.fromordinal(opened).isoformat(),
+                    "project": rng.choice(["bugmgmt", "project_management"]),
+                    "status": rng.choice(issues.STATUS_ORDER),
+                    "severity": rng.choice(issues.SEVERITY_ORDER),
+                    "summary": f"Benchmark issue {seq}",
+                }
+                if record["status"] == "closed":
+                    record["date_closed"] = date.fromordinal(opened + int(rng.expovariate(1 / 20))).isoformat()
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        # Build the columnar snapshot first, as any earlier list/stats run would have.
+        issue_columns.load_columns(store)
+        start = time.perf_counter()
+        cols = issue_columns.load_columns(store)
+        load_ms = (time.perf_counter() - start) * 1000
+        outputs = {}
+        engines = [True, False] if importlib.util.find_spec("numpy") else [False]
+        for use_numpy in engines:
+            start = time.perf_counter()
+            outputs[use_numpy] = json.dumps(issue_stats.compute_stats(cols, use_numpy=use_numpy))
+            rows.append(
+                {
+                    "engine": "numpy" if use_numpy else "python",
+                    "issues": count,
+                    "load_ms": round(load_ms, 1),
+                    "stats_ms": round((time.perf_counter() - start) * 1000, 1),
+                }
+            )
+    for row in rows:
+        row["matches_python"] = outputs[row["engine"] == "numpy"] == outputs[False]
+    return rows
+
+
+def bench_search(docs: int, words: int) -> List[Dict[str, object]]:
+    """Docs search index: full build versus re-indexing one edited document."""
+    import random
+
+    import search_index
+
+    rng = random.Random(7)
+    vocab = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10))) for _ in range(20000)
+    ]
+
+    def text_for(n: int) -> List[str]:
+        body = [" ".join(rng.choice(vocab) for _ in range(12)) for _ in range(words // 12)]
+        return [f"# Doc {n}", "", *body]
+
+    def index_doc(index: "search_index.SearchIndex", n: int, lines: List[str]) -> None:
+        text = search_index.DocText()
+        for _ in text.feed(lines):
+            pass
+        index.update(f"docs/doc{n}.html", f"Doc {n}", f"AI_first/docs/doc{n}.md", text)
+
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-search-") as tmp:
+        root = Path(tmp)
+        corpus = [text_for(n) for n in range(docs)]
+        start = time.perf_counter()
+        index = search_index.SearchIndex(root / "search", root, root / "cache")
+        for n, lines in enumerate(corpus):
+            index_doc(index, n, lines)
+        written = index.save()
+        rows.append({"mode": "full build", "docs": docs, "seconds": round(time.perf_counter() - start, 3), "shards_written": written})
+
+        corpus[0] = corpus[0] + ["An appended paragraph about zebra crossings."]
+        start = time.perf_counter()
+        index = search_index.SearchIndex(root / "search", root, root / "cache")
+        index_doc(index, 0, corpus[0])
+        written = index.save()
+        rows.append({"mode": "one doc edited", "docs": 1, "seconds": round(time.perf_counter() - start, 3), "shards_written": written})
+        total = len(list((root / "search" / search_index.SHARDS_DIR).glob("*.js")))
+    for row in rows:
+        row["shards_total"] = total
+    return rows
+
+
+def bench_render_cache(docs: int, words: int) -> List[Dict[str, object]]:
+    """render_docs: no cache, filling the shared cache, and a fresh worktree reading from it."""
+    import hashlib
+    import random
+
+    import render_docs
+    import search_index
+    from render_cache import RenderCache, renderer_version, stats
+
+    rng = random.Random(11)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10))) for _ in range(5000)]
+
+    def sentence() -> str:
+        return " ".join(rng.choice(vocab) for _ in range(12))
+
+    sources: List[str] = []
+    for n in range(docs):
+        lines = [f"# Doc {n}", ""]
+        while len(lines) * 12 < words:
+            lines += [f"## {sentence()[:30]}", "", sentence(), f"- `{rng.choice(vocab)}` {sentence()}", ""]
+            lines += ["| Field | Value |", "| --- | --- |", f"| {rng.choice(vocab)} | [link](doc{n}.md) |", ""]
+        sources.append("\n".join(lines))
+
+    def build(repo: Path, cache: Optional[RenderCache]) -> Dict[str, object]:
+        docs_root = repo / "AI_first" / "docs"
+        for n, text in enumerate(sources):
+            path = docs_root / f"sub{n % 10}" / f"doc{n}.md"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+        out_root = repo / "AI_first" / "ui" / "docs"
+        index = search_index.open_index(repo)
+        fragments = render_docs.open_fragments(repo)
+        start = time.perf_counter()
+        for md_path, out_path in render_docs._doc_targets(docs_root, repo / "AI_first" / "projects", out_root):
+            render_docs._build_doc(md_path, out_path, repo, index, fragments, cache)
+        index.save()
+        fragments.save()
+        if cache is not None:
+            cache.close()
+        seconds = time.perf_counter() - start
+        digest = hashlib.sha1()
+        for path in sorted((repo / "AI_first" / "ui").rglob("*")):
+            if path.is_file():
+                digest.update(path.relative_to(repo).as_posix().encode("utf-8") + b"\0" + path.read_bytes())
+        return {"seconds": round(seconds, 3), "outputs": digest.hexdigest()}
+
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-render-cache-") as tmp:
+        root = Path(tmp)
+        version = renderer_version(SCRIPTS_DIR / "render_docs.py", SCRIPTS_DIR / "search_index.py")
+        baseline = build(root / "plain", None)
+        cache = RenderCache(root / "cache", version, 1 << 40)
+        cold = build(root / "worktree-a", cache)
+        warm_cache = RenderCache(root / "cache", version, 1 << 40)
+        warm = build(root / "worktree-b", warm_cache)
+        cache_mb = round(stats(root / "cache")["bytes"] / 1e6, 1)
+        for mode, result, used in (
+            ("no cache", baseline, None),
+            ("cold cache", cold, cache),
+            ("warm cache, new worktree", warm, warm_cache),
+        ):
+            rows.append(
+                {
+                    "mode": mode,
+                    "docs": docs,
+                    "seconds": result["seconds"],
+                    "reused": "-" if used is None else used.hits,
+                    "cache_mb": "-" if used is None else cache_mb,
+                    "matches": result["outputs"] == baseline["outputs"],
+                }
+            )
+    return rows
+
+
+def bench_links(docs: int, refs: int) -> List[Dict[str, object]]:
+    """Link graph: broken-reference check after one move, incremental versus a full scan."""
+    import contextlib
+    import io
+    import random
+
+    import render_docs
+    from link_graph import LinkGraph
+
+    rng = random.Random(5)
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-links-") as tmp:
+        repo = Path(tmp)
+        docs_root = repo / "AI_first" / "docs"
+        names = [f"AI_first/docs/area{n % 20}/doc{n}.md" for n in range(docs)]
+        for n, name in enumerate(names):
+            path = repo / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            cited = rng.sample(names, min(refs, docs))
+            path.write_text(f"# Doc {n}\n\n" + "".join(f"- See `{target}`.\n" for target in cited), encoding="utf-8")
+        links = LinkGraph(repo / "links.json")
+        start = time.perf_counter()
+        for md_path, out_path in render_docs._doc_targets(docs_root, repo / "AI_first" / "projects", repo / "out"):
+            render_docs._build_doc(md_path, out_path, repo, links=links)
+        links.save()
+        rows.append({"mode": "full build", "seconds": round(time.perf_counter() - start, 3), "sources_checked": docs, "broken": 0})
+
+        moved = repo / names[0]
+        moved.rename(moved.with_name("renamed.md"))
+        changed = [moved, moved.with_name("renamed.md")]
+        start = time.perf_counter()
+        links = LinkGraph(repo / "links.json")
+        rows.append({"mode": "load graph", "seconds": round(time.perf_counter() - start, 3), "sources_checked": "-", "broken": "-"})
+        start = time.perf_counter()
+        found = links.broken(repo, [name for name in names if (repo / name).exists()])
+        rows.append(
+            {
+                "mode": "full broken scan",
+                "seconds": round(time.perf_counter() - start, 3),
+                "sources_checked": docs - 1,
+                "broken": len(found),
+            }
+        )
+        links = LinkGraph(repo / "links.json")
+        start = time.perf_counter()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            render_docs._finish_links(links, repo, [], changed)
+        reported = sum(1 for line in out.getvalue().splitlines() if " -> " in line)
+        suspects = len(links.sources(names[0]))
+        rows.append(
+            {
+                "mode": "after one move",
+                "seconds": round(time.perf_counter() - start, 3),
+                "sources_checked": suspects,
+                "broken": reported,
+            }
+        )
+    for row in rows:
+        row["docs"] = docs
+    return rows
+
+
+# Runs assets/markdown.js under node with just enough of `window`/`document` for it to load.
+_NODE_MARKDOWN = r"""
+const fs = require("fs");
+const crypto = require("crypto");
+const [corpusPath, scriptPath, docPath, repeat] = process.argv.slice(1);
+globalThis.window = { location: { href: "file:///bench/" } };
+globalThis.document = { currentScript: null, addEventListener() {} };
+eval(fs.readFileSync(scriptPath, "utf8"));
+const render = window.Markdown.render;
+const corpus = JSON.parse(fs.readFileSync(corpusPath, "utf8"));
+const outputs = {};
+corpus.forEach((c) => { outputs[c.name] = render(c.markdown); });
+let start = process.hrtime.bigint();
+for (let r = 0; r < Number(repeat); r += 1) corpus.forEach((c) => render(c.markdown));
+const corpusMs = Number(process.hrtime.bigint() - start) / 1e6 / Number(repeat);
+const doc = fs.readFileSync(docPath, "utf8");
+start = process.hrtime.bigint();
+const html = render(doc);
+const docMs = Number(process.hrtime.bigint() - start) / 1e6;
+const docHash = crypto.createHash("sha1").update(html, "utf8").digest("hex");
+process.stdout.write(JSON.stringify({ outputs, corpusMs, docMs, docHash }));
+"""
+
+
+def bench_markdown(size_mb: float, repeat: int) -> List[Dict[str, object]]:
+    """Conformance of render_docs.py and assets/markdown.js on the shared corpus, and each one's speed."""
+    import hashlib
+    import shutil
+
+    import render_docs
+
+    corpus = json.loads(MARKDOWN_CORPUS.read_text(encoding="utf-8"))
+    rows: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench-markdown-") as tmp:
+        doc_path = Path(tmp) / "log_action.md"
+        _write_log_doc(doc_path, size_mb)
+        doc = doc_path.read_text(encoding="utf-8")
+
+        failed = [case["name"] for case in corpus if render_docs._render_markdown(case["markdown"]) != case["html"]]
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for case in corpus:
+                render_docs._render_markdown(case["markdown"])
+        corpus_ms = (time.perf_counter() - start) * 1000 / repeat
+        start = time.perf_counter()
+        reference = render_docs._render_markdown(doc)
+        doc_ms = (time.perf_counter() - start) * 1000
+        reference_hash = hashlib.sha1(reference.encode("utf-8")).hexdigest()
+        rows.append(
+            {
+                "renderer": "python (render_docs.py)",
+                "corpus": f"{len(corpus) - len(failed)}/{len(corpus)}",
+                "corpus_ms": round(corpus_ms, 2),
+                "doc_mb": round(size_mb, 1),
+                "doc_ms": round(doc_ms, 1),
+                "doc_matches": True,
+                "failed": ", ".join(failed) or "-",
+            }
+        )
+
+        node = shutil.which("node")
+        if node is None:
+            rows.append(
+                {
+                    "renderer": "js (assets/markdown.js)",
+                    "corpus": "skipped: node not found",
+                    "corpus_ms": "-",
+                    "doc_mb": round(size_mb, 1),
+                    "doc_ms": "-",
+                    "doc_matches": "-",
+                    "failed": "-",
+                }
+            )
+            return rows
+        result = subprocess.run(
+            [node, "-e", _NODE_MARKDOWN, str(MARKDOWN_CORPUS), str(MARKDOWN_JS), str(doc_path), str(repeat)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        js = json.loads(result.stdout)
+        failed = [case["name"] for case in corpus if js["outputs"].get(case["name"]) != case["html"]]
+        rows.append(
+            {
+                "renderer": "js (assets/markdown.js)",
+                "corpus": f"{len(corpus) - len(failed)}/{len(corpus)}",
+                "corpus_ms": round(js["corpusMs"], 2),
+                "doc_mb": round(size_mb, 1),
+                "doc_ms": round(js["docMs"], 1),
+                "doc_matches": js["docHash"] == reference_hash,
+                "failed": ", ".join(failed) or "-",
+            }
+        )
+    return rows
+
+
+def _time_command(cmd: List[str], runs: int) -> float:
+    # Measure the normal case of a warm bytecode cache: allow .pyc writes and discard a warm-up run.
+    env = dict(os.environ, AIFIRST_NO_DAEMON="1")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, env=env)
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, env=env)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench_startup(runs: int, budget_ms: float) -> List[Dict[str, object]]:
+    """Median cold-start time per `aifirst.py` command versus a bare `python3 -c pass`."""
+    from aifirst import COMMANDS
+
+    baseline = _time_command([sys.executable, "-c", "pass"], runs)
+    entry = str(SCRIPTS_DIR / "aifirst.py")
+    rows: List[Dict[str, object]] = [
+        {
+            "command": "python3 -c pass",
+            "median_ms": round(baseline, 1),
+            "overhead_ms": 0.0,
+            "budget": "",
+            "direct_script_ms": "",
+        }
+    ]
+    for command in ["--help", *COMMANDS]:
+        cmd = [sys.executable, entry] + ([command] if command == "--help" else [command, "--help"])
+        median = _time_command(cmd, runs)
+        overhead = median - baseline
+        row: Dict[str, object] = {
+            "command": " ".join(["aifirst.py", *cmd[2:]]),
+            "median_ms": round(median, 1),
+            "overhead_ms": round(overhead, 1),
+            "budget": "ok" if overhead <= budget_ms else f"over {budget_ms:g}ms",
+        }
+        if command in COMMANDS:
+            # Scripts run directly are compiled on every start; imported modules reuse cached bytecode.
+            script = str(SCRIPTS_DIR / f"{COMMANDS[command][0]}.py")
+            row["direct_script_ms"] = round(_time_command([sys.executable, script, "--help"], runs), 1)
+        else:
+            row["direct_script_ms"] = ""
+        rows.append(row)
+    return rows
+
+
+def _parser_cases() -> Dict[str, Callable[[int], Callable[[], object]]]:
+    """Adversarial inputs of size n for each markdown/HTML parse path, as zero-argument calls."""
+    import render_common
+    import render_docs
+    import render_pm
+
+    root = SCRIPTS_DIR.parents[1]
+    dash = render_pm.EM_DASH
+    return {
+        "docs table separator (space run)": lambda n: lambda: render_docs._render_markdown(
+            "a | b\n" + " " * n + "---|---x"
+        ),
+        "docs table separator (many cells)": lambda n: lambda: render_docs._render_markdown(
+            "a | b\n" + "|---" * n + "|x"
+        ),
+        "docs links (unclosed brackets)": lambda n: lambda: render_docs._render_markdown("[" * n),
+        "docs links (unclosed targets)": lambda n: lambda: render_docs._render_markdown("[a](" * n),
+        "docs lists": lambda n: lambda: render_docs._render_markdown("- item\n" * (n // 7)),
+        "pm list summary links": lambda n: lambda: render_pm._render_list_summary("- " + "[a](" * n),
+        "pm field after blank lines": lambda n: lambda: render_pm._extract_field("\n" * n + "x", "Status"),
+        "pm field value spaces": lambda n: lambda: render_pm._extract_field(
+            "- **Status:**" + " " * n, "Status"
+        ),
+        "pm stage actions": lambda n: lambda: render_pm._extract_stage_actions(
+            "`AI_first/projects/" + "x/actions/" * (n // 10), root
+        ),
+        "pm phase line (space run)": lambda n: lambda: render_pm.PHASE_LINE.match(
+            f"  - Phase 1 {dash} a" + " " * n
+        ),
+        "pm phase line (words)": lambda n: lambda: render_pm.PHASE_LINE.match(
+            f"  - Phase 1 {dash} " + "a " * (n // 2) + "(Active)"
+        ),
+        "pm slot scan": lambda n: lambda: render_common.scan_slots(
+            '<div class="summary-card">' + " " * n + '<div class="muted small">x'
+        ),
+    }
+
+
+def bench_parsers(size: int, steps: int, repeat: int) -> List[Dict[str, object]]:
+    """Time each parse path on adversarial inputs that double in size, and flag superlinear growth."""
+    sizes = [size * 2**step for step in range(steps)]
+    rows: List[Dict[str, object]] = []
+    for name, build in _parser_cases().items():
+        timings = []
+        for n in sizes:
+            call = build(n)
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                call()
+                samples.append((time.perf_counter() - start) * 1000)
+            timings.append(min(samples))
+        # Geometric mean of the per-doubling ratios; tiny timings are floored to damp timer noise.
+        growth = (max(timings[-1], 0.05) / max(timings[0], 0.05)) ** (1 / max(len(sizes) - 1, 1))
+        row: Dict[str, object] = {"parser": name}
+        row.update({f"n={n}_ms": round(ms, 3) for n, ms in zip(sizes, timings)})
+        row["growth"] = round(growth, 2)
+        row["verdict"] = "linear" if growth <= PARSER_GROWTH_LIMIT else "superlinear"
+        rows.append(row)
+    return rows
+
+
+def _print_rows(rows: List[Dict[str, object]]) -> None:
+    if not rows:
+        return
+    headers = list(rows[0])
+    widths = [max(len(str(h)), *(len(str(row[h])) for row in rows)) for h in headers]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(row[h]).ljust(w) for h, w in zip(headers, widths)))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser = argparse.ArgumentParser(description="Benchmark AI_first tooling hot paths")
+    sub = parser.add_subparsers(dest="bench", required=True)
+    writes = sub.add_parser(
+        "writes",
+        parents=[common],
+        help="Concurrent issues.py add throughput (group commit vs per-append fsync)",
+    )
+    writes.add_argument("--writers", type=int, default=32, help="Concurrent writer processes")
+    writes.add_argument("--records", type=int, default=50, help="Records appended per writer")
+    startup = sub.add_parser(
+        "startup",
+        parents=[common],
+        help="Cold-start time of each aifirst.py command against the import budget",
+    )
+    startup.add_argument("--runs", type=int, default=7, help="Runs per command (median is reported)")
+    startup.add_argument(
+        "--budget-ms",
+        type=float,
+        default=COLD_START_BUDGET_MS,
+        help="Allowed overhead over a bare interpreter start",
+    )
+    startup.add_argument("--check", action="store_true", help="Exit non-zero when a command is over budget")
+    bodies = sub.add_parser(
+        "bodies",
+        parents=[common],
+        help="issues.py list cost with bodies inline versus split into <store>.bodies",
+    )
+    bodies.add_argument("--issues", type=int, default=5000, help="Issues in the generated store")
+    bodies.add_argument("--body-bytes", type=int, default=1500, help="Characters per free-text field")
+    bodies.add_argument("--runs", type=int, default=5, help="List runs per layout (median is reported)")
+    docs = sub.add_parser(
+        "docs",
+        parents=[common],
+        help="Peak memory rendering one large markdown file, buffered versus streamed",
+    )
+    docs.add_argument("--size-mb", type=float, default=8, help="Size of the generated markdown file")
+    markdown = sub.add_parser(
+        "markdown",
+        parents=[common],
+        help="render_docs.py and markdown.js on the shared conformance corpus (needs node for the JS side)",
+    )
+    markdown.add_argument("--size-mb", type=float, default=2, help="Size of the generated markdown file timed")
+    markdown.add_argument("--repeat", type=int, default=50, help="Passes over the corpus (mean is reported)")
+    markdown.add_argument("--check", action="store_true", help="Exit non-zero when a renderer diverges")
+    columns = sub.add_parser(
+        "columns",
+        parents=[common],
+        help="issues.py list: dict rows versus the columnar model and its snapshot",
+    )
+    columns.add_argument("--issues", type=int, default=100000, help="Issues in the generated store (try 1000000)")
+    columns.add_argument("--runs", type=int, default=3, help="Runs per mode (median is reported)")
+    columns.add_argument("--check", action="store_true", help="Exit non-zero when an export differs from the dict path")
+    stats = sub.add_parser(
+        "stats",
+        parents=[common],
+        help="issues.py stats (cycle time, aging, SLA) with and without NumPy",
+    )
+    stats.add_argument("--issues", type=int, default=1000000, help="Issues in the generated store")
+    stats.add_argument("--check", action="store_true", help="Exit non-zero when the NumPy and Python results differ")
+    search = sub.add_parser(
+        "search",
+        parents=[common],
+        help="Docs search index: full build versus re-indexing one edited document",
+    )
+    search.add_argument("--docs", type=int, default=300, help="Generated documents")
+    search.add_argument("--words", type=int, default=2000, help="Words per document")
+    links = sub.add_parser(
+        "links",
+        parents=[common],
+        help="Link graph: broken references after one move, incremental versus a full scan",
+    )
+    links.add_argument("--docs", type=int, default=5000, help="Generated documents")
+    links.add_argument("--refs", type=int, default=20, help="Path references per document")
+    render_cache = sub.add_parser(
+        "render-cache",
+        parents=[common],
+        help="render_docs.py with no cache, a cold shared cache, and a warm one from a fresh worktree",
+    )
+    render_cache.add_argument("--docs", type=int, default=500, help="Generated documents")
+    render_cache.add_argument("--words", type=int, default=1500, help="Words per document")
+    render_cache.add_argument("--check", action="store_true", help="Exit non-zero when cached outputs differ")
+    parsers = sub.add_parser(
+        "parsers",
+        parents=[common],
+        help="Markdown/HTML parse paths on adversarial inputs (flags superlinear growth)",
+    )
+    parsers.add_argument("--size", type=int, default=20000, help="Smallest input size in characters")
+    parsers.add_argument("--steps", type=int, default=3, help="Number of doublings of the input size")
+    parsers.add_argument("--repeat", type=int, default=5, help="Runs per size (fastest is reported)")
+    parsers.add_argument("--check", action="store_true", help="Exit non-zero when a parser grows superlinearly")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.bench == "writes":
+        rows = bench_writes(args.writers, args.records)
+    elif args.bench == "startup":
+        rows = bench_startup(args.runs, args.budget_ms)
+    elif args.bench == "bodies":
+        rows = bench_bodies(args.issues, args.body_bytes, args.runs)
+    elif args.bench == "docs":
+        rows = bench_docs(args.size_mb)
+    elif args.bench == "markdown":
+        rows = bench_markdown(args.size_mb, args.repeat)
+    elif args.bench == "columns":
+        rows = bench_columns(args.issues, args.runs)
+    elif args.bench == "stats":
+        rows = bench_stats(args.issues)
+    elif args.bench == "search":
+        rows = bench_search(args.docs, args.words)
+    elif args.bench == "links":
+        rows = bench_links(args.docs, args.refs)
+    elif args.bench == "render-cache":
+        rows = bench_render_cache(args.docs, args.words)
+    elif args.bench == "parsers":
+        rows = bench_parsers(args.size, args.steps, args.repeat)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        _print_rows(rows)
+    if args.bench == "startup" and args.check and any(str(row["budget"]).startswith("over") for row in rows):
+        raise SystemExit(1)
+    if args.bench == "markdown" and args.check and any(row["failed"] != "-" or row["doc_matches"] is False for row in rows):
+        raise SystemExit(1)
+    if args.bench == "columns" and args.check and not all(row["export_matches"] for row in rows):
+        raise SystemExit(1)
+    if args.bench == "stats" and args.check and not all(row["matches_python"] for row in rows):
+        raise SystemExit(1)
+    if args.bench == "render-cache" and args.check and not all(row["matches"] for row in rows):
+        raise SystemExit(1)
+    if args.bench == "parsers" and args.check and any(row["verdict"] != "linear" for row in rows):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
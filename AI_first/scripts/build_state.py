@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Shared build-state helpers for incremental renders (git change detection and stamps).
+
+State lives under `AI_first/.cache/` (git-ignored) so regenerated outputs stay deterministic.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+STATE_FILE = "build_state.json"
+
+
+def state_dir(repo_root: Path) -> Path:
+    return repo_root / "AI_first" / ".cache"
+
+
+def _git(repo_root: Path, *args: str) -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_root), *args],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+
+def git_head(repo_root: Path) -> Optional[str]:
+    out = _git(repo_root, "rev-parse", "HEAD")
+    return out.strip() if out else None
+
+
+def _git_toplevel(repo_root: Path) -> Optional[Path]:
+    out = _git(repo_root, "rev-parse", "--show-toplevel")
+    return Path(out.strip()).resolve() if out else None
+
+
+def _dirty_paths(toplevel: Path, repo_root: Path) -> Optional[Set[Path]]:
+    out = _git(repo_root, "status", "--porcelain", "-z", "--untracked-files=all")
+    if out is None:
+        return None
+    paths: Set[Path] = set()
+    tokens = out.split("\0")
+    idx = 0
+    while idx < len(tokens):
+        entry = tokens[idx]
+        idx += 1
+        if len(entry) < 4:
+            continue
+        code, rel = entry[:2], entry[3:]
+        paths.add(toplevel / rel)
+        if "R" in code or "C" in code:
+            # Renames and copies carry the original path as the next token.
+            if idx < len(tokens) and tokens[idx]:
+                paths.add(toplevel / tokens[idx])
+            idx += 1
+    return paths
+
+
+def _load_state(repo_root: Path) -> Dict[str, dict]:
+    path = state_dir(repo_root) / STATE_FILE
+    if not path.exists():
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def changed_since_build(repo_root: Path, name: str) -> Optional[Set[Path]]:
+    """Return absolute paths changed since the last recorded `name` build, or None for a full build.
+
+    The set is `git diff --name-only <stamp> HEAD` plus the current working-tree status plus
+    whatever was dirty at the previous build (so reverted edits are re-rendered too).
+    """
+    record = _load_state(repo_root).get(name)
+    if not isinstance(record, dict) or not record.get("commit"):
+        return None
+    toplevel = _git_toplevel(repo_root)
+    if toplevel is None:
+        return None
+    diff = _git(repo_root, "diff", "--name-only", "-z", f"{record['commit']}", "HEAD")
+    dirty = _dirty_paths(toplevel, repo_root)
+    if diff is None or dirty is None:
+        return None
+    changed = {toplevel / rel for rel in diff.split("\0") if rel}
+    changed |= dirty
+    changed |= {toplevel / rel for rel in record.get("dirty", [])}
+    return {path.resolve() for path in changed}
+
+
+def record_build(repo_root: Path, name: str) -> None:
+    commit = git_head(repo_root)
+    toplevel = _git_toplevel(repo_root)
+    if commit is None or toplevel is None:
+        return
+    dirty = _dirty_paths(toplevel, repo_root) or set()
+    dirty_rel: List[str] = sorted(path.relative_to(toplevel).as_posix() for path in dirty)
+    state = _load_state(repo_root)
+    state[name] = {"commit": commit, "dirty": dirty_rel}
+    path = state_dir(repo_root) / STATE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
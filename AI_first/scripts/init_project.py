@@ -4,17 +4,52 @@ from __future__ import annotations
 
 import argparse
 import html
-import json
 import re
 import sys
 import textwrap
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from render_common import render_links
+
+if TYPE_CHECKING:
+    from render_pm import ProjectInfo
 
 PROJECT_SLUG_RE = re.compile(r"^[a-z][a-z0-9_]*$")
 PREFIX_RE = re.compile(r"^[A-Z0-9]+$")
-PM_ROWS_START = "<!-- PROJECT_ROWS_START -->"
-PM_ROWS_END = "<!-- PROJECT_ROWS_END -->"
+GROW_COMMANDS = ("add-phase", "add-stage")
+# Boilerplate for Phase 01 (scaffolded with the project) and for phases added later with add-phase.
+PHASE_TEXT = {
+    "initial": {
+        "scope": "In: project docs, phase/stage definitions; Out: implementation or integrations.",
+        "completion": "Phase action plan and at least one stage action exist with persona notes and DoD references.",
+        "plan_scope": "In: stage action doc(s); Out: implementation or external tooling.",
+        "plan_risks": "Keep the initial stage actionable and small.",
+        "validation": "Stage action file exists and references review checklists.",
+        "ready": "Templates available.",
+        "done": "Stage action populated with persona notes.",
+    },
+    "next": {
+        "scope": "In: TBD; Out: TBD.",
+        "completion": "Every stage action is complete with persona notes, validation recorded, and DoD met.",
+        "plan_scope": "In: stage action doc(s) and the files they name; Out: TBD.",
+        "plan_risks": "Keep each stage actionable and small.",
+        "validation": "Each stage action records its validation results.",
+        "ready": "Previous phase complete; templates available.",
+        "done": "Stage actions complete with persona notes.",
+    },
+}
+INITIAL_STAGE_PLAN = [
+    "Confirm project scope and constraints.",
+    "Define initial workflow and phase expectations.",
+    "Record acceptance and validation steps.",
+]
+STAGE_PLAN = [
+    "Confirm stage scope and acceptance criteria.",
+    "Carry out the work and record execution notes.",
+    "Record validation steps and results.",
+]
 
 
 def _slugify(value: str) -> str:
@@ -38,6 +73,99 @@ def _write_text(path: Path, content: str, dry_run: bool) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def _phase_rel(project: str, number: str) -> str:
+    return f"AI_first/projects/{project}/phases/phase{number}"
+
+
+def _stage_action_name(project: str, number: str, stage_slug: str) -> str:
+    return f"{project}_phase{number}_stage_{stage_slug}_action.md"
+
+
+def _stage_line(project: str, number: str, stage_name: str, stage_slug: str) -> str:
+    action = f"{_phase_rel(project, number)}/actions/{_stage_action_name(project, number, stage_slug)}"
+    return f"{stage_name} stage -> `{action}`"
+
+
+def _phase_dependencies(number: str) -> str:
+    previous = int(number) - 1
+    return f"Phase {previous:02d}." if previous >= 1 else "None."
+
+
+def _phase_definition_body(project: str, number: str, phase_name: str, objective: str, stage_line: str) -> str:
+    text = PHASE_TEXT["initial" if number == "01" else "next"]
+    return textwrap.dedent(
+        f"""\
+        # Phase {number} — {phase_name}
+
+        - **Objective:** {objective}
+        - **Scope:** {text["scope"]}
+        - **Definition of completion:** {text["completion"]}
+        - **Stages:**
+          - {stage_line}
+        - **Dependencies:** {_phase_dependencies(number)}
+        - **Risks/assumptions:** Keep scope focused; remain PII-free.
+        - **Links:** `AI_first/docs/projectplan.md`, `AI_first/projects/{project}/project_summary_{project}.md`
+        """
+    )
+
+
+def _action_plan_body(project: str, number: str, phase_name: str, objective: str, stage_line: str) -> str:
+    text = PHASE_TEXT["initial" if number == "01" else "next"]
+    return textwrap.dedent(
+        f"""\
+        # Phase {number} Action Plan — {phase_name}
+
+        - **Phase:** see `{_phase_rel(project, number)}/phase_definition.md`.
+        - **Stage list:**
+          - {stage_line}
+        - **Objective:** {objective}
+        - **Scope/files:** {text["plan_scope"]}
+        - **Dependencies:** {_phase_dependencies(number)}
+        - **Risks/assumptions:** {text["plan_risks"]}
+        - **Persona actions:** Default Project Creator/Owner → Project/Process Manager → Developer → QA Lead; add optional personas as needed.
+        - **Validation:** {text["validation"]}
+        - **Rollback:** Revert phase documents if scope changes.
+        - **Ready checklist:** {text["ready"]}
+        - **Done checklist:** {text["done"]}
+        """
+    )
+
+
+def _stage_action_body(
+    project: str,
+    number: str,
+    phase_name: str,
+    stage_name: str,
+    stage_slug: str,
+    objective: str,
+    scope: str,
+    plan: list[str],
+) -> str:
+    lines = [
+        f"# Stage Action ({_stage_action_name(project, number, stage_slug)})",
+        "",
+        f"- **Phase/Stage:** Phase {number} — {phase_name} ({stage_name}).",
+        f"- **Objective:** {objective}",
+        f"- **Scope:** {scope}",
+        "- **Acceptance:** Persona notes recorded; scope documented; DoD referenced.",
+        f"- **Dependencies/data:** `AI_first/docs/process.md`, `AI_first/docs/projectplan.md`, `AI_first/projects/{project}/project_summary_{project}.md`",
+        "- **Outputs:** Updated phase/stage docs and any related process updates.",
+        "- **Definition of Done:** Persona notes filled, DoD checklist referenced, validation steps recorded.",
+        "",
+        "## Personas (record outputs; use `AI_first/docs/templates/review_checklists.md`)",
+        "- Project/Process Manager:",
+        "- Developer:",
+        "- QA Lead:",
+        "- Optional personas (Product Manager, Repository Steward, Docs Expert, UI/Accessibility, Bug Triage, Automation/Tooling, Architect, Security, Ops/Observability, Performance/Cost, DBA):",
+        "",
+        "## Plan",
+        *(f"- {step}" for step in plan),
+    ]
+    for heading in ("Execution notes", "Validation", "Documentation updates", "Issues & lessons"):
+        lines += ["", f"## {heading}", "- Pending."]
+    return "\n".join(lines) + "\n"
+
+
 def _update_mapping(text: str, var_name: str, key: str, value: str) -> tuple[str, bool]:
     pattern = re.compile(rf"({var_name}\s*=\s*{{)(?P<body>[^}}]*)(}})", re.S)
     match = pattern.search(text)
@@ -60,23 +188,6 @@ def _update_mapping(text: str, var_name: str, key: str, value: str) -> tuple[str
     return updated, True
 
 
-def _count_open_bugs(path: Path) -> int:
-    if not path.exists():
-        return 0
-    count = 0
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if str(payload.get("status", "")).lower() == "open":
-            count += 1
-    return count
-
-
 def _extract_list_block(md_text: str) -> str:
     lines = md_text.splitlines()
     block: list[str] = []
@@ -94,7 +205,7 @@ def _extract_list_block(md_text: str) -> str:
 def _render_inline(text: str) -> str:
     escaped = html.escape(text)
     escaped = re.sub(r"`([^`]+)`", r"<code>\1</code>", escaped)
-    escaped = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"<a href=\"\2\">\1</a>", escaped)
+    escaped = render_links(escaped)
     escaped = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", escaped)
     return escaped
 
@@ -143,16 +254,6 @@ def _render_project_row(
     )
 
 
-def _replace_count(text: str, key: str, value: int) -> str:
-    pattern = re.compile(rf'(data-count="{re.escape(key)}">)(\d+)(</div>)')
-    return pattern.sub(rf"\g<1>{value}\3", text, count=1)
-
-
-def _replace_last_updated(text: str, value: str) -> str:
-    pattern = re.compile(r'(<span id="pm-last-updated">)([^<]*)(</span>)')
-    return pattern.sub(rf"\g<1>{value}\3", text, count=1)
-
-
 def _update_pm_html(
     pm_path: Path,
     project: str,
@@ -163,27 +264,36 @@ def _update_pm_html(
     issues_path: Path,
     dry_run: bool,
 ) -> bool:
+    from render_common import bug_rollup, open_bug_counts, patch_slots, scan_slots
+
     text = _read_text(pm_path)
     if f"project_{project}.html" in text:
         raise SystemExit(f"{pm_path} already references project_{project}.html")
-    start_idx = text.find(PM_ROWS_START)
-    end_idx = text.find(PM_ROWS_END)
-    if start_idx == -1 or end_idx == -1 or start_idx > end_idx:
+    slots, _ = scan_slots(text)
+    rows_slot = slots.get(("block", "PROJECT_ROWS"))
+    if not rows_slot:
         raise SystemExit(f"{pm_path} is missing project row markers for auto-update.")
-    rows_section = text[start_idx + len(PM_ROWS_START) : end_idx]
+    rows_section = text[rows_slot[0].start : rows_slot[0].end]
     new_row = _render_project_row(project, purpose, owner, phase_name, date_str)
     if rows_section.strip():
-        rows_section = rows_section.rstrip() + "\n" + new_row + "\n"
+        rows_section = rows_section.rstrip() + "\n" + new_row
     else:
-        rows_section = "\n" + new_row + "\n"
+        rows_section = new_row
 
-    updated = text[: start_idx + len(PM_ROWS_START)] + rows_section + text[end_idx:]
     row_count = len(re.findall(r'<tr\s+[^>]*data-link="project_', rows_section))
-    updated = _replace_count(updated, "projects", row_count)
-    updated = _replace_count(updated, "active-phases", row_count)
-    open_bugs = _count_open_bugs(issues_path)
-    updated = _replace_count(updated, "open-bugs", open_bugs)
-    updated = _replace_last_updated(updated, date_str)
+    open_bugs = sum(open_bug_counts(bug_rollup(issues_path)).values())
+    updated = patch_slots(
+        text,
+        {
+            ("block", "PROJECT_ROWS"): rows_section,
+            ("count", "projects"): str(row_count),
+            ("count", "active-phases"): str(row_count),
+            ("count", "open-bugs"): str(open_bugs),
+            ("span", "pm-last-updated"): date_str,
+        },
+        required=[("block", "PROJECT_ROWS")],
+        source=str(pm_path),
+    )
 
     if dry_run:
         print(f"[dry-run] update {pm_path}")
@@ -401,8 +511,299 @@ def _validate_project_slug(slug: str) -> None:
         )
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Initialize a new project in the template")
+def _project_entry(plan_text: str, project: str, projectplan_path: Path) -> dict:
+    from render_pm import projectplan_entries
+
+    for raw in projectplan_entries(plan_text):
+        if raw["slug"] == project:
+            return raw
+    raise SystemExit(f"{projectplan_path} does not list project {project}; run init_project.py --project {project} first.")
+
+
+def _list_position(lines: list[str], start: int, end: int, label: str, pattern: str, number: int) -> tuple[int, str] | None:
+    """Where a phase `number` entry goes in a project's `label` list, and the indent its items use.
+
+    Entries stay in phase order: the new one follows the last entry for an earlier phase.
+    """
+    head = next((i for i in range(start, end) if lines[i].strip() == f"- {label}"), None)
+    if head is None:
+        return None
+    depth = len(lines[head]) - len(lines[head].lstrip())
+    indent = " " * (depth + 2)
+    position = head + 1
+    for i in range(head + 1, end):
+        line = lines[i]
+        if not line.strip() or len(line) - len(line.lstrip()) <= depth:
+            break
+        if i == head + 1:
+            indent = line[: len(line) - len(line.lstrip())]
+        match = re.search(pattern, line)
+        if match and int(match.group(1)) < number:
+            position = i + 1
+    return position, indent
+
+
+def _insert_phase_entries(plan_text: str, project: str, number: str, phase_name: str, projectplan_path: Path) -> str:
+    """Add a phase to one project's "Phases overview" and "Phase directory map" in projectplan.md."""
+    lines = plan_text.split("\n")
+    start = next(
+        (i for i, line in enumerate(lines) if re.match(rf"^- \*\*{re.escape(project)}(?: \([^)]*\))?\*\*", line)),
+        None,
+    )
+    if start is None:
+        raise SystemExit(f"{projectplan_path} does not list project {project}.")
+    end = next((i for i in range(start + 1, len(lines)) if lines[i].startswith(("- ", "#"))), len(lines))
+    phase_root = _phase_rel(project, number)
+    overview = _list_position(lines, start, end, "Phases overview:", r"^\s+- Phase\s+(\d+)\s", int(number))
+    if overview is None:
+        raise SystemExit(f"{projectplan_path} has no 'Phases overview:' list for {project}; add Phase {number} by hand.")
+    dir_map = _list_position(
+        lines, start, end, "Phase directory map:", rf"`AI_first/projects/{re.escape(project)}/phases/phase(\d+)/", int(number)
+    )
+    inserts = [
+        (overview[0], [f"{overview[1]}- Phase {number} — {phase_name} (planning): see `{phase_root}/`."]),
+    ]
+    if dir_map is None:
+        print(f"[skip] {projectplan_path} has no 'Phase directory map:' list for {project}.")
+    else:
+        inserts.append(
+            (
+                dir_map[0],
+                [
+                    f"{dir_map[1]}- `{phase_root}/phase_definition.md` — definition of Phase {number}.",
+                    f"{dir_map[1]}- `{phase_root}/action_plan_phase{number}.md` — action plan for Phase {number} "
+                    f"(links to stage actions under `{phase_root}/actions/`).",
+                ],
+            )
+        )
+    # Later positions first, so earlier ones stay valid.
+    for position, new_lines in sorted(inserts, key=lambda item: item[0], reverse=True):
+        lines[position:position] = new_lines
+    return "\n".join(lines)
+
+
+def _append_list_item(md_text: str, label: str, item: str) -> str | None:
+    """Add `item` as the last nested entry under a `- **label:**` field; None when the field is absent."""
+    lines = md_text.split("\n")
+    head = next((i for i, line in enumerate(lines) if line.lstrip().startswith(f"- **{label}:**")), None)
+    if head is None:
+        return None
+    depth = len(lines[head]) - len(lines[head].lstrip())
+    indent = " " * (depth + 2)
+    position = head + 1
+    while position < len(lines) and lines[position].strip():
+        line = lines[position]
+        if len(line) - len(line.lstrip()) <= depth:
+            break
+        if position == head + 1:
+            indent = line[: len(line) - len(line.lstrip())]
+        position += 1
+    lines.insert(position, f"{indent}- {item}")
+    return "\n".join(lines)
+
+
+def _refresh_outputs(
+    repo_root: Path,
+    project: str,
+    before: ProjectInfo | None,
+    changed: list[Path],
+    dry_run: bool,
+    no_render: bool,
+) -> None:
+    """Render only the changed docs, then patch this project's PM row and detail page."""
+    rel = [path.relative_to(repo_root).as_posix() for path in changed]
+    if dry_run:
+        print(f"[dry-run] render {' '.join(rel)}")
+        print(f"[dry-run] patch the {project} row of AI_first/ui/PM.html and AI_first/ui/project_{project}.html")
+        return
+    if no_render:
+        print("Next steps:")
+        print(f"  - Run python3 AI_first/scripts/render_docs.py --only {' '.join(rel)}")
+        print("  - Run python3 AI_first/scripts/render_pm.py to refresh AI_first/ui/PM.html and the detail page.")
+        return
+
+    import render_docs
+    from link_graph import open_graph
+    from render_common import bug_rollup
+    from render_pm import (
+        build_one_project,
+        has_active_phase,
+        patch_project_row,
+        record_links,
+        update_project_detail,
+    )
+
+    render_docs.main(["--no-daemon", "--only", *rel])
+    ui_root = repo_root / "AI_first" / "ui"
+    detail_path = ui_root / f"project_{project}.html"
+    if not detail_path.exists():
+        print(f"[skip] missing {detail_path}; run python3 AI_first/scripts/render_pm.py once the page exists.")
+        return
+    after = build_one_project(repo_root, repo_root / "AI_first" / "docs" / "projectplan.md", project)
+    if after is None:
+        raise SystemExit(f"AI_first/docs/projectplan.md no longer lists {project}.")
+    updated: list[Path] = []
+    pm_path = ui_root / "PM.html"
+    active_delta = int(has_active_phase(after)) - int(before is not None and has_active_phase(before))
+    if pm_path.exists() and patch_project_row(pm_path, after, active_delta, dry_run=False):
+        updated.append(pm_path)
+    lazy = "assets/pm_phases.js" in _read_text(detail_path)
+    rollup = bug_rollup(repo_root / "AI_first" / "bugmgmt" / "issues" / "issues.jsonl")
+    if update_project_detail(after, detail_path, repo_root, rollup, dry_run=False, lazy=lazy):
+        updated.append(detail_path)
+    record_links(open_graph(repo_root), [after], ui_root, repo_root, {project})
+    if not updated:
+        print("No updates needed.")
+        return
+    print("Updated:")
+    for path in updated:
+        print(f"  - {path}")
+
+
+def _add_phase(args: argparse.Namespace, repo_root: Path) -> None:
+    from render_pm import build_one_project
+
+    project = args.project.strip()
+    _validate_project_slug(project)
+    projectplan_path = repo_root / "AI_first" / "docs" / "projectplan.md"
+    plan_text = _read_text(projectplan_path)
+    raw = _project_entry(plan_text, project, projectplan_path)
+    listed = [int(phase["number"]) for phase in raw["phases"]]
+    number_value = args.number if args.number is not None else max(listed, default=0) + 1
+    if not 1 <= number_value <= 99:
+        raise SystemExit("Phase number must be between 1 and 99.")
+    number = f"{number_value:02d}"
+    phase_dir = repo_root / _phase_rel(project, number)
+    if number_value in listed or phase_dir.exists():
+        raise SystemExit(f"Phase {number} already exists for {project}; pick another --number.")
+
+    title = _project_title(project)
+    phase_name = args.phase_name.strip()
+    stage_name = (args.stage_name or phase_name).strip()
+    stage_slug = _slugify(stage_name) or "stage"
+    objective = args.objective.strip() if args.objective else f"Deliver {phase_name} for {title}."
+    before = build_one_project(repo_root, projectplan_path, project)
+
+    stage_line = _stage_line(project, number, stage_name, stage_slug)
+    phase_def_path = phase_dir / "phase_definition.md"
+    action_plan_path = phase_dir / f"action_plan_phase{number}.md"
+    stage_action_path = phase_dir / "actions" / _stage_action_name(project, number, stage_slug)
+    _write_text(phase_def_path, _phase_definition_body(project, number, phase_name, objective, stage_line), args.dry_run)
+    _write_text(action_plan_path, _action_plan_body(project, number, phase_name, objective, stage_line), args.dry_run)
+    _write_text(
+        stage_action_path,
+        _stage_action_body(
+            project,
+            number,
+            phase_name,
+            stage_name,
+            stage_slug,
+            f"Define the work and acceptance criteria for the {stage_name} stage.",
+            "In: TBD; Out: TBD.",
+            STAGE_PLAN,
+        ),
+        args.dry_run,
+    )
+    _write_text(
+        projectplan_path, _insert_phase_entries(plan_text, project, number, phase_name, projectplan_path), args.dry_run
+    )
+    print(f"Phase {number} added to {project}:")
+    for path in (phase_def_path, action_plan_path, stage_action_path):
+        print(f"  - {path}")
+    print("Updated AI_first/docs/projectplan.md")
+    _refresh_outputs(
+        repo_root,
+        project,
+        before,
+        [projectplan_path, phase_def_path, action_plan_path, stage_action_path],
+        args.dry_run,
+        args.no_render,
+    )
+
+
+def _add_stage(args: argparse.Namespace, repo_root: Path) -> None:
+    from render_pm import build_one_project
+
+    project = args.project.strip()
+    _validate_project_slug(project)
+    projectplan_path = repo_root / "AI_first" / "docs" / "projectplan.md"
+    raw = _project_entry(_read_text(projectplan_path), project, projectplan_path)
+    phases = {phase["number"]: phase["name"] for phase in raw["phases"]}
+    if not phases:
+        raise SystemExit(f"{project} has no phases in {projectplan_path}; use add-phase first.")
+    number = f"{args.phase:02d}" if args.phase is not None else max(phases, key=int)
+    if number not in phases:
+        raise SystemExit(f"Phase {number} is not listed for {project} in {projectplan_path}.")
+
+    stage_name = args.stage_name.strip()
+    stage_slug = _slugify(stage_name) or "stage"
+    phase_dir = repo_root / _phase_rel(project, number)
+    stage_action_path = phase_dir / "actions" / _stage_action_name(project, number, stage_slug)
+    if stage_action_path.exists():
+        raise SystemExit(f"{stage_action_path} already exists; choose a different --stage-name.")
+    objective = (
+        args.objective.strip() if args.objective else f"Define the work and acceptance criteria for the {stage_name} stage."
+    )
+    before = build_one_project(repo_root, projectplan_path, project)
+
+    _write_text(
+        stage_action_path,
+        _stage_action_body(
+            project, number, phases[number], stage_name, stage_slug, objective, "In: TBD; Out: TBD.", STAGE_PLAN
+        ),
+        args.dry_run,
+    )
+    changed = [stage_action_path]
+    stage_line = _stage_line(project, number, stage_name, stage_slug)
+    for path, label in ((phase_dir / f"action_plan_phase{number}.md", "Stage list"), (phase_dir / "phase_definition.md", "Stages")):
+        if not path.exists():
+            print(f"[skip] missing {path}")
+            continue
+        updated = _append_list_item(_read_text(path), label, stage_line)
+        if updated is None:
+            print(f"[skip] {path} has no **{label}:** field; list the stage there by hand.")
+            continue
+        _write_text(path, updated, args.dry_run)
+        changed.append(path)
+    print(f"Stage {stage_name} added to {project} Phase {number}:")
+    for path in changed:
+        print(f"  - {path}")
+    _refresh_outputs(repo_root, project, before, changed, args.dry_run, args.no_render)
+
+
+def _parse_grow_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="init_project.py", description="Grow an existing project and patch its outputs in place"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    phase = sub.add_parser(
+        "add-phase", help="Add a phase with its first stage and list it in AI_first/docs/projectplan.md"
+    )
+    phase.add_argument("--project", required=True, help="Project slug")
+    phase.add_argument("--phase-name", required=True, help="Phase name")
+    phase.add_argument("--number", type=int, default=None, help="Phase number (default: one past the highest listed)")
+    phase.add_argument("--objective", default=None, help="Phase objective")
+    phase.add_argument("--stage-name", default=None, help="Name of the phase's first stage (default: the phase name)")
+    stage = sub.add_parser("add-stage", help="Add a stage action to a phase and list it in the phase docs")
+    stage.add_argument("--project", required=True, help="Project slug")
+    stage.add_argument("--phase", type=int, default=None, help="Phase number (default: the highest listed)")
+    stage.add_argument("--stage-name", required=True, help="Stage name")
+    stage.add_argument("--objective", default=None, help="Stage objective")
+    for command in (phase, stage):
+        command.add_argument(
+            "--no-render",
+            action="store_true",
+            help="Only write the markdown; leave AI_first/ui/ for the next render_docs.py / render_pm.py run",
+        )
+        command.add_argument("--dry-run", action="store_true", help="Print actions without writing files")
+    return parser.parse_args(argv)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Initialize a new project in the template",
+        epilog="Grow an existing project with: init_project.py add-phase|add-stage --help",
+    )
     parser.add_argument("--project", required=True, help="Project slug (snake_case)")
     parser.add_argument("--title", default=None, help="Display title (defaults to slug in title case)")
     parser.add_argument("--owner", default="unassigned", help="Project owner name")
@@ -414,11 +815,20 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--no-projectplan", action="store_true", help="Skip updating AI_first/docs/projectplan.md")
     parser.add_argument("--no-ui", action="store_true", help="Skip updating AI_first/ui/PM.html and project detail page")
     parser.add_argument("--dry-run", action="store_true", help="Print actions without writing files")
-    return parser.parse_args()
-
-
-def main() -> None:
-    args = parse_args()
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in GROW_COMMANDS:
+        args = _parse_grow_args(argv)
+        repo_root = Path(__file__).resolve().parents[2]
+        if args.command == "add-phase":
+            _add_phase(args, repo_root)
+        else:
+            _add_stage(args, repo_root)
+        return
+    args = parse_args(argv)
     project = args.project.strip()
     _validate_project_slug(project)
 
@@ -441,7 +851,7 @@ def main() -> None:
     phase_dir = project_root / "phases" / "phase01"
     phase_def_path = phase_dir / "phase_definition.md"
     action_plan_path = phase_dir / "action_plan_phase01.md"
-    stage_action_path = phase_dir / "actions" / f"{project}_phase01_stage_{stage_slug}_action.md"
+    stage_action_path = phase_dir / "actions" / _stage_action_name(project, "01", stage_slug)
 
     summary_body = textwrap.dedent(
         f"""\
@@ -457,73 +867,22 @@ def main() -> None:
         - **Owner:** {args.owner.strip()}
         """
     )
-    phase_def_body = textwrap.dedent(
-        f"""\
-        # Phase 01 — {phase_name}
-
-        - **Objective:** Establish the baseline plan and workflow for {title}.
-        - **Scope:** In: project docs, phase/stage definitions; Out: implementation or integrations.
-        - **Definition of completion:** Phase action plan and at least one stage action exist with persona notes and DoD references.
-        - **Stages:**
-          - {stage_name} stage -> `AI_first/projects/{project}/phases/phase01/actions/{project}_phase01_stage_{stage_slug}_action.md`
-        - **Dependencies:** None.
-        - **Risks/assumptions:** Keep scope focused; remain PII-free.
-        - **Links:** `AI_first/docs/projectplan.md`, `AI_first/projects/{project}/project_summary_{project}.md`
-        """
+    stage_line = _stage_line(project, "01", stage_name, stage_slug)
+    phase_def_body = _phase_definition_body(
+        project, "01", phase_name, f"Establish the baseline plan and workflow for {title}.", stage_line
     )
-    action_plan_body = textwrap.dedent(
-        f"""\
-        # Phase 01 Action Plan — {phase_name}
-
-        - **Phase:** see `AI_first/projects/{project}/phases/phase01/phase_definition.md`.
-        - **Stage list:**
-          - {stage_name} stage -> `AI_first/projects/{project}/phases/phase01/actions/{project}_phase01_stage_{stage_slug}_action.md`
-        - **Objective:** Establish the baseline project workflow, scope, and documentation.
-        - **Scope/files:** In: stage action doc(s); Out: implementation or external tooling.
-        - **Dependencies:** None.
-        - **Risks/assumptions:** Keep the initial stage actionable and small.
-        - **Persona actions:** Default Project Creator/Owner → Project/Process Manager → Developer → QA Lead; add optional personas as needed.
-        - **Validation:** Stage action file exists and references review checklists.
-        - **Rollback:** Revert phase documents if scope changes.
-        - **Ready checklist:** Templates available.
-        - **Done checklist:** Stage action populated with persona notes.
-        """
+    action_plan_body = _action_plan_body(
+        project, "01", phase_name, "Establish the baseline project workflow, scope, and documentation.", stage_line
     )
-    stage_action_body = textwrap.dedent(
-        f"""\
-        # Stage Action ({project}_phase01_stage_{stage_slug}_action.md)
-
-        - **Phase/Stage:** Phase 01 — {phase_name} ({stage_name}).
-        - **Objective:** Define scope, workflow, and expectations for {title}.
-        - **Scope:** In: planning docs and acceptance criteria; Out: implementation.
-        - **Acceptance:** Persona notes recorded; scope documented; DoD referenced.
-        - **Dependencies/data:** `AI_first/docs/process.md`, `AI_first/docs/projectplan.md`, `AI_first/projects/{project}/project_summary_{project}.md`
-        - **Outputs:** Updated phase/stage docs and any related process updates.
-        - **Definition of Done:** Persona notes filled, DoD checklist referenced, validation steps recorded.
-
-        ## Personas (record outputs; use `AI_first/docs/templates/review_checklists.md`)
-        - Project/Process Manager:
-        - Developer:
-        - QA Lead:
-        - Optional personas (Product Manager, Repository Steward, Docs Expert, UI/Accessibility, Bug Triage, Automation/Tooling, Architect, Security, Ops/Observability, Performance/Cost, DBA):
-
-        ## Plan
-        - Confirm project scope and constraints.
-        - Define initial workflow and phase expectations.
-        - Record acceptance and validation steps.
-
-        ## Execution notes
-        - Pending.
-
-        ## Validation
-        - Pending.
-
-        ## Documentation updates
-        - Pending.
-
-        ## Issues & lessons
-        - Pending.
-        """
+    stage_action_body = _stage_action_body(
+        project,
+        "01",
+        phase_name,
+        stage_name,
+        stage_slug,
+        f"Define scope, workflow, and expectations for {title}.",
+        "In: planning docs and acceptance criteria; Out: implementation.",
+        INITIAL_STAGE_PLAN,
     )
 
     phase_def_summary = _render_list_summary(phase_def_body)
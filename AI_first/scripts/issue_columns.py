@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Columnar snapshot of an issue store: the latest record per issue, stored column by column.
+
+`issues.py` reads the store through `load_columns`, which keeps `<store>.columns` (derived,
+git-ignored) next to the JSONL store. The snapshot remembers how much of the store it covers:
+records appended since are read on top of it, and any rewrite of the covered bytes rebuilds it.
+Validation, owner defaults, and export order stay in `issues.py`, which owns those rules.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def _norm(val: Any) -> str:
+    return "" if val is None else str(val).strip()
+
+
+# Columnar model: low-cardinality fields become array("I") codes into per-column value lists.
+CODED_FIELDS = ["project", "status", "severity", "owner", "phase", "stage", "area", "date", "date_closed"]
+COLUMNS_MAGIC = b"BMGCOLS1"
+# Rebuild the extra-field blob on save once superseded records take up this share of it.
+COLUMNS_GARBAGE_RATIO = 0.25
+_encode_extra = json.JSONEncoder(separators=(",", ":")).encode
+_decode_extra = json.JSONDecoder().decode
+
+
+def _code_key(value: Any) -> Any:
+    """Dictionary key for a column value: strings as-is, anything else by type and JSON text, so
+    1, 1.0 and True keep their own codes and rows rebuild exactly as stored."""
+    return value if type(value) is str else (type(value).__name__, json.dumps(value, sort_keys=True))
+
+
+def _crc_prefix(path: Path, size: int) -> int:
+    crc = 0
+    with path.open("rb") as f:
+        remaining = size
+        while remaining:
+            chunk = f.read(min(remaining, 1 << 20))
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            remaining -= len(chunk)
+    return crc
+
+
+class IssueColumns:
+    """The latest record per issue, stored column-wise.
+
+    Each CODED_FIELDS column is an `array("I")` of codes into that column's value list (code 0:
+    field absent). Normalized ids and the remaining fields (as compact JSON per row) live in byte
+    blobs with offsets, and each row's key order is itself coded, so `row(i)` rebuilds the record
+    exactly. `issues.jsonl` stays the source of truth: `<store>.columns` is a snapshot of this
+    object that remembers how much of the store it covers, and later appends are read on top.
+    """
+
+    def __init__(self) -> None:
+        self.codes: Dict[str, array] = {field: array("I") for field in CODED_FIELDS}
+        self.values: Dict[str, List[Any]] = {field: [None] for field in CODED_FIELDS}
+        self.layout = array("I")
+        self.layouts: List[Tuple[str, ...]] = []
+        self.id_offsets = array("Q", [0])
+        self.ids = bytearray()
+        self.extra_start = array("Q")
+        self.extra_len = array("I")
+        self.extra = bytearray()
+        self.source: Dict[str, int] = {"size": 0, "crc": 0, "mtime_ns": 0, "ino": 0}
+        self._lookups: Dict[str, Dict[Any, int]] = {}
+        self._positions: Optional[Dict[str, int]] = None
+        self._plans: Dict[int, List[Tuple[str, Optional[array], List[Any]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.layout)
+
+    def issue_id(self, idx: int) -> str:
+        return self.ids[self.id_offsets[idx] : self.id_offsets[idx + 1]].decode("utf-8")
+
+    def iter_ids(self) -> Iterator[str]:
+        offsets = self.id_offsets
+        if self.ids.isascii():
+            # Byte offsets are character offsets, so decode once and slice the text.
+            ids: Any = self.ids.decode("ascii")
+            for idx in range(len(self)):
+                yield ids[offsets[idx] : offsets[idx + 1]]
+            return
+        ids = self.ids
+        for idx in range(len(self)):
+            yield ids[offsets[idx] : offsets[idx + 1]].decode("utf-8")
+
+    def _plan(self, layout: int) -> List[Tuple[str, Optional[array], List[Any]]]:
+        plan = self._plans.get(layout)
+        if plan is None:
+            plan = [(key, self.codes.get(key), self.values.get(key, [])) for key in self.layouts[layout]]
+            self._plans[layout] = plan
+        return plan
+
+    def row(self, idx: int) -> Dict[str, Any]:
+        start = self.extra_start[idx]
+        extra = _decode_extra(self.extra[start : start + self.extra_len[idx]].decode("utf-8"))
+        row: Dict[str, Any] = {}
+        for key, codes, values in self._plan(self.layout[idx]):
+            if codes is not None:
+                row[key] = values[codes[idx]]
+            elif key in extra:
+                row[key] = extra[key]
+            else:
+                # An "id" that was already normalized is only kept in the id blob.
+                row[key] = self.issue_id(idx)
+        return row
+
+    def _lookup(self, name: str) -> Dict[Any, int]:
+        lookup = self._lookups.get(name)
+        if lookup is None:
+            if name == "layout":
+                lookup = {layout: code for code, layout in enumerate(self.layouts)}
+            else:
+                lookup = {_code_key(value): code for code, value in enumerate(self.values[name]) if code}
+            self._lookups[name] = lookup
+        return lookup
+
+    def encode(self, field: str, value: Any) -> int:
+        lookup = self._lookup(field)
+        key = _code_key(value)
+        code = lookup.get(key)
+        if code is None:
+            code = lookup[key] = len(self.values[field])
+            self.values[field].append(value)
+        return code
+
+    def layout_code(self, keys: Tuple[str, ...]) -> int:
+        lookup = self._lookup("layout")
+        code = lookup.get(keys)
+        if code is None:
+            code = lookup[keys] = len(self.layouts)
+            self.layouts.append(keys)
+        return code
+
+    def _encode_row(self, row: Dict[str, Any], issue_id: str) -> Tuple[List[int], int, bytes]:
+        codes = []
+        for field in CODED_FIELDS:
+            if field not in row:
+                codes.append(0)
+                continue
+            value = row[field]
+            code = self._lookup(field).get(value if type(value) is str else _code_key(value))
+            codes.append(self.encode(field, value) if code is None else code)
+        extra = {
+            key: value
+            for key, value in row.items()
+            if key not in self.codes and not (key == "id" and value == issue_id and type(value) is str)
+        }
+        return codes, self.layout_code(tuple(row)), _encode_extra(extra).encode("utf-8")
+
+    def _set_extra(self, idx: int, blob: bytes) -> None:
+        self.extra_start[idx] = len(self.extra)
+        self.extra_len[idx] = len(blob)
+        self.extra += blob
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Apply one store record: later records for an ID replace the earlier row in place."""
+        issue_id = _norm(row.get("id"))
+        positions = self._id_positions()
+        idx = positions.get(issue_id) if issue_id else None
+        codes, layout, blob = self._encode_row(row, issue_id)
+        if idx is None:
+            if issue_id:
+                positions[issue_id] = len(self)
+            for field, code in zip(CODED_FIELDS, codes):
+                self.codes[field].append(code)
+            self.layout.append(layout)
+            self.ids += issue_id.encode("utf-8")
+            self.id_offsets.append(len(self.ids))
+            self.extra_start.append(0)
+            self.extra_len.append(0)
+            idx = len(self) - 1
+        else:
+            for field, code in zip(CODED_FIELDS, codes):
+                self.codes[field][idx] = code
+            self.layout[idx] = layout
+        self._set_extra(idx, blob)
+
+    def _id_positions(self) -> Dict[str, int]:
+        if self._positions is None:
+            self._positions = {}
+            for idx, issue_id in enumerate(self.iter_ids()):
+                if issue_id:
+                    self._positions[issue_id] = idx
+        return self._positions
+
+    def catch_up(self, path: Path) -> bool:
+        """Read store records past the covered prefix; False when there was nothing new."""
+        st = path.stat()
+        if (st.st_size, st.st_mtime_ns, st.st_ino) == (self.source["size"], self.source["mtime_ns"], self.source["ino"]):
+            return False
+        with path.open("rb") as f:
+            f.seek(self.source["size"])
+            crc = self.source["crc"]
+            for raw in f:
+                crc = zlib.crc32(raw, crc)
+                line = raw.decode("utf-8").strip()
+                if line:
+                    self.add(json.loads(line))
+            size = f.tell()
+        self.source = {"size": size, "crc": crc, "mtime_ns": st.st_mtime_ns, "ino": st.st_ino}
+        return True
+
+    def _arrays(self) -> List[Tuple[str, array]]:
+        named = [(f"codes.{field}", self.codes[field]) for field in CODED_FIELDS]
+        return named + [
+            ("layout", self.layout),
+            ("id_offsets", self.id_offsets),
+            ("extra_start", self.extra_start),
+            ("extra_len", self.extra_len),
+        ]
+
+    def _compact_extra(self) -> None:
+        extra = bytearray()
+        for idx in range(len(self)):
+            start = self.extra_start[idx]
+            self.extra_start[idx] = len(extra)
+            extra += self.extra[start : start + self.extra_len[idx]]
+        self.extra = extra
+
+    def save(self, snapshot: Path) -> None:
+        if len(self.extra) and sum(self.extra_len) < len(self.extra) * (1 - COLUMNS_GARBAGE_RATIO):
+            self._compact_extra()
+        header = {
+            "byteorder": sys.byteorder,
+            "source": self.source,
+            "values": self.values,
+            "layouts": self.layouts,
+            "arrays": [[name, arr.typecode, arr.itemsize, len(arr)] for name, arr in self._arrays()],
+            "ids": len(self.ids),
+            "extra": len(self.extra),
+        }
+        head = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        tmp_path = snapshot.with_name(snapshot.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            f.write(COLUMNS_MAGIC + len(head).to_bytes(8, "little") + head)
+            for _, arr in self._arrays():
+                arr.tofile(f)
+            f.write(self.ids)
+            f.write(self.extra)
+        os.replace(tmp_path, snapshot)
+
+    @classmethod
+    def load(cls, snapshot: Path, path: Path) -> Optional["IssueColumns"]:
+        """The snapshot, if it was written on this platform and the store still starts with the
+        bytes it covers (appends are fine; any rewrite of the covered prefix is not)."""
+        try:
+            with snapshot.open("rb") as f:
+                if f.read(len(COLUMNS_MAGIC)) != COLUMNS_MAGIC:
+                    return None
+                header = json.loads(f.read(int.from_bytes(f.read(8), "little")))
+                cols = cls()
+                del cols.id_offsets[:]
+                arrays = dict(cols._arrays())
+                if header["byteorder"] != sys.byteorder or [name for name, *_ in header["arrays"]] != list(arrays):
+                    return None
+                for name, typecode, itemsize, count in header["arrays"]:
+                    arr = arrays[name]
+                    if arr.typecode != typecode or arr.itemsize != itemsize:
+                        return None
+                    arr.fromfile(f, count)
+                cols.ids = bytearray(f.read(header["ids"]))
+                cols.extra = bytearray(f.read(header["extra"]))
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+        cols.values = header["values"]
+        cols.layouts = [tuple(layout) for layout in header["layouts"]]
+        cols.source = header["source"]
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        source = cols.source
+        unchanged = (st.st_size, st.st_mtime_ns, st.st_ino) == (source["size"], source["mtime_ns"], source["ino"])
+        if not unchanged and (st.st_size < source["size"] or _crc_prefix(path, source["size"]) != source["crc"]):
+            return None
+        return cols
+
+    def view(self, order: Optional[array] = None) -> "IssueView":
+        return IssueView(self, order if order is not None else array("I", range(len(self))))
+
+
+class IssueView:
+    """Rows of an IssueColumns in a given order; re-iterable, rebuilding one record at a time."""
+
+    def __init__(self, columns: IssueColumns, order: array) -> None:
+        self.columns = columns
+        self.order = order
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        row = self.columns.row
+        for idx in self.order:
+            yield row(idx)
+
+    def counts(self, field: str) -> Dict[int, int]:
+        """Rows per code of a coded column."""
+        codes = self.columns.codes[field]
+        if len(self.order) == len(codes):
+            return dict(Counter(codes))
+        return dict(Counter(codes[idx] for idx in self.order))
+
+
+def columns_path(path: Path) -> Path:
+    return path.with_name(path.name + ".columns")
+
+
+def load_columns(path: Path) -> IssueColumns:
+    """Columns for the store: the snapshot plus any records appended since, rebuilt if the store was
+    rewritten. The snapshot is refreshed whenever new records were read."""
+    if not path.exists():
+        return IssueColumns()
+    snapshot = columns_path(path)
+    cols = IssueColumns.load(snapshot, path) or IssueColumns()
+    if cols.catch_up(path):
+        try:
+            cols.save(snapshot)
+        except OSError:
+            pass
+    return cols
+
+
+def where_filter(cols: IssueColumns, where: Optional[List[str]]) -> Optional[List[Tuple[array, set]]]:
+    """Parse `--where FIELD=VALUE` into (codes, matching codes) pairs; values match case-insensitively."""
+    if not where:
+        return None
+    wanted: Dict[str, set] = {}
+    for item in where:
+        field, sep, value = item.partition("=")
+        field = field.strip()
+        if not sep or field not in cols.codes:
+            raise SystemExit(f"--where expects FIELD=VALUE with FIELD one of: {', '.join(CODED_FIELDS)}")
+        wanted.setdefault(field, set()).add(value.strip().lower())
+    return [
+        (cols.codes[field], {code for code, value in enumerate(cols.values[field]) if code and _norm(value).lower() in values})
+        for field, values in wanted.items()
+    ]
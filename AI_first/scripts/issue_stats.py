@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""Cycle time, open-issue aging, and SLA overruns for `issues.py stats`.
+
+Works from the columnar snapshot (`issue_columns.py`), so dates, statuses, and labels are parsed
+once per distinct value rather than once per row.
+"""
+from __future__ import annotations
+
+import bisect
+import html
+import itertools
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from issues import SEVERITY_ORDER
+
+if TYPE_CHECKING:
+    from issue_columns import IssueColumns
+
+
+def _norm(val: Any) -> str:
+    return "" if val is None else str(val).strip()
+
+
+def _severity_weight(severity: str) -> int:
+    try:
+        return SEVERITY_ORDER.index(severity.lower())
+    except ValueError:
+        return len(SEVERITY_ORDER)
+
+
+STATS_FORMAT = "bugmgmt-stats/1"
+# Days to close by severity; closed issues that took longer, and open issues older than this, are over SLA.
+SLA_DAYS = {"critical": 2, "major": 7, "minor": 30, "nit": 90}
+# Inclusive upper bounds, in days, of the cycle-time and aging buckets; a last bucket holds the rest.
+STATS_BUCKETS = [0, 1, 3, 7, 14, 30, 60, 90, 180, 365]
+STATS_PERCENTILES = [50, 75, 90, 95, 99]
+STATS_ALL = "*"
+
+
+def _bucket_labels() -> List[str]:
+    labels = []
+    low = 0
+    for high in STATS_BUCKETS:
+        labels.append(str(high) if high == low else f"{low}-{high}")
+        low = high + 1
+    return labels + [f">{STATS_BUCKETS[-1]}"]
+
+
+def _day_ordinal(value: Any) -> int:
+    """Proleptic ordinal of a YYYY-MM-DD value, or -1 when it is missing or not a date."""
+    try:
+        return date.fromisoformat(_norm(value)[:10]).toordinal()
+    except ValueError:
+        return -1
+
+
+def _count_upto(values: Any, bound: int) -> int:
+    """Values <= bound in a sorted list or NumPy array."""
+    if hasattr(values, "searchsorted"):
+        return int(values.searchsorted(bound, "right"))
+    return bisect.bisect_right(values, bound)
+
+
+def _distribution(values: Any, total: int, sla: Optional[int]) -> Dict[str, Any]:
+    """Count, mean, percentiles (linear interpolation), max, histogram, and SLA overruns of sorted day counts."""
+    n = len(values)
+    summary: Dict[str, Any] = {"count": n, "mean": round(total / n, 2) if n else None}
+    for pct in STATS_PERCENTILES:
+        if not n:
+            summary[f"p{pct}"] = None
+            continue
+        pos = (n - 1) * pct / 100
+        lo = int(pos)
+        hi = min(lo + 1, n - 1)
+        low, high = int(values[lo]), int(values[hi])
+        summary[f"p{pct}"] = round(low + (high - low) * (pos - lo), 2)
+    summary["max"] = int(values[n - 1]) if n else None
+    edges = [_count_upto(values, bound) for bound in STATS_BUCKETS] + [n]
+    summary["histogram"] = [edges[0]] + [b - a for a, b in zip(edges, edges[1:])]
+    summary["over_sla"] = None if sla is None else n - _count_upto(values, sla)
+    return summary
+
+
+class _StatsInputs:
+    """Per-row group keys and day counts for `stats`, computed from the column codes.
+
+    Groups are (project, severity) label pairs, numbered project * len(severities) + severity.
+    """
+
+    def __init__(self, cols: IssueColumns, as_of: int, where: Optional[List[str]]) -> None:
+        self.projects = sorted({_norm(value).lower() for value in cols.values["project"][1:]} | {""})
+        self.severities = sorted(
+            {_norm(value).lower() for value in cols.values["severity"][1:]} | {""},
+            key=lambda name: (_severity_weight(name), name),
+        )
+        project_index = {name: idx for idx, name in enumerate(self.projects)}
+        severity_index = {name: idx for idx, name in enumerate(self.severities)}
+        self.project_of = [project_index[_norm(value).lower()] for value in cols.values["project"]]
+        self.severity_of = [severity_index[_norm(value).lower()] for value in cols.values["severity"]]
+        self.closed_of = [_norm(value).lower() == "closed" for value in cols.values["status"]]
+        self.opened_of = [_day_ordinal(value) for value in cols.values["date"]]
+        self.closed_day_of = [_day_ordinal(value) for value in cols.values["date_closed"]]
+        self.cols = cols
+        self.as_of = as_of
+        from issue_columns import where_filter
+
+        self.filters = where_filter(cols, where) or []
+
+    def _rows(self) -> Iterable[int]:
+        if not self.filters:
+            return range(len(self.cols))
+        return (idx for idx in range(len(self.cols)) if all(codes[idx] in match for codes, match in self.filters))
+
+    def python(self) -> Dict[str, Any]:
+        codes = self.cols.codes
+        width = len(self.severities)
+        counts: Dict[int, List[int]] = {}
+        cycle: Dict[int, List[int]] = {}
+        age: Dict[int, List[int]] = {}
+        skipped = {"undated": 0, "closed_undated": 0, "negative": 0}
+        for idx in self._rows():
+            group = self.project_of[codes["project"][idx]] * width + self.severity_of[codes["severity"][idx]]
+            closed = self.closed_of[codes["status"][idx]]
+            tally = counts.setdefault(group, [0, 0])
+            tally[closed] += 1
+            opened = self.opened_of[codes["date"][idx]]
+            if opened < 0:
+                skipped["undated"] += 1
+                continue
+            if closed:
+                closed_day = self.closed_day_of[codes["date_closed"][idx]]
+                if closed_day < 0:
+                    skipped["closed_undated"] += 1
+                    continue
+                days, target = closed_day - opened, cycle
+            else:
+                days, target = self.as_of - opened, age
+            if days < 0:
+                skipped["negative"] += 1
+                continue
+            target.setdefault(group, []).append(days)
+        return {
+            "counts": counts,
+            "cycle": {group: (sorted(days), sum(days)) for group, days in cycle.items()},
+            "age": {group: (sorted(days), sum(days)) for group, days in age.items()},
+            "skipped": skipped,
+        }
+
+    def numpy(self, np: Any) -> Dict[str, Any]:
+        def column(field: str) -> Any:
+            return np.frombuffer(self.cols.codes[field], dtype=np.uint32)
+
+        width = len(self.severities)
+        groups = np.asarray(self.project_of, dtype=np.int64)[column("project")] * width
+        groups += np.asarray(self.severity_of, dtype=np.int64)[column("severity")]
+        closed = np.asarray(self.closed_of, dtype=bool)[column("status")]
+        opened = np.asarray(self.opened_of, dtype=np.int64)[column("date")]
+        closed_day = np.asarray(self.closed_day_of, dtype=np.int64)[column("date_closed")]
+        keep = np.ones(len(self.cols), dtype=bool)
+        for codes, match in self.filters:
+            keep &= np.isin(np.frombuffer(codes, dtype=np.uint32), np.fromiter(match, dtype=np.uint32, count=len(match)))
+        dated = keep & (opened >= 0)
+        closed_dated = dated & closed & (closed_day >= 0)
+        days = np.where(closed, closed_day, self.as_of) - opened
+        valid_cycle = closed_dated & (days >= 0)
+        valid_age = dated & ~closed & (days >= 0)
+        count_closed = np.bincount(groups[keep & closed], minlength=len(self.projects) * width)
+        count_all = np.bincount(groups[keep], minlength=len(self.projects) * width)
+        counts = {
+            int(group): [int(count_all[group] - count_closed[group]), int(count_closed[group])]
+            for group in np.flatnonzero(count_all)
+        }
+        skipped = {
+            "undated": int(np.count_nonzero(keep & (opened < 0))),
+            "closed_undated": int(np.count_nonzero(dated & closed & (closed_day < 0))),
+            "negative": int(np.count_nonzero((closed_dated | (dated & ~closed)) & (days < 0))),
+        }
+        return {
+            "counts": counts,
+            "cycle": self._grouped(np, groups[valid_cycle], days[valid_cycle]),
+            "age": self._grouped(np, groups[valid_age], days[valid_age]),
+            "skipped": skipped,
+        }
+
+    @staticmethod
+    def _grouped(np: Any, groups: Any, days: Any) -> Dict[int, Tuple[Any, int]]:
+        """Sorted day counts and their sum per group, from one lexsort."""
+        if not len(groups):
+            return {}
+        order = np.lexsort((days, groups))
+        groups = groups[order]
+        days = days[order]
+        starts = np.flatnonzero(np.concatenate(([True], groups[1:] != groups[:-1])))
+        ends = np.append(starts[1:], len(groups))
+        totals = np.add.reduceat(days, starts)
+        return {int(groups[s]): (days[s:e], int(t)) for s, e, t in zip(starts, ends, totals)}
+
+
+def _merge_sorted(parts: List[Any]) -> Any:
+    """One sorted sequence from sorted parts (lists or NumPy arrays)."""
+    if len(parts) == 1:
+        return parts[0]
+    if parts and hasattr(parts[0], "searchsorted"):
+        import numpy as np
+
+        return np.sort(np.concatenate(parts), kind="stable")
+    return sorted(itertools.chain.from_iterable(parts))
+
+
+def compute_stats(
+    cols: IssueColumns, as_of: Optional[str] = None, where: Optional[List[str]] = None, use_numpy: bool = True
+) -> Dict[str, Any]:
+    """Cycle time, open-issue aging, and SLA overruns per project and severity, with rollups.
+
+    `as_of` (default: the latest date or date_closed in the store) is the day open issues are aged
+    against. NumPy does the per-row work when it is installed; the output is identical without it.
+    """
+    if as_of is None:
+        days = [
+            _day_ordinal(cols.values[field][code])
+            for field in ("date", "date_closed")
+            for code in set(cols.codes[field])
+            if code
+        ]
+        as_of_day = max(days + [-1])
+        as_of = date.fromordinal(as_of_day).isoformat() if as_of_day > 0 else date.today().isoformat()
+    inputs = _StatsInputs(cols, date.fromisoformat(as_of).toordinal(), where)
+    np = None
+    if use_numpy:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+    raw = inputs.numpy(np) if np is not None else inputs.python()
+    width = len(inputs.severities)
+    # Each (project, severity) group, then its rollups: per project, per severity, and overall.
+    members: Dict[Tuple[str, str], List[int]] = {}
+    for group in raw["counts"]:
+        project = inputs.projects[group // width] or "(none)"
+        severity = inputs.severities[group % width] or "(none)"
+        for key in ((project, severity), (project, STATS_ALL), (STATS_ALL, severity), (STATS_ALL, STATS_ALL)):
+            members.setdefault(key, []).append(group)
+    # SLA overruns are counted per group against its severity's target, then summed for rollups.
+    over: Dict[Tuple[str, int], int] = {}
+    for kind in ("cycle", "age"):
+        for group, (values, _) in raw[kind].items():
+            sla = SLA_DAYS.get(inputs.severities[group % width])
+            over[(kind, group)] = 0 if sla is None else len(values) - _count_upto(values, sla)
+
+    def order(key: Tuple[str, str]) -> Tuple[Any, ...]:
+        project, severity = key
+        return (project != STATS_ALL, project, severity != STATS_ALL, _severity_weight(severity), severity)
+
+    results: List[Dict[str, Any]] = []
+    for key in sorted(members, key=order):
+        groups = members[key]
+        rollup = STATS_ALL in key
+        sla = None if rollup else SLA_DAYS.get(key[1])
+        entry: Dict[str, Any] = {
+            "project": key[0],
+            "severity": key[1],
+            "issues": sum(sum(raw["counts"][group]) for group in groups),
+            "open": sum(raw["counts"][group][0] for group in groups),
+            "closed": sum(raw["counts"][group][1] for group in groups),
+            "sla_days": sla,
+        }
+        for kind, name in (("cycle", "cycle_days"), ("age", "open_age_days")):
+            parts = [raw[kind][group] for group in groups if group in raw[kind]]
+            values = _merge_sorted([part[0] for part in parts]) if parts else []
+            summary = _distribution(values, sum(part[1] for part in parts), sla)
+            if rollup:
+                summary["over_sla"] = sum(over.get((kind, group), 0) for group in groups)
+            entry[name] = summary
+        results.append(entry)
+    return {
+        "format": STATS_FORMAT,
+        "as_of": as_of,
+        "issues": results[0]["issues"] if results else 0,
+        "where": list(where or []),
+        "sla_days": SLA_DAYS,
+        "buckets": _bucket_labels(),
+        "percentiles": STATS_PERCENTILES,
+        "skipped": raw["skipped"],
+        "groups": results,
+    }
+
+
+def stats_page(stats: Dict[str, Any], source: str) -> str:
+    def cell(value: Any) -> str:
+        return "&ndash;" if value is None else html.escape(str(value))
+
+    def label(value: str) -> str:
+        return "<strong>All</strong>" if value == STATS_ALL else html.escape(value)
+
+    overall = stats["groups"][0] if stats["groups"] else None
+    cycle = overall["cycle_days"] if overall else {}
+    age = overall["open_age_days"] if overall else {}
+    cards = [
+        ("Issues", stats["issues"]),
+        ("Open", overall["open"] if overall else 0),
+        ("Median days to close", cell(cycle.get("p50"))),
+        ("90th percentile days to close", cell(cycle.get("p90"))),
+        ("Closed over SLA", cell(cycle.get("over_sla"))),
+        ("Open over SLA", cell(age.get("over_sla"))),
+    ]
+    card_html = "\n        ".join(
+        f'<div class="summary-card"><div class="muted small">{name}</div><div class="h6">{value}</div></div>'
+        for name, value in cards
+    )
+    group_rows = "\n            ".join(
+        "<tr>"
+        + "".join(
+            f"<td>{value}</td>"
+            for value in [
+                label(group["project"]),
+                label(group["severity"]),
+                cell(group["sla_days"]),
+                group["open"],
+                group["closed"],
+                cell(group["cycle_days"]["p50"]),
+                cell(group["cycle_days"]["p90"]),
+                cell(group["cycle_days"]["p95"]),
+                cell(group["cycle_days"]["max"]),
+                cell(group["cycle_days"]["over_sla"]),
+                cell(group["open_age_days"]["p50"]),
+                cell(group["open_age_days"]["max"]),
+                cell(group["open_age_days"]["over_sla"]),
+            ]
+        )
+        + "</tr>"
+        for group in stats["groups"]
+    ) or '<tr><td colspan="13" class="muted small">No issues in the store.</td></tr>'
+    peak = max([1] + cycle.get("histogram", []) + age.get("histogram", []))
+    bucket_rows = "\n            ".join(
+        f"<tr><td>{html.escape(bucket)}</td>"
+        + "".join(
+            f'<td>{count} <span style="display:inline-block;height:8px;width:{count * 160 // peak}px;'
+            f'background:{color};opacity:0.6"></span></td>'
+            for count, color in ((counts[0], "#16a34a"), (counts[1], "#dc2626"))
+        )
+        + "</tr>"
+        for bucket, *counts in zip(
+            stats["buckets"],
+            cycle.get("histogram", [0] * len(stats["buckets"])),
+            age.get("histogram", [0] * len(stats["buckets"])),
+        )
+    )
+    sla = ", ".join(f"{html.escape(name)} {days}d" for name, days in stats["sla_days"].items())
+    scope = f" · where {html.escape(' and '.join(stats['where']))}" if stats["where"] else ""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Bug Management Cycle Time and SLA</title>
+  <link rel="stylesheet" href="style/bugmgmt.css" />
+</head>
+<body>
+  <div class="container">
+    <nav class="top-nav">
+      <a class="nav-link nav-home" href="index.html">Home</a>
+      <a class="nav-link nav-process" href="process_guide.html">Process Management</a>
+      <a class="nav-link nav-project" href="PM.html">Project Management</a>
+      <a class="nav-link nav-bug" href="bugmgmt_issues.html">Bug Management</a>
+    </nav>
+    <header class="hero">
+      <div>
+        <h1 class="h4">Cycle Time and SLA</h1>
+        <p class="muted small">Days from <code>date</code> to <code>date_closed</code> for closed issues and open-issue age as of {stats["as_of"]}{scope}</p>
+      </div>
+    </header>
+
+    <div class="card">
+      <div class="summary">
+        {card_html}
+      </div>
+      <div class="filter-hint">SLA targets: {sla}. Skipped: {stats["skipped"]["undated"]} without a valid date, {stats["skipped"]["closed_undated"]} closed without date_closed, {stats["skipped"]["negative"]} dated in the wrong order. Source: {html.escape(source)}.</div>
+    </div>
+
+    <div class="card">
+      <div class="table-wrap">
+        <table class="issues">
+          <thead>
+            <tr><th>Project</th><th>Severity</th><th>SLA days</th><th>Open</th><th>Closed</th><th>Close p50</th><th>Close p90</th><th>Close p95</th><th>Close max</th><th>Closed over SLA</th><th>Open age p50</th><th>Open age max</th><th>Open over SLA</th></tr>
+          </thead>
+          <tbody>
+            {group_rows}
+          </tbody>
+        </table>
+      </div>
+    </div>
+
+    <div class="card">
+      <div class="table-wrap">
+        <table class="issues">
+          <thead>
+            <tr><th>Days</th><th>Closed within (days to close)</th><th>Open for (age)</th></tr>
+          </thead>
+          <tbody>
+            {bucket_rows}
+          </tbody>
+        </table>
+      </div>
+    </div>
+  </div>
+</body>
+</html>
+"""
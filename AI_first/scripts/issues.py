@@ -2,18 +2,29 @@
 """Lightweight local issue tracker helper (template version).
 
 Reads a JSONL issue store and produces JSON or HTML exports with deterministic ordering.
+The store is append-only: `add`/`update`/`close` append a full record and the last record for an
+ID wins; `compact` folds superseded records away. `compact --layout split` moves free-text bodies
+into a <store>.bodies sidecar so the store itself holds only compact header records.
 All paths are configurable via flags; defaults assume running from the template root.
 """
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import glob
+import heapq
 import json
 import os
 import re
-import subprocess
-from dataclasses import dataclass
+import sys
+from array import array
+from datetime import date, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, BinaryIO, Iterable, Iterator, Optional, TextIO, Tuple
+
+if TYPE_CHECKING:
+    from issue_columns import IssueColumns, IssueView
 
 SEVERITY_ORDER = ["critical", "major", "minor", "nit"]
 STATUS_ORDER = ["open", "in_progress", "closed"]
@@ -22,14 +33,26 @@ PROJECT_PREFIXES = {
     "project_management": "PMG",
 }
 PROJECT_OWNERS = {}
-ID_PATTERN = re.compile(r"^(?P<prefix>[A-Z0-9]+)-(?P<year>\d{4})-(?P<month>\d{2})-(?P<seq>\d{3})$")
+ID_PATTERN = re.compile(r"^(?P<prefix>[A-Z0-9]+)-(?P<year>\d{4})-(?P<month>\d{2})-(?P<seq>\d{3,})$")
 OWNER_PLACEHOLDERS = {"", "unassigned", "<assign>", "tbd"}
+DEFAULT_DATA = Path("AI_first/bugmgmt/issues/issues.jsonl")
+DEFAULT_ID_WIDTH = 3
+# Packed exports: a header block (presorted marker, columns, facet dictionaries and counts) and
+# rows as arrays in column order, with facet fields replaced by indexes into their dictionary.
+EXPORT_FORMAT = "bugmgmt-issues/2"
+FACET_FIELDS = ["project", "status", "severity", "phase", "stage"]
+# Body scripts for the UI detail pane, relative to the directory of bugmgmt_issues.html.
+UI_BODIES_DIR = Path("data/bugmgmt_bodies")
 
 
+@functools.lru_cache(maxsize=None)
 def _repo_owner() -> str:
+    """Fallback owner for unassigned issues; resolved on first use so importing this module never forks git."""
     env_owner = os.environ.get("BUGMGMT_REPO_OWNER", "").strip()
     if env_owner:
         return env_owner
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "config", "user.name"],
@@ -42,19 +65,25 @@ def _repo_owner() -> str:
         return ""
 
 
-DEFAULT_OWNER = _repo_owner()
-
-
 def _load_issues(path: Path) -> List[Dict[str, Any]]:
+    """Load the store, letting later records for an ID supersede earlier ones."""
     if not path.exists():
         return []
     rows: List[Dict[str, Any]] = []
+    positions: Dict[str, int] = {}
     with path.open("r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            rows.append(json.loads(line))
+            row = json.loads(line)
+            issue_id = _norm(row.get("id"))
+            if issue_id in positions:
+                rows[positions[issue_id]] = row
+                continue
+            if issue_id:
+                positions[issue_id] = len(rows)
+            rows.append(row)
     return rows
 
 
@@ -83,16 +112,19 @@ def _apply_owner_defaults(rows: List[Dict[str, Any]]) -> None:
             continue
         owner = _norm(issue.get("owner")).lower()
         if owner in OWNER_PLACEHOLDERS:
-            default_owner = PROJECT_OWNERS.get(project.lower()) or DEFAULT_OWNER
+            default_owner = PROJECT_OWNERS.get(project.lower()) or _repo_owner()
             if default_owner:
                 issue["owner"] = default_owner
 
 
 def _validate_issue_ids(rows: List[Dict[str, Any]]) -> None:
+    _check_ids((_norm(issue.get("project")), _norm(issue.get("id"))) for issue in rows)
+
+
+def _check_ids(pairs: Iterable[Tuple[str, str]]) -> None:
+    """Validate (project, id) pairs in store order."""
     errors = []
-    for idx, issue in enumerate(rows, start=1):
-        project = _norm(issue.get("project"))
-        issue_id = _norm(issue.get("id"))
+    for idx, (project, issue_id) in enumerate(pairs, start=1):
         if not project or not issue_id:
             errors.append(f"#{idx} missing project or id (project='{project}', id='{issue_id}')")
             continue
@@ -112,24 +144,28 @@ def _validate_issue_ids(rows: List[Dict[str, Any]]) -> None:
         raise SystemExit("Issue ID validation failed:\n" + "\n".join(errors))
 
 
-def _sorted(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    return sorted(
-        rows,
-        key=lambda r: (
-            _status_weight(_norm(r.get("status", ""))),
-            _norm(r.get("project", "")).lower(),
-            _severity_weight(_norm(r.get("severity", ""))),
-            _norm(r.get("id", "")),
-        ),
+def _sort_key(row: Dict[str, Any]) -> Tuple[int, str, int, str]:
+    return (
+        _status_weight(_norm(row.get("status", ""))),
+        _norm(row.get("project", "")).lower(),
+        _severity_weight(_norm(row.get("severity", ""))),
+        _norm(row.get("id", "")),
     )
 
 
+def _sorted(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(rows, key=_sort_key)
+
+
 def _to_json(rows: List[Dict[str, Any]]) -> str:
     return json.dumps(rows, ensure_ascii=True, separators=(",", ":"))
 
 
 def _to_html(rows: List[Dict[str, Any]], json_rel_path: Path) -> str:
-    data_json = json.dumps(rows, ensure_ascii=True)
+    return _html_page(json_rel_path, json.dumps(rows, ensure_ascii=True))
+
+
+def _html_page(json_rel_path: Path, data_json: str) -> str:
     json_path_str = json_rel_path.as_posix()
     return f"""<!DOCTYPE html>
 <html lang="en">
@@ -167,7 +203,7 @@ def _to_html(rows: List[Dict[str, Any]], json_rel_path: Path) -> str:
         <label>Search<input id="search" placeholder="Search text..." /></label>
         <button id="resetFilters" class="btn">Reset filters</button>
       </div>
-      <div class="filter-hint">Source: AI_first/bugmgmt/issues/issues.jsonl · Regenerate exports only when you want the UI refreshed.</div>
+      <div class="filter-hint">Source: AI_first/bugmgmt/issues/issues.jsonl · Regenerate exports only when you want the UI refreshed. · <a href="bugmgmt_burndown.html">Burndown report</a> · <a href="bugmgmt_stats.html">Cycle time and SLA</a></div>
       <div class="summary" id="summaryRow"></div>
     </div>
 
@@ -199,7 +235,7 @@ def _to_html(rows: List[Dict[str, Any]], json_rel_path: Path) -> str:
     
   </div>
   <script>
-    window.BUGMGMT_CONFIG = {{ jsonPath: "{json_path_str}" }};
+    window.BUGMGMT_CONFIG = {{ jsonPath: "{json_path_str}", bodiesPath: "{UI_BODIES_DIR.as_posix()}" }};
     window.BUGMGMT_FALLBACK = {data_json};
   </script>
   <script src="assets/bugmgmt.js"></script>
@@ -208,47 +244,1580 @@ def _to_html(rows: List[Dict[str, Any]], json_rel_path: Path) -> str:
 """
 
 
-@dataclass
-class Paths:
-    data: Path
-    json_out: Path
-    html_out: Path
-
-
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Local issue tracker helper (template)")
-    parser.add_argument("command", choices=["list"], help="Command to run")
+    parser.add_argument(
+        "command",
+        choices=[
+            "list",
+            "get",
+            "add",
+            "update",
+            "close",
+            "compact",
+            "dedupe",
+            "next-id",
+            "snapshot",
+            "asof",
+            "burndown",
+            "stats",
+        ],
+        help="Command to run",
+    )
     parser.add_argument(
         "--data",
-        type=Path,
-        default=Path("AI_first/bugmgmt/issues/issues.jsonl"),
-        help="Path to JSONL store",
+        action="append",
+        default=None,
+        help="Path or glob of a JSONL store; repeat to merge several stores into one export",
     )
     parser.add_argument("--format", choices=["json", "html"], default="json", help="Output format")
     parser.add_argument("--output", type=Path, default=None, help="Output file path")
-    return parser.parse_args()
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="list: write a plain array of records instead of the packed format the UI loads",
+    )
+    parser.add_argument(
+        "--where",
+        action="append",
+        metavar="FIELD=VALUE",
+        help="list/stats: only include issues whose FIELD matches VALUE, case-insensitively (repeatable; "
+        "values for the same field are alternatives), e.g. --where status=open",
+    )
+    parser.add_argument(
+        "--id",
+        default=None,
+        help="Issue ID for get/add/update/close (add allocates the next one when omitted)",
+    )
+    parser.add_argument(
+        "--set",
+        action="append",
+        metavar="KEY=VALUE",
+        help="Field to set on add/update/close (repeatable), e.g. --set severity=major",
+    )
+    parser.add_argument("--note", default=None, help="Closure note for close")
+    parser.add_argument(
+        "--reclose",
+        action="store_true",
+        help="close: overwrite date_closed and close_note of an issue that is already closed",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=["inline", "split"],
+        default=None,
+        help="compact: keep bodies in the store or move them to <store>.bodies (default: current layout)",
+    )
+    parser.add_argument(
+        "--project",
+        default=None,
+        help="next-id: project to reserve an ID for; the ID is used up even if never added, so pass it to add --id",
+    )
+    parser.add_argument("--month", default=None, help="next-id: YYYY-MM to allocate in (default: current month)")
+    parser.add_argument(
+        "--date",
+        default=None,
+        help="asof: YYYY-MM-DD to reconstruct issue state for; stats: day open issues are aged against "
+        "(default: the latest date in the store)",
+    )
+    parser.add_argument("--since", default=None, help="burndown: first day (default: first recorded day)")
+    parser.add_argument("--until", default=None, help="burndown: last day (default: last recorded day)")
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=None,
+        help="Minimum digits in the ID sequence for next-id/add (default: BUGMGMT_ID_WIDTH or 3)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="dedupe: minimum estimated similarity (0-1) to report a pair",
+    )
+    parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help="dedupe: only report clusters involving issues added or edited since the last run",
+    )
+    parser.add_argument("--no-daemon", action="store_true", help="Run locally even if the AI_first daemon is running")
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
-    rows = _load_issues(args.data)
+def _prepare_rows(path: Path) -> List[Dict[str, Any]]:
+    """Dict-per-issue equivalent of `_prepare_columns`, without the snapshot or filters."""
+    rows = _load_issues(path)
     _validate_issue_ids(rows)
     _apply_owner_defaults(rows)
-    rows = _sorted(rows)
-    if args.format == "json":
-        content = _to_json(rows)
+    return _sorted(rows)
+
+
+# Store rules applied to the columnar snapshot (issue_columns.py) without rebuilding rows.
+def _validate_columns(cols: IssueColumns, ids: List[str]) -> None:
+    """`_validate_issue_ids` over the columns: one regex pass per project over its joined ids, with the
+    row-by-row check (and its messages) only when some id fails."""
+    projects = [_norm(value) for value in cols.values["project"]]
+    codes = cols.codes["project"]
+    by_project: Dict[int, List[str]] = {}
+    for code, issue_id in zip(codes, ids):
+        by_project.setdefault(code, []).append(issue_id)
+    for code, group in by_project.items():
+        prefix = PROJECT_PREFIXES.get(projects[code].lower())
+        joined = "\n".join(group) + "\n"
+        # ID_PATTERN with the project's prefix, repeated once per line.
+        pattern = rf"(?:{re.escape(prefix or '')}-\d{{4}}-\d{{2}}-\d{{3,}}\n)*"
+        if not (projects[code] and prefix and joined.count("\n") == len(group) and re.fullmatch(pattern, joined)):
+            _check_ids((projects[code], issue_id) for code, issue_id in zip(codes, ids))
+            return
+
+
+def _apply_owner_defaults_columns(cols: IssueColumns) -> None:
+    """`_apply_owner_defaults` on codes: decided once per (project, owner) code pair."""
+    projects = [_norm(value) for value in cols.values["project"]]
+    placeholder = [_norm(value).lower() in OWNER_PLACEHOLDERS for value in cols.values["owner"]]
+    owner_codes = cols.codes["owner"]
+    project_codes = cols.codes["project"]
+    defaults: Dict[int, int] = {}
+    grown: Dict[int, int] = {}
+    for idx in range(len(cols)):
+        owner = owner_codes[idx]
+        project = project_codes[idx]
+        if not projects[project] or not placeholder[owner]:
+            continue
+        if project not in defaults:
+            default_owner = PROJECT_OWNERS.get(projects[project].lower()) or _repo_owner()
+            defaults[project] = cols.encode("owner", default_owner) if default_owner else 0
+        if not defaults[project]:
+            continue
+        owner_codes[idx] = defaults[project]
+        if owner == 0:
+            # The field was missing, so it is added after the existing keys.
+            layout = cols.layout[idx]
+            if layout not in grown:
+                grown[layout] = cols.layout_code(cols.layouts[layout] + ("owner",))
+            cols.layout[idx] = grown[layout]
+
+
+def _sorted_order(cols: IssueColumns, ids: List[str], where: Optional[List[str]] = None) -> array:
+    """Row order of `_sorted`, computed from per-code weights and ranks plus the ids."""
+    status = [_status_weight(_norm(value)) for value in cols.values["status"]]
+    severity = [_severity_weight(_norm(value)) for value in cols.values["severity"]]
+    projects = [_norm(value).lower() for value in cols.values["project"]]
+    ranks = {name: rank for rank, name in enumerate(sorted(set(projects)))}
+    project = [ranks[name] for name in projects]
+    span_project = len(ranks) or 1
+    span_severity = len(SEVERITY_ORDER) + 1
+    composite = [
+        (status[s] * span_project + project[p]) * span_severity + severity[v]
+        for s, p, v in zip(cols.codes["status"], cols.codes["project"], cols.codes["severity"])
+    ]
+    from issue_columns import where_filter
+
+    rows: Iterable[int] = range(len(cols))
+    filters = where_filter(cols, where)
+    if filters:
+        rows = [idx for idx in rows if all(codes[idx] in match for codes, match in filters)]
+    # Two stable sorts (id, then the composite) give the tuple order without building tuples.
+    order = sorted(rows, key=ids.__getitem__)
+    order.sort(key=composite.__getitem__)
+    return array("I", order)
+
+
+def _prepare_columns(path: Path, where: Optional[List[str]] = None) -> IssueView:
+    """Columnar `_prepare_rows`: validated, owner defaults applied, filtered, in export order."""
+    from issue_columns import load_columns
+
+    cols = load_columns(path)
+    ids = list(cols.iter_ids())
+    _validate_columns(cols, ids)
+    _apply_owner_defaults_columns(cols)
+    return cols.view(_sorted_order(cols, ids, where))
+
+
+def _resolve_stores(values: Optional[List[str]]) -> List[Path]:
+    """Expand repeated --data values and glob patterns into a sorted, de-duplicated store list."""
+    if not values:
+        return [DEFAULT_DATA]
+    stores: List[Path] = []
+    for value in values:
+        if glob.has_magic(value):
+            matches = sorted(glob.glob(value, recursive=True))
+            if not matches:
+                raise SystemExit(f"No issue stores match {value}")
+            stores.extend(Path(match) for match in matches)
+        else:
+            stores.append(Path(value))
+    unique = {store.resolve(): store for store in stores}
+    return [unique[key] for key in sorted(unique)]
+
+
+def _sort_store(path: Path, run_dir: Path, index: int, where: Optional[List[str]] = None) -> Tuple[Path, Path]:
+    """Worker: load, validate, and sort one store into a record run and an ID run on disk."""
+    try:
+        rows = _prepare_columns(path, where)
+    except SystemExit as exc:
+        raise SystemExit(f"{path}: {exc.code}") from None
+    record_run = run_dir / f"{index:04d}.records.jsonl"
+    id_run = run_dir / f"{index:04d}.ids.txt"
+    with record_run.open("w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=True, separators=(",", ":")) + "\n")
+    with id_run.open("w", encoding="utf-8") as f:
+        for issue_id in sorted(rows.columns.issue_id(idx) for idx in rows.order):
+            f.write(issue_id + "\n")
+    return record_run, id_run
+
+
+def _iter_run(path: Path, store: int) -> Iterator[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            row = json.loads(line)
+            if isinstance(row.get(BODY_REF), list):
+                # Body offsets are per store; carry the store index through the merge.
+                row[BODY_REF] = row[BODY_REF][:2] + [store]
+            yield row
+
+
+def _iter_ids(path: Path, store: Path) -> Iterator[Tuple[str, str]]:
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            yield line.rstrip("\n"), str(store)
+
+
+def _check_cross_store_ids(id_runs: List[Tuple[Path, Path]]) -> None:
+    duplicates: List[str] = []
+    previous: Optional[Tuple[str, str]] = None
+    for issue_id, store in heapq.merge(*(_iter_ids(run, store) for run, store in id_runs)):
+        if previous and previous[0] == issue_id and previous[1] != store:
+            duplicates.append(f"id '{issue_id}' appears in {previous[1]} and {store}")
+        previous = (issue_id, store)
+    if duplicates:
+        raise SystemExit("Cross-store duplicate IDs:\n" + "\n".join(duplicates))
+
+
+class _MergedRuns:
+    """Export-ordered k-way heap merge over sorted run files; every iteration re-reads the runs."""
+
+    def __init__(self, record_runs: List[Path]) -> None:
+        self.record_runs = record_runs
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return heapq.merge(*(_iter_run(run, idx) for idx, run in enumerate(self.record_runs)), key=_sort_key)
+
+
+def _merged_rows(stores: List[Path], run_dir: Path, where: Optional[List[str]] = None) -> Iterable[Dict[str, Any]]:
+    """Sort each store in parallel, then stream a k-way heap merge in export order."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(len(stores), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(_sort_store, store, run_dir, idx, where) for idx, store in enumerate(stores)]
+        runs = [future.result() for future in futures]
+    _check_cross_store_ids([(id_run, store) for (_, id_run), store in zip(runs, stores)])
+    return _MergedRuns([record_run for record_run, _ in runs])
+
+
+def _write_json_array(f: TextIO, rows: Iterable[Any], separators: Tuple[str, str]) -> None:
+    # Streams the same bytes json.dumps(list) would produce without materializing the list.
+    f.write("[")
+    for idx, row in enumerate(rows):
+        if idx:
+            f.write(separators[0])
+        f.write(json.dumps(row, ensure_ascii=True, separators=separators))
+    f.write("]")
+
+
+def _export_header(rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Columns in first-seen order plus each facet's sorted values and counts, from one pass over `rows`."""
+    from issue_columns import IssueView
+
+    if isinstance(rows, IssueView):
+        return _view_export_header(rows)
+    columns: Dict[str, None] = {}
+    tallies: Dict[str, Dict[Any, int]] = {facet: {} for facet in FACET_FIELDS}
+    count = 0
+    for row in rows:
+        count += 1
+        columns.update(dict.fromkeys(row))
+        for facet in FACET_FIELDS:
+            if facet in row:
+                tally = tallies[facet]
+                tally[row[facet]] = tally.get(row[facet], 0) + 1
+    facets = {}
+    for facet, tally in tallies.items():
+        values = sorted(tally, key=lambda value: (_norm(value), json.dumps(value)))
+        facets[facet] = {"values": values, "counts": [tally[value] for value in values]}
+    return {"format": EXPORT_FORMAT, "presorted": True, "count": count, "columns": list(columns), "facets": facets}
+
+
+def _view_export_header(view: IssueView) -> Dict[str, Any]:
+    """`_export_header` computed from the columns: layouts and code counts instead of rows."""
+    cols = view.columns
+    pending = set(cols.layout[idx] for idx in view.order) if len(view.order) != len(cols) else set(cols.layout)
+    columns: Dict[str, None] = {}
+    for idx in view.order:
+        if not pending:
+            break
+        code = cols.layout[idx]
+        if code in pending:
+            pending.discard(code)
+            columns.update(dict.fromkeys(cols.layouts[code]))
+    facets = {}
+    for facet in FACET_FIELDS:
+        counts = view.counts(facet)
+        if len({value for code, value in enumerate(cols.values[facet]) if code}) < len(cols.values[facet]) - 1:
+            # Equal values with distinct codes (1 and 1.0): the first one in export order names the facet value.
+            first: Dict[int, int] = {}
+            for pos, idx in enumerate(view.order):
+                first.setdefault(cols.codes[facet][idx], pos)
+            counts = {code: counts[code] for code in sorted(counts, key=first.__getitem__)}
+        tally: Dict[Any, int] = {}
+        for code, count in counts.items():
+            if code:
+                value = cols.values[facet][code]
+                tally[value] = tally.get(value, 0) + count
+        values = sorted(tally, key=lambda value: (_norm(value), json.dumps(value)))
+        facets[facet] = {"values": values, "counts": [tally[value] for value in values]}
+    return {"format": EXPORT_FORMAT, "presorted": True, "count": len(view), "columns": list(columns), "facets": facets}
+
+
+def _pack_rows(rows: Iterable[Dict[str, Any]], header: Dict[str, Any]) -> Iterator[List[Any]]:
+    columns = {name: idx for idx, name in enumerate(header["columns"])}
+    codes = {
+        facet: {value: code for code, value in enumerate(entry["values"])}
+        for facet, entry in header["facets"].items()
+    }
+    for row in rows:
+        packed: List[Any] = [None] * len(columns)
+        for key, value in row.items():
+            packed[columns[key]] = codes[key][value] if key in codes else value
+        while packed and packed[-1] is None:
+            packed.pop()
+        yield packed
+
+
+def _export(
+    rows: Iterable[Dict[str, Any]],
+    fmt: str,
+    output: Optional[Path],
+    stores: List[Path],
+    plain: bool = False,
+) -> Path:
+    """Write the JSON or HTML export.
+
+    The packed format reads `rows` twice (header, then rows), so they must be re-iterable: a
+    list, an IssueView, or a merge over run files. Out-of-line bodies are written as UI shards
+    next to an HTML export, or next to the UI page for the default JSON export; other JSON
+    exports carry only the shard names (`get --id` prints a full record).
+    """
+    if fmt == "json":
         default_out = Path("AI_first/bugmgmt/exports/json/bugmgmt_issues.json")
+        head, tail, separators = "", "", (",", ":")
     else:
         # derive relative JSON path for the UI to fetch (defaults assume AI_first/ui alongside AI_first/bugmgmt/exports)
         default_out = Path("AI_first/ui/bugmgmt_issues.html")
         json_path = Path("AI_first/bugmgmt/exports/json/bugmgmt_issues.json")
-        html_out = Path(args.output) if args.output else default_out
+        html_out = Path(output) if output else default_out
         # compute relative path from HTML dir to JSON file
         rel_json = Path(os.path.relpath(json_path, start=html_out.parent))
-        content = _to_html(rows, rel_json)
-    out_path = args.output or default_out
+        head, tail = _html_page(rel_json, "\0").split("\0")
+        separators = (", ", ": ")
+    out_path = output or default_out
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(content, encoding="utf-8")
+    refs: Dict[str, List[Tuple[str, List[int]]]] = {}
+    with out_path.open("w", encoding="utf-8") as f:
+        f.write(head)
+        if plain:
+            _write_json_array(f, _collect_body_refs(rows, refs), separators)
+        else:
+            header = _export_header(rows)
+            f.write('{"header"' + separators[1] + json.dumps(header, ensure_ascii=True, separators=separators))
+            f.write(separators[0] + '"rows"' + separators[1])
+            _write_json_array(f, _pack_rows(_collect_body_refs(rows, refs), header), separators)
+            f.write("}")
+        f.write(tail)
+    if refs:
+        if fmt == "html":
+            _write_body_shards(refs, stores, out_path.parent / UI_BODIES_DIR)
+        elif out_path.resolve() == (Path(__file__).resolve().parents[2] / default_out).resolve():
+            # The default JSON export is the one the UI page fetches; its bodies go next to that page.
+            _write_body_shards(refs, stores, Path(__file__).resolve().parents[2] / "AI_first" / "ui" / UI_BODIES_DIR)
+    return out_path
+
+
+def _export_stores(
+    stores: List[Path],
+    fmt: str,
+    output: Optional[Path],
+    plain: bool = False,
+    where: Optional[List[str]] = None,
+) -> Path:
+    if len(stores) == 1:
+        return _export(_prepare_columns(stores[0], where), fmt, output, stores, plain)
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="bugmgmt-merge-") as run_dir:
+        return _export(_merged_rows(stores, Path(run_dir), where), fmt, output, stores, plain)
+
+
+REQUIRED_FIELDS = ["id", "date", "project", "phase", "stage", "area", "status", "severity", "summary", "owner"]
+
+
+def _sidecar(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
+
+
+@contextlib.contextmanager
+def _locked(lock_path: Path) -> Iterator[None]:
+    try:
+        import fcntl
+    except ImportError:
+        raise SystemExit("Issue writes need POSIX fcntl file locking.") from None
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _read_watermark(sync_path: Path) -> Tuple[int, int]:
+    try:
+        inode, size = sync_path.read_text(encoding="utf-8").split()
+        return int(inode), int(size)
+    except (OSError, ValueError):
+        return -1, -1
+
+
+def _group_sync(path: Path, end: int) -> bool:
+    """Make the store durable up to byte `end`; False when another writer's fsync already covered it.
+
+    Appends happen under the store lock while fsync runs under a separate sync lock, so every
+    append that lands during an in-flight fsync is covered by the next one (group commit).
+    """
+    sync_path = _sidecar(path, ".sync")
+    with _locked(_sidecar(path, ".sync.lock")):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            inode, synced = _read_watermark(sync_path)
+            if inode == st.st_ino and synced >= end:
+                return False
+            # Bodies are appended before their headers, so syncing them first covers every header.
+            _fsync_bodies(path)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        sync_path.write_text(f"{st.st_ino} {st.st_size}", encoding="utf-8")
+        return True
+
+
+def _append_record(path: Path, record: Dict[str, Any]) -> Tuple[int, int]:
+    """Append one record (caller holds the store lock) and return its start and the new end offset."""
+    data = (json.dumps(record, ensure_ascii=True, separators=(",", ":")) + "\n").encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        start = f.tell()
+        f.write(data)
+        f.flush()
+        return start, f.tell()
+
+
+# Header fields stay in the store. Once a store has a <store>.bodies sidecar, every other field of a
+# record is appended there and the header carries "body": [offset, length] pointing at that line.
+HEADER_FIELDS = REQUIRED_FIELDS + ["date_closed", "symptom"]
+BODY_REF = "body"
+
+
+def _bodies_path(path: Path) -> Path:
+    return _sidecar(path, ".bodies")
+
+
+def _split_record(record: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    header = {key: value for key, value in record.items() if key in HEADER_FIELDS}
+    body = {key: value for key, value in record.items() if key not in HEADER_FIELDS and key != BODY_REF}
+    return header, body
+
+
+def _body_line(issue_id: str, body: Dict[str, Any]) -> bytes:
+    # The ID is stored with the body so a reference into the wrong line is caught, not misread.
+    return json.dumps({"id": issue_id, **body}, ensure_ascii=True, separators=(",", ":")).encode("utf-8")
+
+
+def _append_body(path: Path, issue_id: str, body: Dict[str, Any]) -> List[int]:
+    """Append one body (caller holds the store lock) and return its [offset, length] reference."""
+    data = _body_line(issue_id, body)
+    with _bodies_path(path).open("ab") as f:
+        offset = f.seek(0, os.SEEK_END)
+        f.write(data + b"\n")
+    return [offset, len(data)]
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_bodies(name: str, ino: int, size: int, mtime_ns: int) -> Dict[str, List[int]]:
+    """[offset, length] of the last line for each issue ID in a bodies file; later lines win."""
+    index: Dict[str, List[int]] = {}
+    offset = 0
+    with open(name, "rb") as f:
+        for line in f:
+            data = line.rstrip(b"\n")
+            try:
+                body = json.loads(data)
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and isinstance(body.get("id"), str):
+                index[body["id"]] = [offset, len(data)]
+            offset += len(line)
+    return index
+
+
+def _body_index(handle: BinaryIO) -> Dict[str, List[int]]:
+    st = os.fstat(handle.fileno())
+    return _scan_bodies(handle.name, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _body_at(handle: BinaryIO, ref: List[int]) -> Optional[Dict[str, Any]]:
+    handle.seek(ref[0])
+    try:
+        body = json.loads(handle.read(ref[1]))
+    except ValueError:
+        return None
+    return body if isinstance(body, dict) else None
+
+
+def _read_body(handle: BinaryIO, issue_id: str, ref: List[int], trust_ref: bool = True) -> Dict[str, Any]:
+    """The body `ref` points at, or the last body line for `issue_id` when the reference is stale.
+
+    A reference goes stale when git merges two branches that both appended to the store: each
+    branch's offsets then land mid-line or on another issue's line. Body lines carry their issue
+    ID, so both cases are detected and resolved by scanning the file.
+    """
+    body = _body_at(handle, ref) if trust_ref else None
+    if body is None or body.get("id") != issue_id:
+        found = _body_index(handle).get(issue_id)
+        body = None if found is None else _body_at(handle, found)
+        if body is None:
+            raise SystemExit(f"{handle.name}: no body line for {issue_id}; restore the bodies file that goes with the store.")
+    del body["id"]
+    return body
+
+
+def _hydrate(row: Dict[str, Any], handle: Optional[BinaryIO], trust_ref: bool = True) -> Dict[str, Any]:
+    """Full record for a header row; rows without a body reference come back unchanged."""
+    ref = row.get(BODY_REF)
+    if not isinstance(ref, list):
+        return row
+    if handle is None:
+        raise SystemExit(f"Issue {row.get('id')} has an out-of-line body but the store has no bodies file.")
+    record = {key: value for key, value in row.items() if key != BODY_REF}
+    record.update(_read_body(handle, _norm(row.get("id")), ref, trust_ref))
+    return record
+
+
+def _fsync_bodies(path: Path) -> None:
+    bodies = _bodies_path(path)
+    if not bodies.exists():
+        return
+    fd = os.open(bodies, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _collect_body_refs(
+    rows: Iterable[Dict[str, Any]], refs: Dict[str, List[Tuple[str, List[int]]]]
+) -> Iterator[Dict[str, Any]]:
+    """Yield export rows with body references swapped for their UI shard (<PREFIX>-YYYY-MM)."""
+    for row in rows:
+        ref = row.get(BODY_REF)
+        if isinstance(ref, list):
+            issue_id = _norm(row.get("id"))
+            shard = issue_id.rsplit("-", 1)[0]
+            refs.setdefault(shard, []).append((issue_id, ref))
+            row = {**row, BODY_REF: shard}
+        yield row
+
+
+def _write_body_shards(refs: Dict[str, List[Tuple[str, List[int]]]], stores: List[Path], out_dir: Path) -> None:
+    """Write one script per shard for the UI detail pane, reading each body by offset.
+
+    Only one shard's bodies are held at a time; the rows themselves never carry them.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with contextlib.ExitStack() as stack:
+        handles: Dict[int, BinaryIO] = {}
+        for shard in sorted(refs):
+            bodies: Dict[str, Dict[str, Any]] = {}
+            for issue_id, ref in sorted(refs[shard]):
+                store = ref[2] if len(ref) > 2 else 0
+                if store not in handles:
+                    handles[store] = stack.enter_context(_bodies_path(stores[store]).open("rb"))
+                bodies[issue_id] = _read_body(handles[store], issue_id, ref)
+            payload = json.dumps(bodies, ensure_ascii=True, separators=(",", ":"))
+            (out_dir / f"{shard}.js").write_text(
+                f"window.BUGMGMT_BODIES_LOADED({json.dumps(shard)}, {payload});\n", encoding="utf-8"
+            )
+
+
+def _get_issue(path: Path, issue_id: str) -> Optional[Dict[str, Any]]:
+    row = _find_latest(path, issue_id)
+    if row is None or not isinstance(row.get(BODY_REF), list):
+        return row
+    with _bodies_path(path).open("rb") as handle:
+        return _hydrate(row, handle)
+
+
+def _offsets_path(path: Path) -> Path:
+    return _sidecar(path, ".offsets.json")
+
+
+def _load_offsets(path: Path, rescan: bool = False) -> Tuple[Dict[str, int], int]:
+    """Byte offset of each issue's latest record, plus the store size those offsets cover.
+
+    The table lives in <store>.offsets.json with the inode and size it was saved at; records
+    appended since (by another tool or by hand) are scanned from there. A store that was replaced
+    or shrank (compact, an editor rewrite) is rescanned from the start.
+    """
+    offsets: Dict[str, int] = {}
+    covered = 0
+    st = path.stat()
+    if not rescan:
+        try:
+            saved = json.loads(_offsets_path(path).read_text(encoding="utf-8"))
+            if saved["inode"] == st.st_ino and 0 <= saved["size"] <= st.st_size:
+                offsets, covered = saved["offsets"], saved["size"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    with path.open("rb") as f:
+        if covered:
+            f.seek(covered - 1)
+            if f.read(1) != b"\n":
+                # The saved size does not end on a record boundary, so the prefix was rewritten.
+                offsets, covered = {}, 0
+        f.seek(covered)
+        pos = covered
+        for raw in f:
+            if raw.strip():
+                issue_id = _norm(json.loads(raw).get("id"))
+                if issue_id:
+                    offsets[issue_id] = pos
+            pos += len(raw)
+    return offsets, pos
+
+
+def _save_offsets(path: Path, offsets: Dict[str, int], size: int) -> None:
+    target = _offsets_path(path)
+    tmp_path = _sidecar(path, ".offsets.json.tmp")
+    payload = {"inode": path.stat().st_ino, "size": size, "offsets": offsets}
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, target)
+
+
+def _find_latest(path: Path, issue_id: str, offsets: Optional[Dict[str, int]] = None) -> Optional[Dict[str, Any]]:
+    """Latest record for `issue_id`, read at its offset; `offsets` is rebuilt in place if it is stale."""
+    if not path.exists():
+        return None
+    if offsets is None:
+        offsets = _load_offsets(path)[0]
+    offset = offsets.get(issue_id)
+    if offset is None:
+        return None
+    with path.open("rb") as f:
+        f.seek(offset)
+        try:
+            row = json.loads(f.readline())
+        except ValueError:
+            row = {}
+    if _norm(row.get("id")) != issue_id:
+        # Rewritten in place behind the table (same inode, not shorter): rebuild it once.
+        offsets.clear()
+        offsets.update(_load_offsets(path, rescan=True)[0])
+        return _find_latest(path, issue_id, offsets)
+    return row
+
+
+def _check_record(record: Dict[str, Any]) -> None:
+    missing = [field for field in REQUIRED_FIELDS if not _norm(record.get(field))]
+    if missing:
+        raise SystemExit(f"Issue {record.get('id') or '<no id>'} is missing required fields: {', '.join(missing)}")
+    if _norm(record["status"]).lower() not in STATUS_ORDER:
+        raise SystemExit(f"Status must be one of {', '.join(STATUS_ORDER)}")
+    if _norm(record["severity"]).lower() not in SEVERITY_ORDER:
+        raise SystemExit(f"Severity must be one of {', '.join(SEVERITY_ORDER)}")
+    _validate_issue_ids([record])
+
+
+def _id_width(value: Optional[int] = None) -> int:
+    if value is None:
+        raw = os.environ.get("BUGMGMT_ID_WIDTH", "").strip()
+        try:
+            value = int(raw) if raw else DEFAULT_ID_WIDTH
+        except ValueError:
+            raise SystemExit(f"BUGMGMT_ID_WIDTH must be an integer, got '{raw}'") from None
+    if value < 3:
+        raise SystemExit("ID sequence width must be at least 3")
+    return value
+
+
+def _scan_high_water(path: Path) -> Dict[str, int]:
+    table: Dict[str, int] = {}
+    if not path.exists():
+        return table
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            match = ID_PATTERN.match(_norm(json.loads(line).get("id")))
+            if match:
+                key = f"{match.group('prefix')}-{match.group('year')}-{match.group('month')}"
+                table[key] = max(table.get(key, 0), int(match.group("seq")))
+    return table
+
+
+def _load_high_water(path: Path) -> Dict[str, int]:
+    """Highest sequence number per <PREFIX>-YYYY-MM (caller holds the store lock).
+
+    The table lives in <store>.ids.json and is rebuilt from a full scan only when it is missing
+    or unreadable.
+    """
+    try:
+        table = json.loads(_sidecar(path, ".ids.json").read_text(encoding="utf-8"))
+        if isinstance(table, dict) and all(isinstance(v, int) for v in table.values()):
+            return table
+    except (OSError, json.JSONDecodeError):
+        pass
+    return _scan_high_water(path)
+
+
+def _save_high_water(path: Path, table: Dict[str, int]) -> None:
+    target = _sidecar(path, ".ids.json")
+    tmp_path = _sidecar(path, ".ids.json.tmp")
+    tmp_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path.write_text(json.dumps(table, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, target)
+
+
+def _next_id(path: Path, project: str, month: str, width: int) -> str:
+    """Reserve the next free ID for `project` in `month` (YYYY-MM); caller holds the store lock."""
+    prefix = PROJECT_PREFIXES.get(project.lower())
+    if not prefix:
+        raise SystemExit(f"Project '{project}' has no configured prefix (set PROJECT_PREFIXES)")
+    if not re.fullmatch(r"\d{4}-\d{2}", month):
+        raise SystemExit(f"Month must be YYYY-MM, got '{month}'")
+    key = f"{prefix}-{month}"
+    table = _load_high_water(path)
+    seq = table.get(key, 0) + 1
+    if seq >= 10**width:
+        raise SystemExit(
+            f"{key} has used all {10**width - 1} IDs at width {width}; "
+            "raise --width (or BUGMGMT_ID_WIDTH) for this store."
+        )
+    table[key] = seq
+    _save_high_water(path, table)
+    return f"{key}-{seq:0{width}d}"
+
+
+def _note_high_water(path: Path, issue_id: str) -> None:
+    match = ID_PATTERN.match(issue_id)
+    if not match:
+        return
+    key = f"{match.group('prefix')}-{match.group('year')}-{match.group('month')}"
+    table = _load_high_water(path)
+    if table.get(key, 0) < int(match.group("seq")):
+        table[key] = int(match.group("seq"))
+        _save_high_water(path, table)
+
+
+def _write_issue(
+    path: Path,
+    issue_id: Optional[str],
+    fields: Dict[str, Any],
+    create: bool,
+    group_commit: bool = True,
+    width: Optional[int] = None,
+    closing: bool = False,
+) -> Tuple[Dict[str, Any], bool]:
+    """Add (create=True) or update one issue; returns the stored record and whether this call fsynced.
+
+    A create without `issue_id` allocates the next ID for the record's project and month.
+    `closing` refuses an issue that is already closed, so its closing date and note are kept.
+    """
+    with _locked(_sidecar(path, ".lock")):
+        if issue_id is None:
+            if not create:
+                raise SystemExit("update and close require --id")
+            if not _norm(fields.get("project")):
+                raise SystemExit("add without --id needs --set project=<project> to allocate one")
+            issue_id = _next_id(path, _norm(fields["project"]), date.today().strftime("%Y-%m"), _id_width(width))
+        offsets: Dict[str, int] = _load_offsets(path)[0] if path.exists() else {}
+        current = _find_latest(path, issue_id, offsets)
+        if create and current is not None:
+            raise SystemExit(f"Issue {issue_id} already exists; use update.")
+        if not create and current is None:
+            raise SystemExit(f"Issue {issue_id} not found in {path}")
+        if closing and _norm(current.get("status")) == "closed":
+            raise SystemExit(
+                f"Issue {issue_id} was already closed on {_norm(current.get('date_closed')) or 'an unknown date'}; "
+                "pass --reclose to overwrite its closing date and note."
+            )
+        if create:
+            record: Dict[str, Any] = {
+                "id": issue_id,
+                "date": date.today().isoformat(),
+                "status": "open",
+                "owner": "unassigned",
+            }
+        else:
+            record = dict(current)
+        old_body = None
+        if isinstance(record.get(BODY_REF), list):
+            with _bodies_path(path).open("rb") as handle:
+                record = _hydrate(record, handle)
+            old_body = _split_record(record)[1]
+        record.update(fields)
+        _check_record(record)
+        stored = record
+        if old_body is not None or _bodies_path(path).exists():
+            stored, body = _split_record(record)
+            if body:
+                # Header-only edits (status, owner, ...) keep pointing at the existing body line.
+                stored[BODY_REF] = current[BODY_REF] if body == old_body else _append_body(path, issue_id, body)
+        start, end = _append_record(path, stored)
+        offsets[issue_id] = start
+        _save_offsets(path, offsets, end)
+        if create:
+            _note_high_water(path, issue_id)
+        # Deltas are recorded once `snapshot` has seeded the history from record dates.
+        hist = _history_dir(path)
+        if (hist / "index.json").exists() and (current is None or _issue_state(current) != _issue_state(record)):
+            _append_deltas(hist, [{"d": date.today().isoformat(), "id": issue_id, "s": _issue_state(record)}])
+    if group_commit:
+        return record, _group_sync(path, end)
+    _fsync_bodies(path)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return record, True
+
+
+def _compact(path: Path, layout: Optional[str] = None) -> Tuple[int, int]:
+    """Fold superseded records in one streaming pass; returns (records before, records after).
+
+    `layout` ("inline" or "split") converts the store; by default it keeps its current layout.
+    Live bodies are copied into a fresh bodies file, which replaces the old one just before the
+    store does; body lines carry their issue ID, so a crash between the two renames is caught on
+    the next read instead of returning another issue's body. Bodies are looked up by issue ID
+    rather than through the header references, so compacting also repairs references that a git
+    merge has shifted.
+    """
+    if not path.exists():
+        return 0, 0
+    bodies = _bodies_path(path)
+    with _locked(_sidecar(path, ".lock")), _locked(_sidecar(path, ".sync.lock")):
+        was_split = bodies.exists()
+        split = was_split if layout is None else layout == "split"
+        latest: Dict[Any, str] = {}
+        total = 0
+        with path.open("r", encoding="utf-8") as f:
+            for idx, line in enumerate(f):
+                line = line.strip()
+                if not line:
+                    continue
+                total += 1
+                issue_id = _norm(json.loads(line).get("id"))
+                # Dict order keeps each issue at its first position; records without ids stay put.
+                latest[issue_id or ("", idx)] = line
+        tmp_path = _sidecar(path, ".compact.tmp")
+        bodies_tmp = _sidecar(path, ".bodies.compact.tmp")
+        offsets: Dict[str, int] = {}
+        size = 0
+        with contextlib.ExitStack() as stack:
+            out = stack.enter_context(tmp_path.open("w", encoding="utf-8"))
+            old_bodies = stack.enter_context(bodies.open("rb")) if was_split else None
+            new_bodies = stack.enter_context(bodies_tmp.open("wb")) if split else None
+            for key, line in latest.items():
+                if isinstance(key, str) and (was_split or split):
+                    record = _hydrate(json.loads(line), old_bodies, trust_ref=False)
+                    if new_bodies is not None:
+                        record, body = _split_record(record)
+                        if body:
+                            data = _body_line(key, body)
+                            record[BODY_REF] = [new_bodies.tell(), len(data)]
+                            new_bodies.write(data + b"\n")
+                    line = json.dumps(record, ensure_ascii=True, separators=(",", ":"))
+                if isinstance(key, str):
+                    offsets[key] = size
+                out.write(line + "\n")
+                size += len(line.encode("utf-8")) + 1
+            for handle in (new_bodies, out):
+                if handle is not None:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+        if split:
+            os.replace(bodies_tmp, bodies)
+        os.replace(tmp_path, path)
+        if was_split and not split:
+            bodies.unlink()
+        st = path.stat()
+        _sidecar(path, ".sync").write_text(f"{st.st_ino} {st.st_size}", encoding="utf-8")
+        _save_offsets(path, offsets, size)
+    return total, len(latest)
+
+
+# Signature length: the share of equal slots estimates Jaccard similarity with a standard error of
+# about sqrt(s(1 - s) / 128), under 0.05 for any s.
+MINHASH_PERMUTATIONS = 128
+# LSH bands of MINHASH_PERMUTATIONS / MINHASH_BANDS = 4 rows. Two issues become a candidate pair when
+# any band matches, with probability 1 - (1 - s^4)^32: about 0.87 at s = 0.5 (the default --threshold),
+# 0.99 at s = 0.6, and 0.23 at s = 0.3. Candidates are then checked against --threshold on the full
+# signature, so the bands only trade recall near the threshold against pairwise comparisons.
+MINHASH_BANDS = 32
+# Modulus of the (a * h + b) mod p permutations: a Mersenne prime wide enough that distinct shingles
+# almost never collide.
+MINHASH_PRIME = (1 << 61) - 1
+# Word trigrams: long enough that unrelated issues sharing stock words ("the page does not") rarely
+# overlap, short enough that a reworded sentence still shares most shingles.
+SHINGLE_WORDS = 3
+DEDUPE_FIELDS = ["summary", "description", "details", "symptom"]
+
+
+def _shingles(row: Dict[str, Any]) -> set:
+    text = " ".join(_norm(row.get(field)) for field in DEDUPE_FIELDS).lower()
+    words = re.findall(r"[a-z0-9]+", text)
+    if len(words) < SHINGLE_WORDS:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[idx : idx + SHINGLE_WORDS]) for idx in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def _minhash_params() -> List[Tuple[int, int]]:
+    import random
+
+    rng = random.Random(20251222)
+    return [(rng.randrange(1, MINHASH_PRIME), rng.randrange(0, MINHASH_PRIME)) for _ in range(MINHASH_PERMUTATIONS)]
+
+
+def _minhash(shingles: set, params: List[Tuple[int, int]]) -> List[int]:
+    import hashlib
+
+    hashed = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingles]
+    if not hashed:
+        return [MINHASH_PRIME] * len(params)
+    return [min((a * h + b) % MINHASH_PRIME for h in hashed) for a, b in params]
+
+
+def _load_signature_index(path: Path) -> Dict[str, Dict[str, Any]]:
+    index_path = _sidecar(path, ".minhash.json")
+    if not index_path.exists():
+        return {}
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    params = payload.get("params", {})
+    if params != {"permutations": MINHASH_PERMUTATIONS, "bands": MINHASH_BANDS, "shingle_words": SHINGLE_WORDS}:
+        return {}
+    return payload.get("signatures", {})
+
+
+def _update_signatures(path: Path, rows: List[Dict[str, Any]]) -> Tuple[Dict[str, List[int]], set]:
+    """Return MinHash signatures for every issue, recomputing only new or edited ones.
+
+    Signatures are persisted in <store>.minhash.json keyed by issue ID and a digest of the
+    shingled text, so later runs only hash what was appended or changed. For split stores the
+    entry also records the body reference: body lines are never rewritten in place, so an issue
+    whose reference and header text are unchanged is reused without reading its body.
+    """
+    import hashlib
+
+    cached = _load_signature_index(path)
+    params = _minhash_params()
+    signatures: Dict[str, List[int]] = {}
+    fresh: set = set()
+    stored: Dict[str, Dict[str, Any]] = {}
+    bodies = _bodies_path(path)
+    with contextlib.ExitStack() as stack:
+        handle = stack.enter_context(bodies.open("rb")) if bodies.exists() else None
+        for row in rows:
+            issue_id = _norm(row.get("id"))
+            if not issue_id:
+                continue
+            entry = cached.get(issue_id)
+            source = None
+            if isinstance(row.get(BODY_REF), list):
+                source = json.dumps([row[BODY_REF]] + [_norm(row.get(field)) for field in DEDUPE_FIELDS])
+                if entry and entry.get("source") == source:
+                    signatures[issue_id] = entry["sig"]
+                    stored[issue_id] = entry
+                    continue
+            shingles = _shingles(_hydrate(row, handle))
+            digest = hashlib.sha1("\n".join(sorted(shingles)).encode("utf-8")).hexdigest()
+            if entry and entry.get("digest") == digest:
+                signature = entry["sig"]
+            else:
+                signature = _minhash(shingles, params)
+                fresh.add(issue_id)
+            signatures[issue_id] = signature
+            stored[issue_id] = {"digest": digest, "sig": signature}
+            if source:
+                stored[issue_id]["source"] = source
+    if fresh or stored != cached:
+        payload = {
+            "params": {"permutations": MINHASH_PERMUTATIONS, "bands": MINHASH_BANDS, "shingle_words": SHINGLE_WORDS},
+            "signatures": stored,
+        }
+        _sidecar(path, ".minhash.json").write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    return signatures, fresh
+
+
+def _duplicate_clusters(
+    signatures: Dict[str, List[int]],
+    threshold: float,
+    focus: Optional[set] = None,
+) -> List[Tuple[float, List[str]]]:
+    """Group near-duplicates via LSH banding; only bucket collisions are compared pairwise.
+
+    With `focus`, only candidate pairs touching those IDs are verified (incremental checks).
+    """
+    rows_per_band = MINHASH_PERMUTATIONS // MINHASH_BANDS
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+    for issue_id, signature in signatures.items():
+        if signature[0] == MINHASH_PRIME:
+            continue  # no text to compare
+        for band in range(MINHASH_BANDS):
+            key = (band, tuple(signature[band * rows_per_band : (band + 1) * rows_per_band]))
+            buckets.setdefault(key, []).append(issue_id)
+    parent: Dict[str, str] = {}
+
+    def find(item: str) -> str:
+        while parent.get(item, item) != item:
+            parent[item] = parent.get(parent[item], parent[item])
+            item = parent[item]
+        return item
+
+    checked: set = set()
+    scores: Dict[str, float] = {}
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for i, left in enumerate(members):
+            for right in members[i + 1 :]:
+                pair = (left, right) if left < right else (right, left)
+                if pair in checked or (focus is not None and left not in focus and right not in focus):
+                    continue
+                checked.add(pair)
+                sig_l, sig_r = signatures[left], signatures[right]
+                similarity = sum(1 for a, b in zip(sig_l, sig_r) if a == b) / MINHASH_PERMUTATIONS
+                if similarity < threshold:
+                    continue
+                root_l, root_r = find(left), find(right)
+                if root_l != root_r:
+                    parent[root_r] = root_l
+                for member in pair:
+                    scores[member] = max(scores.get(member, 0.0), similarity)
+    clusters: Dict[str, List[str]] = {}
+    for member in scores:
+        clusters.setdefault(find(member), []).append(member)
+    result = [(max(scores[m] for m in members), sorted(members)) for members in clusters.values()]
+    return sorted(result, key=lambda item: (-item[0], item[1]))
+
+
+def _run_dedupe(args: argparse.Namespace) -> None:
+    path = _single_store(args.data)
+    rows = _load_issues(path)
+    by_id = {_norm(row.get("id")): row for row in rows}
+    signatures, fresh = _update_signatures(path, rows)
+    clusters = _duplicate_clusters(signatures, args.threshold, fresh if args.new_only else None)
+    if args.output:
+        payload = [{"similarity": round(score, 3), "ids": members} for score, members in clusters]
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if not clusters:
+        print(f"No likely duplicates at similarity >= {args.threshold} ({len(signatures)} issues, {len(fresh)} re-hashed).")
+        return
+    print(f"{len(clusters)} likely duplicate cluster(s) ({len(signatures)} issues, {len(fresh)} re-hashed):")
+    for score, members in clusters:
+        print(f"- ~{score:.2f} similar:")
+        for issue_id in members:
+            row = by_id.get(issue_id, {})
+            print(f"    {issue_id} [{_norm(row.get('status'))}] {_norm(row.get('summary'))}")
+
+
+HISTORY_SNAPSHOT_EVERY = 256
+
+
+def _history_dir(path: Path) -> Path:
+    return path.with_name(path.name + ".history")
+
+
+def _issue_state(row: Dict[str, Any]) -> List[str]:
+    return [_norm(row.get("status")).lower(), _norm(row.get("severity")).lower(), _norm(row.get("project"))]
+
+
+def _load_history_index(hist: Path) -> Dict[str, Any]:
+    try:
+        return json.loads((hist / "index.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {"first_day": "", "last_day": "", "pending": 0, "snapshots": []}
+
+
+def _save_history_index(hist: Path, index: Dict[str, Any]) -> None:
+    tmp_path = hist / "index.json.tmp"
+    tmp_path.write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, hist / "index.json")
+
+
+def _replay(hist: Path, start: int, state: Dict[str, List[str]], until: Optional[str] = None) -> int:
+    """Apply deltas from byte `start` through day `until`; returns the offset of the first unapplied delta."""
+    log_path = hist / "deltas.jsonl"
+    offset = start
+    if not log_path.exists():
+        return offset
+    with log_path.open("rb") as f:
+        f.seek(start)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # a writer is still appending this line
+            delta = json.loads(raw)
+            if until is not None and delta["d"] > until:
+                break
+            if delta["s"] is None:
+                state.pop(delta["id"], None)
+            else:
+                state[delta["id"]] = delta["s"]
+            offset += len(raw)
+    return offset
+
+
+def _write_snapshot(hist: Path, index: Dict[str, Any], offset: int) -> None:
+    state: Dict[str, List[str]] = {}
+    start = 0
+    if index["snapshots"]:
+        previous = index["snapshots"][-1]
+        state = json.loads((hist / "snapshots" / previous["file"]).read_text(encoding="utf-8"))["issues"]
+        start = previous["offset"]
+    _replay(hist, start, state)
+    name = f"{index['last_day']}-{offset}.json"
+    payload = {"day": index["last_day"], "offset": offset, "issues": state}
+    (hist / "snapshots" / name).write_text(json.dumps(payload, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+    index["snapshots"].append({"day": index["last_day"], "offset": offset, "file": name})
+    index["pending"] = 0
+
+
+def _append_deltas(hist: Path, deltas: List[Dict[str, Any]], snapshot: bool = False) -> None:
+    """Append issue state changes (caller holds the store lock) and snapshot every HISTORY_SNAPSHOT_EVERY deltas.
+
+    Days never go backwards in the log, so a replay can stop at the first delta past its date.
+    """
+    index = _load_history_index(hist)
+    (hist / "snapshots").mkdir(parents=True, exist_ok=True)
+    with (hist / "deltas.jsonl").open("ab") as f:
+        for delta in deltas:
+            delta["d"] = max(delta["d"], index["last_day"])
+            f.write((json.dumps(delta, separators=(",", ":")) + "\n").encode("utf-8"))
+            index["first_day"] = index["first_day"] or delta["d"]
+            index["last_day"] = delta["d"]
+            index["pending"] += 1
+            if index["pending"] >= HISTORY_SNAPSHOT_EVERY:
+                f.flush()
+                _write_snapshot(hist, index, f.tell())
+        f.flush()
+        if snapshot and index["pending"]:
+            _write_snapshot(hist, index, f.tell())
+    _save_history_index(hist, index)
+
+
+def _ensure_history(path: Path) -> Path:
+    """Return the store's history dir, seeding it from record dates on first use (caller holds the lock)."""
+    hist = _history_dir(path)
+    if (hist / "index.json").exists():
+        return hist
+    hist.mkdir(parents=True, exist_ok=True)
+    deltas: List[Dict[str, Any]] = []
+    today = date.today().isoformat()
+    for row in _load_issues(path):
+        issue_id = _norm(row.get("id"))
+        if not issue_id:
+            continue
+        state = _issue_state(row)
+        opened = _norm(row.get("date")) or today
+        if state[0] == "closed":
+            deltas.append({"d": opened, "id": issue_id, "s": ["open", *state[1:]]})
+            deltas.append({"d": _norm(row.get("date_closed")) or opened, "id": issue_id, "s": state})
+        else:
+            deltas.append({"d": opened, "id": issue_id, "s": state})
+    deltas.sort(key=lambda delta: (delta["d"], delta["s"][0] == "closed", delta["id"]))
+    _append_deltas(hist, deltas)
+    return hist
+
+
+def _state_asof(hist: Path, day: str) -> Tuple[Dict[str, List[str]], int]:
+    """Issue states at the end of `day`: nearest snapshot plus the deltas after it."""
+    base = None
+    for snap in _load_history_index(hist)["snapshots"]:
+        if snap["day"] > day:
+            break
+        base = snap
+    state: Dict[str, List[str]] = {}
+    start = 0
+    if base:
+        state = json.loads((hist / "snapshots" / base["file"]).read_text(encoding="utf-8"))["issues"]
+        start = base["offset"]
+    return state, _replay(hist, start, state, day)
+
+
+def _check_day(value: str, flag: str) -> str:
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise SystemExit(f"{flag} must be YYYY-MM-DD, got '{value}'") from None
+
+
+def _burndown(hist: Path, since: str, until: str) -> List[Dict[str, Any]]:
+    """Daily open/opened/closed series from one snapshot lookup and a single forward pass over the deltas."""
+    start_day = date.fromisoformat(since)
+    state, offset = _state_asof(hist, (start_day - timedelta(days=1)).isoformat())
+    open_count = sum(1 for value in state.values() if value[0] != "closed")
+    activity: Dict[str, List[int]] = {}
+    log_path = hist / "deltas.jsonl"
+    if log_path.exists():
+        with log_path.open("rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                delta = json.loads(raw)
+                if delta["d"] > until:
+                    break
+                counts = activity.setdefault(delta["d"], [0, 0, 0])
+                before = state.get(delta["id"])
+                after = delta["s"]
+                was_open = before is not None and before[0] != "closed"
+                is_open = after is not None and after[0] != "closed"
+                if before is None and after is not None:
+                    counts[1] += 1
+                if was_open and after is not None and after[0] == "closed":
+                    counts[2] += 1
+                counts[0] += int(is_open) - int(was_open)
+                if after is None:
+                    state.pop(delta["id"], None)
+                else:
+                    state[delta["id"]] = after
+    series: List[Dict[str, Any]] = []
+    day = start_day
+    end_day = date.fromisoformat(until)
+    while day <= end_day:
+        change, opened, closed = activity.get(day.isoformat(), [0, 0, 0])
+        open_count += change
+        series.append({"date": day.isoformat(), "open": open_count, "opened": opened, "closed": closed})
+        day += timedelta(days=1)
+    return series
+
+
+def _burndown_svg(series: List[Dict[str, Any]]) -> str:
+    width, height, pad = 720, 220, 28
+    peak = max([1] + [max(row["open"], row["opened"], row["closed"]) for row in series])
+    step = (width - 2 * pad) / max(1, len(series) - 1)
+    bar = max(1.0, min(12.0, step * 0.4))
+
+    def y(value: int) -> float:
+        return height - pad - value * (height - 2 * pad) / peak
+
+    parts = [
+        f'<svg viewBox="0 0 {width} {height}" width="100%" role="img" aria-label="Open issues per day">',
+        f'<line x1="{pad}" y1="{height - pad}" x2="{width - pad}" y2="{height - pad}" stroke="#cbd5e1" />',
+        f'<text x="4" y="{pad}" font-size="11" fill="#64748b">{peak}</text>',
+    ]
+    for idx, row in enumerate(series):
+        x = pad + idx * step
+        if row["closed"]:
+            parts.append(
+                f'<rect x="{x - bar:.1f}" y="{y(row["closed"]):.1f}" width="{bar:.1f}" '
+                f'height="{height - pad - y(row["closed"]):.1f}" fill="#16a34a" opacity="0.6" />'
+            )
+        if row["opened"]:
+            parts.append(
+                f'<rect x="{x:.1f}" y="{y(row["opened"]):.1f}" width="{bar:.1f}" '
+                f'height="{height - pad - y(row["opened"]):.1f}" fill="#dc2626" opacity="0.5" />'
+            )
+    points = " ".join(f"{pad + idx * step:.1f},{y(row['open']):.1f}" for idx, row in enumerate(series))
+    parts.append(f'<polyline points="{points}" fill="none" stroke="#1d4ed8" stroke-width="2" />')
+    if series:
+        parts.append(f'<text x="{pad}" y="{height - 8}" font-size="11" fill="#64748b">{series[0]["date"]}</text>')
+        parts.append(
+            f'<text x="{width - pad}" y="{height - 8}" font-size="11" fill="#64748b" text-anchor="end">'
+            f'{series[-1]["date"]}</text>'
+        )
+    parts.append("</svg>")
+    return "\n        ".join(parts)
+
+
+def _burndown_page(series: List[Dict[str, Any]], source: str) -> str:
+    import html
+
+    opened = sum(row["opened"] for row in series)
+    closed = sum(row["closed"] for row in series)
+    weeks = max(1.0, len(series) / 7)
+    cards = [
+        (f"Open on {series[0]['date']}" if series else "Open at start", series[0]["open"] if series else 0),
+        (f"Open on {series[-1]['date']}" if series else "Open at end", series[-1]["open"] if series else 0),
+        ("Opened", opened),
+        ("Closed", closed),
+        ("Closed per week", f"{closed / weeks:.1f}"),
+    ]
+    card_html = "\n        ".join(
+        f'<div class="summary-card"><div class="muted small">{label}</div><div class="h6">{value}</div></div>'
+        for label, value in cards
+    )
+    active = [row for row in series if row["opened"] or row["closed"]]
+    table_rows = "\n            ".join(
+        f"<tr><td>{row['date']}</td><td>{row['open']}</td><td>{row['opened']}</td><td>{row['closed']}</td></tr>"
+        for row in reversed(active)
+    ) or '<tr><td colspan="4" class="muted small">No issue activity in this range.</td></tr>'
+    span = f"{series[0]['date']} to {series[-1]['date']}" if series else "no history"
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Bug Management Burndown</title>
+  <link rel="stylesheet" href="style/bugmgmt.css" />
+</head>
+<body>
+  <div class="container">
+    <nav class="top-nav">
+      <a class="nav-link nav-home" href="index.html">Home</a>
+      <a class="nav-link nav-process" href="process_guide.html">Process Management</a>
+      <a class="nav-link nav-project" href="PM.html">Project Management</a>
+      <a class="nav-link nav-bug" href="bugmgmt_issues.html">Bug Management</a>
+    </nav>
+    <header class="hero">
+      <div>
+        <h1 class="h4">Bug Management Burndown</h1>
+        <p class="muted small">Open issues per day with daily opened/closed throughput · {span}</p>
+      </div>
+    </header>
+
+    <div class="card">
+      <div class="summary">
+        {card_html}
+      </div>
+      <div class="table-wrap">
+        {_burndown_svg(series)}
+      </div>
+      <div class="filter-hint">Blue line: open issues · Red bars: opened · Green bars: closed · Source: {html.escape(source)} history snapshots + deltas.</div>
+    </div>
+
+    <div class="card">
+      <div class="table-wrap">
+        <table class="issues">
+          <thead>
+            <tr><th>Date</th><th>Open</th><th>Opened</th><th>Closed</th></tr>
+          </thead>
+          <tbody>
+            {table_rows}
+          </tbody>
+        </table>
+      </div>
+    </div>
+  </div>
+</body>
+</html>
+"""
+
+
+def _run_history_command(args: argparse.Namespace) -> None:
+    path = _single_store(args.data)
+    if args.command == "snapshot":
+        with _locked(_sidecar(path, ".lock")):
+            hist = _ensure_history(path)
+            recorded, _ = _state_asof(hist, "9999-12-31")
+            today = date.today().isoformat()
+            current = {_norm(row.get("id")): _issue_state(row) for row in _load_issues(path) if _norm(row.get("id"))}
+            deltas = [
+                {"d": today, "id": issue_id, "s": state}
+                for issue_id, state in current.items()
+                if recorded.get(issue_id) != state
+            ]
+            deltas += [{"d": today, "id": issue_id, "s": None} for issue_id in recorded if issue_id not in current]
+            _append_deltas(hist, deltas, snapshot=True)
+            print(f"Snapshot of {len(current)} issues recorded in {hist} ({len(deltas)} untracked change(s) captured)")
+        return
+    # Read-only from here: deltas are appended as whole lines and the index is replaced atomically.
+    hist = _history_dir(path)
+    if not (hist / "index.json").exists():
+        raise SystemExit(f"No history recorded for {path} yet; run `issues.py snapshot` first.")
+    index = _load_history_index(hist)
+    if args.command == "asof":
+        if not args.date:
+            raise SystemExit("asof requires --date YYYY-MM-DD")
+        day = _check_day(args.date, "--date")
+        state, _ = _state_asof(hist, day)
+        counts = {status: 0 for status in STATUS_ORDER}
+        for value in state.values():
+            counts[value[0]] = counts.get(value[0], 0) + 1
+        if args.output:
+            payload = {
+                "date": day,
+                "counts": counts,
+                "issues": {
+                    issue_id: dict(zip(["status", "severity", "project"], value))
+                    for issue_id, value in sorted(state.items())
+                },
+            }
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"As of {day}: " + ", ".join(f"{count} {status}" for status, count in counts.items()))
+        for issue_id, value in sorted(
+            state.items(), key=lambda item: (_status_weight(item[1][0]), _severity_weight(item[1][1]), item[0])
+        ):
+            if value[0] != "closed":
+                print(f"  {issue_id} [{value[0]}] {value[1]} {value[2]}")
+        return
+    since = _check_day(args.since, "--since") if args.since else index["first_day"]
+    until = _check_day(args.until, "--until") if args.until else index["last_day"]
+    if not since or not until:
+        raise SystemExit(f"No history recorded for {path} yet.")
+    series = _burndown(hist, since, until)
+    if args.format == "json":
+        output = args.output or Path("AI_first/bugmgmt/exports/json/bugmgmt_burndown.json")
+    else:
+        output = args.output or Path("AI_first/ui/bugmgmt_burndown.html")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if args.format == "json":
+        output.write_text(json.dumps(series, indent=2) + "\n", encoding="utf-8")
+    else:
+        output.write_text(_burndown_page(series, path.as_posix()), encoding="utf-8")
+    print(f"Wrote {args.format.upper()} burndown ({since} to {until}) to {output}")
+
+
+def _run_stats(args: argparse.Namespace) -> None:
+    path = _single_store(args.data)
+    as_of = _check_day(args.date, "--date") if args.date else None
+    from issue_columns import load_columns
+    from issue_stats import compute_stats, stats_page
+
+    stats = compute_stats(load_columns(path), as_of, args.where)
+    if args.format == "json":
+        output = args.output or Path("AI_first/bugmgmt/exports/json/bugmgmt_stats.json")
+    else:
+        output = args.output or Path("AI_first/ui/bugmgmt_stats.html")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if args.format == "json":
+        output.write_text(json.dumps(stats, indent=2) + "\n", encoding="utf-8")
+    else:
+        output.write_text(stats_page(stats, path.as_posix()), encoding="utf-8")
+    print(f"Wrote {args.format.upper()} stats for {stats['issues']} issues (as of {stats['as_of']}) to {output}")
+
+
+def _single_store(values: Optional[List[str]]) -> Path:
+    stores = _resolve_stores(values)
+    if len(stores) != 1:
+        raise SystemExit("Write commands take exactly one --data store.")
+    return stores[0]
+
+
+def _parse_assignments(values: Optional[List[str]]) -> Dict[str, str]:
+    fields: Dict[str, str] = {}
+    for value in values or []:
+        key, sep, raw = value.partition("=")
+        if not sep or not key.strip():
+            raise SystemExit(f"Expected KEY=VALUE, got '{value}'")
+        fields[key.strip()] = raw.strip()
+    if "id" in fields:
+        raise SystemExit("Use --id to choose the issue, not --set id=...")
+    if BODY_REF in fields:
+        raise SystemExit(f"'{BODY_REF}' is reserved for out-of-line body references")
+    return fields
+
+
+def _run_write_command(args: argparse.Namespace) -> None:
+    path = _single_store(args.data)
+    if args.command == "compact":
+        before, after = _compact(path, args.layout)
+        layout = "split" if _bodies_path(path).exists() else "inline"
+        print(f"Compacted {path}: {before} records -> {after} ({layout} bodies)")
+        return
+    if args.command == "next-id":
+        if not args.project:
+            raise SystemExit("next-id requires --project")
+        month = args.month or date.today().strftime("%Y-%m")
+        with _locked(_sidecar(path, ".lock")):
+            print(_next_id(path, args.project, month, _id_width(args.width)))
+        return
+    if not args.id and args.command != "add":
+        raise SystemExit(f"{args.command} requires --id")
+    fields = _parse_assignments(args.set)
+    if args.command == "close":
+        fields.setdefault("status", "closed")
+        fields.setdefault("date_closed", date.today().isoformat())
+        if args.note:
+            fields["close_note"] = args.note
+    record, _ = _write_issue(
+        path,
+        args.id,
+        fields,
+        create=args.command == "add",
+        width=args.width,
+        closing=args.command == "close" and not args.reclose,
+    )
+    verb = {"add": "Added", "update": "Updated", "close": "Closed"}[args.command]
+    print(f"{verb} {record['id']} ({record['status']})")
+
+
+def _run_get(args: argparse.Namespace) -> None:
+    path = _single_store(args.data)
+    if not args.id:
+        raise SystemExit("get requires --id")
+    record = _get_issue(path, args.id)
+    if record is None:
+        raise SystemExit(f"Issue {args.id} not found in {path}")
+    text = json.dumps(record, indent=2) + "\n"
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+
+
+def _forward_to_daemon(argv: List[str]) -> Optional[int]:
+    if "--no-daemon" in argv:
+        return None
+    try:
+        from aifirst_daemon import forward
+    except ImportError:
+        return None
+    return forward("issues", argv, Path(__file__).resolve().parents[2])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args = parse_args(argv)
+    if args.command == "dedupe":
+        _run_dedupe(args)
+        return
+    if args.command == "get":
+        _run_get(args)
+        return
+    if args.command in {"snapshot", "asof", "burndown"}:
+        _run_history_command(args)
+        return
+    if args.command == "stats":
+        _run_stats(args)
+        return
+    if args.command != "list":
+        _run_write_command(args)
+        return
+    code = _forward_to_daemon(argv)
+    if code is not None:
+        raise SystemExit(code)
+    _export_stores(_resolve_stores(args.data), args.format, args.output, args.plain, args.where)
 
 
 if __name__ == "__main__":
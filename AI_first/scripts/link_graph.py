@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Cross-document reference graph recorded by the renderers, with forward links and backlinks.
+
+`render_docs.py` records, for every markdown source it renders, the `[label](href)` links and the
+backticked `AI_first/...` paths it mentions, plus which page renders it. `render_pm.py` records the
+markdown each project page embeds. The graph lives in `AI_first/.cache/link_graph.json`
+(derived, git-ignored) and keeps both directions, so the pages that depend on a changed or moved
+file, and the references a removal breaks, are found from that file's edges alone.
+
+    python3 AI_first/scripts/link_graph.py backlinks AI_first/docs/process.md
+    python3 AI_first/scripts/link_graph.py broken
+"""
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import os
+import posixpath
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+FORMAT = "aifirst-links/1"
+GRAPH_FILE = Path("AI_first/.cache/link_graph.json")
+# Edges written by a markdown source: a `[label](href)` link, or a backticked repo path.
+REFERENCE_KINDS = ("link", "path")
+# Only links have to resolve: backticked paths also name generated outputs, git-ignored data, and
+# directories a doc describes before they exist, so a missing one is not a broken reference.
+BROKEN_KINDS = ("link",)
+# Edges written by an output page: the source it renders, markdown it embeds, directories it lists.
+PAGE_KINDS = ("renders", "embeds", "lists")
+ANCHOR = re.compile(r'<a href="([^"]*)">')
+CODE_PATH = re.compile(r"<code>(AI_first/[^<]*)</code>")
+# Placeholders such as `AI_first/projects/<project>/`, `AI_first/...`, or globs are patterns, not references.
+NOT_A_PATH = re.compile(r"[<>*{}\s]|\.\.\.")
+
+
+def references(fragment: str, source: str) -> Iterable[Tuple[str, str]]:
+    """(kind, repo-relative target) of each reference in a rendered HTML fragment of `source`."""
+    if "<a " in fragment:
+        for match in ANCHOR.finditer(fragment):
+            href = html.unescape(match.group(1)).split("#", 1)[0].split("?", 1)[0]
+            if not href or href.startswith("/") or ":" in href:
+                # In-page anchors, absolute paths, and URLs are outside the graph.
+                continue
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(source), href))
+            if not target.startswith("../"):
+                yield "link", target
+    if "<code>AI_first/" in fragment:
+        for match in CODE_PATH.finditer(fragment):
+            target = html.unescape(match.group(1))
+            if not NOT_A_PATH.search(target):
+                yield "path", target.rstrip("/")
+
+
+class LinkGraph:
+    """Edges `source -kind-> target` between repo-relative paths, indexed in both directions."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.forward: Dict[str, Dict[str, List[str]]] = {}
+        self.backward: Dict[str, Dict[str, List[str]]] = {}
+        self._dirty = False
+        if path.exists():
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = None
+            if isinstance(payload, dict) and payload.get("format") == FORMAT:
+                self.forward = payload["forward"]
+                self.backward = payload["backward"]
+
+    def targets(self, source: str, kinds: Iterable[str] = REFERENCE_KINDS) -> List[str]:
+        edges = self.forward.get(source, {})
+        return sorted({target for kind in kinds for target in edges.get(kind, [])})
+
+    def sources(self, target: str, kinds: Iterable[str] = REFERENCE_KINDS) -> List[str]:
+        """Backlinks: who points at `target` with one of `kinds`."""
+        edges = self.backward.get(target, {})
+        return sorted({source for kind in kinds for source in edges.get(kind, [])})
+
+    def set(self, source: str, kind: str, targets: Iterable[str]) -> bool:
+        """Replace `source`'s `kind` edges; returns True when they changed."""
+        new = sorted(set(targets))
+        edges = self.forward.setdefault(source, {})
+        old = edges.get(kind, [])
+        if old == new:
+            if not edges:
+                del self.forward[source]
+            return False
+        for target in set(old) - set(new):
+            back = self.backward[target][kind]
+            back.remove(source)
+            if not back:
+                del self.backward[target][kind]
+                if not self.backward[target]:
+                    del self.backward[target]
+        for target in set(new) - set(old):
+            back = self.backward.setdefault(target, {}).setdefault(kind, [])
+            back.append(source)
+            back.sort()
+        if new:
+            edges[kind] = new
+        else:
+            edges.pop(kind, None)
+            if not edges:
+                del self.forward[source]
+        self._dirty = True
+        return True
+
+    def drop(self, source: str) -> None:
+        for kind in list(self.forward.get(source, {})):
+            self.set(source, kind, [])
+
+    def dependents(self, changed: Iterable[str], kinds: Iterable[str] = PAGE_KINDS) -> Set[str]:
+        """Sources with a `kinds` edge to a changed path, or to a directory holding one."""
+        kinds = tuple(kinds)
+        found: Set[str] = set()
+        for path in changed:
+            node = path
+            while node:
+                found.update(self.sources(node, kinds))
+                node = posixpath.dirname(node)
+        return found
+
+    def rendered_sources(self, only: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Markdown source -> the page that renders it, for `only` or every recorded source."""
+        found: Dict[str, str] = {}
+        for source in self.backward if only is None else only:
+            pages = self.backward.get(source, {}).get("renders")
+            if pages:
+                found[source] = pages[0]
+        return found
+
+    def broken(self, repo_root: Path, sources: Iterable[str]) -> List[Tuple[str, str, str]]:
+        """(source, kind, target) for each link from `sources` whose target does not exist."""
+        exists: Dict[str, bool] = {}
+        found: List[Tuple[str, str, str]] = []
+        for source in sorted(set(sources)):
+            for kind in BROKEN_KINDS:
+                for target in self.forward.get(source, {}).get(kind, []):
+                    if target not in exists:
+                        exists[target] = (repo_root / target).exists()
+                    if not exists[target]:
+                        found.append((source, kind, target))
+        return found
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"format": FORMAT, "forward": self.forward, "backward": self.backward}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def open_graph(repo_root: Path) -> LinkGraph:
+    return LinkGraph(repo_root / GRAPH_FILE)
+
+
+def repo_path(path: Path, repo_root: Path) -> str:
+    """Graph node for a filesystem path: repo-relative, POSIX separators."""
+    return Path(os.path.relpath(path, repo_root)).as_posix()
+
+
+def report_broken(broken: List[Tuple[str, str, str]]) -> None:
+    if not broken:
+        return
+    print(f"Broken references ({len(broken)}):")
+    for source, kind, target in broken:
+        print(f"  {source} -> {target} ({kind})")
+
+
+def _node(value: str, repo_root: Path) -> str:
+    path = Path(value)
+    return (repo_path(path, repo_root) if path.is_absolute() else path.as_posix()).rstrip("/")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query the cross-document link graph recorded by the renderers")
+    sub = parser.add_subparsers(dest="command", required=True)
+    back = sub.add_parser("backlinks", help="Sources that link to or mention a path")
+    back.add_argument("paths", nargs="+", help="Repo-relative paths")
+    links = sub.add_parser("links", help="References made by a markdown source")
+    links.add_argument("paths", nargs="+", help="Repo-relative markdown paths")
+    deps = sub.add_parser("dependents", help="Pages that must be rebuilt when these paths change or move")
+    deps.add_argument("paths", nargs="+", help="Repo-relative paths")
+    broken = sub.add_parser("broken", help="Markdown links whose target does not exist")
+    broken.add_argument("paths", nargs="*", help="Only check these sources (default: every recorded source)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    repo_root = Path(__file__).resolve().parents[2]
+    graph = open_graph(repo_root)
+    if not graph.forward:
+        raise SystemExit(f"No link graph at {graph.path}; run render_docs.py and render_pm.py first.")
+    paths = [_node(value, repo_root) for value in args.paths]
+    if args.command == "backlinks":
+        for path in paths:
+            for source in graph.sources(path, REFERENCE_KINDS + PAGE_KINDS):
+                print(source)
+    elif args.command == "links":
+        for path in paths:
+            for target in graph.targets(path):
+                print(target)
+    elif args.command == "dependents":
+        for page in sorted(graph.dependents(paths)):
+            print(page)
+    else:
+        sources = paths or [source for source, edges in graph.forward.items() if any(k in edges for k in REFERENCE_KINDS)]
+        found = graph.broken(repo_root, sources)
+        report_broken(found)
+        if found:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Content-addressed render cache that several checkouts and worktrees can share.
+
+The cache is opt-in: pass `--cache DIR` to `render_docs.py` / `render_pm.py`, or set
+`AIFIRST_RENDER_CACHE`. Entries are keyed by a hash of the renderer's own source (so editing a
+renderer strands its old entries instead of serving them) plus the inputs an entry was derived
+from, and hold rendered bodies and parsed metadata as JSON. A hit refreshes the entry's mtime;
+when a run adds entries and the directory grows past its size bound, the least recently used
+entries are evicted. Nothing in the cache is needed for correctness, so it can be deleted at will.
+
+    python3 AI_first/scripts/render_cache.py stats
+    python3 AI_first/scripts/render_cache.py prune --max-mb 64
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+FORMAT = "aifirst-render-cache/1"
+ENV_VAR = "AIFIRST_RENDER_CACHE"
+DEFAULT_MAX_MB = 512
+
+
+def renderer_version(*paths: Path) -> str:
+    """Hash of the renderer sources whose output an entry captures."""
+    import hashlib
+
+    digest = hashlib.sha1(FORMAT.encode("utf-8"))
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _entries(root: Path) -> Iterator[Tuple[str, Path, os.stat_result]]:
+    """(kind, path, stat) of every entry under `root`."""
+    if not root.is_dir():
+        return
+    for kind_dir in sorted(os.scandir(root), key=lambda entry: entry.name):
+        if not kind_dir.is_dir():
+            continue
+        for bucket in os.scandir(kind_dir.path):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    yield kind_dir.name, Path(entry.path), entry.stat()
+                except FileNotFoundError:
+                    # Evicted by another checkout mid-scan.
+                    continue
+
+
+class RenderCache:
+    """One cache directory, seen through a single renderer version."""
+
+    def __init__(self, root: Path, version: str, max_bytes: int) -> None:
+        self.root = root
+        self.version = version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.written = 0
+
+    def key(self, *parts: str) -> str:
+        import hashlib
+
+        digest = hashlib.sha256(self.version.encode("utf-8"))
+        for part in parts:
+            digest.update(b"\0" + part.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.root / kind / key[:2] / f"{key}.json"
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        path = self._path(kind, key)
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, kind: str, key: str, value: Any) -> None:
+        path = self._path(kind, key)
+        data = json.dumps(value, separators=(",", ":"))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per process, since other checkouts may be writing the same entry.
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            print(f"[cache] could not write {path}: {exc}", file=sys.stderr)
+            return
+        self.written += len(data)
+
+    def close(self) -> int:
+        """Evict down to the size bound if this run added entries; returns entries removed."""
+        if not self.written:
+            return 0
+        return prune(self.root, self.max_bytes)[0]
+
+
+def prune(root: Path, max_bytes: Optional[int] = None, older_than: Optional[float] = None) -> Tuple[int, int]:
+    """Drop entries unused for `older_than` seconds, then least recently used ones over `max_bytes`.
+
+    Returns (entries removed, bytes freed).
+    """
+    entries = sorted(_entries(root), key=lambda item: item[2].st_mtime)
+    total = sum(st.st_size for _, _, st in entries)
+    cutoff = None if older_than is None else time.time() - older_than
+    removed = freed = 0
+    for _, path, st in entries:
+        stale = cutoff is not None and st.st_mtime < cutoff
+        if not stale and (max_bytes is None or total <= max_bytes):
+            # Sorted by last use, so nothing later is stale or needed to get under the bound.
+            break
+        path.unlink(missing_ok=True)
+        total -= st.st_size
+        removed += 1
+        freed += st.st_size
+    # Leftovers from interrupted writes; anything an hour old is not in flight.
+    for tmp_path in root.glob("*/*/*.tmp") if root.is_dir() else []:
+        try:
+            if time.time() - tmp_path.stat().st_mtime > 3600:
+                tmp_path.unlink()
+        except FileNotFoundError:
+            continue
+    return removed, freed
+
+
+def stats(root: Path) -> Dict[str, Any]:
+    kinds: Dict[str, Dict[str, int]] = {}
+    oldest = newest = None
+    for kind, _, st in _entries(root):
+        entry = kinds.setdefault(kind, {"entries": 0, "bytes": 0})
+        entry["entries"] += 1
+        entry["bytes"] += st.st_size
+        oldest = st.st_mtime if oldest is None else min(oldest, st.st_mtime)
+        newest = st.st_mtime if newest is None else max(newest, st.st_mtime)
+    return {
+        "format": FORMAT,
+        "root": str(root),
+        "entries": sum(entry["entries"] for entry in kinds.values()),
+        "bytes": sum(entry["bytes"] for entry in kinds.values()),
+        "kinds": kinds,
+        "oldest_use": None if oldest is None else round(oldest, 3),
+        "newest_use": None if newest is None else round(newest, 3),
+    }
+
+
+def cache_dir(value: Optional[Path]) -> Optional[Path]:
+    """The configured cache directory: `value` if given, else `$AIFIRST_RENDER_CACHE`, else None."""
+    if value is None:
+        env = os.environ.get(ENV_VAR)
+        if not env:
+            return None
+        value = Path(env)
+    return value.expanduser().resolve()
+
+
+def open_cache(value: Optional[Path], max_mb: float, *renderers: Path) -> Optional[RenderCache]:
+    root = cache_dir(value)
+    if root is None:
+        return None
+    return RenderCache(root, renderer_version(*renderers), int(max_mb * 1024 * 1024))
+
+
+def add_cache_args(parser: argparse.ArgumentParser) -> None:
+    """The `--cache` / `--cache-max-mb` options shared by the renderers."""
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help=f"Shared render cache directory (default: ${ENV_VAR}; no cache when unset)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_MAX_MB,
+        help=f"Evict least recently used cache entries beyond this size (default: {DEFAULT_MAX_MB})",
+    )
+
+
+def _size(num: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if num < 1024:
+            return f"{num:.0f} {unit}" if unit == "B" else f"{num:.1f} {unit}"
+        num /= 1024
+    return f"{num:.1f} GB"
+
+
+def _when(stamp: Optional[float]) -> str:
+    return "-" if stamp is None else time.strftime("%Y-%m-%d %H:%M", time.localtime(stamp))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or trim the shared render cache")
+    parser.add_argument("--cache", type=Path, default=None, help=f"Cache directory (default: ${ENV_VAR})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    stats_parser = sub.add_parser("stats", help="Entries and bytes per kind, and last-use range")
+    stats_parser.add_argument("--json", action="store_true", help="Print the stats as JSON")
+    prune_parser = sub.add_parser("prune", help="Evict least recently used entries")
+    prune_parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=DEFAULT_MAX_MB,
+        help=f"Keep at most this many megabytes (default: {DEFAULT_MAX_MB})",
+    )
+    prune_parser.add_argument("--older-than", type=float, default=None, metavar="DAYS", help="Also drop entries unused for DAYS")
+    prune_parser.add_argument("--all", action="store_true", help="Empty the cache")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    root = cache_dir(args.cache)
+    if root is None:
+        raise SystemExit(f"No render cache configured: pass --cache DIR or set {ENV_VAR}.")
+    if args.command == "stats":
+        summary = stats(root)
+        if args.json:
+            print(json.dumps(summary, indent=2))
+            return
+        print(f"Render cache {root}: {summary['entries']} entries, {_size(summary['bytes'])}")
+        for kind, entry in sorted(summary["kinds"].items()):
+            print(f"  {kind}: {entry['entries']} entries, {_size(entry['bytes'])}")
+        print(f"  last used: {_when(summary['oldest_use'])} .. {_when(summary['newest_use'])}")
+        return
+    max_bytes = 0 if args.all else int(args.max_mb * 1024 * 1024)
+    older_than = None if args.older_than is None else args.older_than * 86400
+    removed, freed = prune(root, max_bytes, older_than)
+    print(f"Pruned {removed} entries ({_size(freed)}) from {root}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Helpers shared by render_docs.py, render_pm.py, and init_project.py.
+
+Inline link rendering, the slot scanner and patcher that update generated pages in place, and the
+bug rollup read from the issue store.
+"""
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+# project -> phase -> stage -> status -> severity -> count
+BugRollup = Dict[str, Dict[str, Dict[str, Dict[str, Dict[str, int]]]]]
+
+# Helper modules the renderers' output depends on; editing one counts as a renderer change.
+SHARED_MODULES = ("render_common.py", "search_index.py", "link_graph.py", "render_cache.py")
+
+
+def renderer_sources(script: str) -> List[Path]:
+    """`script` (a file next to this one) plus `SHARED_MODULES`, as absolute paths."""
+    scripts = Path(__file__).resolve().parent
+    return [scripts / name for name in (script, *SHARED_MODULES)]
+
+
+def render_links(text: str) -> str:
+    """Replace `[label](href)` with anchors in one left-to-right pass.
+
+    Same matches as `re.sub(r"\\[([^\\]]+)\\]\\(([^)]+)\\)", ...)`, whose retries from every `[`
+    make runs of unclosed brackets quadratic: every `[` before a given `]` shares that `]`, so
+    when one of them fails the scan resumes after the `]`.
+    """
+    pieces: List[str] = []
+    pos = 0
+    start = text.find("[")
+    while start != -1:
+        close = text.find("]", start + 1)
+        if close == -1:
+            break
+        end = text.find(")", close + 2) if text.startswith("(", close + 1) else -1
+        if close > start + 1 and end > close + 2:
+            pieces.append(text[pos:start])
+            pieces.append(f'<a href="{text[close + 2:end]}">{text[start + 1:close]}</a>')
+            pos = end + 1
+            start = text.find("[", pos)
+        elif end == -1 and text.startswith("(", close + 1):
+            break
+        else:
+            start = text.find("[", close + 1)
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+SLOT_PATTERN = re.compile(
+    r"<!-- (?P<marker>[A-Z_]+)_(?P<edge>START|END) -->"
+    r'|<div class="summary-card">\s*<div class="muted small">(?P<card>[^<]*)</div>\s*<div class="h6">(?P<card_value>[^<]*)</div>\s*</div>'
+    r"|<li>\s*<strong>(?P<item>[^<:]*):</strong>(?P<item_value>[^<]*)</li>"
+    r'|data-count="(?P<count>[^"]*)">(?P<count_value>\d+)</div>'
+    r'|<span id="(?P<span>[^"]*)">(?P<span_value>[^<]*)</span>'
+)
+
+
+class Slot(NamedTuple):
+    kind: str
+    key: str
+    start: int
+    end: int
+
+
+def scan_slots(text: str) -> tuple[Dict[tuple[str, str], List[Slot]], List[str]]:
+    """Locate every marker block and summary slot in one pass over the page.
+
+    Slots are keyed by (kind, key) where kind is block, card, item, count, or span; the span
+    covers only the replaceable value. Slots inside a marker block belong to the block body and
+    are not indexed. Unbalanced markers are returned as problems.
+    """
+    slots: Dict[tuple[str, str], List[Slot]] = {}
+    problems: List[str] = []
+    open_markers: Dict[str, int] = {}
+    for match in SLOT_PATTERN.finditer(text):
+        if match.group("marker"):
+            name = match.group("marker")
+            if match.group("edge") == "START":
+                if name in open_markers:
+                    problems.append(f"nested {name}_START marker")
+                open_markers[name] = match.end()
+                continue
+            if name not in open_markers:
+                problems.append(f"{name}_END marker without a matching start")
+                continue
+            slot = Slot("block", name, open_markers.pop(name), match.start())
+        elif open_markers:
+            continue
+        else:
+            kind = next(k for k in ("card", "item", "count", "span") if match.group(k) is not None)
+            slot = Slot(kind, match.group(kind).strip(), match.start(f"{kind}_value"), match.end(f"{kind}_value"))
+        slots.setdefault((slot.kind, slot.key), []).append(slot)
+    problems.extend(f"{name}_START marker without a matching end" for name in open_markers)
+    return slots, problems
+
+
+def patch_slots(
+    text: str,
+    patches: Dict[tuple[str, str], str],
+    required: Iterable[tuple[str, str]] = (),
+    source: str = "page",
+) -> str:
+    """Apply all slot replacements with a single scan and a single join.
+
+    Block patches replace the body between START/END markers; other patches replace the slot
+    value verbatim (callers escape). Optional slots that are absent are skipped; missing required
+    slots, duplicated targets, and unbalanced markers are reported together before any output.
+    """
+    slots, problems = scan_slots(text)
+    for kind, key in required:
+        if (kind, key) not in slots:
+            problems.append(f"missing {kind} slot '{key}'")
+    for kind, key in patches:
+        if len(slots.get((kind, key), [])) > 1:
+            problems.append(f"duplicated {kind} slot '{key}'")
+    if problems:
+        raise SystemExit(f"Slot check failed for {source}:\n" + "\n".join(f"  - {p}" for p in problems))
+    edits = []
+    for (kind, key), value in patches.items():
+        found = slots.get((kind, key))
+        if not found:
+            continue
+        if kind == "block":
+            value = "\n" + value.strip("\n") + "\n"
+        edits.append((found[0].start, found[0].end, value))
+    edits.sort()
+    pieces: List[str] = []
+    pos = 0
+    for start, end, value in edits:
+        pieces.append(text[pos:start])
+        pieces.append(value)
+        pos = end
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+def rollup_phase_key(value: object) -> str:
+    text = str(value or "").strip()
+    return f"{int(text):02d}" if text.isdigit() else text
+
+
+def bug_rollup(issues_path: Path) -> BugRollup:
+    """Group issues by project, phase, stage, status, and severity in one streaming pass."""
+    rollup: BugRollup = {}
+    if not issues_path.exists():
+        return rollup
+    # The store is append-only, so only the last record per issue id counts.
+    latest: Dict[str, Tuple[str, str, str, str, str]] = {}
+    with issues_path.open("r", encoding="utf-8") as f:
+        for idx, line in enumerate(f):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            issue_id = str(payload.get("id", "")).strip() or f"#{idx}"
+            latest[issue_id] = (
+                str(payload.get("project", "")).strip(),
+                rollup_phase_key(payload.get("phase")),
+                str(payload.get("stage", "") or "").strip(),
+                str(payload.get("status", "")).strip().lower(),
+                str(payload.get("severity", "")).strip().lower(),
+            )
+    for project, phase, stage, status, severity in latest.values():
+        if not project:
+            continue
+        by_severity = (
+            rollup.setdefault(project, {}).setdefault(phase, {}).setdefault(stage, {}).setdefault(status, {})
+        )
+        by_severity[severity] = by_severity.get(severity, 0) + 1
+    return rollup
+
+
+def project_open_bugs(phases: Dict[str, Dict[str, Dict[str, Dict[str, int]]]]) -> int:
+    return sum(sum(statuses.get("open", {}).values()) for stages in phases.values() for statuses in stages.values())
+
+
+def open_bug_counts(rollup: BugRollup) -> Dict[str, int]:
+    return {project: project_open_bugs(phases) for project, phases in rollup.items()}
@@ -3,21 +3,37 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
 import html
+import json
 import os
 import re
+import sys
 from pathlib import Path
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from render_common import render_links, renderer_sources
 
-TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?[-]+:?\s*(\|\s*:?[-]+:?\s*)+\|?\s*$")
+if TYPE_CHECKING:
+    from link_graph import LinkGraph
+    from render_cache import RenderCache
+    from search_index import SearchIndex
+
+
+# Prerendered bodies for markdown_viewer.html, one script per source hash.
+FRAGMENTS_DIR = Path("AI_first/ui/data/fragments")
+FRAGMENT_MANIFEST = "manifest.js"
+# Larger sources are rendered without the cache, so their pages keep streaming in flat memory.
+CACHE_MAX_SOURCE = 8 * 1024 * 1024
+# Each optional pipe or space run can only be matched one way, so a near-miss fails in linear time.
+TABLE_SEPARATOR = re.compile(r"^\s*(?:\|\s*)?:?-+:?\s*(?:\|\s*:?-+:?\s*)+(?:\|\s*)?$")
 
 
 def _render_inline(text: str) -> str:
     escaped = html.escape(text)
     escaped = re.sub(r"`([^`]+)`", r"<code>\1</code>", escaped)
-    escaped = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"<a href=\"\2\">\1</a>", escaped)
-    return escaped
+    return render_links(escaped)
 
 
 def _split_table_row(line: str) -> List[str]:
@@ -26,121 +42,153 @@ def _split_table_row(line: str) -> List[str]:
 
 
 def _render_markdown(md: str) -> str:
-    lines = md.replace("\r\n", "\n").split("\n")
-    out: List[str] = []
+    return "\n".join(_iter_markdown(md.replace("\r\n", "\n").split("\n")))
+
+
+def _iter_markdown(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the HTML fragments for markdown `lines`; joined with newlines they form the body.
+
+    Only the current line and one line of lookahead (for table separators) are held, so the
+    lines can come straight from a file.
+    """
+    source = iter(lines)
+    line = next(source, None)
+    following = next(source, None)
     in_code = False
     list_type: str | None = None
-    idx = 0
 
-    def close_list() -> None:
+    def advance() -> None:
+        nonlocal line, following
+        line, following = following, next(source, None)
+
+    def close_list() -> Iterator[str]:
         nonlocal list_type
         if list_type:
-            out.append(f"</{list_type}>")
+            yield f"</{list_type}>"
             list_type = None
 
-    while idx < len(lines):
-        line = lines[idx]
-
+    while line is not None:
         if line.strip().startswith("```"):
             if in_code:
-                out.append("</code></pre>")
+                yield "</code></pre>"
                 in_code = False
             else:
-                close_list()
-                out.append("<pre><code>")
+                yield from close_list()
+                yield "<pre><code>"
                 in_code = True
-            idx += 1
+            advance()
             continue
 
         if in_code:
-            out.append(html.escape(line))
-            idx += 1
+            yield html.escape(line)
+            advance()
             continue
 
         heading = re.match(r"^(#{1,3})\s+(.*)$", line)
         if heading:
-            close_list()
+            yield from close_list()
             level = len(heading.group(1))
-            out.append(f"<h{level}>{_render_inline(heading.group(2))}</h{level}>")
-            idx += 1
+            yield f"<h{level}>{_render_inline(heading.group(2))}</h{level}>"
+            advance()
             continue
 
-        if idx + 1 < len(lines) and "|" in line and TABLE_SEPARATOR.match(lines[idx + 1] or ""):
-            close_list()
-            header_cells = _split_table_row(line)
-            out.append("<table><thead><tr>")
-            for cell in header_cells:
-                out.append(f"<th>{_render_inline(cell)}</th>")
-            out.append("</tr></thead><tbody>")
-            idx += 2
-            while idx < len(lines) and "|" in lines[idx]:
-                row_cells = _split_table_row(lines[idx])
-                out.append("<tr>")
-                for cell in row_cells:
-                    out.append(f"<td>{_render_inline(cell)}</td>")
-                out.append("</tr>")
-                idx += 1
-            out.append("</tbody></table>")
+        if following is not None and "|" in line and TABLE_SEPARATOR.match(following):
+            yield from close_list()
+            yield "<table><thead><tr>"
+            for cell in _split_table_row(line):
+                yield f"<th>{_render_inline(cell)}</th>"
+            yield "</tr></thead><tbody>"
+            advance()
+            advance()
+            while line is not None and "|" in line:
+                yield "<tr>"
+                for cell in _split_table_row(line):
+                    yield f"<td>{_render_inline(cell)}</td>"
+                yield "</tr>"
+                advance()
+            yield "</tbody></table>"
             continue
 
         ul_item = re.match(r"^\s*[-*]\s+(.*)$", line)
         if ul_item:
             if list_type != "ul":
-                close_list()
-                out.append("<ul>")
+                yield from close_list()
+                yield "<ul>"
                 list_type = "ul"
-            out.append(f"<li>{_render_inline(ul_item.group(1))}</li>")
-            idx += 1
+            yield f"<li>{_render_inline(ul_item.group(1))}</li>"
+            advance()
             continue
 
         ol_item = re.match(r"^\s*\d+\.\s+(.*)$", line)
         if ol_item:
             if list_type != "ol":
-                close_list()
-                out.append("<ol>")
+                yield from close_list()
+                yield "<ol>"
                 list_type = "ol"
-            out.append(f"<li>{_render_inline(ol_item.group(1))}</li>")
-            idx += 1
+            yield f"<li>{_render_inline(ol_item.group(1))}</li>"
+            advance()
             continue
 
         if not line.strip():
-            close_list()
-            idx += 1
+            yield from close_list()
+            advance()
             continue
 
-        close_list()
-        out.append(f"<p>{_render_inline(line.strip())}</p>")
-        idx += 1
+        yield from close_list()
+        yield f"<p>{_render_inline(line.strip())}</p>"
+        advance()
 
-    close_list()
+    yield from close_list()
     if in_code:
-        out.append("</code></pre>")
-
-    return "\n".join(out)
+        yield "</code></pre>"
+
+
+def _read_lines(md_path: Path) -> Iterator[str]:
+    """Lines of a markdown file, read lazily and split exactly as `_render_markdown` splits text."""
+    with md_path.open("r", encoding="utf-8", newline="\n") as f:
+        last = "\n"
+        for last in f:
+            if last.endswith("\r\n"):
+                yield last[:-2]
+            elif last.endswith("\n"):
+                yield last[:-1]
+            else:
+                yield last
+        if last.endswith("\n"):
+            yield ""
 
 
-def _extract_title(md: str, default: str) -> str:
-    for line in md.splitlines():
+def _extract_title(lines: Iterable[str], default: str) -> str:
+    for line in lines:
         if line.startswith("# "):
             return line[2:].strip()
     return default
 
 
-def _build_doc(md_path: Path, out_path: Path, repo_root: Path) -> None:
-    md_text = md_path.read_text(encoding="utf-8")
-    title = _extract_title(md_text, md_path.stem)
-    body = _render_markdown(md_text)
-    css_path = repo_root / "AI_first" / "ui" / "style" / "bugmgmt.css"
-    home_path = repo_root / "AI_first" / "ui" / "index.html"
-    pm_path = repo_root / "AI_first" / "ui" / "PM.html"
-    bug_path = repo_root / "AI_first" / "ui" / "bugmgmt_issues.html"
-    process_path = repo_root / "AI_first" / "ui" / "process_guide.html"
-    css_rel = os.path.relpath(css_path, start=out_path.parent)
-    home_rel = os.path.relpath(home_path, start=out_path.parent)
-    pm_rel = os.path.relpath(pm_path, start=out_path.parent)
-    bug_rel = os.path.relpath(bug_path, start=out_path.parent)
-    process_rel = os.path.relpath(process_path, start=out_path.parent)
-    raw_rel = os.path.relpath(md_path, start=out_path.parent)
+def _nav_paths(md_path: Path, out_path: Path, repo_root: Path) -> Dict[str, str]:
+    """The page's links and source label, which depend on where the output sits."""
+    ui_root = repo_root / "AI_first" / "ui"
+    return {
+        "css": os.path.relpath(ui_root / "style" / "bugmgmt.css", start=out_path.parent),
+        "home": os.path.relpath(ui_root / "index.html", start=out_path.parent),
+        "pm": os.path.relpath(ui_root / "PM.html", start=out_path.parent),
+        "bug": os.path.relpath(ui_root / "bugmgmt_issues.html", start=out_path.parent),
+        "process": os.path.relpath(ui_root / "process_guide.html", start=out_path.parent),
+        "raw": os.path.relpath(md_path, start=out_path.parent),
+        "source": str(md_path.relative_to(repo_root)),
+    }
+
+
+def _doc_page(
+    md_path: Path, out_path: Path, repo_root: Path, title: str, body: str, nav: Optional[Dict[str, str]] = None
+) -> str:
+    nav = nav or _nav_paths(md_path, out_path, repo_root)
+    css_rel = nav["css"]
+    home_rel = nav["home"]
+    pm_rel = nav["pm"]
+    bug_rel = nav["bug"]
+    process_rel = nav["process"]
+    raw_rel = nav["raw"]
 
     html_doc = f"""<!DOCTYPE html>
 <html lang=\"en\">
@@ -161,7 +209,7 @@ def _build_doc(md_path: Path, out_path: Path, repo_root: Path) -> None:
     <header class=\"hero\">
       <div>
         <h1 class=\"h4\">{html.escape(title)}</h1>
-        <p class=\"muted small\">{html.escape(str(md_path.relative_to(repo_root)))}</p>
+        <p class=\"muted small\">{html.escape(nav["source"])}</p>
       </div>
       <div class=\"badges\">
         <a class=\"btn\" href=\"{raw_rel}\">Open Raw</a>
@@ -176,39 +224,385 @@ def _build_doc(md_path: Path, out_path: Path, repo_root: Path) -> None:
 </body>
 </html>
 """
+    return html_doc
+
+
+def _source_digest(md_path: Path) -> str:
+    """Hash of the raw markdown bytes; markdown.js computes the same key with SubtleCrypto."""
+    digest = hashlib.sha1()
+    with md_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class FragmentCache:
+    """Prerendered markdown bodies for `markdown_viewer.html`, stored as `<source hash>.js` scripts (git-ignored).
+
+    A viewer that can read the markdown hashes it and loads the matching fragment. Under
+    `file://` it cannot, so `manifest.js` maps each repo-relative source path to its current hash.
+    Fragments no source points at any more are deleted on save.
+    """
+
+    def __init__(self, root: Path) -> None:
+        from search_index import _read_script
+
+        self.root = root
+        manifest = root / FRAGMENT_MANIFEST
+        self.sources: Dict[str, str] = _read_script(manifest) if manifest.exists() else {}
+        self._replaced: Set[str] = set()
+        self._dirty = False
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / f"{digest}.js"
+
+    def has(self, source: str) -> bool:
+        return source in self.sources
+
+    def record(self, source: str, digest: str) -> None:
+        old = self.sources.get(source)
+        if old == digest:
+            return
+        if old:
+            self._replaced.add(old)
+        self.sources[source] = digest
+        self._dirty = True
+
+    def prune(self, repo_root: Path) -> None:
+        """Forget sources whose markdown no longer exists."""
+        for source in [source for source in self.sources if not (repo_root / source).exists()]:
+            self._replaced.add(self.sources.pop(source))
+            self._dirty = True
+
+    def save(self) -> None:
+        from search_index import _write_script
+
+        for digest in self._replaced - set(self.sources.values()):
+            self.path_for(digest).unlink(missing_ok=True)
+        if self._dirty:
+            _write_script(self.root / FRAGMENT_MANIFEST, "window.AIFIRST_MD_MANIFEST(", self.sources)
+        self._replaced.clear()
+        self._dirty = False
+
+
+def open_fragments(repo_root: Path) -> FragmentCache:
+    return FragmentCache(repo_root / FRAGMENTS_DIR)
+
+
+def _build_doc(
+    md_path: Path,
+    out_path: Path,
+    repo_root: Path,
+    index: Optional[SearchIndex] = None,
+    fragments: Optional[FragmentCache] = None,
+    cache: Optional[RenderCache] = None,
+    links: Optional[LinkGraph] = None,
+) -> None:
+    """Render one markdown file, streaming its lines through the renderer into the output file.
+
+    The file is read twice (once up to its title) and never held whole, so memory stays flat
+    for multi-megabyte execution logs. The page is written beside the target and renamed into
+    place, so readers never see a half-written page. With `index`, the same pass feeds the
+    search index; with `fragments`, it also writes the viewer fragment unless one already
+    exists for this source hash. With `cache`, a body, title, and search terms rendered before
+    from the same bytes at the same nav paths are reused instead of re-rendered. With `links`,
+    the references in the rendered body replace this source's edges in the link graph.
+    """
+    if links is not None:
+        from link_graph import references
+    digest = _source_digest(md_path) if fragments is not None or cache is not None else ""
+    nav = _nav_paths(md_path, out_path, repo_root)
+    key = None
+    entry = None
+    if cache is not None:
+        key = cache.key(digest, *(f"{name}={value}" for name, value in sorted(nav.items())))
+        entry = cache.get("doc", key)
+    text = None
+    collected: Optional[List[str]] = None
+    refs: Set[Tuple[str, str]] = set()
+    source = md_path.relative_to(repo_root).as_posix()
+    pieces: Iterable[str]
+    if entry is not None:
+        title = entry["title"]
+        pieces = [entry["body"]]
+        if index is not None:
+            from search_index import DocText
+
+            text = DocText.from_state(entry["search"])
+    else:
+        title = _extract_title(_read_lines(md_path), md_path.stem)
+        lines: Iterable[str] = _read_lines(md_path)
+        if index is not None or key is not None:
+            from search_index import DocText
+
+            text = DocText()
+            lines = text.feed(lines)
+        pieces = _iter_markdown(lines)
+        if key is not None and md_path.stat().st_size <= CACHE_MAX_SOURCE:
+            collected = []
+    head, tail = _doc_page(md_path, out_path, repo_root, title, "\0", nav).split("\0")
+    frag_path = None
+    if fragments is not None:
+        fragments.record(source, digest)
+        if not fragments.path_for(digest).exists():
+            frag_path = fragments.path_for(digest)
+            frag_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(html_doc, encoding="utf-8")
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with contextlib.ExitStack() as stack:
+        f = stack.enter_context(tmp_path.open("w", encoding="utf-8"))
+        frag = None
+        if frag_path is not None:
+            frag = stack.enter_context(frag_path.with_name(frag_path.name + ".tmp").open("w", encoding="utf-8"))
+            frag.write(f'window.AIFIRST_MD_FRAGMENT({json.dumps(digest)}, "')
+        f.write(head)
+        for idx, fragment in enumerate(pieces):
+            if idx:
+                f.write("\n")
+                if frag:
+                    frag.write("\\n")
+            f.write(fragment)
+            if frag:
+                frag.write(json.dumps(fragment)[1:-1])
+            if collected is not None:
+                collected.append(fragment)
+            if links is not None:
+                refs.update(references(fragment, source))
+        f.write(tail)
+        if frag:
+            frag.write('");\n')
+    os.replace(tmp_path, out_path)
+    if frag_path is not None:
+        os.replace(frag_path.with_name(frag_path.name + ".tmp"), frag_path)
+    if cache is not None and key is not None and collected is not None and text is not None:
+        cache.put("doc", key, {"title": title, "body": "\n".join(collected), "search": text.state()})
+    if index is not None and text is not None:
+        index.update(index.href_for(out_path), title, source, text)
+    if links is not None:
+        from link_graph import REFERENCE_KINDS, repo_path
+
+        for kind in REFERENCE_KINDS:
+            links.set(source, kind, [target for ref_kind, target in refs if ref_kind == kind])
+        links.set(repo_path(out_path, repo_root), "renders", [source])
+
+
+def _finish_links(
+    links: LinkGraph, repo_root: Path, rendered: Iterable[str], changed: Optional[Iterable[Path]] = None
+) -> None:
+    """Remove pages whose source is gone, report links this run broke, and save the graph.
+
+    With `changed` (an incremental build), only those paths are considered, so the work follows
+    the size of the change: the pages of removed sources, the references made by re-rendered
+    sources, and the backlinks of every removed path.
+    """
+    from link_graph import repo_path, report_broken
+
+    gone = None
+    if changed is not None:
+        gone = [repo_path(path, repo_root) for path in changed if not path.exists()]
+    suspects = set(rendered)
+    for source, page in sorted(links.rendered_sources(gone).items()):
+        if (repo_root / source).exists():
+            continue
+        (repo_root / page).unlink(missing_ok=True)
+        links.drop(page)
+        links.drop(source)
+        suspects.update(links.sources(source))
+        print(f"Removed {page} ({source} no longer exists).")
+    for path in gone or []:
+        suspects.update(links.sources(path))
+    suspects = {source for source in suspects if (repo_root / source).exists()}
+    report_broken(links.broken(repo_root, suspects))
+    links.save()
+
+
+def _open_cache(args: argparse.Namespace) -> Optional[RenderCache]:
+    from render_cache import open_cache
+
+    scripts = Path(__file__).resolve().parent
+    return open_cache(args.cache, args.cache_max_mb, scripts / "render_docs.py", scripts / "search_index.py")
 
 
 def _iter_md_files(root: Path) -> Iterable[Path]:
-    return root.rglob("*.md")
+    # Sorted so a fresh search index numbers documents the same way on every machine.
+    return sorted(root.rglob("*.md"))
 
 
-def main() -> None:
+def _output_for(md_path: Path, support_root: Path, projects_root: Path, out_root: Path) -> Optional[Path]:
+    if md_path.is_relative_to(support_root):
+        return (out_root / md_path.relative_to(support_root)).with_suffix(".html")
+    if md_path.is_relative_to(projects_root):
+        return (out_root / "projects" / md_path.relative_to(projects_root)).with_suffix(".html")
+    return None
+
+
+def _doc_targets(support_root: Path, projects_root: Path, out_root: Path) -> Iterator[Tuple[Path, Path]]:
+    for root in (support_root, projects_root):
+        if not root.exists():
+            continue
+        for md_path in _iter_md_files(root):
+            out_path = _output_for(md_path, support_root, projects_root, out_root)
+            if out_path is not None:
+                yield md_path, out_path
+
+
+def _changed_targets(
+    changed: Iterable[Path], support_root: Path, projects_root: Path, out_root: Path
+) -> Iterator[Tuple[Path, Path]]:
+    for md_path in sorted(changed):
+        if md_path.suffix != ".md" or not md_path.exists():
+            continue
+        out_path = _output_for(md_path, support_root, projects_root, out_root)
+        if out_path is not None:
+            yield md_path, out_path
+
+
+def _with_missing_data(
+    targets: List[Tuple[Path, Path]],
+    support_root: Path,
+    projects_root: Path,
+    out_root: Path,
+    repo_root: Path,
+    index: Optional["SearchIndex"],
+    fragments: Optional[FragmentCache],
+) -> List[Tuple[Path, Path]]:
+    """Add the pages the search index or fragments lack; neither is committed, so a fresh checkout starts empty."""
+    if index is None and fragments is None:
+        return targets
+    listed = {md_path.resolve() for md_path, _ in targets}
+    return targets + [
+        (md_path, out_path)
+        for md_path, out_path in _doc_targets(support_root, projects_root, out_root)
+        if md_path.resolve() not in listed
+        and (
+            (index is not None and not index.has(index.href_for(out_path)))
+            or (fragments is not None and not fragments.has(md_path.resolve().relative_to(repo_root).as_posix()))
+        )
+    ]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    from render_cache import add_cache_args
+
     parser = argparse.ArgumentParser(description="Render support and project markdown files into static HTML")
     parser.add_argument("--support", type=Path, default=Path("AI_first/docs"), help="Support docs root")
     parser.add_argument("--projects", type=Path, default=Path("AI_first/projects"), help="Projects root")
     parser.add_argument("--out", type=Path, default=Path("AI_first/ui/docs"), help="Output HTML root")
-    args = parser.parse_args()
-
-    repo_root = Path(__file__).resolve().parents[2]
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Use git to re-render only markdown changed since the last incremental build",
+    )
+    parser.add_argument(
+        "--only",
+        type=Path,
+        nargs="+",
+        default=None,
+        metavar="PATH",
+        help="Render just these markdown files (repo-relative), e.g. docs a script has just written",
+    )
+    parser.add_argument(
+        "--no-fragments",
+        action="store_true",
+        help="Skip writing markdown_viewer.html fragments under AI_first/ui/data/fragments",
+    )
+    parser.add_argument(
+        "--no-search",
+        action="store_true",
+        help="Skip updating the search index under AI_first/ui/data/search",
+    )
+    parser.add_argument(
+        "--no-links",
+        action="store_true",
+        help="Skip the link graph (AI_first/.cache/link_graph.json) and the broken-reference report",
+    )
+    add_cache_args(parser)
+    parser.add_argument("--no-daemon", action="store_true", help="Run locally even if the AI_first daemon is running")
+    return parser.parse_args(argv)
+
+
+def _resolve_roots(args: argparse.Namespace, repo_root: Path) -> Tuple[Path, Path, Path]:
     support_root = (repo_root / args.support).resolve()
     projects_root = (repo_root / args.projects).resolve()
     out_root = (repo_root / args.out).resolve()
+    return support_root, projects_root, out_root
+
 
-    if support_root.exists():
-        for md_path in _iter_md_files(support_root):
-            rel = md_path.relative_to(support_root)
-            out_path = out_root / rel
-            out_path = out_path.with_suffix(".html")
-            _build_doc(md_path, out_path, repo_root)
-
-    if projects_root.exists():
-        for md_path in _iter_md_files(projects_root):
-            rel = md_path.relative_to(projects_root)
-            out_path = out_root / "projects" / rel
-            out_path = out_path.with_suffix(".html")
-            _build_doc(md_path, out_path, repo_root)
+def _forward_to_daemon(args: argparse.Namespace, argv: List[str], repo_root: Path) -> Optional[int]:
+    # The daemon re-renders from its own file watch; git-driven incremental builds and --only run locally.
+    if args.no_daemon or args.incremental or args.only:
+        return None
+    try:
+        from aifirst_daemon import forward
+    except ImportError:
+        return None
+    return forward("docs", argv, repo_root)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    repo_root = Path(__file__).resolve().parents[2]
+    args = parse_args(argv)
+    code = _forward_to_daemon(args, argv, repo_root)
+    if code is not None:
+        raise SystemExit(code)
+    support_root, projects_root, out_root = _resolve_roots(args, repo_root)
+
+    changed = None
+    if args.only:
+        if args.incremental:
+            raise SystemExit("--only and --incremental cannot be combined.")
+        changed = [(repo_root / path).resolve() for path in args.only]
+    elif args.incremental:
+        from build_state import changed_since_build
+
+        changed = changed_since_build(repo_root, "docs")
+        if changed is not None and not changed.isdisjoint(renderer_sources("render_docs.py")):
+            # The renderer or a helper it uses changed, so every page is stale.
+            changed = None
+    if changed is None:
+        targets = _doc_targets(support_root, projects_root, out_root)
+    else:
+        targets = _changed_targets(changed, support_root, projects_root, out_root)
+
+    index = None
+    if not args.no_search:
+        from search_index import open_index
+
+        index = open_index(repo_root)
+    fragments = None if args.no_fragments else open_fragments(repo_root)
+    cache = _open_cache(args)
+    links = None
+    if not args.no_links:
+        from link_graph import open_graph
+
+        links = open_graph(repo_root)
+    if args.incremental and changed is not None:
+        targets = _with_missing_data(list(targets), support_root, projects_root, out_root, repo_root, index, fragments)
+    rendered: List[str] = []
+    for md_path, out_path in targets:
+        _build_doc(md_path, out_path, repo_root, index, fragments, cache, links)
+        rendered.append(md_path.relative_to(repo_root).as_posix())
+    if links is not None:
+        _finish_links(links, repo_root, rendered, changed)
+    if index is not None:
+        index.prune(repo_root)
+        index.save()
+    if fragments is not None:
+        fragments.prune(repo_root)
+        fragments.save()
+    if cache is not None:
+        evicted = cache.close()
+        print(f"Render cache: {cache.hits} reused, {cache.misses} rendered, {evicted} evicted ({cache.root}).")
+
+    if args.incremental:
+        from build_state import record_build
+
+        record_build(repo_root, "docs")
+        scope = "full build" if changed is None else "changed since last build"
+        print(f"Rendered {len(rendered)} doc(s) ({scope}).")
+    elif args.only:
+        print(f"Rendered {len(rendered)} doc(s).")
 
 
 if __name__ == "__main__":
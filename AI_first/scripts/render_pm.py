@@ -5,24 +5,59 @@ from __future__ import annotations
 import argparse
 import html
 import json
+import os
+import posixpath
 import re
 import sys
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
+from render_common import (
+    BugRollup,
+    bug_rollup,
+    open_bug_counts,
+    patch_slots,
+    project_open_bugs,
+    render_links,
+    renderer_sources,
+    rollup_phase_key,
+    scan_slots,
+)
 
-PM_ROWS_START = "<!-- PROJECT_ROWS_START -->"
-PM_ROWS_END = "<!-- PROJECT_ROWS_END -->"
-PHASE_ROWS_START = "<!-- PHASE_ROWS_START -->"
-PHASE_ROWS_END = "<!-- PHASE_ROWS_END -->"
-PHASE_TEMPLATES_START = "<!-- PHASE_TEMPLATES_START -->"
-PHASE_TEMPLATES_END = "<!-- PHASE_TEMPLATES_END -->"
-EM_DASH = "\u2014"
+if TYPE_CHECKING:
+    from link_graph import LinkGraph
+    from render_cache import RenderCache
 
 
-@dataclass
-class PhaseInfo:
+EM_DASH = "\u2014"
+LAZY_DATA_DIR = "data"
+PM_DATA_COLUMNS = [
+    "slug",
+    "description_html",
+    "phase",
+    "status",
+    "status_class",
+    "health",
+    "health_class",
+    "owner",
+    "last_updated",
+    "action1_html",
+    "action2_html",
+]
+BUG_STATUSES = ["open", "in_progress", "closed"]
+BUG_SEVERITIES = ["critical", "major", "minor", "nit"]
+# The name starts and ends on a non-space character, so the space runs around it have exactly one
+# owner and a line that almost matches is rejected in linear time.
+PHASE_LINE = re.compile(
+    rf"^\s+- Phase\s+(?P<num>\d+)\s+{re.escape(EM_DASH)}\s+"
+    r"(?P<name>[^()\s](?:[^()]*?[^()\s])??)"
+    r"(?:\s+\((?P<status>[^)]+)\)|\s*):\s+see\s+`(?P<path>[^`]+)`"
+)
+STAGE_ACTION_PREFIX = "AI_first/projects/"
+STAGE_ACTION_SUFFIX = "_action.md"
+
+
+class PhaseInfo(NamedTuple):
     number: str
     name: str
     status: str
@@ -30,10 +65,11 @@ class PhaseInfo:
     phase_def_path: Path
     action_plan_path: Path
     stage_actions: List[Path]
+    # Set when the action plan names no stage actions and they were listed from this directory.
+    actions_dir: Optional[Path] = None
 
 
-@dataclass
-class ProjectInfo:
+class ProjectInfo(NamedTuple):
     slug: str
     status: str
     summary_path: Path
@@ -66,7 +102,9 @@ def _status_badge(status: str) -> tuple[str, str]:
 
 
 def _extract_field(md_text: str, field: str) -> Optional[str]:
-    pattern = re.compile(rf"^\s*-\s*\*\*{re.escape(field)}:\*\*\s*(.+)$", re.I | re.M)
+    # `[^\S\n]*` rather than `\s*` before the dash: a leading `\s*` can start at every line of a
+    # blank run and rescan it, which is quadratic on long runs of empty lines.
+    pattern = re.compile(rf"^[^\S\n]*-\s*\*\*{re.escape(field)}:\*\*\s*(.+)$", re.I | re.M)
     match = pattern.search(md_text)
     if not match:
         return None
@@ -90,7 +128,7 @@ def _extract_list_block(md_text: str) -> str:
 def _render_inline(text: str) -> str:
     escaped = html.escape(text)
     escaped = re.sub(r"`([^`]+)`", r"<code>\1</code>", escaped)
-    escaped = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"<a href=\"\2\">\1</a>", escaped)
+    escaped = render_links(escaped)
     escaped = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>", escaped)
     return escaped
 
@@ -109,32 +147,49 @@ def _render_list_summary(md_text: str) -> str:
     return '<ul class="muted small">' + "".join(items) + "</ul>"
 
 
-def _replace_between_markers(text: str, start_marker: str, end_marker: str, new_body: str) -> str:
-    start_idx = text.find(start_marker)
-    end_idx = text.find(end_marker)
-    if start_idx == -1 or end_idx == -1 or start_idx > end_idx:
-        raise SystemExit(f"Missing marker block: {start_marker} ... {end_marker}")
-    before = text[: start_idx + len(start_marker)]
-    after = text[end_idx:]
-    body = new_body.strip("\n")
-    return f"{before}\n{body}\n{after}"
+class _Sources:
+    """Markdown inputs read once per run, with the values parsed or rendered from each memoized.
 
+    With a render cache, those values are also stored under a hash of the file's text, so a run in
+    another checkout or worktree that sees the same text reuses them instead of re-parsing.
+    """
 
-def _replace_summary_value(text: str, label: str, value: str) -> str:
-    pattern = re.compile(
-        rf'(<div class="summary-card">\s*<div class="muted small">{re.escape(label)}</div>\s*<div class="h6">)([^<]*)(</div>\s*</div>)',
-        re.S,
-    )
-    return pattern.sub(rf"\g<1>{value}\g<3>", text, count=1)
+    def __init__(self, cache: Optional[RenderCache] = None) -> None:
+        self.cache = cache
+        self._entries: Dict[Path, Dict[str, Any]] = {}
 
+    def derive(self, path: Path, name: str, parse: Callable[[str], Any]) -> Any:
+        entry = self._entries.get(path)
+        if entry is None:
+            text = path.read_text(encoding="utf-8")
+            entry = {"text": text, "key": None, "values": {}, "dirty": False}
+            if self.cache is not None:
+                import hashlib
 
-def _replace_summary_item(text: str, label: str, value: str) -> str:
-    if not value:
-        return text
-    pattern = re.compile(
-        rf"(<li>\s*<strong>{re.escape(label)}:</strong>)([^<]*)(</li>)"
-    )
-    return pattern.sub(rf"\g<1> {html.escape(value)}\g<3>", text, count=1)
+                entry["key"] = self.cache.key(hashlib.sha1(text.encode("utf-8")).hexdigest())
+                entry["values"] = self.cache.get("pm", entry["key"]) or {}
+            self._entries[path] = entry
+        values = entry["values"]
+        if name not in values:
+            values[name] = parse(entry["text"])
+            entry["dirty"] = True
+        return values[name]
+
+    def save(self) -> int:
+        """Store newly derived values; returns the number of cache entries evicted."""
+        if self.cache is None:
+            return 0
+        for entry in self._entries.values():
+            if entry["dirty"]:
+                self.cache.put("pm", entry["key"], entry["values"])
+                entry["dirty"] = False
+        return self.cache.close()
+
+
+def _derive(sources: Optional[_Sources], path: Path, name: str, parse: Callable[[str], Any]) -> Any:
+    if sources is None:
+        return parse(path.read_text(encoding="utf-8"))
+    return sources.derive(path, name, parse)
 
 
 def _doc_link_from_md(md_path: Path, repo_root: Path) -> str:
@@ -143,16 +198,42 @@ def _doc_link_from_md(md_path: Path, repo_root: Path) -> str:
     return html_rel.with_suffix(".html").as_posix()
 
 
+def _is_stage_action_path(span: str) -> bool:
+    # AI_first/projects/<one or more chars>/actions/<one or more chars>_action.md
+    if not span.startswith(STAGE_ACTION_PREFIX) or not span.endswith(STAGE_ACTION_SUFFIX):
+        return False
+    marker = span.find("/actions/", len(STAGE_ACTION_PREFIX) + 1)
+    return marker != -1 and marker + len("/actions/") < len(span) - len(STAGE_ACTION_SUFFIX)
+
+
 def _extract_stage_actions(action_plan_text: str, repo_root: Path) -> List[Path]:
-    matches = re.findall(
-        r"`(AI_first/projects/[^`]+/actions/[^`]+_action\.md)`",
-        action_plan_text,
-    )
-    return [repo_root / match for match in matches]
+    return [repo_root / match for match in _stage_action_spans(action_plan_text)]
+
+
+def _stage_action_spans(action_plan_text: str) -> List[str]:
+    """Backticked stage action paths, in order.
+
+    Same result as findall over r"`(AI_first/projects/[^`]+/actions/[^`]+_action\\.md)`", but
+    each backticked span is checked once instead of rescanned from every position.
+    """
+    spans = action_plan_text.split("`")
+    matches: List[str] = []
+    idx = 1
+    while idx < len(spans) - 1:
+        if _is_stage_action_path(spans[idx]):
+            matches.append(spans[idx])
+            # The closing backtick was consumed by this match, so it cannot open the next one.
+            idx += 2
+        else:
+            idx += 1
+    return matches
+
 
+def _parse_projectplan(projectplan_path: Path, sources: Optional[_Sources] = None) -> List[dict]:
+    return _derive(sources, projectplan_path, "projectplan", projectplan_entries)
 
-def _parse_projectplan(projectplan_path: Path) -> List[dict]:
-    text = projectplan_path.read_text(encoding="utf-8")
+
+def projectplan_entries(text: str) -> List[dict]:
     lines = text.splitlines()
     in_projects = False
     projects: List[dict] = []
@@ -185,10 +266,7 @@ def _parse_projectplan(projectplan_path: Path) -> List[dict]:
         if summary_match:
             current["summary_path"] = summary_match.group(1)
             continue
-        phase_match = re.match(
-            rf"^\s+- Phase\s+(?P<num>\d+)\s+{re.escape(EM_DASH)}\s+(?P<name>[^()]+?)(?:\s+\((?P<status>[^)]+)\))?:\s+see\s+`(?P<path>[^`]+)`",
-            line,
-        )
+        phase_match = PHASE_LINE.match(line)
         if phase_match:
             current["phases"].append(
                 {
@@ -203,11 +281,15 @@ def _parse_projectplan(projectplan_path: Path) -> List[dict]:
     return projects
 
 
-def _parse_project_summary(summary_path: Path) -> dict:
-    result = {"purpose": "", "current_goal": "", "status": "", "owner": ""}
+def _parse_project_summary(summary_path: Path, sources: Optional[_Sources] = None) -> dict:
     if not summary_path.exists():
-        return result
-    for line in summary_path.read_text(encoding="utf-8").splitlines():
+        return _summary_fields("")
+    return _derive(sources, summary_path, "summary", _summary_fields)
+
+
+def _summary_fields(text: str) -> dict:
+    result = {"purpose": "", "current_goal": "", "status": "", "owner": ""}
+    for line in text.splitlines():
         match = re.match(r"^- \*\*(?P<label>[^*]+):\*\*\s*(?P<value>.*)$", line.strip())
         if not match:
             continue
@@ -224,18 +306,21 @@ def _parse_project_summary(summary_path: Path) -> dict:
     return result
 
 
-def _parse_status_completed(phase_def_path: Path, action_plan_path: Path) -> tuple[str, Optional[str]]:
+def _status_fields(text: str) -> List[Optional[str]]:
+    return [_normalize_status(_extract_field(text, "Status")), _extract_field(text, "Completed")]
+
+
+def _parse_status_completed(
+    phase_def_path: Path, action_plan_path: Path, sources: Optional[_Sources] = None
+) -> tuple[str, Optional[str]]:
     status = ""
     completed = None
     if phase_def_path.exists():
-        text = phase_def_path.read_text(encoding="utf-8")
-        status = _normalize_status(_extract_field(text, "Status"))
-        completed = _extract_field(text, "Completed")
+        status, completed = _derive(sources, phase_def_path, "status", _status_fields)
     if not status and action_plan_path.exists():
-        text = action_plan_path.read_text(encoding="utf-8")
-        status = _normalize_status(_extract_field(text, "Status"))
+        status, plan_completed = _derive(sources, action_plan_path, "status", _status_fields)
         if not completed:
-            completed = _extract_field(text, "Completed")
+            completed = plan_completed
     return status, completed
 
 
@@ -295,128 +380,163 @@ def _derive_next_actions(current_goal: str, project_status: str) -> List[str]:
     return result if len(result) == 2 else (result + defaults)[:2]
 
 
-def _count_open_bugs(issues_path: Path) -> Dict[str, int]:
-    counts: Dict[str, int] = {}
-    if not issues_path.exists():
-        return counts
-    for line in issues_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if str(payload.get("status", "")).lower() != "open":
-            continue
-        project = str(payload.get("project", "")).strip()
-        if not project:
-            continue
-        counts[project] = counts.get(project, 0) + 1
+def _phase_bug_counts(stages: Dict[str, Dict[str, Dict[str, int]]]) -> Dict[str, Dict[str, int]]:
+    """Collapse one phase's stages into status -> severity -> count."""
+    counts: Dict[str, Dict[str, int]] = {}
+    for statuses in stages.values():
+        for status, severities in statuses.items():
+            target = counts.setdefault(status, {})
+            for severity, count in severities.items():
+                target[severity] = target.get(severity, 0) + count
     return counts
 
 
-def _build_projects(repo_root: Path, projectplan_path: Path) -> List[ProjectInfo]:
-    raw_projects = _parse_projectplan(projectplan_path)
-    projects: List[ProjectInfo] = []
-    for raw in raw_projects:
-        slug = raw["slug"]
-        summary_path = repo_root / raw["summary_path"] if raw.get("summary_path") else None
-        if not summary_path:
-            raise SystemExit(f"Missing summary path for project {slug} in {projectplan_path}")
-        summary = _parse_project_summary(summary_path)
-        project_status = raw["status"] or summary["status"] or "active"
-        phases: List[PhaseInfo] = []
-        for phase_data in raw["phases"]:
-            number = phase_data["number"]
-            name = phase_data["name"]
-            phase_root = repo_root / "AI_first" / "projects" / slug / "phases" / f"phase{number}"
-            phase_def_path = phase_root / "phase_definition.md"
-            action_plan_path = phase_root / f"action_plan_phase{number}.md"
-            doc_status, completed = _parse_status_completed(phase_def_path, action_plan_path)
-            status = phase_data["status"] or doc_status
-            stage_actions: List[Path] = []
-            if action_plan_path.exists():
-                stage_actions = _extract_stage_actions(action_plan_path.read_text(encoding="utf-8"), repo_root)
-            if not stage_actions:
-                actions_dir = phase_root / "actions"
-                if actions_dir.exists():
-                    stage_actions = sorted(actions_dir.glob("*.md"))
-            phases.append(
-                PhaseInfo(
-                    number=number,
-                    name=name,
-                    status=status,
-                    completed=completed,
-                    phase_def_path=phase_def_path,
-                    action_plan_path=action_plan_path,
-                    stage_actions=stage_actions,
-                )
-            )
-        active_phase = _determine_active_phase(summary["current_goal"], phases)
-        for phase in phases:
-            if phase.status:
-                continue
-            if active_phase and phase.number == active_phase and project_status != "complete":
-                phase.status = "active"
-            elif project_status == "complete":
-                phase.status = "complete"
-            else:
-                phase.status = "planning"
-        projects.append(
-            ProjectInfo(
-                slug=slug,
-                status=project_status,
-                summary_path=summary_path,
-                purpose=summary["purpose"],
-                current_goal=summary["current_goal"],
-                owner=summary["owner"] or "unassigned",
-                phases=phases,
-                active_phase=active_phase,
+def _bug_summary(counts: Dict[str, Dict[str, int]]) -> str:
+    parts: List[str] = []
+    for status in BUG_STATUSES + sorted(set(counts) - set(BUG_STATUSES)):
+        severities = counts.get(status)
+        if not severities:
+            continue
+        label = f"{sum(severities.values())} {status.replace('_', ' ') or 'unknown'}"
+        if status != "closed":
+            ordered = BUG_SEVERITIES + sorted(set(severities) - set(BUG_SEVERITIES))
+            label += " (" + ", ".join(f"{severities[sev]} {sev}" for sev in ordered if severities.get(sev)) + ")"
+        parts.append(label)
+    return "Bugs: " + " \u00b7 ".join(parts)
+
+
+def _write_rollup_json(path: Path, rollup: BugRollup, dry_run: bool) -> None:
+    content = json.dumps({"rollup": rollup}, indent=2, sort_keys=True) + "\n"
+    _write_data_file(path, content, dry_run)
+
+
+def _build_projects(
+    repo_root: Path, projectplan_path: Path, sources: Optional[_Sources] = None
+) -> List[ProjectInfo]:
+    raw_projects = _parse_projectplan(projectplan_path, sources)
+    return [_build_project(repo_root, raw, projectplan_path, sources) for raw in raw_projects]
+
+
+def _build_project(
+    repo_root: Path, raw: dict, projectplan_path: Path, sources: Optional[_Sources] = None
+) -> ProjectInfo:
+    slug = raw["slug"]
+    summary_path = repo_root / raw["summary_path"] if raw.get("summary_path") else None
+    if not summary_path:
+        raise SystemExit(f"Missing summary path for project {slug} in {projectplan_path}")
+    summary = _parse_project_summary(summary_path, sources)
+    project_status = raw["status"] or summary["status"] or "active"
+    phases: List[PhaseInfo] = []
+    for phase_data in raw["phases"]:
+        number = phase_data["number"]
+        name = phase_data["name"]
+        phase_root = repo_root / "AI_first" / "projects" / slug / "phases" / f"phase{number}"
+        phase_def_path = phase_root / "phase_definition.md"
+        action_plan_path = phase_root / f"action_plan_phase{number}.md"
+        doc_status, completed = _parse_status_completed(phase_def_path, action_plan_path, sources)
+        status = phase_data["status"] or doc_status
+        stage_actions: List[Path] = []
+        if action_plan_path.exists():
+            spans = _derive(sources, action_plan_path, "stage_actions", _stage_action_spans)
+            stage_actions = [repo_root / span for span in spans]
+        actions_dir = None
+        if not stage_actions:
+            actions_dir = phase_root / "actions"
+            if actions_dir.exists():
+                stage_actions = sorted(actions_dir.glob("*.md"))
+        phases.append(
+            PhaseInfo(
+                number=number,
+                name=name,
+                status=status,
+                completed=completed,
+                phase_def_path=phase_def_path,
+                action_plan_path=action_plan_path,
+                stage_actions=stage_actions,
+                actions_dir=actions_dir,
             )
         )
-    return projects
+    active_phase = _determine_active_phase(summary["current_goal"], phases)
+    for idx, phase in enumerate(phases):
+        if phase.status:
+            continue
+        if active_phase and phase.number == active_phase and project_status != "complete":
+            status = "active"
+        elif project_status == "complete":
+            status = "complete"
+        else:
+            status = "planning"
+        phases[idx] = phase._replace(status=status)
+    return ProjectInfo(
+        slug=slug,
+        status=project_status,
+        summary_path=summary_path,
+        purpose=summary["purpose"],
+        current_goal=summary["current_goal"],
+        owner=summary["owner"] or "unassigned",
+        phases=phases,
+        active_phase=active_phase,
+    )
+
+
+def build_one_project(repo_root: Path, projectplan_path: Path, slug: str) -> Optional[ProjectInfo]:
+    """Build just `slug` from the project plan; None when the plan does not list it."""
+    for raw in _parse_projectplan(projectplan_path):
+        if raw["slug"] == slug:
+            return _build_project(repo_root, raw, projectplan_path)
+    return None
+
+
+def _pm_row_fields(project: ProjectInfo) -> Dict[str, str]:
+    """Return the display values for one PM row (HTML-ready where noted by the *_html keys)."""
+    active_phase = next((phase for phase in project.phases if phase.number == project.active_phase), None)
+    if active_phase:
+        phase_label = f"Phase {active_phase.number} {EM_DASH} {active_phase.name}"
+    elif project.phases:
+        phase_label = f"Phase {project.phases[-1].number} {EM_DASH} {project.phases[-1].name}"
+    else:
+        phase_label = "TBD"
+    status_label, status_class = _status_badge(project.status)
+    actions = _derive_next_actions(project.current_goal, project.status)
+    return {
+        "slug": project.slug,
+        "description_html": _render_inline(project.purpose or "Project overview."),
+        "phase": phase_label,
+        "status": status_label,
+        "status_class": status_class,
+        "health": "Complete" if project.status == "complete" else "On Track",
+        "health_class": "status-closed",
+        "owner": project.owner,
+        "last_updated": _latest_completed_date(project.phases) or "TBD",
+        "action1_html": _render_inline(actions[0]),
+        "action2_html": _render_inline(actions[1]),
+    }
+
+
+def _render_pm_row(row: Dict[str, str], href: str, indent: str = "            ") -> str:
+    slug = row["slug"]
+    row_lines = [
+        f'{indent}<tr data-link="{href}" tabindex="0" role="button" aria-label="Open {slug} project details">',
+        f"{indent}  <td>",
+        f'{indent}    <a class="fw" href="{href}">{slug}</a>',
+        f'{indent}    <div class="muted small">{row["description_html"]}</div>',
+        f"{indent}  </td>",
+        f"{indent}  <td>{html.escape(row['phase'])}</td>",
+        f'{indent}  <td><span class="badge {row["status_class"]}">{row["status"]}</span></td>',
+        f'{indent}  <td><span class="badge {row["health_class"]}">{row["health"]}</span></td>',
+        f"{indent}  <td>{html.escape(row['owner'])}</td>",
+        f"{indent}  <td>{row['last_updated']}</td>",
+        f'{indent}  <td class="muted small">',
+        f"{indent}    <div>{row['action1_html']}</div>",
+        f"{indent}    <div>{row['action2_html']}</div>",
+        f"{indent}  </td>",
+        f"{indent}</tr>",
+    ]
+    return "\n".join(row_lines)
 
 
 def _render_pm_rows(projects: Iterable[ProjectInfo]) -> str:
-    rows: List[str] = []
-    indent = "            "
-    for project in projects:
-        active_phase = next(
-            (phase for phase in project.phases if phase.number == project.active_phase), None
-        )
-        if active_phase:
-            phase_label = f"Phase {active_phase.number} {EM_DASH} {active_phase.name}"
-        elif project.phases:
-            phase_label = f"Phase {project.phases[-1].number} {EM_DASH} {project.phases[-1].name}"
-        else:
-            phase_label = "TBD"
-        status_label, status_class = _status_badge(project.status)
-        health_label = "Complete" if project.status == "complete" else "On Track"
-        health_class = "status-closed"
-        actions = _derive_next_actions(project.current_goal, project.status)
-        description = project.purpose or "Project overview."
-        description_html = _render_inline(description)
-        last_updated = _latest_completed_date(project.phases) or "TBD"
-        row_lines = [
-            f'{indent}<tr data-link="project_{project.slug}.html" tabindex="0" role="button" aria-label="Open {project.slug} project details">',
-            f"{indent}  <td>",
-            f'{indent}    <a class="fw" href="project_{project.slug}.html">{project.slug}</a>',
-            f'{indent}    <div class="muted small">{description_html}</div>',
-            f"{indent}  </td>",
-            f"{indent}  <td>{html.escape(phase_label)}</td>",
-            f'{indent}  <td><span class="badge {status_class}">{status_label}</span></td>',
-            f'{indent}  <td><span class="badge {health_class}">{health_label}</span></td>',
-            f"{indent}  <td>{html.escape(project.owner)}</td>",
-            f"{indent}  <td>{last_updated}</td>",
-            f'{indent}  <td class="muted small">',
-            f"{indent}    <div>{_render_inline(actions[0])}</div>",
-            f"{indent}    <div>{_render_inline(actions[1])}</div>",
-            f"{indent}  </td>",
-            f"{indent}</tr>",
-        ]
-        rows.append("\n".join(row_lines))
-    return "\n".join(rows)
+    return "\n".join(_render_pm_row(_pm_row_fields(project), f"project_{project.slug}.html") for project in projects)
 
 
 def _latest_completed_date(phases: Iterable[PhaseInfo]) -> Optional[str]:
@@ -425,53 +545,176 @@ def _latest_completed_date(phases: Iterable[PhaseInfo]) -> Optional[str]:
     return max(dates) if dates else None
 
 
+def has_active_phase(project: ProjectInfo) -> bool:
+    return bool(project.active_phase) and any(
+        phase.number == project.active_phase and phase.status != "complete" for phase in project.phases
+    )
+
+
 def _update_pm_html(
     pm_path: Path,
     projects: List[ProjectInfo],
     open_bugs: Dict[str, int],
     dry_run: bool,
+    lazy: bool = False,
 ) -> bool:
     text = pm_path.read_text(encoding="utf-8")
-    rows = _render_pm_rows(projects)
-    updated = _replace_between_markers(text, PM_ROWS_START, PM_ROWS_END, rows)
-    updated = _replace_count(updated, "projects", len(projects))
-    active_count = sum(
-        1
-        for project in projects
-        if project.active_phase
-        and any(
-            phase.number == project.active_phase and phase.status != "complete" for phase in project.phases
-        )
-    )
-    updated = _replace_count(updated, "active-phases", active_count)
+    if lazy:
+        rows, data_changed = _write_lazy_pm_data(pm_path, projects, dry_run)
+    else:
+        rows, data_changed = _render_pm_rows(projects), False
+    active_count = sum(1 for project in projects if has_active_phase(project))
     total_open = sum(open_bugs.values())
-    updated = _replace_count(updated, "open-bugs", total_open)
+    updated = patch_slots(
+        text,
+        {
+            ("block", "PROJECT_ROWS"): rows,
+            ("count", "projects"): str(len(projects)),
+            ("count", "active-phases"): str(active_count),
+            ("count", "open-bugs"): str(total_open),
+        },
+        required=[("block", "PROJECT_ROWS")],
+        source=str(pm_path),
+    )
     if dry_run:
         print(f"[dry-run] update {pm_path}")
         return False
+    if updated == text:
+        return data_changed
     pm_path.write_text(updated, encoding="utf-8")
     return True
 
 
-def _replace_count(text: str, key: str, value: int) -> str:
-    pattern = re.compile(rf'(data-count="{re.escape(key)}">)(\d+)(</div>)')
-    return pattern.sub(rf"\g<1>{value}\3", text, count=1)
+def patch_project_row(pm_path: Path, project: ProjectInfo, active_delta: int, dry_run: bool) -> bool:
+    """Re-render one project's PM row in place, leaving every other row untouched.
+
+    A lazy PM.html keeps its rows in `data/pm_projects.js`, so the project's entry there is
+    replaced instead. `active_delta` adjusts the active-phases count when the project gained or
+    lost an active phase. Returns True only when PM.html or its row data changed.
+    """
+    text = original = pm_path.read_text(encoding="utf-8")
+    data_changed = False
+    slots, problems = scan_slots(text)
+    block = slots.get(("block", "PROJECT_ROWS"))
+    if problems or not block:
+        raise SystemExit(f"{pm_path} has no usable PROJECT_ROWS block; run render_pm.py.")
+    start, end = block[0].start, block[0].end
+    href = f"project_{project.slug}.html"
+    fields = _pm_row_fields(project)
+    if "data-virtual-rows=" in text[start:end]:
+        data_path = pm_path.parent / LAZY_DATA_DIR / "pm_projects.js"
+        data = data_path.read_text(encoding="utf-8")
+        payload = json.loads(data[data.index("{") : data.rindex("}") + 1])
+        slug_column = payload["columns"].index("slug")
+        index = next((i for i, row in enumerate(payload["rows"]) if row[slug_column] == project.slug), None)
+        if index is None:
+            raise SystemExit(f"{data_path} has no row for {project.slug}; run render_pm.py --lazy.")
+        payload["rows"][index] = [fields[column] for column in payload["columns"]]
+        data_changed = _write_data_file(data_path, _js_data("window.AIFIRST_PM_LOADED", payload), dry_run)
+    else:
+        row_start = text.find(f'<tr data-link="{href}"', start, end)
+        if row_start == -1:
+            raise SystemExit(f"{pm_path} has no row for {project.slug}; run render_pm.py.")
+        line_start = text.rfind("\n", 0, row_start) + 1
+        row_end = text.index("</tr>", row_start) + len("</tr>")
+        row = _render_pm_row(fields, href, text[line_start:row_start])
+        text = text[:line_start] + row + text[row_end:]
+    if active_delta:
+        slots, _ = scan_slots(text)
+        found = slots.get(("count", "active-phases"))
+        if found:
+            count = int(text[found[0].start : found[0].end]) + active_delta
+            text = patch_slots(text, {("count", "active-phases"): str(max(count, 0))}, source=str(pm_path))
+    if dry_run:
+        print(f"[dry-run] update {pm_path}")
+        return False
+    if text == original:
+        return data_changed
+    pm_path.write_text(text, encoding="utf-8")
+    return True
+
+
+def _write_data_file(path: Path, content: str, dry_run: bool) -> bool:
+    """Write `content` unless the file already holds it; True when the file changed."""
+    if dry_run:
+        print(f"[dry-run] write {path}")
+        return False
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def _js_data(callback: str, *payload: object) -> str:
+    # Data files are JSON wrapped in a script call so they load from file:// without fetch().
+    args = ",".join(json.dumps(item, ensure_ascii=True, separators=(",", ":")) for item in payload)
+    return f"{callback}({args});\n"
 
 
-def _render_phase_rows(project: ProjectInfo, repo_root: Path) -> str:
+def _write_lazy_pm_data(pm_path: Path, projects: List[ProjectInfo], dry_run: bool) -> Tuple[str, bool]:
+    """Write compact PM row data; returns the PROJECT_ROWS block that loads it and whether the data changed."""
+    rows = []
+    for project in projects:
+        fields = _pm_row_fields(project)
+        rows.append([fields[column] for column in PM_DATA_COLUMNS])
+    data_path = pm_path.parent / LAZY_DATA_DIR / "pm_projects.js"
+    payload = {"columns": PM_DATA_COLUMNS, "rows": rows}
+    changed = _write_data_file(data_path, _js_data("window.AIFIRST_PM_LOADED", payload), dry_run)
+    indent = "            "
+    block = "\n".join(
+        [
+            f'{indent}<tr data-virtual-rows="{len(rows)}"><td colspan="7" class="muted small">Loading {len(rows)} projects...</td></tr>',
+            f'{indent}<script src="assets/pm_table.js"></script>',
+            f'{indent}<script src="{LAZY_DATA_DIR}/pm_projects.js"></script>',
+        ]
+    )
+    return block, changed
+
+
+def _phase_data_rel(project: ProjectInfo, phase: PhaseInfo) -> str:
+    return f"{LAZY_DATA_DIR}/phases/{project.slug}/phase{phase.number}.js"
+
+
+def _render_phase_rows(
+    project: ProjectInfo,
+    repo_root: Path,
+    lazy: bool = False,
+    bugs: Optional[Dict[str, Dict[str, Dict[str, Dict[str, int]]]]] = None,
+) -> str:
     rows: List[str] = []
     indent = "            "
+    bugs = bugs or {}
     for phase in project.phases:
         status_label, status_class = _status_badge(phase.status)
         last_updated = phase.completed or "TBD"
         phase_label = f"Phase {phase.number} {EM_DASH} {phase.name}"
+        lazy_attrs = []
+        if lazy:
+            lazy_attrs = [
+                f'{indent}    data-phase-key="phase{phase.number}"',
+                f'{indent}    data-phase-src="{_phase_data_rel(project, phase)}"',
+            ]
+        bug_attrs: List[str] = []
+        phase_cell = f"{indent}  <td>{html.escape(phase_label)}</td>"
+        counts = _phase_bug_counts(bugs.get(rollup_phase_key(phase.number), {}))
+        if counts:
+            open_count = sum(counts.get("open", {}).values())
+            total = sum(sum(severities.values()) for severities in counts.values())
+            bug_attrs = [f'{indent}    data-bugs-open="{open_count}" data-bugs-total="{total}"']
+            phase_cell = (
+                f"{indent}  <td>{html.escape(phase_label)}"
+                f'<div class="muted small">{html.escape(_bug_summary(counts))}</div></td>'
+            )
         row_lines = [
             f'{indent}<tr data-phase="{html.escape(phase_label)}"',
             f'{indent}    data-phase-def-id="phase{phase.number}-def"',
             f'{indent}    data-action-plan-id="phase{phase.number}-plan"',
             f'{indent}    data-stage-action-id="phase{phase.number}-action"',
+            *lazy_attrs,
+            *bug_attrs,
             f'{indent}    tabindex="0" role="button" aria-label="View Phase {phase.number} details">',
-            f"{indent}  <td>{html.escape(phase_label)}</td>",
+            phase_cell,
             f'{indent}  <td><span class="badge {status_class}">{status_label}</span></td>',
             f"{indent}  <td>{last_updated}</td>",
             f"{indent}</tr>",
@@ -480,26 +723,45 @@ def _render_phase_rows(project: ProjectInfo, repo_root: Path) -> str:
     return "\n".join(rows)
 
 
-def _render_phase_templates(project: ProjectInfo) -> str:
+def _phase_bodies(phase: PhaseInfo, sources: Optional[_Sources] = None) -> Tuple[str, str, str]:
+    phase_def_body = _read_summary_body(phase.phase_def_path, sources)
+    action_plan_body = _read_summary_body(phase.action_plan_path, sources)
+    if phase.stage_actions:
+        stage_action_body = _read_summary_body(phase.stage_actions[0], sources)
+    else:
+        stage_action_body = '<ul class="muted small"><li><strong>Stage Action:</strong> TBD.</li></ul>'
+    return phase_def_body, action_plan_body, stage_action_body
+
+
+def _write_lazy_phase_data(
+    project: ProjectInfo, ui_root: Path, dry_run: bool, sources: Optional[_Sources] = None
+) -> Tuple[str, bool]:
+    """Write one data file per phase; returns the PHASE_TEMPLATES block that loads them on demand
+    and whether any data file changed."""
+    changed = False
+    for phase in project.phases:
+        phase_def_body, action_plan_body, stage_action_body = _phase_bodies(phase, sources)
+        payload = {"def": phase_def_body, "plan": action_plan_body, "action": stage_action_body}
+        content = _js_data("window.AIFIRST_PHASE_LOADED", f"phase{phase.number}", payload)
+        changed |= _write_data_file(ui_root / _phase_data_rel(project, phase), content, dry_run)
+    return '    <script src="assets/pm_phases.js"></script>', changed
+
+
+def _render_phase_templates(project: ProjectInfo, sources: Optional[_Sources] = None) -> str:
     indent = "    "
     templates: List[str] = []
     for phase in project.phases:
-        phase_def_body = _read_summary_body(phase.phase_def_path)
-        action_plan_body = _read_summary_body(phase.action_plan_path)
-        if phase.stage_actions:
-            stage_action_body = _read_summary_body(phase.stage_actions[0])
-        else:
-            stage_action_body = '<ul class="muted small"><li><strong>Stage Action:</strong> TBD.</li></ul>'
+        phase_def_body, action_plan_body, stage_action_body = _phase_bodies(phase, sources)
         templates.append(_wrap_template(f"phase{phase.number}-def", phase_def_body, indent))
         templates.append(_wrap_template(f"phase{phase.number}-plan", action_plan_body, indent))
         templates.append(_wrap_template(f"phase{phase.number}-action", stage_action_body, indent))
     return "\n".join(templates)
 
 
-def _read_summary_body(md_path: Path) -> str:
+def _read_summary_body(md_path: Path, sources: Optional[_Sources] = None) -> str:
     if not md_path.exists():
         return '<ul class="muted small"><li><strong>Missing:</strong> file not found.</li></ul>'
-    return _render_list_summary(md_path.read_text(encoding="utf-8"))
+    return _derive(sources, md_path, "summary_body", _render_list_summary)
 
 
 def _wrap_template(template_id: str, body: str, indent: str) -> str:
@@ -507,44 +769,267 @@ def _wrap_template(template_id: str, body: str, indent: str) -> str:
     return f'{indent}<template id="{template_id}">\n{body_indented}\n{indent}</template>'
 
 
-def _update_project_detail(
+def update_project_detail(
     project: ProjectInfo,
     html_path: Path,
     repo_root: Path,
-    open_bugs: Dict[str, int],
+    rollup: BugRollup,
     dry_run: bool,
+    lazy: bool = False,
+    sources: Optional[_Sources] = None,
 ) -> bool:
     if not html_path.exists():
         print(f"[skip] missing {html_path}")
         return False
     text = html_path.read_text(encoding="utf-8")
-    phase_rows = _render_phase_rows(project, repo_root)
-    text = _replace_between_markers(text, PHASE_ROWS_START, PHASE_ROWS_END, phase_rows)
-    templates = _render_phase_templates(project)
-    text = _replace_between_markers(text, PHASE_TEMPLATES_START, PHASE_TEMPLATES_END, templates)
-    text = _replace_summary_value(text, "Phases", str(len(project.phases)))
-    if "Open Bugs" in text:
-        text = _replace_summary_value(text, "Open Bugs", str(open_bugs.get(project.slug, 0)))
-    if "Active Phase" in text:
-        active_label = "Complete"
-        if project.active_phase and project.status != "complete":
-            active_label = f"Phase {project.active_phase}"
-        text = _replace_summary_value(text, "Active Phase", active_label)
-    if "Status" in text:
-        status_label, _ = _status_badge(project.status)
-        text = _replace_summary_value(text, "Status", status_label)
-    text = _replace_summary_item(text, "Purpose", project.purpose)
-    text = _replace_summary_item(text, "Current Goal", project.current_goal)
-    text = _replace_summary_item(text, "Status", _status_badge(project.status)[0])
-    text = _replace_summary_item(text, "Owner", project.owner)
+    if lazy:
+        templates, data_changed = _write_lazy_phase_data(project, html_path.parent, dry_run, sources)
+    else:
+        templates, data_changed = _render_phase_templates(project, sources), False
+    status_label, _ = _status_badge(project.status)
+    active_label = "Complete"
+    if project.active_phase and project.status != "complete":
+        active_label = f"Phase {project.active_phase}"
+    patches = {
+        ("block", "PHASE_ROWS"): _render_phase_rows(project, repo_root, lazy, rollup.get(project.slug)),
+        ("block", "PHASE_TEMPLATES"): templates,
+        ("card", "Phases"): str(len(project.phases)),
+        ("card", "Open Bugs"): str(project_open_bugs(rollup.get(project.slug, {}))),
+        ("card", "Active Phase"): active_label,
+        ("card", "Status"): status_label,
+        ("item", "Status"): f" {html.escape(status_label)}",
+    }
+    for label, value in (
+        ("Purpose", project.purpose),
+        ("Current Goal", project.current_goal),
+        ("Owner", project.owner),
+    ):
+        if value:
+            patches[("item", label)] = f" {html.escape(value)}"
+    updated = patch_slots(
+        text,
+        patches,
+        required=[("block", "PHASE_ROWS"), ("block", "PHASE_TEMPLATES")],
+        source=str(html_path),
+    )
     if dry_run:
         print(f"[dry-run] update {html_path}")
         return False
-    html_path.write_text(text, encoding="utf-8")
+    if updated == text:
+        return data_changed
+    html_path.write_text(updated, encoding="utf-8")
     return True
 
 
-def parse_args() -> argparse.Namespace:
+PORTFOLIO_PROJECTPLAN = Path("AI_first/docs/projectplan.md")
+PORTFOLIO_ISSUES = Path("AI_first/bugmgmt/issues/issues.jsonl")
+
+
+def _portfolio_fingerprint(root: Path) -> str:
+    """Hash the stat signature of every input render_pm reads for `root` (plus the renderer code)."""
+    import hashlib
+
+    digest = hashlib.sha1()
+    inputs = [*renderer_sources("render_pm.py"), root / PORTFOLIO_PROJECTPLAN, root / PORTFOLIO_ISSUES]
+    projects_root = root / "AI_first" / "projects"
+    for dirpath, dirnames, filenames in os.walk(projects_root):
+        dirnames.sort()
+        inputs.extend(Path(dirpath) / name for name in sorted(filenames) if name.endswith(".md"))
+    for path in inputs:
+        try:
+            st = path.stat()
+        except OSError:
+            digest.update(f"{path}|missing\n".encode("utf-8"))
+            continue
+        digest.update(f"{path}|{st.st_mtime_ns}|{st.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _portfolio_model(root_str: str) -> Dict[str, object]:
+    """Worker: parse one AI_first tree into the row fields and counts the portfolio page needs."""
+    root = Path(root_str)
+    projects = _build_projects(root, root / PORTFOLIO_PROJECTPLAN)
+    rollup = bug_rollup(root / PORTFOLIO_ISSUES)
+    return {
+        "root": root_str,
+        "projects": [
+            {
+                **_pm_row_fields(project),
+                "active": has_active_phase(project),
+                "open_bugs": project_open_bugs(rollup.get(project.slug, {})),
+            }
+            for project in projects
+        ],
+    }
+
+
+def _portfolio_models(roots: List[Path], cache_dir: Path) -> Tuple[List[Dict[str, object]], int]:
+    """Return one model per root, re-parsing (in parallel) only roots whose fingerprint changed."""
+    import hashlib
+    from concurrent.futures import ProcessPoolExecutor
+
+    models: Dict[str, Dict[str, object]] = {}
+    stale: Dict[str, Tuple[Path, str]] = {}
+    for root in roots:
+        fingerprint = _portfolio_fingerprint(root)
+        cache_path = cache_dir / f"{hashlib.sha1(str(root).encode('utf-8')).hexdigest()[:16]}.json"
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            cached = None
+        if isinstance(cached, dict) and cached.get("fingerprint") == fingerprint:
+            models[str(root)] = cached["model"]
+        else:
+            stale[str(root)] = (cache_path, fingerprint)
+    if stale:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as pool:
+            for model in pool.map(_portfolio_model, list(stale)):
+                cache_path, fingerprint = stale[model["root"]]
+                cache_path.write_text(json.dumps({"fingerprint": fingerprint, "model": model}), encoding="utf-8")
+                models[model["root"]] = model
+    return [models[str(root)] for root in roots], len(stale)
+
+
+def _render_portfolio(models: List[Dict[str, object]], out_path: Path) -> str:
+    def rel(target: Path) -> str:
+        return html.escape(Path(os.path.relpath(target, out_path.parent)).as_posix())
+
+    names = [Path(str(model["root"])).name for model in models]
+    repo_rows: List[str] = []
+    sections: List[str] = []
+    totals = {"projects": 0, "active": 0, "open_bugs": 0}
+    for idx, model in enumerate(models, start=1):
+        root = Path(str(model["root"]))
+        label = names[idx - 1] if names.count(names[idx - 1]) == 1 else str(root)
+        projects = model["projects"]
+        active = sum(1 for project in projects if project["active"])
+        open_bugs = sum(project["open_bugs"] for project in projects)
+        totals["projects"] += len(projects)
+        totals["active"] += active
+        totals["open_bugs"] += open_bugs
+        ui_root = root / "AI_first" / "ui"
+        repo_rows.append(
+            f'            <tr data-link="#repo-{idx}" tabindex="0" role="button" aria-label="Show {html.escape(label)} projects">'
+            f'<td><a class="fw" href="#repo-{idx}">{html.escape(label)}</a>'
+            f'<div class="muted small">{html.escape(str(root))}</div></td>'
+            f"<td>{len(projects)}</td><td>{active}</td><td>{open_bugs}</td>"
+            f'<td><a href="{rel(ui_root / "PM.html")}">PM dashboard</a></td></tr>'
+        )
+        rows = "\n".join(
+            _render_pm_row(project, rel(ui_root / f"project_{project['slug']}.html"), "            ")
+            for project in projects
+        )
+        sections.append(
+            f"""    <section class="card" id="repo-{idx}">
+      <h2 class="h4">{html.escape(label)}</h2>
+      <p class="muted small">{len(projects)} projects · {active} active phases · {open_bugs} open bugs · <a href="{rel(ui_root / "PM.html")}">Open the repo PM dashboard</a></p>
+      <div class="table-wrap">
+        <table class="issues pm-table">
+          <thead>
+            <tr>
+              <th>Project</th>
+              <th>Phase</th>
+              <th>Status</th>
+              <th>Health</th>
+              <th>Owner</th>
+              <th>Last Updated</th>
+              <th>Next Actions</th>
+            </tr>
+          </thead>
+          <tbody>
+{rows}
+          </tbody>
+        </table>
+      </div>
+    </section>"""
+        )
+    repo_rows_html = "\n".join(repo_rows)
+    sections_html = "\n\n".join(sections)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Portfolio Report</title>
+  <link rel="stylesheet" href="style/bugmgmt.css" />
+</head>
+<body>
+  <div class="container">
+    <nav class="top-nav">
+      <a class="nav-link nav-home" href="index.html">Home</a>
+      <a class="nav-link nav-process" href="process_guide.html">Process Management</a>
+      <a class="nav-link nav-project" href="PM.html">Project Management</a>
+      <a class="nav-link nav-bug" href="bugmgmt_issues.html">Bug Management</a>
+    </nav>
+    <header class="hero">
+      <div>
+        <h1 class="h4">Portfolio Report</h1>
+        <p class="muted small">Projects across {len(models)} AI_first repos. Generated by `render_pm.py --portfolio`; each repo's `projectplan.md` stays the source of truth.</p>
+      </div>
+    </header>
+
+    <div class="summary">
+      <div class="summary-card"><div class="muted small">Repos</div><div class="h6">{len(models)}</div></div>
+      <div class="summary-card"><div class="muted small">Projects</div><div class="h6">{totals["projects"]}</div></div>
+      <div class="summary-card"><div class="muted small">Active Phases</div><div class="h6">{totals["active"]}</div></div>
+      <div class="summary-card"><div class="muted small">Open Bugs</div><div class="h6">{totals["open_bugs"]}</div></div>
+    </div>
+
+    <section class="card">
+      <div class="table-wrap">
+        <table class="issues pm-table">
+          <thead>
+            <tr><th>Repo</th><th>Projects</th><th>Active Phases</th><th>Open Bugs</th><th>Drill-down</th></tr>
+          </thead>
+          <tbody>
+{repo_rows_html}
+          </tbody>
+        </table>
+      </div>
+    </section>
+
+{sections_html}
+  </div>
+  <script>
+    document.querySelectorAll("tr[data-link]").forEach((row) => {{
+      const open = (evt) => {{
+        if (evt.target.closest("a")) return;
+        if (evt.type === "keydown" && evt.key !== "Enter" && evt.key !== " ") return;
+        window.location.href = row.getAttribute("data-link");
+      }};
+      row.addEventListener("click", open);
+      row.addEventListener("keydown", open);
+    }});
+  </script>
+</body>
+</html>
+"""
+
+
+def _run_portfolio(args: argparse.Namespace, repo_root: Path) -> None:
+    roots: List[Path] = []
+    for value in args.portfolio:
+        root = Path(value).expanduser().resolve()
+        if not (root / PORTFOLIO_PROJECTPLAN).exists():
+            raise SystemExit(f"{root} is not an AI_first repo (missing {PORTFOLIO_PROJECTPLAN})")
+        if root not in roots:
+            roots.append(root)
+    out_path = (repo_root / args.portfolio_out).resolve()
+    from build_state import state_dir
+
+    models, parsed = _portfolio_models(roots, state_dir(repo_root) / "portfolio")
+    content = _render_portfolio(models, out_path)
+    if args.dry_run:
+        print(f"[dry-run] write {out_path} ({len(roots)} repos, {parsed} re-parsed)")
+        return
+    _write_data_file(out_path, content, dry_run=False)
+    print(f"Portfolio: {len(roots)} repos ({parsed} re-parsed, {len(roots) - parsed} cached) -> {out_path}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    from render_cache import add_cache_args
+
     parser = argparse.ArgumentParser(description="Render PM dashboards from project docs")
     parser.add_argument(
         "--projectplan",
@@ -570,31 +1055,144 @@ def parse_args() -> argparse.Namespace:
         default=Path("AI_first/ui"),
         help="UI root containing project_<project>.html",
     )
+    parser.add_argument(
+        "--rollup",
+        type=Path,
+        default=Path("AI_first/bugmgmt/exports/json/bug_rollup.json"),
+        help="Bug rollup JSON output (project/phase/stage/status/severity counts)",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Print actions without writing files")
-    return parser.parse_args()
+    parser.add_argument(
+        "--portfolio",
+        action="append",
+        metavar="REPO_ROOT",
+        default=None,
+        help="Build one portfolio page from several AI_first repo roots instead (repeatable)",
+    )
+    parser.add_argument(
+        "--portfolio-out",
+        type=Path,
+        default=Path("AI_first/ui/portfolio.html"),
+        help="Portfolio page output",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Write row/phase data files under <ui>/data and render them lazily (large portfolios)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Use git to refresh only outputs whose sources changed since the last incremental build",
+    )
+    add_cache_args(parser)
+    parser.add_argument(
+        "--no-links",
+        action="store_true",
+        help="Skip recording page inputs in the link graph (AI_first/.cache/link_graph.json)",
+    )
+    parser.add_argument("--no-daemon", action="store_true", help="Run locally even if the AI_first daemon is running")
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
-    repo_root = Path(__file__).resolve().parents[2]
+def _resolve_paths(args: argparse.Namespace, repo_root: Path) -> Tuple[Path, Path, Path, Path]:
     projectplan_path = (repo_root / args.projectplan).resolve()
     issues_path = (repo_root / args.issues).resolve()
     pm_path = (repo_root / args.pm).resolve()
     ui_root = (repo_root / args.ui).resolve()
+    return projectplan_path, issues_path, pm_path, ui_root
+
+
+def _affected_slugs(
+    changed: Iterable[Path],
+    repo_root: Path,
+    global_inputs: Iterable[Path],
+    links: Optional[LinkGraph] = None,
+    ui_root: Optional[Path] = None,
+) -> Optional[set]:
+    """Map changed paths to project slugs; None means every output is affected.
+
+    With `links`, a project is affected when its detail page embeds a changed (or moved) file or
+    lists a directory holding one, wherever that file lives. A project whose page has no recorded
+    inputs yet is affected by any change under its own directory.
+    """
+    changed = set(changed)
+    if any(path.resolve() in changed for path in global_inputs):
+        return None
+    projects_root = (repo_root / "AI_first" / "projects").resolve()
+    slugs = set()
+    if links is not None and ui_root is not None:
+        from link_graph import repo_path
+
+        ui_dir = repo_path(ui_root, repo_root)
+        for page in links.dependents((repo_path(path, repo_root) for path in changed), ("embeds", "lists")):
+            name = posixpath.basename(page)
+            if posixpath.dirname(page) == ui_dir and name.startswith("project_") and name.endswith(".html"):
+                slugs.add(name[len("project_") : -len(".html")])
+    for path in changed:
+        if not path.is_relative_to(projects_root):
+            continue
+        rel = path.relative_to(projects_root)
+        if len(rel.parts) < 2:
+            continue
+        if links is None or ui_root is None or not _page_recorded(links, ui_root, repo_root, rel.parts[0]):
+            slugs.add(rel.parts[0])
+    return slugs
+
+
+def _page_recorded(links: LinkGraph, ui_root: Path, repo_root: Path, slug: str) -> bool:
+    from link_graph import repo_path
+
+    return bool(links.targets(repo_path(ui_root / f"project_{slug}.html", repo_root), ("embeds",)))
+
 
-    projects = _build_projects(repo_root, projectplan_path)
-    open_bugs = _count_open_bugs(issues_path)
+def record_links(
+    links: LinkGraph, projects: List[ProjectInfo], ui_root: Path, repo_root: Path, only: Optional[set] = None
+) -> None:
+    """Record the markdown each detail page embeds, and report embedded files that are missing."""
+    from link_graph import repo_path, report_broken
 
+    missing = []
+    for project in projects:
+        page = repo_path(ui_root / f"project_{project.slug}.html", repo_root)
+        embeds = [project.summary_path]
+        for phase in project.phases:
+            embeds += [phase.phase_def_path, phase.action_plan_path, *phase.stage_actions[:1]]
+        listed = [phase.actions_dir for phase in project.phases if phase.actions_dir is not None]
+        links.set(page, "embeds", [repo_path(path, repo_root) for path in embeds])
+        links.set(page, "lists", [repo_path(path, repo_root) for path in listed])
+        if only is None or project.slug in only:
+            missing += [(page, "embeds", repo_path(path, repo_root)) for path in embeds if not path.exists()]
+    report_broken(missing)
+    links.save()
+
+
+def _write_outputs(
+    projects: List[ProjectInfo],
+    rollup: BugRollup,
+    pm_path: Path,
+    ui_root: Path,
+    repo_root: Path,
+    dry_run: bool,
+    only: Optional[set] = None,
+    lazy: bool = False,
+    rollup_path: Optional[Path] = None,
+    sources: Optional[_Sources] = None,
+) -> None:
     updated_files: List[Path] = []
-    if _update_pm_html(pm_path, projects, open_bugs, args.dry_run):
+    if rollup_path is not None:
+        _write_rollup_json(rollup_path, rollup, dry_run)
+    if _update_pm_html(pm_path, projects, open_bug_counts(rollup), dry_run, lazy):
         updated_files.append(pm_path)
 
     for project in projects:
+        if only is not None and project.slug not in only:
+            continue
         detail_path = ui_root / f"project_{project.slug}.html"
-        if _update_project_detail(project, detail_path, repo_root, open_bugs, args.dry_run):
+        if update_project_detail(project, detail_path, repo_root, rollup, dry_run, lazy, sources):
             updated_files.append(detail_path)
 
-    if args.dry_run:
+    if dry_run:
         return
     if updated_files:
         print("Updated:")
@@ -604,6 +1202,72 @@ def main() -> None:
         print("No updates needed.")
 
 
+def _open_sources(args: argparse.Namespace) -> _Sources:
+    from render_cache import open_cache
+
+    return _Sources(open_cache(args.cache, args.cache_max_mb, Path(__file__).resolve()))
+
+
+def _forward_to_daemon(args: argparse.Namespace, argv: List[str], repo_root: Path) -> Optional[int]:
+    # The daemon re-renders from its own file watch; git-driven incremental builds run locally.
+    if args.no_daemon or args.incremental:
+        return None
+    try:
+        from aifirst_daemon import forward
+    except ImportError:
+        return None
+    return forward("pm", argv, repo_root)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    repo_root = Path(__file__).resolve().parents[2]
+    args = parse_args(argv)
+    code = _forward_to_daemon(args, argv, repo_root)
+    if code is not None:
+        raise SystemExit(code)
+    if args.portfolio:
+        _run_portfolio(args, repo_root)
+        return
+    projectplan_path, issues_path, pm_path, ui_root = _resolve_paths(args, repo_root)
+
+    links = None
+    if not args.no_links:
+        from link_graph import open_graph
+
+        links = open_graph(repo_root)
+    only = None
+    if args.incremental:
+        from build_state import changed_since_build
+
+        changed = changed_since_build(repo_root, "pm")
+        if changed is not None:
+            only = _affected_slugs(
+                changed, repo_root, [projectplan_path, issues_path, *renderer_sources("render_pm.py")], links, ui_root
+            )
+        if only is not None and not only:
+            print("No source changes since the last build.")
+            return
+
+    sources = _open_sources(args)
+    projects = _build_projects(repo_root, projectplan_path, sources)
+    rollup = bug_rollup(issues_path)
+    rollup_path = (repo_root / args.rollup).resolve()
+    _write_outputs(
+        projects, rollup, pm_path, ui_root, repo_root, args.dry_run, only, args.lazy, rollup_path, sources
+    )
+    if links is not None and not args.dry_run:
+        record_links(links, projects, ui_root, repo_root, only)
+    evicted = sources.save()
+    if sources.cache is not None:
+        cache = sources.cache
+        print(f"Render cache: {cache.hits} reused, {cache.misses} parsed, {evicted} evicted ({cache.root}).")
+    if args.incremental and not args.dry_run:
+        from build_state import record_build
+
+        record_build(repo_root, "pm")
+
+
 if __name__ == "__main__":
     try:
         main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""Static full-text search index for the rendered docs, read by `AI_first/ui/search.html`.
+
+The index is an inverted index with term positions, sharded by the first two characters of each
+term. Shards and the document table are written as scripts under `AI_first/ui/data/search/`
+(git-ignored; every docs render keeps it current) so the search page can load just the shards a
+query needs from `file://`. Each document entry keeps
+its content hash and the shards that hold its terms, so re-indexing or removing one document
+rewrites only the shards whose postings changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+FORMAT = "aifirst-search/1"
+INDEX_DIR = Path("AI_first/ui/data/search")
+# Document hrefs are relative to the directory holding search.html.
+PAGE_DIR = Path("AI_first/ui")
+# Per-document forward index (derived, git-ignored), used to re-index edits without scanning shards.
+CACHE_DIR = Path("AI_first/.cache/search")
+DOCS_FILE = "docs.js"
+SHARDS_DIR = "shards"
+SHARD_PREFIX = 2
+# Positions kept per term per document (delta-encoded); the term count is always exact.
+MAX_POSITIONS = 64
+# Longer tokens (hashes, encoded blobs) still take a position but are not indexed.
+MAX_TERM = 40
+SUMMARY_CHARS = 160
+TOKEN = re.compile(r"[^\W_]+")
+SUMMARY_SKIP = re.compile(r"^(?:#|```|\||:?-{3})")
+
+
+def shard_key(term: str) -> str:
+    """File-safe shard name for a term; `search.js` derives the same name in the browser."""
+    prefix = term[:SHARD_PREFIX]
+    if prefix.isascii():
+        return prefix
+    return "".join(ch if ch.isascii() else f"_{ord(ch):x}_" for ch in prefix)
+
+
+def _summary_text(line: str) -> str:
+    text = line.strip()
+    if not text or SUMMARY_SKIP.match(text):
+        return ""
+    text = re.sub(r"^(?:[-*>]|\d+\.)\s+", "", text)
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    return text.replace("`", "").replace("**", "").strip()
+
+
+class DocText:
+    """Terms, positions, content hash, and summary of one document, gathered as its lines stream past."""
+
+    def __init__(self) -> None:
+        self.positions: Dict[str, List[int]] = {}
+        self.counts: Dict[str, int] = {}
+        self.length = 0
+        self.summary = ""
+        self._digest = hashlib.sha1()
+        self._fixed: Optional[str] = None
+
+    @property
+    def digest(self) -> str:
+        return self._fixed or self._digest.hexdigest()[:16]
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-safe copy of what was gathered, for `render_cache`."""
+        return {
+            "positions": self.positions,
+            "counts": self.counts,
+            "length": self.length,
+            "summary": self.summary,
+            "digest": self.digest,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "DocText":
+        text = cls()
+        text.positions = state["positions"]
+        text.counts = state["counts"]
+        text.length = state["length"]
+        text.summary = state["summary"]
+        text._fixed = state["digest"]
+        return text
+
+    def feed(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield `lines` unchanged while indexing them."""
+        for line in lines:
+            self._digest.update(line.encode("utf-8") + b"\n")
+            if not self.summary:
+                self.summary = _summary_text(line)[:SUMMARY_CHARS]
+            for match in TOKEN.finditer(line.lower()):
+                term = match.group()
+                pos = self.length
+                self.length += 1
+                if len(term) > MAX_TERM:
+                    continue
+                count = self.counts.get(term, 0)
+                self.counts[term] = count + 1
+                if count < MAX_POSITIONS:
+                    self.positions.setdefault(term, []).append(pos)
+            yield line
+
+
+def _read_script(path: Path) -> Any:
+    """Payload of a `window.CALLBACK(..., {...});` script written by `_write_script`."""
+    text = path.read_text(encoding="utf-8")
+    return json.loads(text[text.index("{") : text.rindex("}") + 1])
+
+
+def _write_script(path: Path, call: str, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    body = json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(",", ":"))
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(f"{call}{body});\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class SearchIndex:
+    """The on-disk index, with shards loaded on first use and rewritten only when touched.
+
+    With `cache_dir`, each document's own postings are also kept there (a forward index keyed by
+    document id), so re-indexing an edited document diffs against them and loads only the shards
+    whose postings changed. Without a current forward entry, the document's shards are scanned.
+    """
+
+    def __init__(self, root: Path, page_dir: Path, cache_dir: Optional[Path] = None) -> None:
+        self.root = root
+        self.page_dir = page_dir
+        self.cache_dir = cache_dir
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.next_id = 0
+        self._shards: Dict[str, Dict[str, List[List[int]]]] = {}
+        self._dirty: Set[str] = set()
+        self._docs_dirty = False
+        self._forward: Dict[int, Optional[Dict[str, Any]]] = {}
+        docs_path = root / DOCS_FILE
+        if docs_path.exists():
+            payload = _read_script(docs_path)
+            if payload.get("format") == FORMAT:
+                self.next_id = payload["next"]
+                self.docs = {doc["href"]: doc for doc in payload["docs"]}
+            else:
+                # Unknown layout: start over; every shard is rewritten as documents are indexed.
+                self._docs_dirty = True
+                self._drop_all_shards()
+
+    def href_for(self, out_path: Path) -> str:
+        return Path(os.path.relpath(out_path, self.page_dir)).as_posix()
+
+    def has(self, href: str) -> bool:
+        return href in self.docs
+
+    def _shard_path(self, key: str) -> Path:
+        return self.root / SHARDS_DIR / f"{key}.js"
+
+    def _shard(self, key: str) -> Dict[str, List[List[int]]]:
+        shard = self._shards.get(key)
+        if shard is None:
+            path = self._shard_path(key)
+            shard = _read_script(path) if path.exists() else {}
+            self._shards[key] = shard
+        return shard
+
+    def _drop_all_shards(self) -> None:
+        shard_dir = self.root / SHARDS_DIR
+        if shard_dir.exists():
+            for path in shard_dir.glob("*.js"):
+                self._shards[path.stem] = {}
+                self._dirty.add(path.stem)
+
+    def _forward_path(self, doc_id: int) -> Optional[Path]:
+        return None if self.cache_dir is None else self.cache_dir / f"{doc_id}.json"
+
+    def _postings_of(self, doc: Dict[str, Any]) -> Dict[str, List[int]]:
+        """A document's current postings by term, from the forward index when it matches the entry."""
+        path = self._forward_path(doc["id"])
+        if path is not None and path.exists():
+            try:
+                cached = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                cached = None
+            if isinstance(cached, dict) and cached.get("href") == doc["href"] and cached.get("hash") == doc["hash"]:
+                return cached["postings"]
+        doc_id = doc["id"]
+        found: Dict[str, List[int]] = {}
+        for key in doc["shards"]:
+            for term, postings in self._shard(key).items():
+                for posting in postings:
+                    if posting[0] == doc_id:
+                        found[term] = posting
+                        break
+        return found
+
+    def _apply(self, doc_id: int, old: Dict[str, List[int]], new: Dict[str, List[int]]) -> None:
+        """Swap a document's postings, touching only terms whose posting differs."""
+        for term in old.keys() | new.keys():
+            posting = new.get(term)
+            if old.get(term) == posting:
+                continue
+            key = shard_key(term)
+            shard = self._shard(key)
+            self._dirty.add(key)
+            if term not in old:
+                shard.setdefault(term, []).append(posting)
+                continue
+            postings = [p for p in shard.get(term, []) if p[0] != doc_id]
+            if posting is not None:
+                postings.append(posting)
+            if postings:
+                shard[term] = postings
+            else:
+                shard.pop(term, None)
+
+    def update(self, href: str, title: str, source: str, text: DocText) -> bool:
+        """Index one document; returns False when its entry is already current."""
+        doc = self.docs.get(href)
+        if doc and doc["hash"] == text.digest and doc["title"] == title and doc["source"] == source:
+            return False
+        if doc:
+            doc_id = doc["id"]
+            old = self._postings_of(doc)
+        else:
+            doc_id = self.next_id
+            self.next_id += 1
+            old = {}
+        new: Dict[str, List[int]] = {}
+        for term, positions in text.positions.items():
+            deltas = [positions[0]] + [b - a for a, b in zip(positions, positions[1:])]
+            new[term] = [doc_id, text.counts[term], *deltas]
+        self._apply(doc_id, old, new)
+        self.docs[href] = {
+            "id": doc_id,
+            "href": href,
+            "title": title,
+            "source": source,
+            "summary": text.summary,
+            "length": text.length,
+            "hash": text.digest,
+            "shards": sorted({shard_key(term) for term in new}),
+        }
+        self._forward[doc_id] = {"href": href, "hash": text.digest, "postings": new}
+        self._docs_dirty = True
+        return True
+
+    def remove(self, href: str) -> bool:
+        doc = self.docs.pop(href, None)
+        if doc is None:
+            return False
+        self._apply(doc["id"], self._postings_of(doc), {})
+        self._forward[doc["id"]] = None
+        self._docs_dirty = True
+        return True
+
+    def prune(self, repo_root: Path) -> int:
+        """Drop documents whose markdown source no longer exists."""
+        stale = [href for href, doc in self.docs.items() if not (repo_root / doc["source"]).exists()]
+        for href in stale:
+            self.remove(href)
+        return len(stale)
+
+    def save(self) -> int:
+        """Write the touched shards and the document table; returns the number of shards written."""
+        for key in sorted(self._dirty):
+            shard = self._shards[key]
+            path = self._shard_path(key)
+            if not shard:
+                if path.exists():
+                    path.unlink()
+                continue
+            for postings in shard.values():
+                postings.sort(key=lambda p: p[0])
+            _write_script(path, f"window.AIFIRST_SEARCH_SHARD({json.dumps(key)}, ", shard)
+        written = len(self._dirty)
+        if self._docs_dirty:
+            docs = sorted(self.docs.values(), key=lambda doc: doc["id"])
+            payload = {"format": FORMAT, "next": self.next_id, "docs": docs}
+            _write_script(self.root / DOCS_FILE, "window.AIFIRST_SEARCH_DOCS(", payload)
+        for doc_id, entry in self._forward.items():
+            path = self._forward_path(doc_id)
+            if path is None:
+                continue
+            if entry is None:
+                path.unlink(missing_ok=True)
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(entry, separators=(",", ":")), encoding="utf-8")
+        self._dirty.clear()
+        self._forward.clear()
+        self._docs_dirty = False
+        return written
+
+
+def open_index(repo_root: Path) -> SearchIndex:
+    return SearchIndex(repo_root / INDEX_DIR, repo_root / PAGE_DIR, repo_root / CACHE_DIR)
@@ -1,24 +1,45 @@
 #!/usr/bin/env python3
-"""Watch markdown under AI_first/docs and AI_first/projects, auto-rendering on change."""
+"""Watch markdown under AI_first/docs and AI_first/projects, auto-rendering on change.
+
+Each polling cycle is measured (scan time, files examined, changes, render time, save-to-render
+lag, and changes that queued up behind a render). Rolling p50/p95/p99 values over the recent cycles
+are written to a JSON status file, and optionally to a small self-refreshing status page.
+"""
 from __future__ import annotations
 
 import argparse
+import html
+import json
+import os
 import subprocess
 import sys
 import time
+from collections import deque
 from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
+STATUS_FORMAT = "aifirst-watch/1"
+DEFAULT_STATUS = Path("AI_first/.cache/watch_docs/status.json")
+DEFAULT_STATUS_PAGE = Path("AI_first/ui/watch_status.html")
+STYLESHEET = Path("AI_first/ui/style/bugmgmt.css")
+# Metrics summarized in the status file; render-only metrics skip cycles that did not render.
+METRICS = ["scan_ms", "files", "changed", "render_ms", "lag_ms", "backlog"]
+PERCENTILES = [50, 95, 99]
+RECENT_CYCLES = 20
 
-def _latest_mtime(root: Path) -> float:
-    latest = 0.0
-    if not root.exists():
-        return latest
-    for path in root.rglob("*.md"):
-        try:
-            latest = max(latest, path.stat().st_mtime)
-        except FileNotFoundError:
+
+def _scan(roots: List[Path]) -> Dict[str, float]:
+    """Modification time of every markdown file under `roots`."""
+    mtimes: Dict[str, float] = {}
+    for root in roots:
+        if not root.exists():
             continue
-    return latest
+        for path in root.rglob("*.md"):
+            try:
+                mtimes[str(path)] = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+    return mtimes
 
 
 def _render_once(repo_root: Path) -> int:
@@ -27,32 +48,259 @@ def _render_once(repo_root: Path) -> int:
     return result.returncode
 
 
-def parse_args() -> argparse.Namespace:
+def _percentile(values: List[float], pct: int) -> float:
+    """Linear-interpolation percentile of sorted values."""
+    pos = (len(values) - 1) * pct / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return round(values[lo] + (values[hi] - values[lo]) * (pos - lo), 1)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class _Telemetry:
+    """Per-cycle watcher metrics over a rolling window, flushed to the status file every few seconds."""
+
+    def __init__(
+        self,
+        status_path: Optional[Path],
+        page_path: Optional[Path],
+        stylesheet: Path,
+        window: int,
+        interval: float,
+        every: float,
+    ) -> None:
+        self.status_path = status_path
+        self.page_path = page_path
+        self.stylesheet = stylesheet
+        self.interval = interval
+        self.every = every
+        self.cycles: Deque[Dict[str, Any]] = deque(maxlen=window)
+        self.started = time.time()
+        self.totals = {"cycles": 0, "renders": 0, "render_failures": 0, "overruns": 0}
+        self._written = 0.0
+
+    def record(self, cycle: Dict[str, Any]) -> None:
+        self.cycles.append(cycle)
+        self.totals["cycles"] += 1
+        if cycle["render_ms"] is not None:
+            self.totals["renders"] += 1
+            self.totals["render_failures"] += int(cycle["render_exit"] != 0)
+        # A cycle whose work took longer than the polling interval means the watcher is falling behind.
+        self.totals["overruns"] += int(cycle["scan_ms"] + (cycle["render_ms"] or 0) > self.interval * 1000)
+        if cycle["render_ms"] is not None or time.time() - self._written >= self.every:
+            self.flush()
+
+    def status(self) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {}
+        for metric in METRICS:
+            values = sorted(cycle[metric] for cycle in self.cycles if cycle[metric] is not None)
+            entry: Dict[str, Any] = {"samples": len(values)}
+            for pct in PERCENTILES:
+                entry[f"p{pct}"] = _percentile(values, pct) if values else None
+            entry["max"] = values[-1] if values else None
+            summary[metric] = entry
+        return {
+            "format": STATUS_FORMAT,
+            "pid": os.getpid(),
+            "started": round(self.started, 3),
+            "updated": round(time.time(), 3),
+            "interval": self.interval,
+            "window": self.cycles.maxlen,
+            **self.totals,
+            "last": self.cycles[-1] if self.cycles else None,
+            "metrics": summary,
+            "recent": list(self.cycles)[-RECENT_CYCLES:],
+        }
+
+    def flush(self) -> None:
+        self._written = time.time()
+        if self.status_path is None and self.page_path is None:
+            return
+        status = self.status()
+        try:
+            if self.status_path is not None:
+                _write_atomic(self.status_path, json.dumps(status, indent=2) + "\n")
+            if self.page_path is not None:
+                css = Path(os.path.relpath(self.stylesheet, self.page_path.parent)).as_posix()
+                _write_atomic(self.page_path, _status_page(status, css, max(2, round(self.every))))
+        except OSError as exc:
+            print(f"Could not write watcher status: {exc}")
+
+
+def _status_page(status: Dict[str, Any], css: str, refresh: int) -> str:
+    def cell(value: Any) -> str:
+        return "&ndash;" if value is None else html.escape(str(value))
+
+    def clock(stamp: float) -> str:
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stamp))
+
+    cards = [
+        ("Cycles", status["cycles"]),
+        ("Renders", status["renders"]),
+        ("Render failures", status["render_failures"]),
+        ("Cycles over interval", status["overruns"]),
+        ("Files watched", cell((status["last"] or {}).get("files"))),
+    ]
+    card_html = "\n        ".join(
+        f'<div class="summary-card"><div class="muted small">{name}</div><div class="h6">{value}</div></div>'
+        for name, value in cards
+    )
+    metric_rows = "\n            ".join(
+        f"<tr><td>{metric}</td><td>{entry['samples']}</td>"
+        + "".join(f"<td>{cell(entry[f'p{pct}'])}</td>" for pct in PERCENTILES)
+        + f"<td>{cell(entry['max'])}</td><td>{cell((status['last'] or {}).get(metric))}</td></tr>"
+        for metric, entry in status["metrics"].items()
+    )
+    recent_rows = "\n            ".join(
+        f"<tr><td>{clock(cycle['time'])}</td>" + "".join(f"<td>{cell(cycle[metric])}</td>" for metric in METRICS) + "</tr>"
+        for cycle in reversed(status["recent"])
+    ) or f'<tr><td colspan="{len(METRICS) + 1}" class="muted small">No cycles yet.</td></tr>'
+    heads = "".join(f"<th>{metric}</th>" for metric in METRICS)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <meta http-equiv="refresh" content="{refresh}" />
+  <title>Doc Watcher Status</title>
+  <link rel="stylesheet" href="{html.escape(css)}" />
+</head>
+<body>
+  <div class="container">
+    <header class="hero">
+      <div>
+        <h1 class="h4">Doc Watcher Status</h1>
+        <p class="muted small">watch_docs.py pid {status["pid"]} · polling every {status["interval"]}s · started {clock(status["started"])} · updated {clock(status["updated"])}</p>
+      </div>
+    </header>
+
+    <div class="card">
+      <div class="summary">
+        {card_html}
+      </div>
+      <div class="filter-hint">Percentiles over the last {min(status["cycles"], status["window"])} cycles. Times in milliseconds; lag is from the oldest unrendered save to the end of its render; backlog counts changes saved while the previous render ran.</div>
+    </div>
+
+    <div class="card">
+      <div class="table-wrap">
+        <table class="issues">
+          <thead>
+            <tr><th>Metric</th><th>Samples</th>{"".join(f"<th>p{pct}</th>" for pct in PERCENTILES)}<th>Max</th><th>Last</th></tr>
+          </thead>
+          <tbody>
+            {metric_rows}
+          </tbody>
+        </table>
+      </div>
+    </div>
+
+    <div class="card">
+      <div class="table-wrap">
+        <table class="issues">
+          <thead>
+            <tr><th>Cycle</th>{heads}</tr>
+          </thead>
+          <tbody>
+            {recent_rows}
+          </tbody>
+        </table>
+      </div>
+    </div>
+  </div>
+</body>
+</html>
+"""
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Watch markdown and auto-render docs")
     parser.add_argument("--interval", type=float, default=1.0, help="Polling interval in seconds")
-    return parser.parse_args()
+    parser.add_argument(
+        "--status",
+        type=Path,
+        default=DEFAULT_STATUS,
+        help=f"JSON status file with rolling cycle metrics (default: {DEFAULT_STATUS})",
+    )
+    parser.add_argument("--no-status", action="store_true", help="Do not write the JSON status file")
+    parser.add_argument(
+        "--status-page",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_STATUS_PAGE,
+        default=None,
+        help=f"Also write a self-refreshing HTML status page (default path: {DEFAULT_STATUS_PAGE})",
+    )
+    parser.add_argument("--status-every", type=float, default=5.0, help="Seconds between status refreshes when idle")
+    parser.add_argument("--window", type=int, default=500, help="Cycles kept for the rolling percentiles")
+    parser.add_argument("--cycles", type=int, default=None, help="Stop after this many cycles (default: run until Ctrl+C)")
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
     repo_root = Path(__file__).resolve().parents[2]
-    support_root = repo_root / "AI_first" / "docs"
-    projects_root = repo_root / "AI_first" / "projects"
-    last_seen = max(_latest_mtime(support_root), _latest_mtime(projects_root))
+    roots = [repo_root / "AI_first" / "docs", repo_root / "AI_first" / "projects"]
+    telemetry = _Telemetry(
+        None if args.no_status else repo_root / args.status,
+        None if args.status_page is None else repo_root / args.status_page,
+        repo_root / STYLESHEET,
+        max(1, args.window),
+        args.interval,
+        args.status_every,
+    )
+    seen = _scan(roots)
+    telemetry.flush()
+    last_render: Optional[Tuple[float, float]] = None
 
     print("Watching docs for changes (Ctrl+C to stop)...")
     try:
-        while True:
+        count = 0
+        while args.cycles is None or count < args.cycles:
+            count += 1
             time.sleep(args.interval)
-            latest = max(_latest_mtime(support_root), _latest_mtime(projects_root))
-            if latest > last_seen:
+            started = time.time()
+            scan_start = time.perf_counter()
+            current = _scan(roots)
+            scan_ms = (time.perf_counter() - scan_start) * 1000
+            changed = [path for path, mtime in current.items() if seen.get(path) != mtime]
+            removed = [path for path in seen if path not in current]
+            cycle: Dict[str, Any] = {
+                "time": round(started, 3),
+                "scan_ms": round(scan_ms, 1),
+                "files": len(current),
+                "changed": len(changed) + len(removed),
+                "render_ms": None,
+                "render_exit": None,
+                "lag_ms": None,
+                "backlog": None,
+            }
+            if changed or removed:
                 print("Docs changed. Rendering AI_first/ui/docs...")
+                # Saves that landed while the previous render was running had to wait for this cycle.
+                if last_render is not None:
+                    cycle["backlog"] = sum(1 for path in changed if last_render[0] <= current[path] <= last_render[1])
+                render_start = time.time()
                 code = _render_once(repo_root)
+                render_end = time.time()
                 if code != 0:
                     print(f"Render failed with exit code {code}.")
-                last_seen = latest
+                oldest = min([current[path] for path in changed] or [started])
+                cycle["render_ms"] = round((render_end - render_start) * 1000, 1)
+                cycle["render_exit"] = code
+                cycle["lag_ms"] = round(max(0.0, render_end - oldest) * 1000, 1)
+                last_render = (render_start, render_end)
+            seen = current
+            telemetry.record(cycle)
     except KeyboardInterrupt:
         print("Stopped.")
+    finally:
+        telemetry.flush()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 (() => {
   const cfg = window.BUGMGMT_CONFIG || {};
   const JSON_PATH = cfg.jsonPath || "";
-  const FALLBACK = Array.isArray(window.BUGMGMT_FALLBACK) ? window.BUGMGMT_FALLBACK : [];
+  const FALLBACK = window.BUGMGMT_FALLBACK || [];
+  const BODIES_PATH = cfg.bodiesPath || "";
 
   const els = {
     project: document.getElementById("project"),
@@ -22,8 +23,63 @@
 
   const statusOrder = ["open", "in_progress", "closed"];
   const severityOrder = ["critical", "major", "minor", "nit"];
+  // The table is virtualized: only rows near the viewport are in the DOM. Rows wrap to different
+  // heights, so each rendered row is measured and spacers come from prefix sums of those heights.
+  const OVERSCAN = 8;
+  const DEFAULT_ROW_HEIGHT = 64;
+  const SEARCH_DEBOUNCE_MS = 150;
   let issues = [];
+  let issueById = new Map();
+  const FACETS = ["project", "phase", "stage", "status", "severity"];
+  // Lower-cased FACETS values per issue, computed once at load.
+  let facetKeys = [];
+  // Facet name -> [[value, count], ...] in option order.
+  let facetOptions = {};
+  let filtered = [];
   let selectedId = "";
+  // Measured height per issue; rows not yet rendered count as the mean of those measured.
+  let rowHeights = new WeakMap();
+  let measuredSum = 0;
+  let measuredCount = 0;
+  // offsets[k] is the top of filtered[k] within the table body; offsets[filtered.length] is its height.
+  let offsets = new Float64Array(1);
+  let offsetsStale = true;
+  let range = [-1, -1];
+  let frame = 0;
+  let renderTimer = 0;
+  // Lower-cased search text per issue, built on first use and dropped when the issue's body loads.
+  const searchText = new WeakMap();
+  // Split stores export header rows only; `body` names the shard script holding the rest.
+  const bodyShards = new Map();
+
+  window.BUGMGMT_BODIES_LOADED = (shard, bodies) => {
+    const data = bodies || {};
+    issues.forEach(i => {
+      if (i.body !== shard) return;
+      Object.assign(i, data[norm(i.id)] || {});
+      delete i.body;
+      searchText.delete(i);
+    });
+    const pending = bodyShards.get(shard);
+    if (pending) pending.resolve();
+  };
+
+  function loadBody(issue) {
+    const shard = issue.body;
+    if (!bodyShards.has(shard)) {
+      let resolve;
+      const done = new Promise((res) => { resolve = res; });
+      bodyShards.set(shard, { done, resolve });
+      const script = document.createElement("script");
+      script.src = `${BODIES_PATH}/${shard}.js`;
+      script.onerror = () => {
+        issues.forEach(i => { if (i.body === shard) delete i.body; });
+        resolve();
+      };
+      document.head.appendChild(script);
+    }
+    return bodyShards.get(shard).done;
+  }
 
   const norm = (v) => (v === null || v === undefined ? "" : String(v).trim());
   const normLower = (v) => norm(v).toLowerCase();
@@ -53,18 +109,9 @@
     });
   }
 
-  function uniqValues(key) {
-    const vals = new Set();
-    issues.forEach(i => {
-      const v = norm(i[key]);
-      if (v) vals.add(v);
-    });
-    return Array.from(vals).sort();
-  }
-
-  function setOptions(select, values) {
+  function setOptions(select, options) {
     if (!select) return;
-    const opts = ['<option value="">All</option>'].concat(values.map(v => `<option value="${v}">${v}</option>`));
+    const opts = ['<option value="">All</option>'].concat((options || []).map(([v, count]) => `<option value="${v}">${v} (${count})</option>`));
     select.innerHTML = opts.join("\n");
     select.value = "";
   }
@@ -88,39 +135,131 @@
     return "";
   }
 
+  function textOf(issue) {
+    let text = searchText.get(issue);
+    if (text === undefined) {
+      text = JSON.stringify(issue).toLowerCase();
+      searchText.set(issue, text);
+    }
+    return text;
+  }
+
+  // One pass over all issues: the matching rows, their status counts, and the selected issue if it matches.
   function filterIssues() {
-    const search = normLower(els.search && els.search.value);
-    return issues.filter(i => {
-      if (els.project && els.project.value && normLower(i.project) !== normLower(els.project.value)) return false;
-      if (els.phase && els.phase.value && normLower(i.phase) !== normLower(els.phase.value)) return false;
-      if (els.stage && els.stage.value && normLower(i.stage) !== normLower(els.stage.value)) return false;
-      if (els.status && els.status.value && normLower(i.status) !== normLower(els.status.value)) return false;
-      if (els.severity && els.severity.value && normLower(i.severity) !== normLower(els.severity.value)) return false;
-      if (search) {
-        const blob = JSON.stringify(i).toLowerCase();
-        if (!blob.includes(search)) return false;
-      }
-      return true;
-    });
+    const want = (el) => normLower(el && el.value);
+    const project = want(els.project);
+    const phase = want(els.phase);
+    const stage = want(els.stage);
+    const status = want(els.status);
+    const severity = want(els.severity);
+    const search = want(els.search);
+    const list = [];
+    const counts = { open: 0, in_progress: 0, closed: 0 };
+    let selected = null;
+    const selectedIssue = selectedId ? issueById.get(selectedId) : null;
+    for (let idx = 0; idx < issues.length; idx += 1) {
+      const i = issues[idx];
+      const keys = facetKeys[idx];
+      if (project && keys[0] !== project) continue;
+      if (phase && keys[1] !== phase) continue;
+      if (stage && keys[2] !== stage) continue;
+      if (status && keys[3] !== status) continue;
+      if (severity && keys[4] !== severity) continue;
+      if (search && !textOf(i).includes(search)) continue;
+      list.push(i);
+      if (Object.prototype.hasOwnProperty.call(counts, keys[3])) counts[keys[3]] += 1;
+      if (i === selectedIssue) selected = i;
+    }
+    return { list, counts, selected };
   }
 
-  function renderSummary(list) {
+  function renderSummary(list, counts) {
     if (!els.total || !els.summary) return;
-    const total = issues.length;
-    const open = list.filter(i => normLower(i.status) === "open").length;
-    const inProgress = list.filter(i => normLower(i.status) === "in_progress").length;
-    const closed = list.filter(i => normLower(i.status) === "closed").length;
-    els.total.textContent = `${list.length} shown / ${total} total`;
+    els.total.textContent = `${list.length} shown / ${issues.length} total`;
     els.summary.innerHTML = `
-      <div class="summary-card"><div class="muted small">Open</div><div class="h6">${open}</div></div>
-      <div class="summary-card"><div class="muted small">In Progress</div><div class="h6">${inProgress}</div></div>
-      <div class="summary-card"><div class="muted small">Closed</div><div class="h6">${closed}</div></div>
+      <div class="summary-card"><div class="muted small">Open</div><div class="h6">${counts.open}</div></div>
+      <div class="summary-card"><div class="muted small">In Progress</div><div class="h6">${counts.in_progress}</div></div>
+      <div class="summary-card"><div class="muted small">Closed</div><div class="h6">${counts.closed}</div></div>
     `;
   }
 
-  function renderTable(list) {
+  const spacer = (height) => (height > 0
+    ? `<tr class="virtual-spacer" aria-hidden="true"><td colspan="8" style="height:${height}px;padding:0;border:0"></td></tr>`
+    : "");
+
+  function rebuildOffsets() {
+    const estimate = measuredCount ? measuredSum / measuredCount : DEFAULT_ROW_HEIGHT;
+    offsets = new Float64Array(filtered.length + 1);
+    for (let idx = 0; idx < filtered.length; idx += 1) {
+      const height = rowHeights.get(filtered[idx]);
+      offsets[idx + 1] = offsets[idx] + (height === undefined ? estimate : height);
+    }
+    offsetsStale = false;
+  }
+
+  // Index of the filtered row under pixel `y` of the table body (binary search over offsets).
+  function rowAt(y) {
+    let lo = 0;
+    let hi = filtered.length;
+    while (lo < hi) {
+      const mid = (lo + hi + 1) >> 1;
+      if (offsets[mid] <= y) lo = mid;
+      else hi = mid - 1;
+    }
+    return lo;
+  }
+
+  // Record the heights of the rendered rows; true when any was new or changed.
+  function measureRows(first) {
+    let changed = false;
+    els.tbody.querySelectorAll("tr[data-id]").forEach((tr, k) => {
+      const issue = filtered[first + k];
+      const height = tr.getBoundingClientRect().height;
+      const known = rowHeights.get(issue);
+      if (!issue || !height || known === height) return;
+      measuredSum += height - (known === undefined ? 0 : known);
+      if (known === undefined) measuredCount += 1;
+      rowHeights.set(issue, height);
+      changed = true;
+    });
+    return changed;
+  }
+
+  function renderRows(force, passes = 0) {
     if (!els.tbody) return;
-    els.tbody.innerHTML = list.map(i => {
+    if (offsetsStale) rebuildOffsets();
+    const top = -els.tbody.getBoundingClientRect().top;
+    const first = Math.max(0, Math.min(rowAt(top), filtered.length - 1) - OVERSCAN);
+    const last = Math.min(filtered.length, rowAt(top + window.innerHeight) + 1 + OVERSCAN);
+    if (!force && first === range[0] && last === range[1]) return;
+    range = [first, last];
+    els.tbody.innerHTML = spacer(offsets[first])
+      + filtered.slice(first, last).map(rowHtml).join("")
+      + spacer(offsets[filtered.length] - offsets[last]);
+    // Newly measured rows move the offsets; re-render so the window covers the viewport again.
+    if (measureRows(first)) {
+      rebuildOffsets();
+      if (passes < 2) renderRows(true, passes + 1);
+    }
+  }
+
+  function resetHeights() {
+    rowHeights = new WeakMap();
+    measuredSum = 0;
+    measuredCount = 0;
+    offsetsStale = true;
+    range = [-1, -1];
+  }
+
+  function scheduleRows() {
+    if (frame) return;
+    frame = window.requestAnimationFrame(() => {
+      frame = 0;
+      renderRows(false);
+    });
+  }
+
+  function rowHtml(i) {
       const statusCls = `status-${normLower(i.status) || "open"}`;
       const sevCls = `sev-${normLower(i.severity) || "minor"}`;
       const summary = norm(i.summary || i.details || i.description);
@@ -144,7 +283,6 @@
           ${detailsHtml || `<div class="muted small">No details provided.</div>`}
         </td>
       </tr>`;
-    }).join("");
   }
 
   function renderDetail(issue) {
@@ -188,20 +326,108 @@
       detailField("Closed", closedAt),
       close ? detailField("Closure note", close) : "",
     ].filter(Boolean);
+    if (typeof issue.body === "string" && BODIES_PATH) {
+      bodyBits.push(`<div class="muted small">Loading details...</div>`);
+      const issueId = norm(issue.id);
+      loadBody(issue).then(() => {
+        const loaded = issueById.get(issueId);
+        if (selectedId === issueId && filtered.includes(loaded)) renderDetail(loaded);
+      });
+    }
     els.detailBody.innerHTML = bodyBits.length ? bodyBits.join("") : `<div class="muted small">No details provided.</div>`;
   }
 
   function selectIssueById(issueId) {
+    // The clicked row is on screen, so it is in the filtered list: no need to filter again.
     selectedId = issueId;
-    render();
+    renderRows(true);
+    renderDetail(issueById.get(issueId) || null);
   }
 
   function render() {
-    const list = filterIssues();
-    renderSummary(list);
-    renderTable(list);
-    const selected = selectedId ? list.find(i => norm(i.id) === selectedId) : null;
-    renderDetail(selected || null);
+    window.clearTimeout(renderTimer);
+    renderTimer = 0;
+    const result = filterIssues();
+    filtered = result.list;
+    offsetsStale = true;
+    renderSummary(result.list, result.counts);
+    renderRows(true);
+    renderDetail(result.selected);
+  }
+
+  function scheduleRender(delay) {
+    window.clearTimeout(renderTimer);
+    renderTimer = window.setTimeout(render, delay);
+  }
+
+  // Plain exports (`issues.py list --plain`, older exports): sort and tally facets here.
+  function indexPlain(list) {
+    const sorted = sortIssues(list);
+    const tallies = FACETS.map(() => new Map());
+    const keys = sorted.map(i => FACETS.map((name, f) => {
+      const v = norm(i[name]);
+      if (v) tallies[f].set(v, (tallies[f].get(v) || 0) + 1);
+      return v.toLowerCase();
+    }));
+    const options = {};
+    FACETS.forEach((name, f) => {
+      options[name] = Array.from(tallies[f].entries()).sort((a, b) => (a[0] < b[0] ? -1 : (a[0] > b[0] ? 1 : 0)));
+    });
+    return { list: sorted, keys, options };
+  }
+
+  // Facet dictionaries are sorted by trimmed value, so values that trim alike are adjacent.
+  function mergeOptions(values, counts) {
+    const out = [];
+    values.forEach((value, idx) => {
+      const v = norm(value);
+      if (!v) return;
+      const last = out[out.length - 1];
+      if (last && last[0] === v) {
+        last[1] += counts[idx];
+      } else {
+        out.push([v, counts[idx]]);
+      }
+    });
+    return out;
+  }
+
+  // Packed exports (`issues.py list`): presorted array rows whose facet fields index the header's dictionaries.
+  function unpack(payload) {
+    const header = payload.header || {};
+    const columns = header.columns || [];
+    const facets = header.facets || {};
+    const dicts = columns.map(name => (facets[name] ? facets[name].values : null));
+    const lowered = dicts.map(dict => (dict ? dict.map(normLower) : null));
+    const slots = FACETS.map(name => columns.indexOf(name));
+    const list = [];
+    const keys = [];
+    (payload.rows || []).forEach(row => {
+      const issue = {};
+      row.forEach((value, idx) => {
+        if (value === null || value === undefined) return;
+        issue[columns[idx]] = dicts[idx] ? dicts[idx][value] : value;
+      });
+      list.push(issue);
+      keys.push(slots.map(slot => {
+        const code = slot === -1 ? undefined : row[slot];
+        return code === null || code === undefined ? "" : lowered[slot][code];
+      }));
+    });
+    const options = {};
+    FACETS.forEach(name => {
+      options[name] = facets[name] ? mergeOptions(facets[name].values || [], facets[name].counts || []) : [];
+    });
+    if (header.presorted !== true) return { ...indexPlain(list), options };
+    return { list, keys, options };
+  }
+
+  function setIssues(payload) {
+    const data = Array.isArray(payload) ? indexPlain(payload) : unpack(payload);
+    issues = data.list;
+    facetKeys = data.keys;
+    facetOptions = data.options;
+    issueById = new Map(issues.map(i => [norm(i.id), i]));
   }
 
   async function loadIssues() {
@@ -210,29 +436,28 @@
         const res = await fetch(JSON_PATH, { cache: "no-store" });
         if (!res.ok) throw new Error(`fetch failed: ${res.status}`);
         const parsed = await res.json();
-        if (!Array.isArray(parsed)) throw new Error("Unexpected payload");
-        issues = sortIssues(parsed);
+        if (!Array.isArray(parsed) && !(parsed && Array.isArray(parsed.rows))) throw new Error("Unexpected payload");
+        setIssues(parsed);
         return;
       } catch (err) {
         console.warn("Using fallback issues due to fetch error", err);
       }
     }
-    issues = sortIssues(FALLBACK);
+    setIssues(FALLBACK);
   }
 
   async function init() {
     await loadIssues();
-    setOptions(els.project, uniqValues("project"));
-    setOptions(els.phase, uniqValues("phase"));
-    setOptions(els.stage, uniqValues("stage"));
-    setOptions(els.status, uniqValues("status"));
-    setOptions(els.severity, uniqValues("severity"));
+    FACETS.forEach(name => setOptions(els[name], facetOptions[name]));
     [els.project, els.phase, els.stage, els.status, els.severity].forEach(el => {
       if (!el) return;
-      el.addEventListener("change", render);
-      el.addEventListener("input", render);
+      // Selects fire both events; scheduling coalesces them into one pass.
+      el.addEventListener("change", () => scheduleRender(0));
+      el.addEventListener("input", () => scheduleRender(0));
     });
-    if (els.search) els.search.addEventListener("input", render);
+    if (els.search) els.search.addEventListener("input", () => scheduleRender(SEARCH_DEBOUNCE_MS));
+    window.addEventListener("scroll", scheduleRows, { passive: true });
+    window.addEventListener("resize", () => { resetHeights(); scheduleRows(); });
     if (els.reset) {
       els.reset.addEventListener("click", (evt) => {
         evt.preventDefault();
@@ -1,17 +1,61 @@
 (() => {
+  // Client-side twin of render_docs._iter_markdown. markdown_viewer.html first loads the fragment
+  // render_docs.py prerendered for the file (data/fragments/<source hash>.js) and only parses here
+  // on a cache miss. Keep both renderers in lockstep: `python3 AI_first/scripts/benchmarks.py
+  // markdown --check` runs them over AI_first/scripts/markdown_corpus.json.
+  const base = document.currentScript ? document.currentScript.src : window.location.href;
+  const FRAGMENT_ROOT = new URL("../data/fragments/", base).href;
+  const REPO_ROOT = new URL("../../../", base).href;
+
+  // Python's str.isspace / re `\s` set (JS `\s` adds U+FEFF and lacks U+001C-U+001F and U+0085).
+  const SPACE = "[\\t-\\r\\x1c-\\x20\\x85\\xa0\\u1680\\u2000-\\u200a\\u2028\\u2029\\u202f\\u205f\\u3000]";
+  const STRIP = new RegExp(`^${SPACE}+|${SPACE}+$`, "gu");
+  const HEADING = new RegExp(`^(#{1,3})${SPACE}+([\\s\\S]*)$`, "u");
+  const UL_ITEM = new RegExp(`^${SPACE}*[-*]${SPACE}+([\\s\\S]*)$`, "u");
+  const OL_ITEM = new RegExp(`^${SPACE}*\\p{Nd}+\\.${SPACE}+([\\s\\S]*)$`, "u");
+  const TABLE_SEPARATOR = new RegExp(
+    `^${SPACE}*(?:\\|${SPACE}*)?:?-+:?${SPACE}*(?:\\|${SPACE}*:?-+:?${SPACE}*)+(?:\\|${SPACE}*)?$`,
+    "u",
+  );
+
+  const strip = (text) => text.replace(STRIP, "");
+
+  // html.escape(text, quote=True)
   const escapeHtml = (text) => text
     .replace(/&/g, "&amp;")
     .replace(/</g, "&lt;")
     .replace(/>/g, "&gt;")
     .replace(/\"/g, "&quot;")
-    .replace(/'/g, "&#39;");
+    .replace(/'/g, "&#x27;");
 
-  const renderInline = (text) => {
-    const escaped = escapeHtml(text);
-    const withCode = escaped.replace(/`([^`]+)`/g, "<code>$1</code>");
-    return withCode.replace(/\[([^\]]+)\]\(([^)]+)\)/g, "<a href=\"$2\">$1</a>");
+  // Same left-to-right scan as render_docs._render_links.
+  const renderLinks = (text) => {
+    const pieces = [];
+    let pos = 0;
+    let start = text.indexOf("[");
+    while (start !== -1) {
+      const close = text.indexOf("]", start + 1);
+      if (close === -1) break;
+      const opens = text.startsWith("(", close + 1);
+      const end = opens ? text.indexOf(")", close + 2) : -1;
+      if (close > start + 1 && end > close + 2) {
+        pieces.push(text.slice(pos, start), `<a href="${text.slice(close + 2, end)}">${text.slice(start + 1, close)}</a>`);
+        pos = end + 1;
+        start = text.indexOf("[", pos);
+      } else if (end === -1 && opens) {
+        break;
+      } else {
+        start = text.indexOf("[", close + 1);
+      }
+    }
+    pieces.push(text.slice(pos));
+    return pieces.join("");
   };
 
+  const renderInline = (text) => renderLinks(escapeHtml(text).replace(/`([^`]+)`/g, "<code>$1</code>"));
+
+  const splitTableRow = (line) => strip(line).replace(/^\|+|\|+$/g, "").split("|").map(strip);
+
   const renderMarkdown = (md) => {
     const lines = md.replace(/\r\n/g, "\n").split("\n");
     const out = [];
@@ -25,9 +69,11 @@
       }
     };
 
-    for (const rawLine of lines) {
-      const line = rawLine.replace(/\t/g, "  ");
-      if (line.trim().startsWith("```")) {
+    let idx = 0;
+    while (idx < lines.length) {
+      const line = lines[idx];
+      const following = idx + 1 < lines.length ? lines[idx + 1] : null;
+      if (strip(line).startsWith("```")) {
         if (inCode) {
           out.push("</code></pre>");
           inCode = false;
@@ -36,23 +82,42 @@
           out.push("<pre><code>");
           inCode = true;
         }
+        idx += 1;
         continue;
       }
 
       if (inCode) {
         out.push(escapeHtml(line));
+        idx += 1;
         continue;
       }
 
-      const heading = line.match(/^(#{1,3})\s+(.*)$/);
+      const heading = line.match(HEADING);
       if (heading) {
         closeList();
         const level = heading[1].length;
         out.push(`<h${level}>${renderInline(heading[2])}</h${level}>`);
+        idx += 1;
         continue;
       }
 
-      const ulItem = line.match(/^\s*[-*]\s+(.*)$/);
+      if (following !== null && line.includes("|") && TABLE_SEPARATOR.test(following)) {
+        closeList();
+        out.push("<table><thead><tr>");
+        splitTableRow(line).forEach((cell) => out.push(`<th>${renderInline(cell)}</th>`));
+        out.push("</tr></thead><tbody>");
+        idx += 2;
+        while (idx < lines.length && lines[idx].includes("|")) {
+          out.push("<tr>");
+          splitTableRow(lines[idx]).forEach((cell) => out.push(`<td>${renderInline(cell)}</td>`));
+          out.push("</tr>");
+          idx += 1;
+        }
+        out.push("</tbody></table>");
+        continue;
+      }
+
+      const ulItem = line.match(UL_ITEM);
       if (ulItem) {
         if (listType !== "ul") {
           closeList();
@@ -60,10 +125,11 @@
           listType = "ul";
         }
         out.push(`<li>${renderInline(ulItem[1])}</li>`);
+        idx += 1;
         continue;
       }
 
-      const olItem = line.match(/^\s*\d+\.\s+(.*)$/);
+      const olItem = line.match(OL_ITEM);
       if (olItem) {
         if (listType !== "ol") {
           closeList();
@@ -71,16 +137,19 @@
           listType = "ol";
         }
         out.push(`<li>${renderInline(olItem[1])}</li>`);
+        idx += 1;
         continue;
       }
 
-      if (!line.trim()) {
+      if (!strip(line)) {
         closeList();
+        idx += 1;
         continue;
       }
 
       closeList();
-      out.push(`<p>${renderInline(line)}</p>`);
+      out.push(`<p>${renderInline(strip(line))}</p>`);
+      idx += 1;
     }
 
     closeList();
@@ -88,22 +157,90 @@
     return out.join("\n");
   };
 
-  const load = (el, path) => {
+  const pending = new Map();
+  let manifest = null;
+
+  window.AIFIRST_MD_FRAGMENT = (digest, body) => {
+    const done = pending.get(digest);
+    if (done) {
+      pending.delete(digest);
+      done(body);
+    }
+  };
+
+  window.AIFIRST_MD_MANIFEST = (sources) => {
+    manifest = sources || {};
+  };
+
+  const loadScript = (src) => new Promise((resolve) => {
+    const tag = document.createElement("script");
+    tag.src = src;
+    tag.onload = () => resolve(true);
+    tag.onerror = () => resolve(false);
+    document.head.appendChild(tag);
+  });
+
+  const loadFragment = (digest) => new Promise((resolve) => {
+    if (!digest) {
+      resolve(null);
+      return;
+    }
+    pending.set(digest, resolve);
+    loadScript(`${FRAGMENT_ROOT}${digest}.js`).then(() => {
+      if (pending.get(digest) === resolve) {
+        pending.delete(digest);
+        resolve(null);
+      }
+    });
+  });
+
+  // Same key as render_docs._source_digest: the first 16 hex digits of the SHA-1 of the raw bytes.
+  const sourceDigest = async (bytes) => {
+    try {
+      const hash = await window.crypto.subtle.digest("SHA-1", bytes);
+      return Array.from(new Uint8Array(hash).slice(0, 8), (b) => b.toString(16).padStart(2, "0")).join("");
+    } catch (err) {
+      return null;
+    }
+  };
+
+  const manifestDigest = async (resolved) => {
+    const url = new URL(resolved);
+    url.search = "";
+    url.hash = "";
+    if (!url.href.startsWith(REPO_ROOT)) return null;
+    if (manifest === null) {
+      await loadScript(`${FRAGMENT_ROOT}manifest.js`);
+      manifest = manifest || {};
+    }
+    return manifest[decodeURIComponent(url.href.slice(REPO_ROOT.length))] || null;
+  };
+
+  const load = async (el, path) => {
     const resolved = new URL(path, window.location.href).href;
-    fetch(resolved, { cache: "no-store" })
-      .then((res) => {
-        if (!res.ok) throw new Error("fetch failed");
-        return res.text();
-      })
-      .then((text) => {
-        el.innerHTML = renderMarkdown(text);
-      })
-      .catch(() => {
-        const hint = window.location.protocol === "file:"
-          ? "Local file fetch blocked by the browser. Open this UI via a local server (example: python3 -m http.server from the repo root)."
-          : "Unable to load markdown.";
-        el.innerHTML = `<p class=\"muted small\">${hint}</p>`;
-      });
+    let bytes = null;
+    try {
+      const res = await fetch(resolved, { cache: "no-store" });
+      if (res.ok) bytes = await res.arrayBuffer();
+    } catch (err) {
+      bytes = null;
+    }
+    // Hash what was read; when the browser cannot read the file (file://), trust the manifest.
+    const digest = bytes ? await sourceDigest(bytes) : await manifestDigest(resolved);
+    const body = await loadFragment(digest);
+    if (body !== null) {
+      el.innerHTML = body;
+      return "fragment";
+    }
+    if (bytes) {
+      el.innerHTML = renderMarkdown(new TextDecoder("utf-8", { ignoreBOM: true }).decode(bytes));
+      return "parsed";
+    }
+    const hint = window.location.protocol === "file:"
+      ? "No prerendered copy of this file. Run python3 AI_first/scripts/render_docs.py, or open this UI via a local server (example: python3 -m http.server from the repo root)."
+      : "Unable to load markdown.";
+    el.innerHTML = `<p class=\"muted small\">${hint}</p>`;
+    return "missing";
   };
 
   document.addEventListener("DOMContentLoaded", () => {
@@ -0,0 +1,54 @@
+(() => {
+  // Lazy phase details used by `render_pm.py --lazy`: a phase's templates load when its row is first opened.
+  const pending = new Map();
+
+  window.AIFIRST_PHASE_LOADED = (key, bodies) => {
+    const data = bodies || {};
+    ["def", "plan", "action"].forEach((part) => {
+      if (document.getElementById(`${key}-${part}`)) return;
+      const tpl = document.createElement("template");
+      tpl.id = `${key}-${part}`;
+      tpl.innerHTML = data[part] || "";
+      document.body.appendChild(tpl);
+    });
+    const done = pending.get(key);
+    if (done) {
+      pending.delete(key);
+      done();
+    }
+  };
+
+  const load = (row) => new Promise((resolve) => {
+    const key = row.dataset.phaseKey;
+    pending.set(key, resolve);
+    const script = document.createElement("script");
+    script.src = row.dataset.phaseSrc;
+    script.onerror = () => {
+      pending.delete(key);
+      resolve();
+    };
+    document.head.appendChild(script);
+  });
+
+  // Runs in the capture phase so the page's own row handlers only fire once the templates exist.
+  const intercept = (evt) => {
+    const row = evt.target.closest ? evt.target.closest("tr[data-phase-src]") : null;
+    if (!row || evt.target.closest("a") || row.dataset.phaseLoaded) return;
+    if (evt.type === "keydown" && evt.key !== "Enter" && evt.key !== " ") return;
+    evt.stopPropagation();
+    if (row.dataset.phaseLoading) return;
+    row.dataset.phaseLoading = "1";
+    const key = evt.key;
+    load(row).then(() => {
+      row.dataset.phaseLoaded = "1";
+      if (evt.type === "click") {
+        row.click();
+      } else {
+        row.dispatchEvent(new KeyboardEvent("keydown", { key, bubbles: true }));
+      }
+    });
+  };
+
+  document.addEventListener("click", intercept, true);
+  document.addEventListener("keydown", intercept, true);
+})();
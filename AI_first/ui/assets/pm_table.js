@@ -0,0 +1,107 @@
+(() => {
+  // Virtualized PM project table used by `render_pm.py --lazy`: only rows near the viewport are in the DOM.
+  const OVERSCAN = 8;
+  const DEFAULT_ROW_HEIGHT = 72;
+  let columns = {};
+  let rows = [];
+  let tbody = null;
+  let rowHeight = 0;
+  let range = [-1, -1];
+  let frame = 0;
+
+  const escapeHtml = (text) => String(text === null || text === undefined ? "" : text)
+    .replace(/&/g, "&amp;")
+    .replace(/</g, "&lt;")
+    .replace(/>/g, "&gt;")
+    .replace(/\"/g, "&quot;")
+    .replace(/'/g, "&#39;");
+
+  const field = (row, name) => {
+    const idx = columns[name];
+    return idx === undefined ? "" : row[idx];
+  };
+
+  function rowHtml(row) {
+    const slug = escapeHtml(field(row, "slug"));
+    return `<tr data-link="project_${slug}.html" tabindex="0" role="button" aria-label="Open ${slug} project details">
+      <td>
+        <a class="fw" href="project_${slug}.html">${slug}</a>
+        <div class="muted small">${field(row, "description_html")}</div>
+      </td>
+      <td>${escapeHtml(field(row, "phase"))}</td>
+      <td><span class="badge ${escapeHtml(field(row, "status_class"))}">${escapeHtml(field(row, "status"))}</span></td>
+      <td><span class="badge ${escapeHtml(field(row, "health_class"))}">${escapeHtml(field(row, "health"))}</span></td>
+      <td>${escapeHtml(field(row, "owner"))}</td>
+      <td>${escapeHtml(field(row, "last_updated"))}</td>
+      <td class="muted small">
+        <div>${field(row, "action1_html")}</div>
+        <div>${field(row, "action2_html")}</div>
+      </td>
+    </tr>`;
+  }
+
+  const spacer = (height) => (height > 0
+    ? `<tr class="virtual-spacer" aria-hidden="true"><td colspan="7" style="height:${height}px;padding:0;border:0"></td></tr>`
+    : "");
+
+  function render(force) {
+    if (!tbody) return;
+    const height = rowHeight || DEFAULT_ROW_HEIGHT;
+    const top = tbody.getBoundingClientRect().top;
+    const first = Math.max(0, Math.floor(-top / height) - OVERSCAN);
+    const last = Math.min(rows.length, first + Math.ceil(window.innerHeight / height) + OVERSCAN * 2);
+    if (!force && first === range[0] && last === range[1]) return;
+    range = [first, last];
+    tbody.innerHTML = spacer(first * height)
+      + rows.slice(first, last).map(rowHtml).join("")
+      + spacer((rows.length - last) * height);
+    if (!rowHeight) {
+      const rendered = tbody.querySelectorAll("tr[data-link]");
+      if (rendered.length) {
+        let sum = 0;
+        rendered.forEach((tr) => { sum += tr.getBoundingClientRect().height; });
+        rowHeight = sum / rendered.length || DEFAULT_ROW_HEIGHT;
+        render(true);
+      }
+    }
+  }
+
+  function schedule() {
+    if (frame) return;
+    frame = window.requestAnimationFrame(() => {
+      frame = 0;
+      render(false);
+    });
+  }
+
+  function open(evt) {
+    if (evt.target.closest("a")) return;
+    if (evt.type === "keydown" && evt.key !== "Enter" && evt.key !== " ") return;
+    const row = evt.target.closest("tr[data-link]");
+    const target = row && row.getAttribute("data-link");
+    if (target) window.location.href = target;
+  }
+
+  function init() {
+    const placeholder = document.querySelector("tr[data-virtual-rows]");
+    if (!placeholder) return;
+    tbody = placeholder.parentNode;
+    tbody.addEventListener("click", open);
+    tbody.addEventListener("keydown", open);
+    window.addEventListener("scroll", schedule, { passive: true });
+    window.addEventListener("resize", () => { rowHeight = 0; range = [-1, -1]; schedule(); });
+    render(true);
+  }
+
+  window.AIFIRST_PM_LOADED = (payload) => {
+    const data = payload || {};
+    columns = {};
+    (data.columns || []).forEach((name, idx) => { columns[name] = idx; });
+    rows = Array.isArray(data.rows) ? data.rows : [];
+    if (document.readyState === "loading") {
+      document.addEventListener("DOMContentLoaded", init);
+    } else {
+      init();
+    }
+  };
+})();
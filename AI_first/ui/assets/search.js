@@ -0,0 +1,199 @@
+(() => {
+  // Docs search for search.html: the index is written by render_docs.py (search_index.py) as script
+  // shards under data/search/, and only the shards for the query's terms are loaded.
+  const INDEX_ROOT = "data/search";
+  const SHARD_PREFIX = 2;
+  const MAX_RESULTS = 50;
+  const SEARCH_DEBOUNCE_MS = 120;
+  const TOKEN = /[\p{L}\p{N}]+/gu;
+
+  let docs = new Map();
+  const shards = new Map();
+  const pending = new Map();
+  let timer = 0;
+  let generation = 0;
+  const els = {};
+
+  const escapeHtml = (text) => String(text === null || text === undefined ? "" : text)
+    .replace(/&/g, "&amp;")
+    .replace(/</g, "&lt;")
+    .replace(/>/g, "&gt;")
+    .replace(/\"/g, "&quot;")
+    .replace(/'/g, "&#39;");
+
+  const tokens = (text) => text.toLowerCase().match(TOKEN) || [];
+
+  // Mirrors search_index.shard_key.
+  const shardKey = (term) => Array.from(term).slice(0, SHARD_PREFIX)
+    .map((ch) => (ch.codePointAt(0) < 128 ? ch : `_${ch.codePointAt(0).toString(16)}_`))
+    .join("");
+
+  window.AIFIRST_SEARCH_DOCS = (payload) => {
+    docs = new Map(((payload && payload.docs) || []).map((doc) => [doc.id, doc]));
+  };
+
+  window.AIFIRST_SEARCH_SHARD = (key, postings) => {
+    shards.set(key, postings || {});
+    const done = pending.get(key);
+    if (done) {
+      pending.delete(key);
+      done();
+    }
+  };
+
+  function loadShard(key) {
+    if (shards.has(key)) return Promise.resolve();
+    return new Promise((resolve) => {
+      if (pending.has(key)) {
+        const previous = pending.get(key);
+        pending.set(key, () => { previous(); resolve(); });
+        return;
+      }
+      pending.set(key, resolve);
+      const script = document.createElement("script");
+      script.src = `${INDEX_ROOT}/shards/${encodeURIComponent(key)}.js`;
+      script.onerror = () => {
+        // No shard means no indexed term starts with this prefix.
+        window.AIFIRST_SEARCH_SHARD(key, {});
+      };
+      document.head.appendChild(script);
+    });
+  }
+
+  // Query groups: each quoted phrase is one group, every other word is a group of one term.
+  // `prefix` marks the word still being typed, which also matches longer terms.
+  function parseQuery(text) {
+    const groups = [];
+    const pattern = /"([^"]*)"?|([^\s"]+)/g;
+    let match;
+    while ((match = pattern.exec(text)) !== null) {
+      const terms = tokens(match[1] !== undefined ? match[1] : match[2]);
+      if (!terms.length) continue;
+      if (match[1] !== undefined && terms.length > 1) {
+        groups.push({ terms, phrase: true, prefix: false });
+      } else {
+        terms.forEach((term) => groups.push({ terms: [term], phrase: false, prefix: false }));
+      }
+    }
+    const last = groups[groups.length - 1];
+    if (last && !last.phrase && /[\p{L}\p{N}]$/u.test(text)) {
+      last.prefix = Array.from(last.terms[0]).length >= SHARD_PREFIX;
+    }
+    return groups;
+  }
+
+  // Doc id -> { tf, positions } for one term; prefix terms merge every matching term in the shard.
+  function postingsFor(term, prefix) {
+    const shard = shards.get(shardKey(term)) || {};
+    const names = prefix ? Object.keys(shard).filter((name) => name.startsWith(term)) : [term];
+    const out = new Map();
+    names.forEach((name) => {
+      (shard[name] || []).forEach((posting) => {
+        const [id, tf] = posting;
+        const entry = out.get(id) || { tf: 0, positions: [] };
+        entry.tf += tf;
+        let pos = 0;
+        for (let k = 2; k < posting.length; k += 1) {
+          pos += posting[k];
+          entry.positions.push(pos);
+        }
+        out.set(id, entry);
+      });
+    });
+    return out;
+  }
+
+  // Positions are capped per term, so phrases are matched within the stored positions only.
+  function phraseHits(lists, id) {
+    const rest = lists.slice(1).map((list) => new Set(list.get(id).positions));
+    return lists[0].get(id).positions.filter((start) => rest.every((set, k) => set.has(start + k + 1))).length;
+  }
+
+  function run(text) {
+    const groups = parseQuery(text);
+    if (!groups.length) return null;
+    const scores = new Map();
+    let candidates = null;
+    groups.forEach((group) => {
+      const lists = group.terms.map((term) => postingsFor(term, group.prefix));
+      const hits = new Map();
+      lists[0].forEach((entry, id) => {
+        if (candidates && !candidates.has(id)) return;
+        if (!lists.every((list) => list.has(id))) return;
+        const tf = group.phrase ? phraseHits(lists, id) : entry.tf;
+        if (tf > 0) hits.set(id, tf);
+      });
+      const idf = Math.log(1 + docs.size / (hits.size || 1));
+      hits.forEach((tf, id) => {
+        const doc = docs.get(id);
+        const title = doc ? doc.title.toLowerCase() : "";
+        const boost = group.terms.every((term) => title.includes(term)) ? 2 : 1;
+        scores.set(id, (scores.get(id) || 0) + (1 + Math.log(tf)) * idf * boost);
+      });
+      candidates = new Set(hits.keys());
+    });
+    return Array.from(candidates || [])
+      .filter((id) => docs.has(id))
+      .map((id) => ({ doc: docs.get(id), score: scores.get(id) }))
+      .sort((a, b) => b.score - a.score || a.doc.href.localeCompare(b.doc.href));
+  }
+
+  function renderResults(text, results) {
+    if (!results) {
+      els.count.textContent = `${docs.size} docs indexed`;
+      els.results.innerHTML = '<p class="muted small">Type to search docs, project plans, and stage action files. Quote words to match a phrase.</p>';
+      return;
+    }
+    els.count.textContent = `${results.length} match${results.length === 1 ? "" : "es"}`;
+    if (!results.length) {
+      els.results.innerHTML = `<p class="muted small">No documents match <code>${escapeHtml(text)}</code>.</p>`;
+      return;
+    }
+    els.results.innerHTML = results.slice(0, MAX_RESULTS).map(({ doc }) => `
+      <div class="detail-item">
+        <a class="fw" href="${escapeHtml(doc.href)}">${escapeHtml(doc.title)}</a>
+        <div class="muted small">${escapeHtml(doc.source)}</div>
+        ${doc.summary ? `<div class="small">${escapeHtml(doc.summary)}</div>` : ""}
+      </div>`).join("")
+      + (results.length > MAX_RESULTS ? `<p class="muted small">Showing the first ${MAX_RESULTS}; refine the query to narrow it down.</p>` : "");
+  }
+
+  async function search() {
+    const text = els.query.value;
+    const current = ++generation;
+    const keys = new Set(parseQuery(text).flatMap((group) => group.terms.map(shardKey)));
+    await Promise.all(Array.from(keys).map(loadShard));
+    if (current !== generation) return;
+    renderResults(text, run(text));
+    const url = new URL(window.location.href);
+    if (text.trim()) {
+      url.searchParams.set("q", text);
+    } else {
+      url.searchParams.delete("q");
+    }
+    window.history.replaceState(null, "", url.toString());
+  }
+
+  function init() {
+    els.query = document.getElementById("query");
+    els.count = document.getElementById("matchCount");
+    els.results = document.getElementById("results");
+    if (!els.query || !els.results) return;
+    if (!docs.size) {
+      els.results.innerHTML = '<p class="muted small">No search index found. Run <code>python3 AI_first/scripts/render_docs.py</code> to build it.</p>';
+      return;
+    }
+    els.query.addEventListener("input", () => {
+      window.clearTimeout(timer);
+      timer = window.setTimeout(search, SEARCH_DEBOUNCE_MS);
+    });
+    els.query.value = new URLSearchParams(window.location.search).get("q") || "";
+    search();
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", init);
+  } else {
+    init();
+  }
+})();
@@ -0,0 +1,7 @@
+"""Make the AI_first scripts importable the way they import each other (as top-level modules)."""
+import sys
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "AI_first" / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
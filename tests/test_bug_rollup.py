@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+
+import render_pm
+from render_common import bug_rollup, open_bug_counts, project_open_bugs
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def _issue(issue_id, project="bugmgmt", phase="01", stage="foundation", status="open", severity="major"):
+    return {
+        "id": issue_id,
+        "project": project,
+        "phase": phase,
+        "stage": stage,
+        "status": status,
+        "severity": severity,
+    }
+
+
+def _store(tmp_path, *lines):
+    path = tmp_path / "issues.jsonl"
+    text = "".join((line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_rollup_counts_the_latest_record_of_each_issue(tmp_path):
+    store = _store(
+        tmp_path,
+        _issue("BMG-1", severity="critical"),
+        _issue("BMG-2", phase="1", status="Closed"),
+        _issue("BMG-3", phase="2", stage="", severity="Minor"),
+        _issue("BMG-1", status="in_progress", severity="critical"),
+        _issue("PMG-1", project="project_management"),
+        _issue("NOP-1", project=""),
+        "{not json",
+        "",
+    )
+    assert bug_rollup(store) == {
+        "bugmgmt": {
+            "01": {"foundation": {"in_progress": {"critical": 1}, "closed": {"major": 1}}},
+            "02": {"": {"open": {"minor": 1}}},
+        },
+        "project_management": {"01": {"foundation": {"open": {"major": 1}}}},
+    }
+
+
+def test_missing_store_has_no_bugs(tmp_path):
+    assert bug_rollup(tmp_path / "missing.jsonl") == {}
+
+
+def test_open_counts_and_phase_summary(tmp_path):
+    store = _store(
+        tmp_path,
+        _issue("BMG-1", severity="critical"),
+        _issue("BMG-2", stage="tooling"),
+        _issue("BMG-3", status="closed", severity="nit"),
+        _issue("BMG-4", phase="02", status="in_progress", severity="minor"),
+        _issue("PMG-1", project="project_management", status="closed"),
+    )
+    rollup = bug_rollup(store)
+    assert project_open_bugs(rollup["bugmgmt"]) == 2
+    assert open_bug_counts(rollup) == {"bugmgmt": 2, "project_management": 0}
+    counts = render_pm._phase_bug_counts(rollup["bugmgmt"]["01"])
+    assert counts == {"open": {"critical": 1, "major": 1}, "closed": {"nit": 1}}
+    assert render_pm._bug_summary(counts) == "Bugs: 2 open (1 critical, 1 major) · 1 closed"
+
+
+def test_phase_rows_carry_their_bug_counts(tmp_path):
+    project = render_pm.build_one_project(REPO, REPO / "AI_first" / "docs" / "projectplan.md", "bugmgmt")
+    phase = project.phases[0]
+    store = _store(
+        tmp_path,
+        _issue("BMG-1", phase=phase.number),
+        _issue("BMG-2", phase=phase.number, status="closed"),
+    )
+    rows = render_pm._render_phase_rows(project, REPO, bugs=bug_rollup(store)["bugmgmt"])
+    assert rows.count("data-bugs-open=") == 1
+    assert 'data-bugs-open="1" data-bugs-total="2"' in rows
+    assert "Bugs: 1 open (1 major) · 1 closed" in rows
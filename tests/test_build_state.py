@@ -0,0 +1,86 @@
+import subprocess
+
+import pytest
+
+import build_state
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / ".gitignore").write_text("AI_first/.cache/\n", encoding="utf-8")
+    (tmp_path / "a.md").write_text("a\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("b\n", encoding="utf-8")
+    _git(tmp_path, "add", ".")
+    _commit(tmp_path, "base")
+    return tmp_path
+
+
+def _commit(repo, message):
+    _git(repo, "-c", "user.email=test@example.com", "-c", "user.name=test", "commit", "-q", "-m", message)
+
+
+def test_no_stamp_means_full_build(repo):
+    assert build_state.changed_since_build(repo, "docs") is None
+
+
+def test_clean_tree_after_a_build_has_no_changes(repo):
+    build_state.record_build(repo, "docs")
+    assert build_state.changed_since_build(repo, "docs") == set()
+
+
+def test_committed_and_working_tree_changes_are_reported(repo):
+    build_state.record_build(repo, "docs")
+    (repo / "a.md").write_text("a2\n", encoding="utf-8")
+    _git(repo, "add", "a.md")
+    _commit(repo, "edit a")
+    (repo / "b.md").write_text("b2\n", encoding="utf-8")
+    (repo / "c.md").write_text("c\n", encoding="utf-8")
+    changed = build_state.changed_since_build(repo, "docs")
+    assert changed == {(repo / name).resolve() for name in ("a.md", "b.md", "c.md")}
+
+
+def test_renames_report_both_paths(repo):
+    build_state.record_build(repo, "docs")
+    _git(repo, "mv", "a.md", "renamed.md")
+    changed = build_state.changed_since_build(repo, "docs")
+    assert {(repo / "a.md").resolve(), (repo / "renamed.md").resolve()} <= changed
+
+
+def test_files_dirty_at_the_last_build_are_rebuilt_after_a_revert(repo):
+    (repo / "b.md").write_text("draft\n", encoding="utf-8")
+    build_state.record_build(repo, "docs")
+    (repo / "b.md").write_text("b\n", encoding="utf-8")
+    assert build_state.changed_since_build(repo, "docs") == {(repo / "b.md").resolve()}
+
+
+def test_stamps_are_per_build_name(repo):
+    build_state.record_build(repo, "docs")
+    assert build_state.changed_since_build(repo, "pm") is None
+
+
+def test_a_shared_helper_change_rebuilds_every_pm_output(repo):
+    import render_pm
+    from render_common import SHARED_MODULES, renderer_sources
+
+    sources = renderer_sources("render_pm.py")
+    assert [path.name for path in sources[1:]] == list(SHARED_MODULES)
+    for helper in sources:
+        assert render_pm._affected_slugs({helper}, repo, sources) is None
+
+
+def test_incremental_builds_are_not_forwarded_to_the_daemon(monkeypatch, repo):
+    import aifirst_daemon
+    import render_docs
+    import render_pm
+
+    calls = []
+    monkeypatch.setattr(aifirst_daemon, "forward", lambda *args: calls.append(args) or 0)
+    for module in (render_docs, render_pm):
+        argv = ["--incremental"]
+        assert module._forward_to_daemon(module.parse_args(argv), argv, repo) is None
+    assert calls == []
@@ -0,0 +1,94 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def _outputs(root):
+    ui = root / "AI_first" / "ui"
+    paths = [root / "issues.json", ui / "PM.html", *ui.glob("project_*.html"), *(ui / "docs").rglob("*.html")]
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in paths}
+
+
+def _checkout(root):
+    files = subprocess.run(
+        ["git", "-C", str(REPO), "ls-files", "-z", "AI_first"], check=True, capture_output=True, text=True
+    ).stdout
+    for rel in filter(None, files.split("\0")):
+        target = root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(REPO / rel, target)
+    # Both runs must write every doc page rather than find the committed ones.
+    shutil.rmtree(root / "AI_first" / "ui" / "docs")
+    return root
+
+
+def _run(root, env, script, *args):
+    return subprocess.run(
+        [sys.executable, f"AI_first/scripts/{script}", *args],
+        cwd=root,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+COMMANDS = [
+    ("issues.py", "list", "--format", "json", "--output", "issues.json"),
+    ("render_docs.py",),
+    ("render_pm.py",),
+]
+
+
+def test_forwarded_commands_match_local_runs(tmp_path):
+    # AF_UNIX paths are short, so the socket lives outside pytest's deep tmp_path.
+    sock_dir = tempfile.mkdtemp(prefix="aif")
+    env = dict(os.environ, AIFIRST_SOCKET=os.path.join(sock_dir, "d.sock"))
+    env.pop("AIFIRST_NO_DAEMON", None)
+    env.pop("AIFIRST_RENDER_CACHE", None)
+    local_root = _checkout(tmp_path / "local")
+    local_out = [_run(local_root, env, *command, "--no-daemon") for command in COMMANDS]
+    checkout = _checkout(tmp_path / "daemon")
+
+    server = subprocess.Popen(
+        [sys.executable, "AI_first/scripts/aifirst_daemon.py", "serve"],
+        cwd=checkout,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while not os.path.exists(env["AIFIRST_SOCKET"]):
+            assert time.monotonic() < deadline, "daemon did not start"
+            time.sleep(0.05)
+        daemon_out = [_run(checkout, env, *command) for command in COMMANDS]
+        status = _run(checkout, env, "aifirst_daemon.py", "status")
+    finally:
+        subprocess.run(
+            [sys.executable, "AI_first/scripts/aifirst_daemon.py", "stop"], cwd=checkout, env=env, capture_output=True
+        )
+        server.wait(timeout=10)
+        shutil.rmtree(sock_dir, ignore_errors=True)
+
+    assert '"requests": 3' in status
+    assert daemon_out == local_out
+    assert "AI_first/ui/docs/process.html" in _outputs(local_root)
+    assert _outputs(checkout) == _outputs(local_root)
+
+
+def test_only_renders_are_not_forwarded(monkeypatch):
+    import aifirst_daemon
+    import render_docs
+
+    calls = []
+    monkeypatch.setattr(aifirst_daemon, "forward", lambda *args: calls.append(args) or 0)
+    argv = ["--only", "AI_first/docs/process.md"]
+    assert render_docs._forward_to_daemon(render_docs.parse_args(argv), argv, REPO) is None
+    assert calls == []
@@ -0,0 +1,75 @@
+import json
+
+import issues
+
+ROWS = [
+    {
+        "id": "BMG-2025-12-001",
+        "summary": "Details column does not display the correct details in the issues table",
+        "description": "Opening the BugMgmt UI shows an empty details column for every issue instead of the summary text",
+    },
+    {
+        "id": "BMG-2025-12-002",
+        "summary": "Details column does not display the correct details in the issues table view",
+        "description": "Opening the BugMgmt UI shows an empty details column for each issue instead of the summary text",
+    },
+    {
+        "id": "BMG-2025-12-003",
+        "summary": "Burndown chart axis labels overlap on narrow screens",
+        "description": "The SVG x axis prints every day label so they collide below 600 pixels wide",
+    },
+    {
+        "id": "BMG-2025-12-004",
+        "summary": "Project plan parser skips phases with an em dash in the name",
+        "description": "render_pm drops the phase line when the phase name itself contains a dash",
+    },
+    {"id": "BMG-2025-12-005", "summary": ""},
+]
+
+
+def _signatures():
+    params = issues._minhash_params()
+    return {row["id"]: issues._minhash(issues._shingles(row), params) for row in ROWS}
+
+
+def test_shingles_are_word_trigrams_over_the_dedupe_fields():
+    row = {"summary": "Save button, broken!", "description": "on Safari", "owner": "ignored words here"}
+    assert issues._shingles(row) == {"save button broken", "button broken on", "broken on safari"}
+    assert issues._shingles({"summary": "Crash"}) == {"crash"}
+    assert issues._shingles({}) == set()
+
+
+def test_near_duplicates_cluster_and_different_issues_do_not():
+    clusters = issues._duplicate_clusters(_signatures(), threshold=0.5)
+    assert [members for _, members in clusters] == [["BMG-2025-12-001", "BMG-2025-12-002"]]
+    score = clusters[0][0]
+    assert 0.5 <= score < 1.0
+
+
+def test_signatures_are_deterministic():
+    assert _signatures() == _signatures()
+
+
+def test_a_higher_threshold_drops_the_pair():
+    assert issues._duplicate_clusters(_signatures(), threshold=0.99) == []
+
+
+def test_focus_limits_clusters_to_new_issues():
+    signatures = _signatures()
+    assert issues._duplicate_clusters(signatures, 0.5, focus={"BMG-2025-12-003"}) == []
+    focused = issues._duplicate_clusters(signatures, 0.5, focus={"BMG-2025-12-002"})
+    assert [members for _, members in focused] == [["BMG-2025-12-001", "BMG-2025-12-002"]]
+
+
+def test_signature_cache_rehashes_only_changed_issues(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    store.write_text("".join(json.dumps(row) + "\n" for row in ROWS), encoding="utf-8")
+    first, fresh = issues._update_signatures(store, ROWS)
+    assert fresh == {row["id"] for row in ROWS}
+    edited = [dict(row) for row in ROWS]
+    edited[2]["summary"] = "Burndown chart labels overlap"
+    second, fresh = issues._update_signatures(store, edited)
+    assert fresh == {"BMG-2025-12-003"}
+    assert {key: value for key, value in second.items() if key != "BMG-2025-12-003"} == {
+        key: value for key, value in first.items() if key != "BMG-2025-12-003"
+    }
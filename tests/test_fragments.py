@@ -0,0 +1,73 @@
+import json
+import shutil
+
+import pytest
+
+import benchmarks
+import render_docs
+from search_index import _read_script
+
+
+def _build(root, fragments):
+    md_path = root / "docs" / "doc.md"
+    render_docs._build_doc(md_path, root / "ui" / "docs" / "doc.html", root, fragments=fragments)
+    fragments.save()
+    return render_docs._source_digest(md_path)
+
+
+def _fragment_body(path):
+    text = path.read_text(encoding="utf-8")
+    prefix, _, rest = text.partition(", ")
+    assert prefix.startswith("window.AIFIRST_MD_FRAGMENT(")
+    return json.loads(rest[: rest.rindex(")")])
+
+
+def test_fragment_holds_the_page_body_and_the_manifest_points_at_it(tmp_path):
+    md_path = tmp_path / "docs" / "doc.md"
+    md_path.parent.mkdir()
+    md_path.write_text("# Doc\n\nSome `code` and a \"quote\".\n\n- one\n- two\n", encoding="utf-8")
+    fragments = render_docs.FragmentCache(tmp_path / "fragments")
+    digest = _build(tmp_path, fragments)
+
+    frag_path = fragments.path_for(digest)
+    assert _fragment_body(frag_path) == render_docs._render_markdown(md_path.read_text(encoding="utf-8"))
+    manifest = tmp_path / "fragments" / render_docs.FRAGMENT_MANIFEST
+    assert _read_script(manifest) == {"docs/doc.md": digest}
+    assert render_docs.FragmentCache(tmp_path / "fragments").has("docs/doc.md")
+
+
+def test_replaced_and_pruned_fragments_are_deleted(tmp_path):
+    md_path = tmp_path / "docs" / "doc.md"
+    md_path.parent.mkdir()
+    md_path.write_text("# First\n", encoding="utf-8")
+    first = _build(tmp_path, render_docs.FragmentCache(tmp_path / "fragments"))
+
+    md_path.write_text("# Second\n", encoding="utf-8")
+    fragments = render_docs.FragmentCache(tmp_path / "fragments")
+    second = _build(tmp_path, fragments)
+    assert second != first
+    assert not fragments.path_for(first).exists()
+    assert _fragment_body(fragments.path_for(second)) == "<h1>Second</h1>"
+
+    md_path.unlink()
+    fragments = render_docs.FragmentCache(tmp_path / "fragments")
+    fragments.prune(tmp_path)
+    fragments.save()
+    assert not fragments.path_for(second).exists()
+    assert _read_script(tmp_path / "fragments" / render_docs.FRAGMENT_MANIFEST) == {}
+
+
+def test_python_renderer_matches_the_conformance_corpus():
+    corpus = json.loads(benchmarks.MARKDOWN_CORPUS.read_text(encoding="utf-8"))
+    assert corpus
+    for case in corpus:
+        assert render_docs._render_markdown(case["markdown"]) == case["html"], case["name"]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not found")
+def test_markdown_js_matches_the_python_renderer():
+    python, js = benchmarks.bench_markdown(size_mb=0.05, repeat=1)
+    assert python["failed"] == "-"
+    assert js["failed"] == "-"
+    assert js["corpus"] == python["corpus"]
+    assert js["doc_matches"] is True
@@ -0,0 +1,138 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import render_docs
+
+REPO = Path(__file__).resolve().parents[1]
+PHASE02 = "AI_first/projects/bugmgmt/phases/phase02"
+PM_PHASE02 = "AI_first/projects/project_management/phases/phase02"
+STAGE_ACTION = f"{PM_PHASE02}/actions/project_management_phase02_stage_polish_action.md"
+
+
+def _checkout(root):
+    files = subprocess.run(
+        ["git", "-C", str(REPO), "ls-files", "-z", "AI_first"], check=True, capture_output=True, text=True
+    ).stdout
+    for rel in filter(None, files.split("\0")):
+        target = root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(REPO / rel, target)
+    return root
+
+
+def _run(root, script, *args, check=True):
+    env = dict(os.environ, AIFIRST_NO_DAEMON="1")
+    env.pop("AIFIRST_RENDER_CACHE", None)
+    return subprocess.run(
+        [sys.executable, f"AI_first/scripts/{script}", *args],
+        cwd=root,
+        env=env,
+        check=check,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _files(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in (root / "AI_first").rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts
+    }
+
+
+def _read(root, rel):
+    return (root / rel).read_text(encoding="utf-8")
+
+
+def _page(rel):
+    out = render_docs._output_for(Path(rel), Path("AI_first/docs"), Path("AI_first/projects"), Path("AI_first/ui/docs"))
+    return out.as_posix()
+
+
+def _full_render(root):
+    _run(root, "render_docs.py")
+    _run(root, "render_pm.py")
+
+
+def _assert_patched_like_a_full_render(patched, full, sources):
+    pages = ["AI_first/ui/PM.html", "AI_first/ui/project_bugmgmt.html", "AI_first/ui/project_project_management.html"]
+    pages += [_page(rel) for rel in sources]
+    for rel in pages:
+        assert (patched / rel).exists(), rel
+        assert _read(patched, rel) == _read(full, rel), rel
+
+
+def test_add_phase_writes_the_docs_and_patches_outputs_like_a_full_render(tmp_path):
+    patched, full = _checkout(tmp_path / "patched"), _checkout(tmp_path / "full")
+    args = ("add-phase", "--project", "bugmgmt", "--phase-name", "Hardening")
+    out = _run(patched, "init_project.py", *args).stdout
+    assert "Rendered 4 doc(s)." in out
+
+    plan = _read(patched, "AI_first/docs/projectplan.md")
+    # Each list gains the new phase after its last earlier one.
+    assert f"    - Phase 02 — Hardening (planning): see `{PHASE02}/`.\n  - Phase directory map:" in plan
+    assert f"    - `{PHASE02}/phase_definition.md` — definition of Phase 02.\n" in plan
+    assert f"under `{PHASE02}/actions/`).\n- **project_management" in plan
+    stage_line = f"Hardening stage -> `{PHASE02}/actions/bugmgmt_phase02_stage_hardening_action.md`"
+    for name in ("phase_definition.md", "action_plan_phase02.md"):
+        text = _read(patched, f"{PHASE02}/{name}")
+        assert "Hardening" in text and stage_line in text
+    assert "Phase 02" in _read(patched, f"{PHASE02}/actions/bugmgmt_phase02_stage_hardening_action.md")
+    assert "Hardening" in _read(patched, "AI_first/ui/project_bugmgmt.html")
+
+    # --no-render leaves AI_first/ui/ alone and says what to run.
+    before = {rel: data for rel, data in _files(full).items() if rel.startswith("AI_first/ui/")}
+    out = _run(full, "init_project.py", *args, "--no-render").stdout
+    assert "render_docs.py --only AI_first/docs/projectplan.md" in out
+    assert {rel: data for rel, data in _files(full).items() if rel.startswith("AI_first/ui/")} == before
+    assert _read(full, "AI_first/docs/projectplan.md") == plan
+
+    _full_render(full)
+    sources = [
+        "AI_first/docs/projectplan.md",
+        f"{PHASE02}/phase_definition.md",
+        f"{PHASE02}/action_plan_phase02.md",
+        f"{PHASE02}/actions/bugmgmt_phase02_stage_hardening_action.md",
+    ]
+    _assert_patched_like_a_full_render(patched, full, sources)
+
+
+def test_add_stage_lists_the_stage_and_patches_outputs_like_a_full_render(tmp_path):
+    patched, full = _checkout(tmp_path / "patched"), _checkout(tmp_path / "full")
+    args = ("add-stage", "--project", "project_management", "--phase", "2", "--stage-name", "Polish")
+    _run(patched, "init_project.py", *args)
+
+    stage_line = f"  - Polish stage -> `{STAGE_ACTION}`\n"
+    assert stage_line in _read(patched, f"{PM_PHASE02}/action_plan_phase02.md")
+    assert stage_line in _read(patched, f"{PM_PHASE02}/phase_definition.md")
+    assert "Polish" in _read(patched, STAGE_ACTION)
+    assert _read(patched, "AI_first/docs/projectplan.md") == _read(REPO, "AI_first/docs/projectplan.md")
+
+    _run(full, "init_project.py", *args, "--no-render")
+    _full_render(full)
+    sources = [STAGE_ACTION, f"{PM_PHASE02}/action_plan_phase02.md", f"{PM_PHASE02}/phase_definition.md"]
+    _assert_patched_like_a_full_render(patched, full, sources)
+
+    again = _run(patched, "init_project.py", *args, check=False)
+    assert again.returncode != 0 and "already exists" in again.stderr
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("add-phase", "--project", "bugmgmt", "--phase-name", "Hardening"),
+        ("add-stage", "--project", "bugmgmt", "--stage-name", "Polish"),
+    ],
+)
+def test_dry_run_writes_nothing(tmp_path, args):
+    root = _checkout(tmp_path)
+    before = _files(root)
+    out = _run(root, "init_project.py", *args, "--dry-run").stdout
+    assert "[dry-run] write" in out and "[dry-run] render" in out
+    assert _files(root) == before
@@ -0,0 +1,68 @@
+import json
+import shutil
+from pathlib import Path
+
+import issue_columns
+import issues
+
+STORE = Path(__file__).resolve().parents[1] / "AI_first" / "bugmgmt" / "issues" / "issues.jsonl"
+
+
+def _record(seq, **extra):
+    record = {
+        "id": f"BMG-2025-01-{seq:06d}",
+        "date": "2025-01-02",
+        "project": "bugmgmt",
+        "status": "open",
+        "severity": "minor",
+        "summary": f"Issue {seq}",
+    }
+    record.update(extra)
+    return record
+
+
+def _write(path, records, mode="w"):
+    with path.open(mode, encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def test_round_trip_matches_the_repo_store(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    shutil.copyfile(STORE, store)
+    expected = issues._load_issues(store)
+    assert list(issue_columns.load_columns(store).view()) == expected
+    # A second load reads the snapshot written by the first.
+    assert issue_columns.columns_path(store).exists()
+    assert list(issue_columns.load_columns(store).view()) == expected
+    assert list(issues._prepare_columns(store)) == issues._prepare_rows(store)
+
+
+def test_hand_appended_records_are_read_on_top(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    _write(store, [_record(1), _record(2)])
+    issue_columns.load_columns(store)
+    covered = store.stat().st_size
+    _write(store, [_record(1, status="closed"), _record(3)], mode="a")
+    cols = issue_columns.IssueColumns.load(issue_columns.columns_path(store), store)
+    assert cols is not None and cols.source["size"] == covered
+    assert list(issue_columns.load_columns(store).view()) == issues._load_issues(store)
+    assert [row["status"] for row in issue_columns.load_columns(store).view()] == ["closed", "open", "open"]
+
+
+def test_rewritten_store_rebuilds_the_snapshot(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    _write(store, [_record(1), _record(2)])
+    issue_columns.load_columns(store)
+    # Same length, different bytes, so only the prefix check can tell.
+    _write(store, [_record(1, severity="major"), _record(2)])
+    assert issue_columns.IssueColumns.load(issue_columns.columns_path(store), store) is None
+    assert [row["severity"] for row in issue_columns.load_columns(store).view()] == ["major", "minor"]
+
+
+def test_truncated_store_rebuilds_the_snapshot(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    _write(store, [_record(1), _record(2)])
+    issue_columns.load_columns(store)
+    _write(store, [_record(2)])
+    assert [row["id"] for row in issue_columns.load_columns(store).view()] == ["BMG-2025-01-000002"]
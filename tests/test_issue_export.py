@@ -0,0 +1,95 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import issues
+
+REPO = Path(__file__).resolve().parents[1]
+
+RECORD = {
+    "id": "BMG-2025-12-001",
+    "date": "2025-12-01",
+    "project": "bugmgmt",
+    "phase": "01",
+    "stage": "foundation",
+    "area": "ui",
+    "status": "open",
+    "severity": "major",
+    "summary": "Details pane is empty",
+    "owner": "Ada",
+    "root_cause": "Bodies are not loaded",
+}
+
+
+def _split_store(tmp_path):
+    store = tmp_path / "store" / "issues.jsonl"
+    store.parent.mkdir()
+    store.write_text(json.dumps(RECORD) + "\n", encoding="utf-8")
+    issues._compact(store, "split")
+    return store
+
+
+def test_html_export_writes_body_shards_next_to_the_page(tmp_path):
+    store = _split_store(tmp_path)
+    out = tmp_path / "ui" / "issues.html"
+    issues._export_stores([store], "html", out, False, None)
+    shard = tmp_path / "ui" / issues.UI_BODIES_DIR / "BMG-2025-12.js"
+    assert '"root_cause":"Bodies are not loaded"' in shard.read_text(encoding="utf-8")
+
+
+def test_json_export_elsewhere_writes_no_shards(tmp_path, monkeypatch):
+    store = _split_store(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "exports" / "issues.json"
+    issues._export_stores([store], "json", out, False, None)
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*.js")) == []
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert payload["rows"][0][payload["header"]["columns"].index("body")] == "BMG-2025-12"
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.email=test@example.com", "-c", "user.name=test", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _add(store, issue_id, root_cause):
+    fields = {key: value for key, value in RECORD.items() if key != "id"}
+    issues._write_issue(store, issue_id, {**fields, "root_cause": root_cause}, create=True)
+
+
+def test_split_store_survives_a_git_merge_of_two_branches(tmp_path):
+    store = _split_store(tmp_path)
+    repo = store.parent
+    shutil.copy(REPO / ".gitattributes", repo)
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "add", ".gitattributes", "issues.jsonl", "issues.jsonl.bodies")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "checkout", "-q", "-b", "left")
+    _add(store, "BMG-2025-12-002", "Left branch cause")
+    _git(repo, "commit", "-q", "-am", "left")
+    _git(repo, "checkout", "-q", "main")
+    _add(store, "BMG-2025-12-003", "Right branch cause")
+    _git(repo, "commit", "-q", "-am", "right")
+    _git(repo, "merge", "-q", "left", "-m", "merge")
+
+    causes = {
+        "BMG-2025-12-001": "Bodies are not loaded",
+        "BMG-2025-12-002": "Left branch cause",
+        "BMG-2025-12-003": "Right branch cause",
+    }
+    for issue_id, cause in causes.items():
+        assert issues._get_issue(store, issue_id)["root_cause"] == cause
+    out = tmp_path / "ui" / "issues.html"
+    issues._export_stores([store], "html", out, False, None)
+    shard = (tmp_path / "ui" / issues.UI_BODIES_DIR / "BMG-2025-12.js").read_text(encoding="utf-8")
+    assert all(f'"root_cause":"{cause}"' in shard for cause in causes.values())
+
+    issues._compact(store)
+    with issues._bodies_path(store).open("rb") as handle:
+        for line in store.read_text(encoding="utf-8").splitlines():
+            row = json.loads(line)
+            assert issues._body_at(handle, row["body"])["root_cause"] == causes[row["id"]]
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+import issues
+
+
+def _store(tmp_path):
+    rows = [
+        {"id": "BMG-2025-12-001", "date": "2025-12-01", "status": "closed", "severity": "major",
+         "project": "bugmgmt", "date_closed": "2025-12-03"},
+        {"id": "BMG-2025-12-002", "date": "2025-12-02", "status": "open", "severity": "minor", "project": "bugmgmt"},
+    ]
+    path = tmp_path / "issues.jsonl"
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    return path
+
+
+def test_reads_need_a_snapshot_and_do_not_create_state(tmp_path):
+    store = _store(tmp_path)
+    for argv in (["asof", "--date", "2025-12-02"], ["burndown", "--format", "json"]):
+        with pytest.raises(SystemExit, match="run `issues.py snapshot` first"):
+            issues.main([*argv, "--data", str(store), "--output", str(tmp_path / "out.json")])
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["issues.jsonl"]
+
+
+def test_snapshot_seeds_history_from_record_dates(tmp_path, capsys):
+    store = _store(tmp_path)
+    issues.main(["snapshot", "--data", str(store)])
+    out = tmp_path / "asof.json"
+    issues.main(["asof", "--data", str(store), "--date", "2025-12-02", "--output", str(out)])
+    assert json.loads(out.read_text(encoding="utf-8"))["counts"] == {"open": 2, "in_progress": 0, "closed": 0}
+    issues.main(["asof", "--data", str(store), "--date", "2025-12-03", "--output", str(out)])
+    assert json.loads(out.read_text(encoding="utf-8"))["counts"] == {"open": 1, "in_progress": 0, "closed": 1}
+    series = tmp_path / "burndown.json"
+    issues.main(["burndown", "--data", str(store), "--format", "json", "--output", str(series)])
+    days = {row["date"]: row for row in json.loads(series.read_text(encoding="utf-8"))}
+    assert days["2025-12-03"] == {"date": "2025-12-03", "open": 1, "opened": 0, "closed": 1}
+    assert "As of 2025-12-03: 1 open, 0 in_progress, 1 closed" in capsys.readouterr().out
+
+
+def test_a_line_still_being_appended_is_ignored(tmp_path):
+    store = _store(tmp_path)
+    issues.main(["snapshot", "--data", str(store)])
+    hist = issues._history_dir(store)
+    with (hist / "deltas.jsonl").open("ab") as f:
+        f.write(b'{"d":"2025-12-04","id":"BMG-2025-12-002","s":["clo')
+    state, _ = issues._state_asof(hist, "2025-12-31")
+    assert state["BMG-2025-12-002"][0] == "open"
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+import issues
+
+
+def _record(issue_id, status="open", severity="major", project="bugmgmt", **extra):
+    record = {
+        "id": issue_id,
+        "date": "2025-12-01",
+        "project": project,
+        "phase": "01",
+        "stage": "foundation",
+        "area": "ui",
+        "status": status,
+        "severity": severity,
+        "summary": f"Summary of {issue_id}",
+        "owner": "Ada",
+    }
+    record.update(extra)
+    return record
+
+
+def _store(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    return path
+
+
+def test_merge_matches_a_single_sorted_store(tmp_path):
+    left = [
+        _record("BMG-2025-12-001", status="closed"),
+        _record("BMG-2025-12-003", severity="critical"),
+        _record("BMG-2025-12-005", severity="nit"),
+    ]
+    right = [
+        _record("PMG-2025-12-002", project="project_management"),
+        _record("BMG-2025-12-004", status="in_progress", severity="minor"),
+        _record("BMG-2025-12-006", severity="critical"),
+    ]
+    stores = [_store(tmp_path / "a.jsonl", left), _store(tmp_path / "b.jsonl", right)]
+    run_dir = tmp_path / "runs"
+    run_dir.mkdir()
+    merged = [row["id"] for row in issues._merged_rows(stores, run_dir)]
+    combined = _store(tmp_path / "all.jsonl", left + right)
+    assert merged == [row["id"] for row in issues._prepare_columns(combined)]
+    assert merged == [row["id"] for row in sorted(left + right, key=issues._sort_key)]
+
+
+def test_merge_can_be_iterated_twice(tmp_path):
+    stores = [
+        _store(tmp_path / "a.jsonl", [_record("BMG-2025-12-001")]),
+        _store(tmp_path / "b.jsonl", [_record("BMG-2025-12-002")]),
+    ]
+    run_dir = tmp_path / "runs"
+    run_dir.mkdir()
+    rows = issues._merged_rows(stores, run_dir)
+    assert list(rows) == list(rows)
+
+
+def test_merge_rejects_an_id_in_two_stores(tmp_path):
+    stores = [
+        _store(tmp_path / "a.jsonl", [_record("BMG-2025-12-001")]),
+        _store(tmp_path / "b.jsonl", [_record("BMG-2025-12-001", status="closed")]),
+    ]
+    run_dir = tmp_path / "runs"
+    run_dir.mkdir()
+    with pytest.raises(SystemExit, match="BMG-2025-12-001"):
+        issues._merged_rows(stores, run_dir)
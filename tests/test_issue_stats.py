@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+import issue_columns
+import issue_stats
+
+AS_OF = "2025-01-11"
+
+
+def _record(seq, severity, status, opened, closed=None, project="bugmgmt"):
+    record = {
+        "id": f"BMG-2025-01-{seq:03d}",
+        "date": opened,
+        "project": project,
+        "status": status,
+        "severity": severity,
+        "summary": f"Issue {seq}",
+    }
+    if closed is not None:
+        record["date_closed"] = closed
+    return record
+
+
+@pytest.fixture
+def cols(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    records = [
+        _record(1, "critical", "closed", "2025-01-01", "2025-01-04"),  # 3 days, over the 2-day SLA
+        _record(2, "critical", "closed", "2025-01-01", "2025-01-02"),  # 1 day
+        _record(3, "major", "open", "2025-01-01"),  # 10 days open, over the 7-day SLA
+        _record(4, "minor", "closed", "2025-01-02", "2025-01-05"),
+        _record(4, "minor", "open", "2025-01-02", "2025-01-05"),  # reopened: aged, not a cycle time
+        _record(5, "minor", "closed", "2025-01-03"),  # closed without date_closed
+        _record(6, "nit", "closed", "2025-01-09", "2025-01-08"),  # closed before it was opened
+    ]
+    store.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    return issue_columns.load_columns(store)
+
+
+def _group(stats, project, severity):
+    return next(g for g in stats["groups"] if (g["project"], g["severity"]) == (project, severity))
+
+
+def test_cycle_time_aging_and_sla(cols):
+    stats = issue_stats.compute_stats(cols, AS_OF, use_numpy=False)
+    assert stats["as_of"] == AS_OF
+    assert stats["issues"] == 6
+    assert stats["skipped"] == {"undated": 0, "closed_undated": 1, "negative": 1}
+    critical = _group(stats, "bugmgmt", "critical")
+    assert critical["cycle_days"]["count"] == 2
+    assert (critical["cycle_days"]["p50"], critical["cycle_days"]["max"]) == (2.0, 3)
+    assert critical["cycle_days"]["over_sla"] == 1
+    major = _group(stats, "bugmgmt", "major")
+    assert major["open_age_days"]["max"] == 10
+    assert major["open_age_days"]["over_sla"] == 1
+    overall = _group(stats, "*", "*")
+    assert (overall["open"], overall["closed"]) == (2, 4)
+    assert overall["cycle_days"]["over_sla"] == 1
+    assert overall["open_age_days"]["over_sla"] == 1
+
+
+def test_reopened_issue_is_aged_from_its_open_date(cols):
+    minor = _group(issue_stats.compute_stats(cols, AS_OF, use_numpy=False), "bugmgmt", "minor")
+    assert (minor["open"], minor["closed"]) == (1, 1)
+    assert minor["cycle_days"]["count"] == 0
+    assert minor["open_age_days"]["max"] == 9
+    assert minor["open_age_days"]["over_sla"] == 0
+
+
+def test_as_of_defaults_to_the_latest_date_in_the_store(cols):
+    assert issue_stats.compute_stats(cols, use_numpy=False)["as_of"] == "2025-01-09"
+
+
+@pytest.mark.parametrize("where", [None, ["severity=critical", "severity=minor"], ["status=open"]])
+def test_numpy_matches_the_python_fallback(cols, where):
+    pytest.importorskip("numpy")
+    expected = issue_stats.compute_stats(cols, AS_OF, where, use_numpy=False)
+    assert json.dumps(issue_stats.compute_stats(cols, AS_OF, where, use_numpy=True)) == json.dumps(expected)
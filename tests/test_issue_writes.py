@@ -0,0 +1,146 @@
+import json
+import multiprocessing
+
+import pytest
+
+import issues
+
+WORKERS = 4
+WRITES = 8
+
+
+def _fields(project="bugmgmt", **extra):
+    fields = {
+        "project": project,
+        "phase": "01",
+        "stage": "foundation",
+        "area": "ui",
+        "severity": "minor",
+        "summary": "Something is off",
+        "owner": "Ada",
+    }
+    fields.update(extra)
+    return fields
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _add_many(path, count, queue):
+    ids = [issues._write_issue(path, None, _fields(), create=True)[0]["id"] for _ in range(count)]
+    queue.put(ids)
+
+
+def _update_many(path, issue_id, worker, count, queue):
+    synced = [issues._write_issue(path, issue_id, {"owner": f"w{worker}-{n}"}, create=False)[1] for n in range(count)]
+    queue.put(synced)
+
+
+def _run(target, args_list):
+    queue = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=target, args=(*args, queue)) for args in args_list]
+    for proc in procs:
+        proc.start()
+    results = [queue.get(timeout=60) for _ in procs]
+    for proc in procs:
+        proc.join(timeout=60)
+        assert proc.exitcode == 0
+    return results
+
+
+def test_concurrent_adds_get_distinct_ids_and_whole_lines(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    results = _run(_add_many, [(store, WRITES)] * WORKERS)
+    ids = [issue_id for batch in results for issue_id in batch]
+    assert len(set(ids)) == WORKERS * WRITES
+    records = _lines(store)
+    assert sorted(record["id"] for record in records) == sorted(ids)
+    assert max(int(issue_id.rsplit("-", 1)[1]) for issue_id in ids) == WORKERS * WRITES
+
+
+def test_concurrent_updates_keep_every_record_and_the_sync_watermark_covers_them(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    record, _ = issues._write_issue(store, "BMG-2025-12-001", _fields(), create=True)
+    results = _run(_update_many, [(store, record["id"], worker, WRITES) for worker in range(WORKERS)])
+    records = _lines(store)
+    assert len(records) == 1 + WORKERS * WRITES
+    assert issues._get_issue(store, record["id"]) == records[-1]
+    # Group commit: at least one writer fsynced, and the last fsync covers the whole store.
+    assert any(synced for batch in results for synced in batch)
+    inode, synced_to = issues._read_watermark(issues._sidecar(store, ".sync"))
+    assert (inode, synced_to) == (store.stat().st_ino, store.stat().st_size)
+
+
+def test_group_sync_skips_ranges_already_synced(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    _, end = issues._append_record(store, {"id": "BMG-2025-12-001"})
+    assert issues._group_sync(store, end) is True
+    assert issues._group_sync(store, end) is False
+    _, end = issues._append_record(store, {"id": "BMG-2025-12-002"})
+    assert issues._group_sync(store, end) is True
+
+
+def _compact_repeatedly(path, rounds, queue):
+    queue.put([issues._compact(path) for _ in range(rounds)])
+
+
+def test_compact_while_writing_loses_no_updates(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    ids = [issues._write_issue(store, None, _fields(), create=True)[0]["id"] for _ in range(WORKERS)]
+    args = [(store, issue_id, worker, WRITES) for worker, issue_id in enumerate(ids)]
+    queue = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_update_many, args=(*item, queue)) for item in args]
+    procs.append(multiprocessing.Process(target=_compact_repeatedly, args=(store, WRITES, queue)))
+    for proc in procs:
+        proc.start()
+    for _ in procs:
+        queue.get(timeout=60)
+    for proc in procs:
+        proc.join(timeout=60)
+        assert proc.exitcode == 0
+    issues._compact(store)
+    records = _lines(store)
+    assert [record["id"] for record in records] == ids
+    assert [record["owner"] for record in records] == [f"w{worker}-{WRITES - 1}" for worker in range(WORKERS)]
+
+
+def test_updates_find_the_latest_record_after_hand_appends_and_rewrites(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    issues._write_issue(store, "BMG-2025-12-001", _fields(), create=True)
+    issues._write_issue(store, "BMG-2025-12-002", _fields(), create=True)
+    # Appended by hand, behind the offsets table.
+    with store.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({**_lines(store)[0], "owner": "Hand"}) + "\n")
+    assert issues._get_issue(store, "BMG-2025-12-001")["owner"] == "Hand"
+    record, _ = issues._write_issue(store, "BMG-2025-12-001", {"status": "in_progress"}, create=False)
+    assert record["owner"] == "Hand"
+    # Rewritten in place (same inode) with the records reordered.
+    records = _lines(store)
+    with store.open("r+", encoding="utf-8") as f:
+        f.write("".join(json.dumps(row) + "\n" for row in [records[1], records[-1]]))
+        f.truncate()
+    record, _ = issues._write_issue(store, "BMG-2025-12-002", {"owner": "Bo"}, create=False)
+    assert record["id"] == "BMG-2025-12-002"
+    assert issues._get_issue(store, "BMG-2025-12-001")["status"] == "in_progress"
+
+
+def test_create_and_update_check_existence(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    issues._write_issue(store, "BMG-2025-12-001", _fields(), create=True)
+    with pytest.raises(SystemExit, match="already exists"):
+        issues._write_issue(store, "BMG-2025-12-001", _fields(), create=True)
+    with pytest.raises(SystemExit, match="not found"):
+        issues._write_issue(store, "BMG-2025-12-009", {"owner": "Bo"}, create=False)
+
+
+def test_close_refuses_a_closed_issue_unless_reclosing(tmp_path):
+    store = tmp_path / "issues.jsonl"
+    issues._write_issue(store, "BMG-2025-12-001", _fields(), create=True)
+    close = ["close", "--data", str(store), "--id", "BMG-2025-12-001"]
+    issues._run_write_command(issues.parse_args([*close, "--note", "fixed", "--set", "date_closed=2025-12-02"]))
+    with pytest.raises(SystemExit, match="already closed on 2025-12-02"):
+        issues._run_write_command(issues.parse_args([*close, "--note", "again"]))
+    assert issues._get_issue(store, "BMG-2025-12-001")["close_note"] == "fixed"
+    issues._run_write_command(issues.parse_args([*close, "--note", "again", "--reclose"]))
+    assert issues._get_issue(store, "BMG-2025-12-001")["close_note"] == "again"
@@ -0,0 +1,44 @@
+import link_graph
+
+FALSE_ALARMS = [
+    ("AI_first/docs/projectplan.md", "AI_first/docs/project_wide_actions"),
+    ("AI_first/docs/process.md", "AI_first/ui/data/bugmgmt_bodies"),
+    ("AI_first/docs/process.md", "AI_first/ui/portfolio.html"),
+    ("AI_first/docs/process.md", "AI_first/ui/watch_status.html"),
+]
+
+
+def _graph(tmp_path):
+    (tmp_path / "AI_first" / "docs").mkdir(parents=True)
+    for name in ("process.md", "projectplan.md", "guide.md"):
+        (tmp_path / "AI_first" / "docs" / name).write_text("# Doc\n", encoding="utf-8")
+    return link_graph.LinkGraph(tmp_path / "link_graph.json")
+
+
+def test_backticked_paths_are_not_broken_references(tmp_path):
+    graph = _graph(tmp_path)
+    for source, target in FALSE_ALARMS:
+        graph.set(source, "path", graph.targets(source, ["path"]) + [target])
+    assert graph.broken(tmp_path, [source for source, _ in FALSE_ALARMS]) == []
+    # They are still recorded, so backlinks find the docs that mention them.
+    assert graph.sources("AI_first/ui/portfolio.html") == ["AI_first/docs/process.md"]
+
+
+def test_missing_link_targets_are_broken(tmp_path):
+    graph = _graph(tmp_path)
+    graph.set("AI_first/docs/process.md", "link", ["AI_first/docs/guide.md", "AI_first/docs/moved.md"])
+    graph.set("AI_first/docs/process.md", "path", ["AI_first/ui/portfolio.html"])
+    assert graph.broken(tmp_path, ["AI_first/docs/process.md"]) == [
+        ("AI_first/docs/process.md", "link", "AI_first/docs/moved.md")
+    ]
+
+
+def test_references_from_rendered_fragment():
+    fragment = (
+        '<p>See <a href="guide.md#setup">the guide</a>, <a href="https://example.com">a site</a>, '
+        "<code>AI_first/ui/data/bugmgmt_bodies/</code> and <code>AI_first/projects/&lt;project&gt;/</code>.</p>"
+    )
+    assert list(link_graph.references(fragment, "AI_first/docs/process.md")) == [
+        ("link", "AI_first/docs/guide.md"),
+        ("path", "AI_first/ui/data/bugmgmt_bodies"),
+    ]
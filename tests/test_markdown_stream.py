@@ -0,0 +1,60 @@
+import pytest
+
+import render_docs
+
+DOC = """# Streaming
+
+Intro with a [link](other.md) and `code`.
+
+| Name | Value |
+| --- | --- |
+| a | 1 |
+
+- one
+- two
+1. first
+
+```
+<raw> & kept
+```
+Trailing paragraph
+"""
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "\n", "a", "a\nb", "a\nb\n", "a\r\nb\r\n", "a\n\n\nb", "x\ry\n", "blank last line\r\n\r\n"],
+)
+def test_file_lines_split_like_the_in_memory_renderer(tmp_path, text):
+    md_path = tmp_path / "doc.md"
+    md_path.write_bytes(text.encode("utf-8"))
+    assert list(render_docs._read_lines(md_path)) == text.replace("\r\n", "\n").split("\n")
+
+
+def test_streamed_page_matches_rendering_the_whole_text(tmp_path):
+    md_path = tmp_path / "docs" / "doc.md"
+    md_path.parent.mkdir()
+    md_path.write_text(DOC.replace("\n", "\r\n"), encoding="utf-8", newline="")
+    out_path = tmp_path / "ui" / "docs" / "doc.html"
+    render_docs._build_doc(md_path, out_path, tmp_path)
+    body = render_docs._render_markdown(DOC)
+    assert out_path.read_text(encoding="utf-8") == render_docs._doc_page(md_path, out_path, tmp_path, "Streaming", body)
+    assert [path.name for path in out_path.parent.iterdir()] == ["doc.html"]
+
+
+def test_renderer_reads_at_most_one_line_ahead():
+    consumed = []
+
+    def lines():
+        for idx, line in enumerate(DOC.split("\n")):
+            consumed.append(idx)
+            yield line
+
+    pieces = render_docs._iter_markdown(lines())
+    assert next(pieces) == "<h1>Streaming</h1>"
+    assert len(consumed) == 2
+    for piece in pieces:
+        if piece == "<table><thead><tr>":
+            break
+    # Up to the header row, with its separator as the one line of lookahead.
+    assert len(consumed) == 6
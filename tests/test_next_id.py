@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+import issues
+
+
+def _store(path, ids):
+    path.write_text("".join(json.dumps({"id": issue_id}) + "\n" for issue_id in ids), encoding="utf-8")
+    return path
+
+
+def test_next_id_continues_after_the_highest_sequence(tmp_path):
+    store = _store(tmp_path / "issues.jsonl", ["BMG-2025-12-001", "BMG-2025-12-007", "BMG-2025-11-020"])
+    assert issues._next_id(store, "bugmgmt", "2025-12", 3) == "BMG-2025-12-008"
+    assert issues._next_id(store, "bugmgmt", "2025-12", 3) == "BMG-2025-12-009"
+    assert issues._next_id(store, "bugmgmt", "2026-01", 3) == "BMG-2026-01-001"
+    assert issues._next_id(store, "project_management", "2025-12", 4) == "PMG-2025-12-0001"
+
+
+def test_reserved_ids_survive_in_the_sidecar(tmp_path):
+    store = _store(tmp_path / "issues.jsonl", ["BMG-2025-12-001"])
+    issues._next_id(store, "bugmgmt", "2025-12", 3)
+    table = json.loads((tmp_path / "issues.jsonl.ids.json").read_text(encoding="utf-8"))
+    assert table == {"BMG-2025-12": 2}
+    # The sidecar, not the store, is the source of truth once it exists.
+    assert issues._next_id(store, "bugmgmt", "2025-12", 3) == "BMG-2025-12-003"
+
+
+def test_missing_or_corrupt_sidecar_is_rebuilt_from_the_store(tmp_path):
+    store = _store(tmp_path / "issues.jsonl", ["BMG-2025-12-004"])
+    (tmp_path / "issues.jsonl.ids.json").write_text("{not json", encoding="utf-8")
+    assert issues._next_id(store, "bugmgmt", "2025-12", 3) == "BMG-2025-12-005"
+
+
+def test_note_high_water_tracks_hand_chosen_ids(tmp_path):
+    store = _store(tmp_path / "issues.jsonl", [])
+    issues._note_high_water(store, "BMG-2025-12-040")
+    assert issues._next_id(store, "bugmgmt", "2025-12", 3) == "BMG-2025-12-041"
+
+
+def test_exhausted_width_is_an_error(tmp_path):
+    store = _store(tmp_path / "issues.jsonl", ["BMG-2025-12-999"])
+    with pytest.raises(SystemExit, match="raise --width"):
+        issues._next_id(store, "bugmgmt", "2025-12", 3)
+    assert issues._next_id(store, "bugmgmt", "2025-12", 4) == "BMG-2025-12-1000"
+
+
+@pytest.mark.parametrize(
+    "project, month, message",
+    [("unknown", "2025-12", "no configured prefix"), ("bugmgmt", "2025-1", "Month must be YYYY-MM")],
+)
+def test_bad_arguments_are_rejected(tmp_path, project, month, message):
+    store = _store(tmp_path / "issues.jsonl", [])
+    with pytest.raises(SystemExit, match=message):
+        issues._next_id(store, project, month, 3)
+
+
+def test_id_width_reads_the_environment(monkeypatch):
+    monkeypatch.setenv("BUGMGMT_ID_WIDTH", "5")
+    assert issues._id_width() == 5
+    assert issues._id_width(4) == 4
+    monkeypatch.setenv("BUGMGMT_ID_WIDTH", "two")
+    with pytest.raises(SystemExit, match="must be an integer"):
+        issues._id_width()
+    with pytest.raises(SystemExit, match="at least 3"):
+        issues._id_width(2)
@@ -0,0 +1,72 @@
+import json
+import re
+import shutil
+from pathlib import Path
+
+import render_pm
+from render_common import bug_rollup
+
+REPO = Path(__file__).resolve().parents[1]
+UI = REPO / "AI_first" / "ui"
+PROJECTPLAN = REPO / "AI_first" / "docs" / "projectplan.md"
+
+
+def _pm_data(pm_path):
+    data = (pm_path.parent / render_pm.LAZY_DATA_DIR / "pm_projects.js").read_text(encoding="utf-8")
+    assert data.startswith("window.AIFIRST_PM_LOADED(")
+    return json.loads(data[data.index("{") : data.rindex("}") + 1])
+
+
+def test_lazy_pm_table_loads_one_row_per_project_from_its_data_file(tmp_path):
+    pm_path = tmp_path / "PM.html"
+    shutil.copyfile(UI / "PM.html", pm_path)
+    projects = render_pm._build_projects(REPO, PROJECTPLAN)
+    assert render_pm._update_pm_html(pm_path, projects, {}, dry_run=False, lazy=True) is True
+
+    text = pm_path.read_text(encoding="utf-8")
+    assert f'data-virtual-rows="{len(projects)}"' in text
+    assert '<script src="data/pm_projects.js"></script>' in text
+    assert "<tr data-link=" not in text
+    payload = _pm_data(pm_path)
+    assert payload["columns"] == render_pm.PM_DATA_COLUMNS
+    assert payload["rows"] == [
+        [render_pm._pm_row_fields(project)[column] for column in payload["columns"]] for project in projects
+    ]
+    assert render_pm._update_pm_html(pm_path, projects, {}, dry_run=False, lazy=True) is False
+
+
+def test_patching_a_lazy_row_rewrites_only_its_data_entry(tmp_path):
+    pm_path = tmp_path / "PM.html"
+    shutil.copyfile(UI / "PM.html", pm_path)
+    projects = render_pm._build_projects(REPO, PROJECTPLAN)
+    render_pm._update_pm_html(pm_path, projects, {}, dry_run=False, lazy=True)
+    data_path = pm_path.parent / render_pm.LAZY_DATA_DIR / "pm_projects.js"
+    current = data_path.read_text(encoding="utf-8")
+    project = projects[0]
+    assert render_pm.patch_project_row(pm_path, project, 0, dry_run=False) is False
+
+    payload = _pm_data(pm_path)
+    payload["rows"][0][payload["columns"].index("status")] = "Stale"
+    data_path.write_text(render_pm._js_data("window.AIFIRST_PM_LOADED", payload), encoding="utf-8")
+    assert render_pm.patch_project_row(pm_path, project, 0, dry_run=False) is True
+    assert data_path.read_text(encoding="utf-8") == current
+
+
+def test_lazy_detail_page_loads_each_phase_from_its_own_data_file(tmp_path):
+    detail_path = tmp_path / "project_bugmgmt.html"
+    shutil.copyfile(UI / "project_bugmgmt.html", detail_path)
+    project = render_pm.build_one_project(REPO, PROJECTPLAN, "bugmgmt")
+    rollup = bug_rollup(REPO / "AI_first" / "bugmgmt" / "issues" / "issues.jsonl")
+    assert render_pm.update_project_detail(project, detail_path, REPO, rollup, dry_run=False, lazy=True) is True
+
+    text = detail_path.read_text(encoding="utf-8")
+    assert '<template id="phase' not in text
+    sources = re.findall(r'data-phase-src="([^"]+)"', text)
+    assert sources == [render_pm._phase_data_rel(project, phase) for phase in project.phases]
+    for phase, rel in zip(project.phases, sources):
+        data = (tmp_path / rel).read_text(encoding="utf-8")
+        key = f"phase{phase.number}"
+        prefix = f"window.AIFIRST_PHASE_LOADED({json.dumps(key)},"
+        assert data.startswith(prefix)
+        payload = json.loads(data[len(prefix) : data.rindex(")")])
+        assert [payload["def"], payload["plan"], payload["action"]] == list(render_pm._phase_bodies(phase))
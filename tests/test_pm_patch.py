@@ -0,0 +1,38 @@
+import shutil
+from pathlib import Path
+
+import render_pm
+from render_common import bug_rollup
+
+REPO = Path(__file__).resolve().parents[1]
+UI = REPO / "AI_first" / "ui"
+
+
+def _project():
+    project = render_pm.build_one_project(REPO, REPO / "AI_first" / "docs" / "projectplan.md", "bugmgmt")
+    assert project is not None
+    return project
+
+
+def test_project_row_is_rewritten_only_when_it_changes(tmp_path):
+    pm_path = tmp_path / "PM.html"
+    shutil.copyfile(UI / "PM.html", pm_path)
+    project = _project()
+    render_pm.patch_project_row(pm_path, project, 0, dry_run=False)
+    current = pm_path.read_bytes()
+    assert render_pm.patch_project_row(pm_path, project, 0, dry_run=False) is False
+    assert pm_path.read_bytes() == current
+    pm_path.write_bytes(current.replace(b'aria-label="Open bugmgmt project details"', b'aria-label="stale"'))
+    assert render_pm.patch_project_row(pm_path, project, 0, dry_run=False) is True
+    assert pm_path.read_bytes() == current
+
+
+def test_detail_page_is_rewritten_only_when_it_changes(tmp_path):
+    detail_path = tmp_path / "project_bugmgmt.html"
+    shutil.copyfile(UI / "project_bugmgmt.html", detail_path)
+    project = _project()
+    rollup = bug_rollup(REPO / "AI_first" / "bugmgmt" / "issues" / "issues.jsonl")
+    render_pm.update_project_detail(project, detail_path, REPO, rollup, dry_run=False)
+    before = detail_path.stat().st_mtime_ns
+    assert render_pm.update_project_detail(project, detail_path, REPO, rollup, dry_run=False) is False
+    assert detail_path.stat().st_mtime_ns == before
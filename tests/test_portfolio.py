@@ -0,0 +1,63 @@
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+
+import render_pm
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def _repo(root):
+    for rel in ("AI_first/docs/projectplan.md", "AI_first/bugmgmt/issues/issues.jsonl"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(REPO / rel, root / rel)
+    shutil.copytree(REPO / "AI_first" / "projects", root / "AI_first" / "projects")
+    return root
+
+
+def _run(host, *roots):
+    argv = [arg for root in roots for arg in ("--portfolio", str(root))]
+    render_pm._run_portfolio(render_pm.parse_args(argv), host)
+    return (host / "AI_first" / "ui" / "portfolio.html").read_text(encoding="utf-8")
+
+
+def _summary(page, label):
+    return int(re.search(rf'<div class="muted small">{label}</div><div class="h6">(\d+)</div>', page).group(1))
+
+
+def test_portfolio_totals_every_repo(tmp_path, capsys):
+    left, right = _repo(tmp_path / "left"), _repo(tmp_path / "right")
+    page = _run(tmp_path / "host", left, right, left)
+    model = render_pm._portfolio_model(str(left))
+    projects = model["projects"]
+    assert _summary(page, "Repos") == 2
+    assert _summary(page, "Projects") == 2 * len(projects)
+    assert _summary(page, "Active Phases") == 2 * sum(1 for project in projects if project["active"])
+    assert _summary(page, "Open Bugs") == 2 * sum(project["open_bugs"] for project in projects)
+    assert 'id="repo-1"' in page and 'id="repo-2"' in page and 'id="repo-3"' not in page
+    assert '<a href="../../../left/AI_first/ui/PM.html">PM dashboard</a>' in page
+    for project in projects:
+        assert f'href="../../../right/AI_first/ui/project_{project["slug"]}.html"' in page
+    assert "(2 re-parsed, 0 cached)" in capsys.readouterr().out
+
+
+def test_unchanged_repos_come_from_the_cache(tmp_path, capsys):
+    left, right = _repo(tmp_path / "left"), _repo(tmp_path / "right")
+    host = tmp_path / "host"
+    first = _run(host, left, right)
+    assert _run(host, left, right) == first
+    assert "(0 re-parsed, 2 cached)" in capsys.readouterr().out.splitlines()[-1]
+
+    issues = right / "AI_first" / "bugmgmt" / "issues" / "issues.jsonl"
+    issues.write_text("", encoding="utf-8")
+    page = _run(host, left, right)
+    assert "(1 re-parsed, 1 cached)" in capsys.readouterr().out
+    left_bugs = sum(project["open_bugs"] for project in render_pm._portfolio_model(str(left))["projects"])
+    assert _summary(page, "Open Bugs") == left_bugs
+
+
+def test_a_root_without_a_project_plan_is_rejected(tmp_path):
+    with pytest.raises(SystemExit, match="is not an AI_first repo"):
+        _run(tmp_path / "host", tmp_path)
@@ -0,0 +1,80 @@
+import os
+
+import render_docs
+from render_cache import ENV_VAR, RenderCache, open_cache, prune, stats
+
+
+def _cache(tmp_path, version="v1", max_bytes=1 << 20):
+    return RenderCache(tmp_path / "cache", version, max_bytes)
+
+
+def test_hits_and_misses_are_keyed_by_renderer_version(tmp_path):
+    cache = _cache(tmp_path)
+    key = cache.key("digest", "nav=a")
+    assert cache.get("doc", key) is None
+    cache.put("doc", key, {"body": "<p>x</p>"})
+    assert cache.get("doc", key) == {"body": "<p>x</p>"}
+    assert cache.get("doc", cache.key("digest", "nav=b")) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    other = _cache(tmp_path, version="v2")
+    assert other.key("digest", "nav=a") != key
+    assert other.get("doc", other.key("digest", "nav=a")) is None
+
+
+def test_corrupt_entries_are_misses(tmp_path):
+    cache = _cache(tmp_path)
+    key = cache.key("x")
+    cache.put("doc", key, [1])
+    cache._path("doc", key).write_text("{", encoding="utf-8")
+    assert cache.get("doc", key) is None and cache.misses == 1
+
+
+def test_close_evicts_least_recently_used_entries(tmp_path):
+    cache = _cache(tmp_path)
+    keys = [cache.key(str(n)) for n in range(4)]
+    for age, key in enumerate(keys):
+        cache.put("doc", key, "x" * 100)
+        stamp = 1_000_000 + age
+        os.utime(cache._path("doc", key), (stamp, stamp))
+    # Reading the oldest entry marks it as the most recently used.
+    assert cache.get("doc", keys[0]) == "x" * 100
+    size = cache._path("doc", keys[0]).stat().st_size
+    cache.max_bytes = 2 * size
+
+    assert cache.close() == 2
+    assert [cache._path("doc", key).exists() for key in keys] == [True, False, False, True]
+    assert stats(tmp_path / "cache")["entries"] == 2
+    # A run that only read from the cache leaves it alone.
+    reader = _cache(tmp_path, max_bytes=0)
+    assert reader.get("doc", keys[3]) is not None
+    assert reader.close() == 0
+    assert prune(tmp_path / "cache", max_bytes=0) == (2, 2 * size)
+
+
+def test_open_cache_is_off_unless_configured(tmp_path, monkeypatch):
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    assert open_cache(None, 1) is None
+    monkeypatch.setenv(ENV_VAR, str(tmp_path / "shared"))
+    cache = open_cache(None, 1)
+    assert cache.root == (tmp_path / "shared").resolve() and cache.max_bytes == 1024 * 1024
+
+
+def test_doc_builds_reuse_cached_bodies(tmp_path):
+    md_path = tmp_path / "docs" / "doc.md"
+    md_path.parent.mkdir()
+    md_path.write_text("# Cached\n\nBody text.\n", encoding="utf-8")
+    out_path = tmp_path / "ui" / "docs" / "doc.html"
+    cache = _cache(tmp_path)
+    render_docs._build_doc(md_path, out_path, tmp_path, cache=cache)
+    first = out_path.read_text(encoding="utf-8")
+    out_path.unlink()
+
+    render_docs._build_doc(md_path, out_path, tmp_path, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert out_path.read_text(encoding="utf-8") == first
+
+    md_path.write_text("# Cached\n\nEdited.\n", encoding="utf-8")
+    render_docs._build_doc(md_path, out_path, tmp_path, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert "Edited." in out_path.read_text(encoding="utf-8")
@@ -0,0 +1,87 @@
+from search_index import DOCS_FILE, SHARDS_DIR, DocText, SearchIndex, _read_script, shard_key
+
+
+def _text(*lines):
+    text = DocText()
+    assert list(text.feed(lines)) == list(lines)
+    return text
+
+
+def _index(tmp_path):
+    return SearchIndex(tmp_path / "index", tmp_path / "pages", tmp_path / "cache")
+
+
+def _shard(tmp_path, key):
+    path = tmp_path / "index" / SHARDS_DIR / f"{key}.js"
+    return _read_script(path) if path.exists() else None
+
+
+def test_shard_keys_are_file_safe():
+    assert shard_key("alpha") == "al"
+    assert shard_key("a") == "a"
+    assert shard_key("été") == "_e9_t"
+
+
+def test_save_writes_the_doc_table_and_one_shard_per_prefix(tmp_path):
+    index = _index(tmp_path)
+    assert index.update("a.html", "A", "docs/a.md", _text("# Alpha beta", "alpha again")) is True
+    assert index.save() == 3
+
+    docs = _read_script(tmp_path / "index" / DOCS_FILE)
+    assert docs["next"] == 1
+    # Headings are skipped for the summary.
+    assert [(doc["href"], doc["summary"], doc["shards"]) for doc in docs["docs"]] == [
+        ("a.html", "alpha again", ["ag", "al", "be"])
+    ]
+    # Postings are [doc id, count, first position, position deltas...].
+    assert _shard(tmp_path, "al") == {"alpha": [[0, 2, 0, 2]]}
+    assert _shard(tmp_path, "ag") == {"again": [[0, 1, 3]]}
+    assert _shard(tmp_path, "be") == {"beta": [[0, 1, 1]]}
+
+
+def test_current_documents_are_skipped(tmp_path):
+    index = _index(tmp_path)
+    index.update("a.html", "A", "docs/a.md", _text("alpha"))
+    index.save()
+    reopened = _index(tmp_path)
+    assert reopened.update("a.html", "A", "docs/a.md", _text("alpha")) is False
+    assert reopened.save() == 0
+
+
+def test_reindexing_an_edit_rewrites_only_the_changed_shards(tmp_path):
+    index = _index(tmp_path)
+    index.update("a.html", "A", "docs/a.md", _text("alpha beta gamma"))
+    index.update("b.html", "B", "docs/b.md", _text("beta delta"))
+    index.save()
+    untouched = (tmp_path / "index" / SHARDS_DIR / "ga.js").stat().st_mtime_ns
+
+    reopened = _index(tmp_path)
+    assert reopened.update("a.html", "A", "docs/a.md", _text("alpha beta gamma omega")) is True
+    assert reopened.save() == 1
+    assert _shard(tmp_path, "om") == {"omega": [[0, 1, 3]]}
+    assert (tmp_path / "index" / SHARDS_DIR / "ga.js").stat().st_mtime_ns == untouched
+
+    # Without the forward index the old postings come from the document's shards instead.
+    scanned = SearchIndex(tmp_path / "index", tmp_path / "pages")
+    assert scanned.update("a.html", "A", "docs/a.md", _text("beta gamma omega")) is True
+    assert scanned.save() == 4
+    assert _shard(tmp_path, "al") is None
+    assert _shard(tmp_path, "be") == {"beta": [[0, 1, 0], [1, 1, 0]]}
+
+
+def test_prune_drops_documents_whose_source_is_gone(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("alpha\n", encoding="utf-8")
+    index = _index(tmp_path)
+    index.update("a.html", "A", "docs/a.md", _text("alpha shared"))
+    index.update("b.html", "B", "docs/b.md", _text("bravo shared"))
+    index.save()
+
+    reopened = _index(tmp_path)
+    assert reopened.prune(tmp_path) == 1
+    reopened.save()
+    assert not reopened.has("b.html") and reopened.has("a.html")
+    assert _shard(tmp_path, "br") is None
+    assert _shard(tmp_path, "sh") == {"shared": [[0, 1, 1]]}
+    assert not (tmp_path / "cache" / "1.json").exists()
+    assert [doc["href"] for doc in _read_script(tmp_path / "index" / DOCS_FILE)["docs"]] == ["a.html"]
@@ -0,0 +1,74 @@
+import pytest
+
+from render_common import patch_slots, scan_slots
+
+PAGE = """<div class="summary-card"><div class="muted small">Projects</div><div class="h6">3</div></div>
+<ul><li><strong>Owner:</strong> Ada</li></ul>
+<div class="bar" data-count="4">4</div>
+<span id="updated">2025-01-01</span>
+<!-- ROWS_START -->
+<div class="summary-card"><div class="muted small">Inner</div><div class="h6">9</div></div>
+<!-- ROWS_END -->
+"""
+
+
+def test_scan_finds_each_slot_kind():
+    slots, problems = scan_slots(PAGE)
+    assert problems == []
+    assert set(slots) == {
+        ("card", "Projects"),
+        ("item", "Owner"),
+        ("count", "4"),
+        ("span", "updated"),
+        ("block", "ROWS"),
+    }
+    card = slots[("card", "Projects")][0]
+    assert PAGE[card.start : card.end] == "3"
+
+
+def test_slots_inside_a_block_are_not_indexed():
+    slots, _ = scan_slots(PAGE)
+    assert ("card", "Inner") not in slots
+
+
+def test_patch_replaces_values_and_block_bodies():
+    out = patch_slots(
+        PAGE,
+        {("card", "Projects"): "5", ("span", "updated"): "2025-02-02", ("block", "ROWS"): "<p>new</p>"},
+    )
+    assert '<div class="h6">5</div>' in out
+    assert '<span id="updated">2025-02-02</span>' in out
+    assert "<!-- ROWS_START -->\n<p>new</p>\n<!-- ROWS_END -->" in out
+    assert "Inner" not in out
+    assert "<strong>Owner:</strong> Ada" in out
+
+
+def test_patch_without_changes_is_identity():
+    assert patch_slots(PAGE, {}) == PAGE
+
+
+def test_absent_optional_slot_is_skipped():
+    assert patch_slots(PAGE, {("span", "missing"): "x"}) == PAGE
+
+
+@pytest.mark.parametrize(
+    "text, required, message",
+    [
+        (PAGE, [("span", "missing")], "missing span slot 'missing'"),
+        ("<!-- ROWS_START --><!-- ROWS_START --><!-- ROWS_END -->", [], "nested ROWS_START marker"),
+        ("<!-- ROWS_END -->", [], "ROWS_END marker without a matching start"),
+        ("<!-- ROWS_START -->", [], "ROWS_START marker without a matching end"),
+    ],
+    ids=["missing", "nested", "unopened", "unclosed"],
+)
+def test_slot_problems_are_reported(text, required, message):
+    with pytest.raises(SystemExit) as exc:
+        patch_slots(text, {}, required, source="page.html")
+    assert "Slot check failed for page.html" in str(exc.value.code)
+    assert message in str(exc.value.code)
+
+
+def test_duplicated_target_is_rejected():
+    text = PAGE + '<span id="updated">x</span>\n'
+    with pytest.raises(SystemExit, match="duplicated span slot 'updated'"):
+        patch_slots(text, {("span", "updated"): "y"})
@@ -0,0 +1,84 @@
+import json
+
+import watch_docs
+
+
+def _cycle(scan_ms, render_ms=None, render_exit=None, **extra):
+    cycle = {metric: None for metric in watch_docs.METRICS}
+    cycle.update(time=1700000000.0, scan_ms=scan_ms, files=3, changed=0, render_ms=render_ms, render_exit=render_exit)
+    cycle.update(extra)
+    return cycle
+
+
+def _telemetry(tmp_path, window=500, page=False):
+    return watch_docs._Telemetry(
+        tmp_path / "status.json",
+        tmp_path / "ui" / "watch_status.html" if page else None,
+        tmp_path / "style" / "bugmgmt.css",
+        window,
+        interval=0.1,
+        every=3600,
+    )
+
+
+def test_percentiles_interpolate_between_samples():
+    values = [float(n) for n in range(1, 11)]
+    assert watch_docs._percentile(values, 50) == 5.5
+    assert watch_docs._percentile(values, 95) == 9.6
+    assert watch_docs._percentile([7.0], 99) == 7.0
+
+
+def test_rolling_window_and_totals(tmp_path):
+    telemetry = _telemetry(tmp_path, window=4)
+    for n in range(10):
+        telemetry.record(_cycle(float(n)))
+    telemetry.record(_cycle(1.0, render_ms=250.0, render_exit=1, lag_ms=300.0))
+
+    status = telemetry.status()
+    assert status["format"] == watch_docs.STATUS_FORMAT
+    assert (status["cycles"], status["renders"], status["render_failures"], status["overruns"]) == (11, 1, 1, 1)
+    assert status["metrics"]["scan_ms"] == {"samples": 4, "p50": 7.5, "p95": 8.8, "p99": 9.0, "max": 9.0}
+    # Render-only metrics count just the cycles that rendered.
+    assert status["metrics"]["render_ms"] == {"samples": 1, "p50": 250.0, "p95": 250.0, "p99": 250.0, "max": 250.0}
+    assert len(status["recent"]) == 4 and status["last"]["render_exit"] == 1
+
+
+def test_render_cycles_flush_the_status_file_and_page(tmp_path):
+    telemetry = _telemetry(tmp_path, page=True)
+    telemetry.flush()
+    telemetry.record(_cycle(2.0))
+    # Idle cycles wait for `every` seconds; a render is written straight away.
+    assert json.loads((tmp_path / "status.json").read_text(encoding="utf-8"))["cycles"] == 0
+    telemetry.record(_cycle(2.0, render_ms=40.0, render_exit=0, lag_ms=45.0))
+
+    status = json.loads((tmp_path / "status.json").read_text(encoding="utf-8"))
+    assert status["cycles"] == 2 and status["metrics"]["lag_ms"]["p50"] == 45.0
+    page = (tmp_path / "ui" / "watch_status.html").read_text(encoding="utf-8")
+    assert 'href="../style/bugmgmt.css"' in page
+    assert f"pid {status['pid']}" in page
+
+
+def test_watch_loop_records_renders_lag_and_backlog(tmp_path, monkeypatch):
+    docs = tmp_path / "AI_first" / "docs"
+    docs.mkdir(parents=True)
+    (docs / "a.md").write_text("# A\n", encoding="utf-8")
+    renders = []
+    sleeps = []
+
+    def sleep(_seconds):
+        sleeps.append(_seconds)
+        if len(sleeps) == 2:
+            (docs / "b.md").write_text("# B\n", encoding="utf-8")
+
+    monkeypatch.setattr(watch_docs, "__file__", str(tmp_path / "AI_first" / "scripts" / "watch_docs.py"))
+    monkeypatch.setattr(watch_docs.time, "sleep", sleep)
+    monkeypatch.setattr(watch_docs, "_render_once", lambda repo_root: renders.append(repo_root) or 0)
+    watch_docs.main(["--interval", "0.01", "--cycles", "3", "--status", "status.json"])
+
+    status = json.loads((tmp_path / "status.json").read_text(encoding="utf-8"))
+    assert renders == [tmp_path]
+    assert (status["cycles"], status["renders"], status["render_failures"]) == (3, 1, 0)
+    rendered = [cycle for cycle in status["recent"] if cycle["render_ms"] is not None]
+    assert [(cycle["files"], cycle["changed"], cycle["render_exit"]) for cycle in rendered] == [(2, 1, 0)]
+    assert rendered[0]["lag_ms"] >= 0 and rendered[0]["backlog"] is None
+    assert status["metrics"]["files"]["samples"] == 3